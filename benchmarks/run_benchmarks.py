@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""Throughput benchmarks for the factory scripts over synthetic corpora.
+
+Each benchmark runs a factory script as a subprocess, the way agents and CI call
+it, against small/medium/large corpora from ``generate_synthetic_corpus.py`` and
+records units/sec, p50/p95 latency and peak RSS per corpus size.
+
+    python benchmarks/run_benchmarks.py --record    # write benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --check     # exit 1 on a regression beyond --max-regression
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from generate_synthetic_corpus import CorpusSpec, generate_corpus  # noqa: E402
+from generate_template_selection import resolve_template_pack_dir  # noqa: E402
+
+
+BASELINE_VERSION = 1
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+DEFAULT_MAX_REGRESSION = 20.0
+DEFAULT_REPEAT = 5
+
+CORPUS_SIZES = {
+    "small": CorpusSpec(programs=1, units=5, los=3, tasks=12, exercises=6, gates=5, artifacts=2, artifact_bytes=4096),
+    "medium": CorpusSpec(
+        programs=2, units=20, los=6, tasks=60, exercises=20, gates=20, artifacts=4, artifact_bytes=64 * 1024
+    ),
+    "large": CorpusSpec(
+        programs=4, units=50, los=12, tasks=240, exercises=60, gates=60, artifacts=8, artifact_bytes=256 * 1024
+    ),
+}
+
+# Whether a larger value is better; a regression moves a metric the other way.
+METRICS = {
+    "units_per_sec": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "peak_rss_bytes": False,
+}
+
+# Environment variables that would let a run replay cached results instead of doing the work.
+_CACHE_ENV = ("LCS_VALIDATION_CACHE", "LCS_VALIDATION_CACHE_DIR", "LCS_SCHEMA_CACHE_DIR")
+
+
+@dataclass(frozen=True)
+class Invocation:
+    argv: list[str]
+    # Units of work the command covers, so batch-style commands weigh in correctly for units/sec.
+    units: int = 1
+
+
+@dataclass(frozen=True)
+class Corpus:
+    root: Path
+    summary: dict[str, Any]
+
+    @property
+    def unit_dirs(self) -> list[str]:
+        return [unit["unit_dir"] for unit in self.summary["units"]]
+
+
+def _script(name: str) -> str:
+    return str(SCRIPTS_DIR / name)
+
+
+def _per_unit(corpus: Corpus, script: str) -> list[Invocation]:
+    return [
+        Invocation([sys.executable, _script(script), "--repo-root", str(ROOT), "--unit-dir", unit, "--json"])
+        for unit in corpus.unit_dirs
+    ]
+
+
+def _validate_artifact_contracts(corpus: Corpus, repeat: int) -> list[Invocation]:
+    return _per_unit(corpus, "validate_artifact_contracts.py")
+
+
+def _validate_rubric_gates(corpus: Corpus, repeat: int) -> list[Invocation]:
+    return [
+        Invocation(
+            [
+                sys.executable,
+                _script("validate_rubric_gates.py"),
+                "--rubric-gates-file",
+                f"{unit}/rubric-gates.json",
+                "--json",
+            ]
+        )
+        for unit in corpus.unit_dirs
+    ]
+
+
+def _manage_program_context(corpus: Corpus, repeat: int) -> list[Invocation]:
+    units_per_program: dict[str, int] = {}
+    for unit in corpus.summary["units"]:
+        units_per_program[unit["program_id"]] = units_per_program.get(unit["program_id"], 0) + 1
+    return [
+        Invocation(
+            [
+                sys.executable,
+                _script("manage_program_context.py"),
+                "workflow-status",
+                "--repo-root",
+                str(corpus.root),
+                "--program",
+                program_id,
+                "--json",
+            ],
+            units=count,
+        )
+        for program_id, count in units_per_program.items()
+    ]
+
+
+def _generate_template_selection(corpus: Corpus, repeat: int) -> list[Invocation]:
+    return _per_unit(corpus, "generate_template_selection.py")
+
+
+def _build_contract_package(corpus: Corpus, repeat: int) -> list[Invocation]:
+    # Corpus-independent; repeated so its latency percentiles mean something.
+    return [
+        Invocation([sys.executable, _script("build_contract_package.py"), "--repo-root", str(ROOT), "--verify"])
+        for _ in range(repeat)
+    ]
+
+
+# Ordered: template selection rewrites unit artifacts, so it runs after the validators have read them.
+BENCHMARKS: dict[str, Callable[[Corpus, int], list[Invocation]]] = {
+    "validate_artifact_contracts": _validate_artifact_contracts,
+    "validate_rubric_gates": _validate_rubric_gates,
+    "manage_program_context": _manage_program_context,
+    "generate_template_selection": _generate_template_selection,
+    "build_contract_package": _build_contract_package,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=list(CORPUS_SIZES), default=list(CORPUS_SIZES))
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--seed", type=int, default=0, help="Corpus generator seed")
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help="Runs of corpus-independent benchmarks per size"
+    )
+    parser.add_argument("--template-pack-dir", help="Override template pack directory")
+    parser.add_argument("--work-dir", help="Keep generated corpora here instead of a temporary directory")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON path")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", action="store_true", help="Write this run's results to --baseline")
+    mode.add_argument("--check", action="store_true", help="Fail when a metric regresses past --max-regression")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Allowed regression per metric, in percent of the baseline value",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON output")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be >= 1")
+    if args.max_regression < 0:
+        parser.error("--max-regression must be >= 0")
+    return args
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; ``values`` need not be sorted."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+# Peak RSS comes from wait4(), but Linux folds the forking process's RSS into a child's ru_maxrss
+# across exec. Children are therefore forked from this minimal interpreter (about 9 MB, below any
+# measured script), never from the benchmark runner, which holds the corpus generator in memory.
+_SPAWNER = r"""
+import json, os, sys, time
+devnull = os.open(os.devnull, os.O_RDWR)
+scale = 1 if sys.platform == "darwin" else 1024
+for line in sys.stdin:
+    request = json.loads(line)
+    started = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.chdir(request["cwd"])
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            os.execv(request["argv"][0], request["argv"])
+        finally:
+            os._exit(127)
+    _, status, usage = os.wait4(pid, 0)
+    elapsed = time.perf_counter() - started
+    result = {"elapsed": elapsed, "peak_rss": usage.ru_maxrss * scale, "returncode": os.waitstatus_to_exitcode(status)}
+    print(json.dumps(result), flush=True)
+"""
+
+
+class Launcher:
+    """Runs benchmark commands and measures wall time and, where the platform allows, peak RSS."""
+
+    def __init__(self, env: dict[str, str]) -> None:
+        self.env = env
+        self._spawner: subprocess.Popen[str] | None = None
+        if hasattr(os, "fork") and hasattr(os, "wait4"):
+            self._spawner = subprocess.Popen(
+                [sys.executable, "-I", "-S", "-c", _SPAWNER],
+                env=env,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+
+    def run(self, invocation: Invocation) -> tuple[float, int | None]:
+        """Run one command; return (wall seconds, peak RSS in bytes or None where unsupported)."""
+        if self._spawner is not None:
+            assert self._spawner.stdin and self._spawner.stdout
+            self._spawner.stdin.write(json.dumps({"argv": invocation.argv, "cwd": str(ROOT)}) + "\n")
+            self._spawner.stdin.flush()
+            result = json.loads(self._spawner.stdout.readline())
+            elapsed, peak_rss, returncode = result["elapsed"], result["peak_rss"], result["returncode"]
+        else:
+            started = time.perf_counter()
+            returncode = subprocess.run(
+                invocation.argv, cwd=ROOT, env=self.env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            ).returncode
+            elapsed, peak_rss = time.perf_counter() - started, None
+        # 1 is a BLOCK verdict, which is still a measured run; anything else means the script broke.
+        if returncode not in (0, 1):
+            raise RuntimeError(f"benchmark command failed with exit code {returncode}: {' '.join(invocation.argv)}")
+        return elapsed, peak_rss
+
+    def close(self) -> None:
+        if self._spawner is not None:
+            assert self._spawner.stdin
+            self._spawner.stdin.close()
+            self._spawner.wait()
+            self._spawner = None
+
+
+def run_benchmark(invocations: list[Invocation], launcher: Launcher) -> dict[str, Any]:
+    latencies: list[float] = []
+    peaks: list[int] = []
+    for invocation in invocations:
+        elapsed, peak_rss = launcher.run(invocation)
+        latencies.append(elapsed)
+        if peak_rss is not None:
+            peaks.append(peak_rss)
+    units = sum(invocation.units for invocation in invocations)
+    total = sum(latencies)
+    return {
+        "runs": len(invocations),
+        "units": units,
+        "units_per_sec": round(units / total, 3) if total > 0 else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "peak_rss_bytes": max(peaks) if peaks else None,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], max_regression_pct: float
+) -> list[dict[str, Any]]:
+    """List metrics in ``current`` that are worse than ``baseline`` by more than ``max_regression_pct``.
+
+    Only (size, benchmark, metric) triples present in both runs are compared.
+    """
+    regressions: list[dict[str, Any]] = []
+    allowed = max_regression_pct / 100
+    for size, benchmarks in current.get("results", {}).items():
+        for name, metrics in benchmarks.items():
+            reference = baseline.get("results", {}).get(size, {}).get(name)
+            if not isinstance(reference, dict):
+                continue
+            for metric, higher_is_better in METRICS.items():
+                base_value = reference.get(metric)
+                value = metrics.get(metric)
+                if not isinstance(base_value, (int, float)) or not isinstance(value, (int, float)) or base_value <= 0:
+                    continue
+                change = (value - base_value) / base_value
+                if (higher_is_better and change < -allowed) or (not higher_is_better and change > allowed):
+                    regressions.append(
+                        {
+                            "size": size,
+                            "benchmark": name,
+                            "metric": metric,
+                            "baseline": base_value,
+                            "current": value,
+                            "change_percent": round(change * 100, 1),
+                        }
+                    )
+    return regressions
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _run_size(
+    size: str,
+    benchmarks: list[str],
+    seed: int,
+    repeat: int,
+    catalog: dict[str, Any],
+    template_pack_dir: Path,
+    work_dir: Path,
+    launcher: Launcher,
+    log: Callable[[str], None],
+) -> dict[str, Any]:
+    corpus_root = work_dir / size
+    spec = replace(CORPUS_SIZES[size], seed=seed, program_prefix=f"bench-{size}")
+    summary = generate_corpus(
+        corpus_root / "programs", spec, catalog=catalog, template_pack_dir=template_pack_dir, force=True
+    )
+    corpus = Corpus(corpus_root, summary)
+    log(f"{size}: {summary['unit_count']} unit(s), {summary['bytes_written']} bytes")
+    results: dict[str, Any] = {}
+    for name, build in BENCHMARKS.items():
+        if name not in benchmarks:
+            continue
+        metrics = run_benchmark(build(corpus, repeat), launcher)
+        results[name] = metrics
+        log(
+            f"  {name}: {metrics['units_per_sec']} units/s, p50 {metrics['p50_ms']} ms, "
+            f"p95 {metrics['p95_ms']} ms, peak RSS {metrics['peak_rss_bytes']}"
+        )
+    return results
+
+
+def run_suite(
+    *,
+    sizes: list[str],
+    benchmarks: list[str],
+    seed: int,
+    repeat: int,
+    template_pack_dir: Path,
+    work_dir: Path,
+    log: Callable[[str], None] = lambda _message: None,
+) -> dict[str, Any]:
+    catalog = json.loads((template_pack_dir / "catalog.json").read_text(encoding="utf-8"))
+    env = {key: value for key, value in os.environ.items() if key not in _CACHE_ENV}
+    env["LCS_TEMPLATE_PACK_DIR"] = str(template_pack_dir)
+
+    results: dict[str, dict[str, Any]] = {}
+    launcher = Launcher(env)
+    try:
+        for size in sizes:
+            results[size] = _run_size(
+                size, benchmarks, seed, repeat, catalog, template_pack_dir, work_dir, launcher, log
+            )
+    finally:
+        launcher.close()
+
+    return {
+        "version": BASELINE_VERSION,
+        "recorded_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "seed": seed,
+        "environment": _environment(),
+        "results": results,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    template_pack_dir = resolve_template_pack_dir(ROOT, args.template_pack_dir)
+    if template_pack_dir is None:
+        print("ERROR: template pack not found; pass --template-pack-dir or set LCS_TEMPLATE_PACK_DIR", file=sys.stderr)
+        return 1
+
+    baseline_path = Path(args.baseline).resolve()
+    baseline: dict[str, Any] | None = None
+    if args.check:
+        try:
+            baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"ERROR: cannot read baseline {baseline_path}: {exc}", file=sys.stderr)
+            return 1
+
+    log = (lambda message: print(message, file=sys.stderr, flush=True)) if not args.json else (lambda _message: None)
+    with tempfile.TemporaryDirectory(prefix="lcs-bench-") as scratch:
+        work_dir = Path(args.work_dir).resolve() if args.work_dir else Path(scratch)
+        try:
+            payload = run_suite(
+                sizes=args.sizes,
+                benchmarks=args.benchmarks,
+                seed=args.seed,
+                repeat=args.repeat,
+                template_pack_dir=template_pack_dir,
+                work_dir=work_dir,
+                log=log,
+            )
+        except RuntimeError as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 1
+
+    if args.record:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        log(f"Recorded baseline: {baseline_path}")
+
+    regressions: list[dict[str, Any]] = []
+    if baseline is not None:
+        regressions = compare_results(baseline, payload, args.max_regression)
+        payload["regressions"] = regressions
+        payload["max_regression_percent"] = args.max_regression
+
+    if args.json:
+        print(json.dumps(payload, separators=(",", ":")))
+    elif baseline is not None:
+        for item in regressions:
+            print(
+                f"REGRESSION {item['size']}/{item['benchmark']} {item['metric']}: "
+                f"{item['baseline']} -> {item['current']} ({item['change_percent']:+}%)"
+            )
+        print(f"BENCHMARK_STATUS: {'BLOCK' if regressions else 'PASS'}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
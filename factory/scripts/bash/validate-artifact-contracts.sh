@@ -3,7 +3,15 @@
 set -euo pipefail
 
 JSON_MODE=false
+WATCH_MODE=false
 UNIT_DIR_OVERRIDE=""
+PROGRAM=""
+UNITS_GLOB=""
+CHANGED_SINCE=""
+WORKERS=""
+MODE=""
+MAX_FINDINGS=""
+MAX_SCHEMA_ERRORS=""
 
 while [[ $# -gt 0 ]]; do
     case "$1" in
@@ -11,12 +19,44 @@ while [[ $# -gt 0 ]]; do
             JSON_MODE=true
             shift
             ;;
+        --watch)
+            WATCH_MODE=true
+            shift
+            ;;
         --unit-dir)
             UNIT_DIR_OVERRIDE="${2:-}"
             shift 2
             ;;
+        --program)
+            PROGRAM="${2:-}"
+            shift 2
+            ;;
+        --units-glob)
+            UNITS_GLOB="${2:-}"
+            shift 2
+            ;;
+        --changed-since)
+            CHANGED_SINCE="${2:-}"
+            shift 2
+            ;;
+        --workers)
+            WORKERS="${2:-}"
+            shift 2
+            ;;
+        --mode)
+            MODE="${2:-}"
+            shift 2
+            ;;
+        --max-findings)
+            MAX_FINDINGS="${2:-}"
+            shift 2
+            ;;
+        --max-schema-errors)
+            MAX_SCHEMA_ERRORS="${2:-}"
+            shift 2
+            ;;
         --help|-h)
-            echo "Usage: $0 [--json] [--unit-dir <path>]"
+            echo "Usage: $0 [--json] [--watch] [--unit-dir <path> | --program <id> | --units-glob <glob>] [--changed-since <git-ref>] [--workers <n>] [--mode collect-all-per-phase|fail-fast] [--max-findings <n>] [--max-schema-errors <n>]"
             exit 0
             ;;
         *)
@@ -29,19 +69,57 @@ done
 SCRIPT_DIR="$(CDPATH="" cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_DIR/common.sh"
 
-eval "$(get_unit_paths)"
 VALIDATOR_TOOL="$(resolve_python_tool validate_artifact_contracts.py)"
 
-UNIT_TARGET="$UNIT_DIR"
-if [[ -n "$UNIT_DIR_OVERRIDE" ]]; then
-    UNIT_TARGET="$UNIT_DIR_OVERRIDE"
+if [[ -n "$PROGRAM" || -n "$UNITS_GLOB" || -n "$CHANGED_SINCE" ]]; then
+    REPO_ROOT="$(get_repo_root)"
+    args=(
+        "$VALIDATOR_TOOL"
+        --repo-root "$REPO_ROOT"
+    )
+    if [[ -n "$PROGRAM" ]]; then
+        args+=(--program "$PROGRAM")
+    fi
+    if [[ -n "$UNITS_GLOB" ]]; then
+        args+=(--units-glob "$UNITS_GLOB")
+    fi
+    if [[ -n "$CHANGED_SINCE" ]]; then
+        args+=(--changed-since "$CHANGED_SINCE")
+    fi
+else
+    eval "$(get_unit_paths)"
+
+    UNIT_TARGET="$UNIT_DIR"
+    if [[ -n "$UNIT_DIR_OVERRIDE" ]]; then
+        UNIT_TARGET="$UNIT_DIR_OVERRIDE"
+    fi
+
+    args=(
+        "$VALIDATOR_TOOL"
+        --repo-root "$REPO_ROOT"
+        --unit-dir "$UNIT_TARGET"
+    )
+fi
+
+if [[ -n "$WORKERS" ]]; then
+    args+=(--workers "$WORKERS")
+fi
+
+if [[ -n "$MODE" ]]; then
+    args+=(--mode "$MODE")
+fi
+
+if [[ -n "$MAX_FINDINGS" ]]; then
+    args+=(--max-findings "$MAX_FINDINGS")
+fi
+
+if [[ -n "$MAX_SCHEMA_ERRORS" ]]; then
+    args+=(--max-schema-errors "$MAX_SCHEMA_ERRORS")
 fi
 
-args=(
-    "$VALIDATOR_TOOL"
-    --repo-root "$REPO_ROOT"
-    --unit-dir "$UNIT_TARGET"
-)
+if [[ "$WATCH_MODE" == "true" ]]; then
+    args+=(--watch)
+fi
 
 if [[ "$JSON_MODE" == "true" ]]; then
     args+=(--json)
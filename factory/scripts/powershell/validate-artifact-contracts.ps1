@@ -2,27 +2,73 @@
 [CmdletBinding()]
 param(
     [switch]$Json,
+    [switch]$Watch,
     [string]$UnitDir,
+    [string]$Program,
+    [string]$UnitsGlob,
+    [string]$ChangedSince,
+    [int]$Workers = 0,
+    [ValidateSet('collect-all-per-phase', 'fail-fast')]
+    [string]$Mode,
+    [int]$MaxFindings = 0,
+    [int]$MaxSchemaErrors = -1,
     [switch]$Help
 )
 
 $ErrorActionPreference = 'Stop'
 
 if ($Help) {
-    Write-Output 'Usage: ./validate-artifact-contracts.ps1 [-Json] [-UnitDir <path>]'
+    Write-Output 'Usage: ./validate-artifact-contracts.ps1 [-Json] [-Watch] [-UnitDir <path> | -Program <id> | -UnitsGlob <glob>] [-ChangedSince <git-ref>] [-Workers <n>] [-Mode collect-all-per-phase|fail-fast] [-MaxFindings <n>] [-MaxSchemaErrors <n>]'
     exit 0
 }
 
 . "$PSScriptRoot/common.ps1"
-$paths = Get-UnitPathsEnv
 $validatorTool = Resolve-PythonTool -ToolName 'validate_artifact_contracts.py'
 
-$unitTarget = if ($UnitDir) { $UnitDir } else { $paths.UNIT_DIR }
-$arguments = @(
-    $validatorTool,
-    '--repo-root', $paths.REPO_ROOT,
-    '--unit-dir', $unitTarget
-)
+if ($Program -or $UnitsGlob -or $ChangedSince) {
+    $arguments = @(
+        $validatorTool,
+        '--repo-root', (Get-RepoRoot)
+    )
+    if ($Program) {
+        $arguments += @('--program', $Program)
+    }
+    if ($UnitsGlob) {
+        $arguments += @('--units-glob', $UnitsGlob)
+    }
+    if ($ChangedSince) {
+        $arguments += @('--changed-since', $ChangedSince)
+    }
+}
+else {
+    $paths = Get-UnitPathsEnv
+    $unitTarget = if ($UnitDir) { $UnitDir } else { $paths.UNIT_DIR }
+    $arguments = @(
+        $validatorTool,
+        '--repo-root', $paths.REPO_ROOT,
+        '--unit-dir', $unitTarget
+    )
+}
+
+if ($Workers -gt 0) {
+    $arguments += @('--workers', "$Workers")
+}
+
+if ($Mode) {
+    $arguments += @('--mode', $Mode)
+}
+
+if ($MaxFindings -gt 0) {
+    $arguments += @('--max-findings', "$MaxFindings")
+}
+
+if ($MaxSchemaErrors -ge 0) {
+    $arguments += @('--max-schema-errors', "$MaxSchemaErrors")
+}
+
+if ($Watch) {
+    $arguments += '--watch'
+}
 
 if ($Json) {
     $arguments += '--json'
@@ -0,0 +1,628 @@
+#!/usr/bin/env python3
+"""Typed records for the unit contract artifacts.
+
+Generated by generate_artifact_models.py from contracts/schemas/ (brief, design, sequence, exercise-design, manifest);
+do not edit by hand.
+
+``from_json`` checks JSON types while it decodes: a field of the wrong type becomes
+None, an absent array becomes an empty list and array entries of the wrong type are
+dropped. Object entries keep their index in the original array as ``position``.
+Patterns, enums and required keys are left to the JSON Schema validators.
+
+Decoders pass fields positionally, in declaration order, and arrays that are already
+clean are shared with the parsed payload rather than copied, so treat records as
+read-only.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+# Shared stand-in for an absent array; never mutated.
+_NO_ITEMS: list[Any] = []
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_int(value: Any) -> bool:
+    # JSON Schema treats 1.0 as an integer.
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_bool(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_str_or_number(value: Any) -> bool:
+    return isinstance(value, str) or _is_number(value)
+
+
+def _strings(value: Any) -> list[str] | None:
+    if not isinstance(value, list):
+        return None
+    for item in value:
+        if not isinstance(item, str):
+            return [item for item in value if isinstance(item, str)]
+    # Already clean: share the parsed list instead of copying it.
+    return value
+
+
+def _items(value: Any, keep: Callable[[Any], bool]) -> list[Any] | None:
+    if not isinstance(value, list):
+        return None
+    for item in value:
+        if not keep(item):
+            return [item for item in value if keep(item)]
+    return value
+
+
+def _records(value: Any, model: Any) -> list[Any] | None:
+    if not isinstance(value, list):
+        return None
+    return [model.from_json(item, position) for position, item in enumerate(value) if isinstance(item, dict)]
+
+
+@dataclass(slots=True)
+class Brief:
+    """lcs.artifact.brief.v1."""
+
+    contract_version: str | None
+    unit_id: str | None
+    title: str | None
+    audience: BriefAudience | None
+    duration_minutes: int | None
+    learning_outcomes: list[BriefLearningOutcome] | None
+    scope: BriefScope | None
+    proficiency_targets: list[BriefProficiencyTarget] | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> Brief | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("contract_version"), str) else None,
+            value if isinstance(value := get("unit_id"), str) else None,
+            value if isinstance(value := get("title"), str) else None,
+            BriefAudience.from_json(get("audience")),
+            value if _is_int(value := get("duration_minutes")) else None,
+            _records(get("learning_outcomes", _NO_ITEMS), BriefLearningOutcome),
+            BriefScope.from_json(get("scope")),
+            _records(get("proficiency_targets", _NO_ITEMS), BriefProficiencyTarget),
+        )
+
+
+@dataclass(slots=True)
+class BriefAudience:
+    """``audience`` in lcs.artifact.brief.v1."""
+
+    primary: str | None
+    entry_level: str | None
+    delivery_context: str | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> BriefAudience | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("primary"), str) else None,
+            value if isinstance(value := get("entry_level"), str) else None,
+            value if isinstance(value := get("delivery_context"), str) else None,
+        )
+
+
+@dataclass(slots=True)
+class BriefLearningOutcome:
+    """``learning_outcomes[]`` in lcs.artifact.brief.v1."""
+
+    position: int
+    lo_id: str | None
+    priority: str | None
+    statement: str | None
+    evidence: str | None
+    acceptance_criteria: list[str] | None
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], position: int) -> BriefLearningOutcome:
+        get = data.get
+        return cls(
+            position,
+            value if isinstance(value := get("lo_id"), str) else None,
+            value if isinstance(value := get("priority"), str) else None,
+            value if isinstance(value := get("statement"), str) else None,
+            value if isinstance(value := get("evidence"), str) else None,
+            _strings(get("acceptance_criteria", _NO_ITEMS)),
+        )
+
+
+@dataclass(slots=True)
+class BriefScope:
+    """``scope`` in lcs.artifact.brief.v1."""
+
+    in_scope: list[str] | None
+    out_of_scope: list[str] | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> BriefScope | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            _strings(get("in_scope", _NO_ITEMS)),
+            _strings(get("out_of_scope", _NO_ITEMS)),
+        )
+
+
+@dataclass(slots=True)
+class BriefProficiencyTarget:
+    """``proficiency_targets[]`` in lcs.artifact.brief.v1."""
+
+    position: int
+    framework_id: str | None
+    scale_id: str | None
+    dimension: str | None
+    domain_tags: list[str] | None
+    priority: str | None
+    provenance: str | None
+    target: dict[str, Any] | None
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], position: int) -> BriefProficiencyTarget:
+        get = data.get
+        return cls(
+            position,
+            value if isinstance(value := get("framework_id"), str) else None,
+            value if isinstance(value := get("scale_id"), str) else None,
+            value if isinstance(value := get("dimension"), str) else None,
+            _strings(get("domain_tags", _NO_ITEMS)),
+            value if isinstance(value := get("priority"), str) else None,
+            value if isinstance(value := get("provenance"), str) else None,
+            value if isinstance(value := get("target"), dict) else None,
+        )
+
+
+@dataclass(slots=True)
+class Design:
+    """lcs.artifact.design.v1."""
+
+    contract_version: str | None
+    unit_id: str | None
+    generated_at: str | None
+    instructional_strategy: DesignInstructionalStrategy | None
+    pedagogy_decisions: DesignPedagogyDecisions | None
+    metadata: DesignMetadata | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> Design | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("contract_version"), str) else None,
+            value if isinstance(value := get("unit_id"), str) else None,
+            value if isinstance(value := get("generated_at"), str) else None,
+            DesignInstructionalStrategy.from_json(get("instructional_strategy")),
+            DesignPedagogyDecisions.from_json(get("pedagogy_decisions")),
+            DesignMetadata.from_json(get("metadata")),
+        )
+
+
+@dataclass(slots=True)
+class DesignInstructionalStrategy:
+    """``instructional_strategy`` in lcs.artifact.design.v1."""
+
+    primary_method: str | None
+    secondary_methods: list[str] | None
+    rationale: str | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> DesignInstructionalStrategy | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("primary_method"), str) else None,
+            _strings(get("secondary_methods", _NO_ITEMS)),
+            value if isinstance(value := get("rationale"), str) else None,
+        )
+
+
+@dataclass(slots=True)
+class DesignPedagogyDecisions:
+    """``pedagogy_decisions`` in lcs.artifact.design.v1."""
+
+    profile: str | None
+    confidence_threshold: float | None
+    confidence: float | None
+    candidate_methods: list[str] | None
+    scores: DesignPedagogyDecisionsScores | None
+    selection_rules: DesignPedagogyDecisionsSelectionRules | None
+    research: DesignPedagogyDecisionsResearch | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> DesignPedagogyDecisions | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("profile"), str) else None,
+            value if _is_number(value := get("confidence_threshold")) else None,
+            value if _is_number(value := get("confidence")) else None,
+            _strings(get("candidate_methods", _NO_ITEMS)),
+            DesignPedagogyDecisionsScores.from_json(get("scores")),
+            DesignPedagogyDecisionsSelectionRules.from_json(get("selection_rules")),
+            DesignPedagogyDecisionsResearch.from_json(get("research")),
+        )
+
+
+@dataclass(slots=True)
+class DesignPedagogyDecisionsScores:
+    """``pedagogy_decisions.scores`` in lcs.artifact.design.v1."""
+
+    learner_fit: float | None
+    outcome_fit: float | None
+    evidence_fit: float | None
+    delivery_fit: float | None
+    accessibility_fit: float | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> DesignPedagogyDecisionsScores | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if _is_number(value := get("learner_fit")) else None,
+            value if _is_number(value := get("outcome_fit")) else None,
+            value if _is_number(value := get("evidence_fit")) else None,
+            value if _is_number(value := get("delivery_fit")) else None,
+            value if _is_number(value := get("accessibility_fit")) else None,
+        )
+
+
+@dataclass(slots=True)
+class DesignPedagogyDecisionsSelectionRules:
+    """``pedagogy_decisions.selection_rules`` in lcs.artifact.design.v1."""
+
+    max_secondary_methods: int | None
+    score_delta_threshold: float | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> DesignPedagogyDecisionsSelectionRules | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if _is_int(value := get("max_secondary_methods")) else None,
+            value if _is_number(value := get("score_delta_threshold")) else None,
+        )
+
+
+@dataclass(slots=True)
+class DesignPedagogyDecisionsResearch:
+    """``pedagogy_decisions.research`` in lcs.artifact.design.v1."""
+
+    required: bool | None
+    triggers: list[str] | None
+    evidence_refs: list[str] | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> DesignPedagogyDecisionsResearch | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("required"), bool) else None,
+            _strings(get("triggers", _NO_ITEMS)),
+            _strings(get("evidence_refs", _NO_ITEMS)),
+        )
+
+
+@dataclass(slots=True)
+class DesignMetadata:
+    """``metadata`` in lcs.artifact.design.v1."""
+
+    audience: str | None
+    duration_minutes: int | None
+    modality: str | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> DesignMetadata | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("audience"), str) else None,
+            value if _is_int(value := get("duration_minutes")) else None,
+            value if isinstance(value := get("modality"), str) else None,
+        )
+
+
+@dataclass(slots=True)
+class Sequence:
+    """lcs.artifact.sequence.v1."""
+
+    contract_version: str | None
+    unit_id: str | None
+    tasks: list[SequenceTask] | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> Sequence | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("contract_version"), str) else None,
+            value if isinstance(value := get("unit_id"), str) else None,
+            _records(get("tasks", _NO_ITEMS), SequenceTask),
+        )
+
+
+@dataclass(slots=True)
+class SequenceTask:
+    """``tasks[]`` in lcs.artifact.sequence.v1."""
+
+    position: int
+    task_id: str | None
+    title: str | None
+    target_path: str | None
+    status: str | None
+    exercise_id: str | None
+    template_id: str | None
+    exercise_refs: list[str] | None
+    template_ids: list[str] | None
+    lo_refs: list[str] | None
+    depends_on: list[str] | None
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], position: int) -> SequenceTask:
+        get = data.get
+        return cls(
+            position,
+            value if isinstance(value := get("task_id"), str) else None,
+            value if isinstance(value := get("title"), str) else None,
+            value if isinstance(value := get("target_path"), str) else None,
+            value if isinstance(value := get("status"), str) else None,
+            value if isinstance(value := get("exercise_id"), str) else None,
+            value if isinstance(value := get("template_id"), str) else None,
+            _strings(get("exercise_refs", _NO_ITEMS)),
+            _strings(get("template_ids", _NO_ITEMS)),
+            _strings(get("lo_refs", _NO_ITEMS)),
+            _strings(get("depends_on", _NO_ITEMS)),
+        )
+
+
+@dataclass(slots=True)
+class ExerciseDesign:
+    """lcs.artifact.exercise-design.v1."""
+
+    contract_version: str | None
+    unit_id: str | None
+    generated_at: str | None
+    source_files: ExerciseDesignSourceFiles | None
+    exercises: list[ExerciseDesignExercise] | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> ExerciseDesign | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("contract_version"), str) else None,
+            value if isinstance(value := get("unit_id"), str) else None,
+            value if isinstance(value := get("generated_at"), str) else None,
+            ExerciseDesignSourceFiles.from_json(get("source_files")),
+            _records(get("exercises", _NO_ITEMS), ExerciseDesignExercise),
+        )
+
+
+@dataclass(slots=True)
+class ExerciseDesignSourceFiles:
+    """``source_files`` in lcs.artifact.exercise-design.v1."""
+
+    assessment_blueprint: str | None
+    template_selection: str | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> ExerciseDesignSourceFiles | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("assessment_blueprint"), str) else None,
+            value if isinstance(value := get("template_selection"), str) else None,
+        )
+
+
+@dataclass(slots=True)
+class ExerciseDesignExercise:
+    """``exercises[]`` in lcs.artifact.exercise-design.v1."""
+
+    position: int
+    exercise_id: str | None
+    lo_id: str | None
+    template_id: str | None
+    day: int | None
+    target_path: str | None
+    status: str | None
+    template_schema_ref: str | None
+    template_rules_ref: str | None
+    scoring_rubric_required_keys: list[str] | None
+    scoring_rubric_source: str | None
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], position: int) -> ExerciseDesignExercise:
+        get = data.get
+        return cls(
+            position,
+            value if isinstance(value := get("exercise_id"), str) else None,
+            value if isinstance(value := get("lo_id"), str) else None,
+            value if isinstance(value := get("template_id"), str) else None,
+            value if _is_int(value := get("day")) else None,
+            value if isinstance(value := get("target_path"), str) else None,
+            value if isinstance(value := get("status"), str) else None,
+            value if isinstance(value := get("template_schema_ref"), str) else None,
+            value if isinstance(value := get("template_rules_ref"), str) else None,
+            _strings(get("scoring_rubric_required_keys", _NO_ITEMS)),
+            value if isinstance(value := get("scoring_rubric_source"), str) else None,
+        )
+
+
+@dataclass(slots=True)
+class Manifest:
+    """lcs.artifact.manifest.v1."""
+
+    contract_version: str | None
+    unit_id: str | None
+    title: str | None
+    locale: str | None
+    generated_at: str | None
+    outcomes: list[ManifestOutcome] | None
+    artifacts: list[ManifestArtifact] | None
+    gate_status: ManifestGateStatus | None
+    interop: ManifestInterop | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> Manifest | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("contract_version"), str) else None,
+            value if isinstance(value := get("unit_id"), str) else None,
+            value if isinstance(value := get("title"), str) else None,
+            value if isinstance(value := get("locale"), str) else None,
+            value if isinstance(value := get("generated_at"), str) else None,
+            _records(get("outcomes", _NO_ITEMS), ManifestOutcome),
+            _records(get("artifacts", _NO_ITEMS), ManifestArtifact),
+            ManifestGateStatus.from_json(get("gate_status")),
+            ManifestInterop.from_json(get("interop")),
+        )
+
+
+@dataclass(slots=True)
+class ManifestOutcome:
+    """``outcomes[]`` in lcs.artifact.manifest.v1."""
+
+    position: int
+    lo_id: str | None
+    priority: str | None
+    evidence_refs: list[str] | None
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], position: int) -> ManifestOutcome:
+        get = data.get
+        return cls(
+            position,
+            value if isinstance(value := get("lo_id"), str) else None,
+            value if isinstance(value := get("priority"), str) else None,
+            _strings(get("evidence_refs", _NO_ITEMS)),
+        )
+
+
+@dataclass(slots=True)
+class ManifestArtifact:
+    """``artifacts[]`` in lcs.artifact.manifest.v1."""
+
+    position: int
+    id: str | None
+    type: str | None
+    path: str | None
+    media_type: str | None
+    checksum: str | None
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], position: int) -> ManifestArtifact:
+        get = data.get
+        return cls(
+            position,
+            value if isinstance(value := get("id"), str) else None,
+            value if isinstance(value := get("type"), str) else None,
+            value if isinstance(value := get("path"), str) else None,
+            value if isinstance(value := get("media_type"), str) else None,
+            value if isinstance(value := get("checksum"), str) else None,
+        )
+
+
+@dataclass(slots=True)
+class ManifestGateStatus:
+    """``gate_status`` in lcs.artifact.manifest.v1."""
+
+    decision: str | None
+    open_critical: int | None
+    open_high: int | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> ManifestGateStatus | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("decision"), str) else None,
+            value if _is_int(value := get("open_critical")) else None,
+            value if _is_int(value := get("open_high")) else None,
+        )
+
+
+@dataclass(slots=True)
+class ManifestInterop:
+    """``interop`` in lcs.artifact.manifest.v1."""
+
+    xapi: ManifestInteropXapi | None
+    case: dict[str, Any] | None
+    qti: dict[str, Any] | None
+    lti: dict[str, Any] | None
+    cmi5: dict[str, Any] | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> ManifestInterop | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            ManifestInteropXapi.from_json(get("xapi")),
+            value if isinstance(value := get("case"), dict) else None,
+            value if isinstance(value := get("qti"), dict) else None,
+            value if isinstance(value := get("lti"), dict) else None,
+            value if isinstance(value := get("cmi5"), dict) else None,
+        )
+
+
+@dataclass(slots=True)
+class ManifestInteropXapi:
+    """``interop.xapi`` in lcs.artifact.manifest.v1."""
+
+    version: str | None
+    activity_id_set: list[str] | None
+    statement_template_refs: list[str] | None
+
+    @classmethod
+    def from_json(cls, data: Any) -> ManifestInteropXapi | None:
+        if not isinstance(data, dict):
+            return None
+        get = data.get
+        return cls(
+            value if isinstance(value := get("version"), str) else None,
+            _strings(get("activity_id_set", _NO_ITEMS)),
+            _strings(get("statement_template_refs", _NO_ITEMS)),
+        )
+
+
+# Root record type for each artifact, keyed by path relative to the unit directory.
+ARTIFACT_MODELS: dict[str, Any] = {
+    "brief.json": Brief,
+    "design.json": Design,
+    "sequence.json": Sequence,
+    "exercise-design.json": ExerciseDesign,
+    "outputs/manifest.json": Manifest,
+}
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Per-unit store that reads and parses each JSON artifact exactly once."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from json_io import BACKEND, loads
+
+
+@dataclass(frozen=True)
+class ArtifactRecord:
+    path: Path
+    sha256: str
+    size: int
+    payload: Any
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+class ArtifactStore:
+    """Memoize artifact bytes, hashes and parsed payloads for one validation run.
+
+    Payloads are shared between phases, so callers must treat them as
+    read-only; ``views()`` exposes the loaded unit artifacts through a
+    read-only mapping keyed by path relative to the unit directory. Loads are
+    serialized so phases running on different threads never parse a file twice.
+    """
+
+    def __init__(self, unit_dir: Path) -> None:
+        self.unit_dir = unit_dir
+        self._records: dict[Path, ArtifactRecord | None] = {}
+        self.parse_counts: dict[str, int] = {}
+        self.stats = {"reads": 0, "parses": 0, "hits": 0, "bytes_read": 0}
+        self._lock = threading.Lock()
+
+    def _resolve(self, path: Path | str) -> Path:
+        candidate = Path(path)
+        if not candidate.is_absolute():
+            candidate = self.unit_dir / candidate
+        return candidate
+
+    def _label(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.unit_dir).as_posix()
+        except ValueError:
+            return str(path)
+
+    def get(self, path: Path | str) -> ArtifactRecord | None:
+        resolved = self._resolve(path)
+        with self._lock:
+            return self._get_locked(resolved)
+
+    def _get_locked(self, resolved: Path) -> ArtifactRecord | None:
+        if resolved in self._records:
+            self.stats["hits"] += 1
+            return self._records[resolved]
+
+        if not resolved.is_file():
+            self._records[resolved] = None
+            return None
+
+        try:
+            raw = resolved.read_bytes()
+        except OSError as exc:
+            record = ArtifactRecord(path=resolved, sha256="", size=0, payload=None, error=str(exc))
+            self._records[resolved] = record
+            return record
+
+        self.stats["reads"] += 1
+        self.stats["bytes_read"] += len(raw)
+        digest = hashlib.sha256(raw).hexdigest()
+        label = self._label(resolved)
+        self.parse_counts[label] = self.parse_counts.get(label, 0) + 1
+        self.stats["parses"] += 1
+        try:
+            payload = loads(raw)
+        except Exception as exc:  # noqa: BLE001
+            record = ArtifactRecord(path=resolved, sha256=digest, size=len(raw), payload=None, error=str(exc))
+        else:
+            record = ArtifactRecord(path=resolved, sha256=digest, size=len(raw), payload=payload)
+        self._records[resolved] = record
+        return record
+
+    def payload(self, path: Path | str) -> Any:
+        record = self.get(path)
+        if record is None or not record.ok:
+            return None
+        return record.payload
+
+    def sha256(self, path: Path | str) -> str:
+        record = self.get(path)
+        return record.sha256 if record is not None else ""
+
+    def views(self, names: list[str] | None = None) -> Mapping[str, Any]:
+        """Read-only mapping of unit artifacts; ``names`` loads exactly those paths first."""
+        if names is not None:
+            loaded = {name: self.payload(name) for name in names}
+            return MappingProxyType({name: payload for name, payload in loaded.items() if payload is not None})
+        with self._lock:
+            loaded = {
+                self._label(path): record.payload
+                for path, record in self._records.items()
+                if record is not None and record.ok and path.is_relative_to(self.unit_dir)
+            }
+        return MappingProxyType(loaded)
+
+    def metadata(self, names: list[str] | None = None) -> dict[str, Any]:
+        if names is not None:
+            # Per-phase view: independent of what concurrently running phases have loaded.
+            counts = {name: self.parse_counts.get(name, 0) for name in sorted(names)}
+            return {"artifact_parses": sum(counts.values()), "parse_counts": counts}
+        return {
+            "artifact_reads": self.stats["reads"],
+            "artifact_parses": self.stats["parses"],
+            "artifact_cache_hits": self.stats["hits"],
+            "artifact_bytes_read": self.stats["bytes_read"],
+            "json_backend": BACKEND,
+            "parse_counts": dict(sorted(self.parse_counts.items())),
+        }
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""Evaluate the /lcs.author gates for a unit in one interpreter.
+
+Runs artifact contract validation, the rubric-gates check and the audit-report check
+against one shared ArtifactStore, so each artifact is read and parsed once. It then emits
+the gate report that validate-author-gates.sh / .ps1 print; those scripts are thin wrappers
+around this one. ``--changed-since <git-ref>`` evaluates every unit touched since the ref in
+the same process, one report per line.
+
+Contract validation takes its settings (mode, schema error cap, caches, history) from the
+same LCS_* environment variables as validate_artifact_contracts.py.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+from artifact_store import ArtifactStore
+from validate_artifact_contracts import (
+    _discover_units,
+    _open_history,
+    _record_history,
+    _shared_inputs,
+    parse_args as parse_validator_args,
+    unit_options_from_args,
+    validate_unit,
+)
+from validate_rubric_gates import evaluate_rubric_gates
+
+GATE_KEYS = (
+    "STATUS",
+    "UNIT_DIR",
+    "CONTRACT_STATUS",
+    "CONTRACT_SUMMARY",
+    "CONTRACT_RESPONSE_VERSION",
+    "CONTRACT_PIPELINE",
+    "CONTRACT_BLOCKING_STEPS",
+    "RUBRIC_UNCHECKED",
+    "RUBRIC_BLOCKERS",
+    "RUBRIC_PARSE_ERRORS",
+    "AUDIT_DECISION",
+    "AUDIT_OPEN_CRITICAL",
+    "AUDIT_OPEN_HIGH",
+    "BLOCKERS",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repo-root", required=True, help="Repository root path")
+    parser.add_argument("--unit-dir", help="Unit directory under programs/<program-id>/units/")
+    parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REF",
+        help="Evaluate every unit with files changed since this git ref (all units when a shared input changed)",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON output")
+    return parser.parse_args()
+
+
+def _contract_gate(payload: dict[str, Any]) -> tuple[str, str, str, str, str]:
+    status = str(payload.get("STATUS", "BLOCK")).upper()
+    missing = len(payload.get("MISSING_FILES", [])) + len(payload.get("MISSING_SCHEMAS", []))
+    errors = len(payload.get("ERRORS", []))
+    phase_summary = payload.get("PHASE_SUMMARY", {})
+    open_critical = int(phase_summary.get("open_critical", 0)) if isinstance(phase_summary, dict) else 0
+    open_high = int(phase_summary.get("open_high", 0)) if isinstance(phase_summary, dict) else 0
+    pipeline = payload.get("PIPELINE", {})
+    agent_report = payload.get("AGENT_REPORT", {})
+    blocking_steps = agent_report.get("blocking_steps", []) if isinstance(agent_report, dict) else []
+    return (
+        status,
+        f"missing={missing},errors={errors},blockers={open_critical + open_high}",
+        str(payload.get("RESPONSE_VERSION", "")),
+        str(pipeline.get("name", "")) if isinstance(pipeline, dict) else "",
+        ",".join(str(item) for item in blocking_steps if isinstance(item, str)),
+    )
+
+
+def _audit_gate(audit_path: Path, store: ArtifactStore) -> tuple[str, int, int] | str:
+    """(decision, open_critical, open_high), or the reason the audit report is unusable."""
+    record = store.get(audit_path)
+    if record is None or not record.ok:
+        return f"invalid-audit-json:{record.error if record is not None else 'unreadable'}"
+    data = record.payload
+    try:
+        decision = str(data.get("gate_decision", "")).upper()
+        critical = int(data.get("open_critical", -1))
+        high = int(data.get("open_high", -1))
+    except Exception as exc:  # noqa: BLE001
+        return f"invalid-audit-fields:{exc}"
+    if decision not in {"PASS", "BLOCK"}:
+        return "missing-or-invalid-gate_decision"
+    if critical < 0:
+        return "missing-or-invalid-open_critical"
+    if high < 0:
+        return "missing-or-invalid-open_high"
+    return decision, critical, high
+
+
+def evaluate_author_gates(
+    repo_root: Path,
+    unit_dir: Path,
+    *,
+    unit_options: dict[str, Any] | None = None,
+    on_contract: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """The author gate report for one unit, keyed and ordered as GATE_KEYS.
+
+    ``unit_dir`` is reported as given; ``unit_options`` are passed on to validate_unit() and
+    ``on_contract`` receives its payload (the CLI records it in the validation history).
+    """
+    given_dir = unit_dir
+    unit_dir = unit_dir.resolve()
+    store = ArtifactStore(unit_dir)
+    blockers: list[str] = []
+
+    contract = ("BLOCK", "validation-not-run", "", "", "")
+    try:
+        payload = validate_unit(repo_root=repo_root, unit_dir=unit_dir, store=store, **(unit_options or {}))
+    except Exception:  # noqa: BLE001
+        blockers.append("Artifact contract validation failed to execute")
+    else:
+        if on_contract is not None:
+            on_contract(payload)
+        contract = _contract_gate(payload)
+        if contract[0] != "PASS":
+            detail = f"{contract[1]},steps={contract[4]}" if contract[4] else contract[1]
+            blockers.append(f"Artifact contract validation is BLOCK ({detail})")
+
+    def _load_shared(path: Path) -> dict[str, Any] | None:
+        record = store.get(path)
+        return record.payload if record is not None and record.ok and isinstance(record.payload, dict) else None
+
+    rubric_unchecked = rubric_blockers = rubric_parse_errors = 0
+    try:
+        rubric = evaluate_rubric_gates(unit_dir / "rubric-gates.json", unit_dir / "rubrics", load=_load_shared)
+    except Exception:  # noqa: BLE001
+        blockers.append("Rubric parser failed to execute")
+    else:
+        rubric_unchecked = int(rubric["UNCHECKED_COUNT"])
+        rubric_blockers = int(rubric["NON_PASS_COUNT"])
+        rubric_parse_errors = int(rubric["PARSE_ERROR_COUNT"])
+        if rubric["STATUS"] != "PASS":
+            details = "; ".join([*rubric["BLOCKERS"], *rubric["PARSE_ERRORS"]])
+            blockers.append(f"Rubric format validation is BLOCK ({details or 'unknown-parse-error'})")
+    if rubric_blockers > 0:
+        blockers.append(f"Rubric has {rubric_blockers} non-pass status item(s)")
+    if rubric_unchecked > 0:
+        blockers.append(f"Rubric has {rubric_unchecked} unchecked item(s)")
+
+    audit_decision, audit_open_critical, audit_open_high = "MISSING", 0, 0
+    audit_path = unit_dir / "audit-report.json"
+    if audit_path.is_file():
+        audit = _audit_gate(audit_path, store)
+        if isinstance(audit, str):
+            blockers.append(f"Audit JSON invalid: {audit}")
+        else:
+            audit_decision, audit_open_critical, audit_open_high = audit
+    else:
+        blockers.append(f"Missing audit report JSON: {given_dir / 'audit-report.json'}")
+    if audit_decision != "PASS":
+        blockers.append(f"Audit decision is {audit_decision}")
+    if audit_open_critical > 0:
+        blockers.append(f"Audit has {audit_open_critical} open CRITICAL finding(s)")
+    if audit_open_high > 0:
+        blockers.append(f"Audit has {audit_open_high} open HIGH finding(s)")
+
+    values = (
+        "BLOCK" if blockers else "PASS",
+        str(given_dir),
+        *contract,
+        rubric_unchecked,
+        rubric_blockers,
+        rubric_parse_errors,
+        audit_decision,
+        audit_open_critical,
+        audit_open_high,
+        # The shell version joined with IFS='; ', which uses only the ';'.
+        ";".join(blockers),
+    )
+    report = dict(zip(GATE_KEYS, values))
+    # Kept for the text output; the JSON form carries the joined BLOCKERS string only.
+    report["_blockers"] = blockers
+    return report
+
+
+def _print_report(report: dict[str, Any], as_json: bool) -> None:
+    if as_json:
+        payload = {key: report[key] for key in GATE_KEYS}
+        print(json.dumps(payload, separators=(",", ":"), ensure_ascii=False), flush=True)
+        return
+    for key in GATE_KEYS[:-1]:
+        print(f"{key}: {report[key]}")
+    if report["_blockers"]:
+        print("BLOCKERS:")
+        for blocker in report["_blockers"]:
+            print(f"  - {blocker}")
+    sys.stdout.flush()
+
+
+def main() -> int:
+    args = parse_args()
+    repo_root = Path(args.repo_root).resolve()
+    validator_args = parse_validator_args(["--repo-root", str(repo_root)])
+    if validator_args.max_schema_errors < 0:
+        print("ERROR: LCS_MAX_SCHEMA_ERRORS must be >= 0", file=sys.stderr)
+        return 2
+    history = None
+    if validator_args.history or validator_args.history_db:
+        history = _open_history(repo_root, validator_args.history_db)
+    gate_options = {
+        "unit_options": unit_options_from_args(validator_args, repo_root),
+        "on_contract": lambda payload: _record_history(history, payload),
+    }
+
+    if args.changed_since:
+        if args.unit_dir:
+            print("ERROR: --changed-since cannot be combined with --unit-dir", file=sys.stderr)
+            return 2
+        # Imported on demand: only --changed-since shells out to git.
+        from changed_units import ChangedUnitsError, git_changed_paths, select_changed_units
+
+        try:
+            changed = git_changed_paths(repo_root, args.changed_since)
+        except ChangedUnitsError as exc:
+            print(f"ERROR: --changed-since: {exc}", file=sys.stderr)
+            return 2
+        scope = select_changed_units(
+            repo_root,
+            changed,
+            ref=args.changed_since,
+            shared_inputs=_shared_inputs(repo_root),
+            all_units=_discover_units(repo_root, program=None, units_glob="programs/*/units/*"),
+        )
+        blocked = []
+        for unit_dir in scope.units:
+            report = evaluate_author_gates(repo_root, unit_dir, **gate_options)
+            _print_report(report, args.json)
+            if report["STATUS"] != "PASS":
+                blocked.append(str(unit_dir))
+        summary = {**scope.summary(), "status": "BLOCK" if blocked else "PASS", "blocked_units": blocked}
+        if args.json:
+            print(json.dumps({"GATES_SUMMARY": summary}, separators=(",", ":")))
+        else:
+            print(f"GATES_STATUS: {summary['status']} ({len(scope.units)} unit(s) changed since {args.changed_since})")
+        return 1 if blocked else 0
+
+    if not args.unit_dir:
+        print("ERROR: one of --unit-dir or --changed-since is required", file=sys.stderr)
+        return 2
+    report = evaluate_author_gates(repo_root, Path(args.unit_dir), **gate_options)
+    _print_report(report, args.json)
+    return 0 if report["STATUS"] == "PASS" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,13 +5,14 @@ from __future__ import annotations
 
 import argparse
 import hashlib
-import json
 import re
 import sys
 import zipfile
 from pathlib import Path
 from typing import Any
 
+from json_io import dumps, load, write_atomic
+
 try:
     import tomllib
 except ImportError:  # pragma: no cover - fallback for older Python in local shells
@@ -82,7 +83,7 @@ def collect_entries(repo_root: Path, globs: tuple[str, ...], include_schema_id:
                 "size_bytes": path.stat().st_size,
             }
             if include_schema_id:
-                payload = json.loads(path.read_text(encoding="utf-8"))
+                payload = load(path)
                 if not isinstance(payload, dict):
                     raise ValueError(f"Schema file must be a JSON object: {path}")
                 schema_id = payload.get("$id")
@@ -122,16 +123,15 @@ def build_index(repo_root: Path) -> dict[str, Any]:
 
 
 def canonical_json(payload: dict[str, Any]) -> str:
-    return json.dumps(payload, indent=2, sort_keys=True) + "\n"
+    return dumps(payload, indent=2, sort_keys=True)
 
 
 def load_index(index_file: Path) -> dict[str, Any]:
-    return json.loads(index_file.read_text(encoding="utf-8"))
+    return load(index_file)
 
 
 def write_index(index_file: Path, payload: dict[str, Any]) -> None:
-    index_file.parent.mkdir(parents=True, exist_ok=True)
-    index_file.write_text(canonical_json(payload), encoding="utf-8")
+    write_atomic(index_file, canonical_json(payload).encode("utf-8"))
 
 
 def verify_index(index_file: Path, expected: dict[str, Any]) -> bool:
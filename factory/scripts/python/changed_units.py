@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Map a git diff to the unit directories it affects (``--changed-since <ref>``).
+
+A changed path under ``programs/<program>/units/<unit>/`` selects that unit. A change to
+a shared input (contract schemas, the template pack, the proficiency fixtures or the
+validator's own sources) can affect every unit, so the selection escalates to all of them.
+Changes are taken from ``git diff <ref>`` against the working tree plus untracked files,
+so uncommitted edits count as well.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+
+class ChangedUnitsError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class ChangeScope:
+    ref: str
+    changed_paths: int
+    units: list[Path] = field(default_factory=list)
+    # Repo-relative path of the first shared input that changed; every unit is selected.
+    escalated_by: str = ""
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "ref": self.ref,
+            "changed_paths": self.changed_paths,
+            "escalated_by": self.escalated_by or None,
+            "unit_count": len(self.units),
+        }
+
+
+def _git(repo_root: Path, *args: str) -> str:
+    try:
+        proc = subprocess.run(["git", "-C", str(repo_root), *args], check=False, capture_output=True, text=True)
+    except OSError as exc:
+        raise ChangedUnitsError(f"git is not available: {exc}") from None
+    if proc.returncode != 0:
+        detail = proc.stderr.strip().splitlines()
+        raise ChangedUnitsError(f"git {args[0]} failed: {detail[-1] if detail else f'exit {proc.returncode}'}")
+    return proc.stdout
+
+
+def git_changed_paths(repo_root: Path, ref: str) -> list[Path]:
+    """Absolute paths changed between ``ref`` and the working tree, including untracked files.
+
+    Renames are reported as a deletion plus an addition so both the old and the new unit count.
+    """
+    top = Path(_git(repo_root, "rev-parse", "--show-toplevel").strip()).resolve()
+    try:
+        _git(repo_root, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}")
+    except ChangedUnitsError:
+        raise ChangedUnitsError(f"unknown git ref '{ref}'") from None
+    names = _git(repo_root, "diff", "--name-only", "--no-renames", "-z", ref, "--").split("\0")
+    names += _git(repo_root, "ls-files", "--others", "--exclude-standard", "--full-name", "-z").split("\0")
+    return sorted({top / name for name in names if name})
+
+
+def _relative_parts(path: Path, root: Path) -> tuple[str, ...] | None:
+    try:
+        return path.relative_to(root).parts
+    except ValueError:
+        return None
+
+
+def select_changed_units(
+    repo_root: Path,
+    changed: Iterable[Path],
+    *,
+    ref: str,
+    shared_inputs: Iterable[Path],
+    all_units: list[Path],
+) -> ChangeScope:
+    """The units of ``all_units`` touched by ``changed``; all of them when a shared input changed.
+
+    ``shared_inputs`` are absolute files or directories. A unit outside ``all_units`` (another
+    program, or one deleted since ``ref``) is never selected.
+    """
+    root = repo_root.resolve()
+    shared = [Path(item).resolve() for item in shared_inputs]
+    allowed = set(all_units)
+    changed = list(changed)
+    units: set[Path] = set()
+    for path in changed:
+        for shared_path in shared:
+            if path == shared_path or shared_path in path.parents:
+                parts = _relative_parts(path, root)
+                label = "/".join(parts) if parts is not None else str(path)
+                return ChangeScope(ref=ref, changed_paths=len(changed), units=list(all_units), escalated_by=label)
+        parts = _relative_parts(path, root)
+        if parts is not None and len(parts) > 4 and parts[0] == "programs" and parts[2] == "units":
+            unit_dir = root.joinpath(*parts[:4])
+            if unit_dir in allowed:
+                units.add(unit_dir)
+    return ChangeScope(ref=ref, changed_paths=len(changed), units=sorted(units))
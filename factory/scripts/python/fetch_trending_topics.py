@@ -13,6 +13,9 @@ from urllib.error import URLError
 from urllib.request import Request, urlopen
 from xml.etree import ElementTree as ET
 
+from json_io import dump_json, load_json_object as load_json
+from keyword_automaton import KeywordAutomaton
+
 GOOGLE_TRENDS_RSS_URLS = [
     "https://trends.google.com/trending/rss?geo={geo}",
     "https://trends.google.com/trendingsearches/daily/rss?geo={geo}",
@@ -48,6 +51,33 @@ EDUCATION_TECH_HINTS = {
     "technology",
 }
 
+# classify_topic() picks the first category, in this order, with a token in the text.
+TOPIC_HINTS = {
+    "technology": {"ai", "technology", "chip", "software", "app"},
+    "education": {"education", "school", "teacher", "student", "learning"},
+    "climate": {"climate", "heat", "weather", "flood"},
+    "health": {"health", "medical", "vaccine", "disease"},
+    "economy": {"economy", "market", "price", "jobs", "inflation"},
+    "sports": SPORTS_HINTS,
+}
+
+_HINT_AUTOMATON: KeywordAutomaton | None = None
+
+
+def hint_automaton() -> KeywordAutomaton:
+    """One automaton for the pedagogical-fit and topic hints, built on first use."""
+    global _HINT_AUTOMATON
+    if _HINT_AUTOMATON is None:
+        categories = {"fit:high": EDUCATION_TECH_HINTS, "fit:low": SPORTS_HINTS}
+        categories.update({f"topic:{name}": tokens for name, tokens in TOPIC_HINTS.items()})
+        _HINT_AUTOMATON = KeywordAutomaton(categories)
+    return _HINT_AUTOMATON
+
+
+def topic_hints(title: str, news_title: str) -> set[str]:
+    """Hint categories present in the trend and news titles, from a single pass."""
+    return hint_automaton().present(f"{title} {news_title}".strip().lower())
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -59,14 +89,6 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def load_json(path: Path) -> dict[str, Any] | None:
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:  # noqa: BLE001
-        return None
-    return payload if isinstance(payload, dict) else None
-
-
 def contract_version(repo_root: Path) -> str:
     index_path = repo_root / "contracts" / "index.json"
     payload = load_json(index_path)
@@ -101,30 +123,24 @@ def parse_pub_date(value: str) -> datetime:
         return datetime.now(UTC)
 
 
-def pedagogical_fit(title: str, news_title: str) -> str:
-    text = f"{title} {news_title}".strip().lower()
-    if any(token in text for token in EDUCATION_TECH_HINTS):
+def _fit_from_hints(hints: set[str]) -> str:
+    if "fit:high" in hints:
         return "high"
-    if any(token in text for token in SPORTS_HINTS):
+    if "fit:low" in hints:
         return "low"
     return "medium"
 
 
+def _topic_from_hints(hints: set[str]) -> str:
+    return next((name for name in TOPIC_HINTS if f"topic:{name}" in hints), "general")
+
+
+def pedagogical_fit(title: str, news_title: str) -> str:
+    return _fit_from_hints(topic_hints(title, news_title))
+
+
 def classify_topic(title: str, news_title: str) -> str:
-    text = f"{title} {news_title}".strip().lower()
-    if any(token in text for token in {"ai", "technology", "chip", "software", "app"}):
-        return "technology"
-    if any(token in text for token in {"education", "school", "teacher", "student", "learning"}):
-        return "education"
-    if any(token in text for token in {"climate", "heat", "weather", "flood"}):
-        return "climate"
-    if any(token in text for token in {"health", "medical", "vaccine", "disease"}):
-        return "health"
-    if any(token in text for token in {"economy", "market", "price", "jobs", "inflation"}):
-        return "economy"
-    if any(token in text for token in SPORTS_HINTS):
-        return "sports"
-    return "general"
+    return _topic_from_hints(topic_hints(title, news_title))
 
 
 def parse_items(xml_payload: str, max_topics: int) -> list[dict[str, Any]]:
@@ -156,6 +172,7 @@ def parse_items(xml_payload: str, max_topics: int) -> list[dict[str, Any]]:
             news_url = (news_item.findtext(f"{{{HT_NS}}}news_item_url") or "").strip()
             news_source = (news_item.findtext(f"{{{HT_NS}}}news_item_source") or "").strip()
 
+        hints = topic_hints(title, news_title)
         parsed.append(
             {
                 "title": title,
@@ -167,8 +184,8 @@ def parse_items(xml_payload: str, max_topics: int) -> list[dict[str, Any]]:
                 "news_title": news_title,
                 "news_url": news_url,
                 "news_source": news_source,
-                "category": classify_topic(title, news_title),
-                "pedagogical_fit": pedagogical_fit(title, news_title),
+                "category": _topic_from_hints(hints),
+                "pedagogical_fit": _fit_from_hints(hints),
             }
         )
 
@@ -233,7 +250,7 @@ def attach_topic_ids(topics: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
 def write_trend_file(unit_dir: Path, payload: dict[str, Any]) -> Path:
     trend_file = unit_dir / "trend-topics.json"
-    trend_file.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    dump_json(trend_file, payload)
     return trend_file
 
 
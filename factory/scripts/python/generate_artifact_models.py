@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Generate artifact_models.py, typed records for the unit contract artifacts.
+
+Each object in contracts/schemas/{brief,design,sequence,exercise-design,manifest}
+becomes a ``__slots__`` dataclass with a ``from_json`` decoder that checks
+JSON types while it reads, so hot paths can work on typed records instead of
+re-checking ``isinstance``/``.get()`` chains on raw dicts at every access.
+
+Re-run after changing those schemas; ``--check`` exits 1 when the checked-in
+module is stale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import keyword
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from json_io import load, write_atomic
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_SCHEMAS_DIR = SCRIPT_DIR.parents[2] / "contracts" / "schemas"
+DEFAULT_OUTPUT = SCRIPT_DIR / "artifact_models.py"
+
+# (artifact path relative to the unit dir, schema file, root class name)
+ARTIFACT_SCHEMAS = (
+    ("brief.json", "brief.schema.json", "Brief"),
+    ("design.json", "design.schema.json", "Design"),
+    ("sequence.json", "sequence.schema.json", "Sequence"),
+    ("exercise-design.json", "exercise-design.schema.json", "ExerciseDesign"),
+    ("outputs/manifest.json", "manifest.schema.json", "Manifest"),
+)
+
+# JSON Schema scalar type(s) -> (annotation, type test applied to `value`, predicate for array items)
+SCALAR_TYPES: dict[tuple[str, ...], tuple[str, str, str]] = {
+    ("string",): ("str", "isinstance(value := {get}, str)", "_is_str"),
+    ("integer",): ("int", "_is_int(value := {get})", "_is_int"),
+    ("number",): ("float", "_is_number(value := {get})", "_is_number"),
+    ("boolean",): ("bool", "isinstance(value := {get}, bool)", "_is_bool"),
+    ("number", "string"): ("str | float", "_is_str_or_number(value := {get})", "_is_str_or_number"),
+}
+
+PRELUDE = '''
+# Shared stand-in for an absent array; never mutated.
+_NO_ITEMS: list[Any] = []
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_int(value: Any) -> bool:
+    # JSON Schema treats 1.0 as an integer.
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_bool(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_str_or_number(value: Any) -> bool:
+    return isinstance(value, str) or _is_number(value)
+
+
+def _strings(value: Any) -> list[str] | None:
+    if not isinstance(value, list):
+        return None
+    for item in value:
+        if not isinstance(item, str):
+            return [item for item in value if isinstance(item, str)]
+    # Already clean: share the parsed list instead of copying it.
+    return value
+
+
+def _items(value: Any, keep: Callable[[Any], bool]) -> list[Any] | None:
+    if not isinstance(value, list):
+        return None
+    for item in value:
+        if not keep(item):
+            return [item for item in value if keep(item)]
+    return value
+
+
+def _records(value: Any, model: Any) -> list[Any] | None:
+    if not isinstance(value, list):
+        return None
+    return [model.from_json(item, position) for position, item in enumerate(value) if isinstance(item, dict)]
+'''
+
+
+class ModelGenerationError(ValueError):
+    pass
+
+
+@dataclass
+class FieldSpec:
+    name: str
+    key: str
+    annotation: str
+    decoder: str
+
+
+@dataclass
+class ModelSpec:
+    name: str
+    label: str
+    schema_id: str
+    is_item: bool
+    fields: list[FieldSpec] = field(default_factory=list)
+
+
+def _pascal(key: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in key.replace("-", "_").split("_") if part)
+
+
+def _singular(key: str) -> str:
+    return key[:-1] if key.endswith("s") and not key.endswith("ss") else key
+
+
+def _resolve(node: Any, root: dict[str, Any]) -> dict[str, Any]:
+    if not isinstance(node, dict):
+        return {}
+    ref = node.get("$ref")
+    if not isinstance(ref, str):
+        return node
+    if not ref.startswith("#/"):
+        raise ModelGenerationError(f"{root.get('$id')}: only local $ref is supported, got {ref!r}")
+    target: Any = root
+    for part in ref[2:].split("/"):
+        if not isinstance(target, dict) or part not in target:
+            raise ModelGenerationError(f"{root.get('$id')}: unresolvable $ref {ref!r}")
+        target = target[part]
+    return _resolve(target, root)
+
+
+def _schema_types(node: dict[str, Any]) -> tuple[str, ...]:
+    declared = node.get("type")
+    if isinstance(declared, str):
+        return (declared,)
+    if isinstance(declared, list):
+        return tuple(sorted(item for item in declared if isinstance(item, str)))
+    if "properties" in node:
+        return ("object",)
+    return ()
+
+
+def _is_record(node: dict[str, Any]) -> bool:
+    return _schema_types(node) == ("object",) and isinstance(node.get("properties"), dict)
+
+
+def _collect(
+    node: dict[str, Any], name: str, label: str, root: dict[str, Any], is_item: bool, models: list[ModelSpec]
+) -> None:
+    model = ModelSpec(name=name, label=label, schema_id=str(root.get("$id", "")), is_item=is_item)
+    models.append(model)
+    for key, raw_child in node["properties"].items():
+        child = _resolve(raw_child, root)
+        attr = f"{key}_" if keyword.iskeyword(key) else key
+        if not attr.isidentifier():
+            raise ModelGenerationError(f"{model.schema_id}: property {label}.{key} is not a valid attribute name")
+        types = _schema_types(child)
+        child_label = f"{label}.{key}" if label else key
+
+        if _is_record(child):
+            child_name = f"{name}{_pascal(key)}"
+            _collect(child, child_name, child_label, root, False, models)
+            model.fields.append(FieldSpec(attr, key, f"{child_name} | None", f'{child_name}.from_json(get("{key}"))'))
+        elif types == ("object",):
+            model.fields.append(
+                FieldSpec(
+                    attr, key, "dict[str, Any] | None", f'value if isinstance(value := get("{key}"), dict) else None'
+                )
+            )
+        elif types == ("array",):
+            items = _resolve(child.get("items"), root)
+            item_types = _schema_types(items)
+            get_list = f'get("{key}", _NO_ITEMS)'
+            if _is_record(items):
+                item_name = f"{name}{_pascal(_singular(key))}"
+                _collect(items, item_name, f"{child_label}[]", root, True, models)
+                model.fields.append(
+                    FieldSpec(attr, key, f"list[{item_name}] | None", f"_records({get_list}, {item_name})")
+                )
+            elif item_types == ("string",):
+                model.fields.append(FieldSpec(attr, key, "list[str] | None", f"_strings({get_list})"))
+            elif item_types in SCALAR_TYPES:
+                annotation, _, predicate = SCALAR_TYPES[item_types]
+                model.fields.append(
+                    FieldSpec(attr, key, f"list[{annotation}] | None", f"_items({get_list}, {predicate})")
+                )
+            else:
+                model.fields.append(FieldSpec(attr, key, "list[Any] | None", f"_items({get_list}, _keep)"))
+        elif types in SCALAR_TYPES:
+            annotation, test, _ = SCALAR_TYPES[types]
+            check = test.format(get=f'get("{key}")')
+            model.fields.append(FieldSpec(attr, key, f"{annotation} | None", f"value if {check} else None"))
+        else:
+            # const-only, oneOf or untyped: passed through as parsed.
+            model.fields.append(FieldSpec(attr, key, "Any", f'get("{key}")'))
+
+
+def _render_model(model: ModelSpec) -> list[str]:
+    where = f"``{model.label}`` in {model.schema_id}" if model.label else model.schema_id
+    lines = ["", "", "@dataclass(slots=True)", f"class {model.name}:", f'    """{where}."""', ""]
+    if model.is_item:
+        lines.append("    position: int")
+    lines.extend(f"    {spec.name}: {spec.annotation}" for spec in model.fields)
+    lines.append("")
+    lines.append("    @classmethod")
+    if model.is_item:
+        lines.append(f"    def from_json(cls, data: dict[str, Any], position: int) -> {model.name}:")
+    else:
+        lines.append(f"    def from_json(cls, data: Any) -> {model.name} | None:")
+        lines.append("        if not isinstance(data, dict):")
+        lines.append("            return None")
+    lines.append("        get = data.get")
+    lines.append("        return cls(")
+    if model.is_item:
+        lines.append("            position,")
+    lines.extend(f"            {spec.decoder}," for spec in model.fields)
+    lines.append("        )")
+    return lines
+
+
+def render_models(schemas_dir: Path) -> str:
+    models: list[ModelSpec] = []
+    sources: list[str] = []
+    for _, schema_file, root_name in ARTIFACT_SCHEMAS:
+        schema = load(schemas_dir / schema_file)
+        if not isinstance(schema, dict) or not _is_record(schema):
+            raise ModelGenerationError(f"{schema_file}: root schema must be an object with properties")
+        sources.append(schema_file)
+        _collect(schema, root_name, "", schema, False, models)
+
+    uses_keep = any("_keep)" in spec.decoder for model in models for spec in model.fields)
+    lines = [
+        "#!/usr/bin/env python3",
+        '"""Typed records for the unit contract artifacts.',
+        "",
+        "Generated by generate_artifact_models.py from contracts/schemas/ "
+        f"({', '.join(name.removesuffix('.schema.json') for name in sources)});",
+        "do not edit by hand.",
+        "",
+        "``from_json`` checks JSON types while it decodes: a field of the wrong type becomes",
+        "None, an absent array becomes an empty list and array entries of the wrong type are",
+        "dropped. Object entries keep their index in the original array as ``position``.",
+        "Patterns, enums and required keys are left to the JSON Schema validators.",
+        "",
+        "Decoders pass fields positionally, in declaration order, and arrays that are already",
+        "clean are shared with the parsed payload rather than copied, so treat records as",
+        "read-only.",
+        '"""',
+        "",
+        "from __future__ import annotations",
+        "",
+        "from dataclasses import dataclass",
+        "from typing import Any, Callable",
+        "",
+        "",
+    ]
+    lines.extend(PRELUDE.rstrip("\n").splitlines()[1:])
+    if uses_keep:
+        lines.extend(["", "", "def _keep(value: Any) -> bool:", "    return True"])
+    for model in models:
+        lines.extend(_render_model(model))
+    lines.extend(["", "", "# Root record type for each artifact, keyed by path relative to the unit directory."])
+    lines.append("ARTIFACT_MODELS: dict[str, Any] = {")
+    lines.extend(f'    "{artifact}": {root_name},' for artifact, _, root_name in ARTIFACT_SCHEMAS)
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--schemas-dir", default=str(DEFAULT_SCHEMAS_DIR), help="Directory with *.schema.json files")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Generated module path")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the generated module is out of date")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    output = Path(args.output)
+    try:
+        rendered = render_models(Path(args.schemas_dir))
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    current = output.read_text(encoding="utf-8") if output.is_file() else ""
+    if args.check:
+        if current != rendered:
+            print(f"ERROR: {output} is out of date; run generate_artifact_models.py", file=sys.stderr)
+            return 1
+        print(f"{output} is up to date")
+        return 0
+    if current != rendered:
+        write_atomic(output, rendered.encode("utf-8"))
+    print(f"Wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""Generate a synthetic programs/ corpus for load-testing the factory scripts.
+
+Every unit mirrors what setup-design produces, scaled to the requested number of
+LOs, sequence tasks, exercises and manifest artifacts, and passes the artifact
+contract validator. A seeded fraction of units carries exactly one injected
+defect so benchmarks can also exercise the BLOCK paths.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import shutil
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from generate_template_selection import resolve_template_pack_dir
+from json_io import dump_json, load
+
+
+# Fixed so that the same seed always produces byte-identical trees.
+GENERATED_AT = "2026-01-01T00:00:00Z"
+# Bounded by the contract ID patterns: task_id is ^S[0-9]{3}$, gate_id is ^RB[0-9]{3}$ and unit slots
+# are three digits.
+MAX_UNITS_PER_PROGRAM = 999
+MAX_TASKS = 999
+MAX_GATES = 999
+DEFECT_KINDS = (
+    "checksum-mismatch",
+    "dependency-cycle",
+    "unknown-lo-ref",
+    "manifest-lo-mismatch",
+    "missing-artifact",
+    "schema-violation",
+)
+BLUEPRINT_TEMPLATE_LIMIT = 7
+PRIORITIES = ("P1", "P2", "P3")
+CANDIDATE_METHODS = [
+    "direct-instruction",
+    "worked-examples",
+    "retrieval-practice",
+    "problem-based-learning",
+    "project-based-learning",
+    "case-based-learning",
+    "peer-instruction",
+    "simulation-lab",
+]
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    programs: int = 1
+    units: int = 10
+    los: int = 3
+    tasks: int = 12
+    exercises: int = 6
+    gates: int = 1
+    artifacts: int = 2
+    artifact_bytes: int = 4096
+    defect_rate: float = 0.0
+    seed: int = 0
+    program_prefix: str = "synthetic"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repo-root", default=".", help="Factory repository root")
+    parser.add_argument("--output-root", help="Directory receiving <program-id>/ trees (default: <repo-root>/programs)")
+    parser.add_argument("--template-pack-dir", help="Override template pack directory")
+    parser.add_argument("--programs", type=int, default=CorpusSpec.programs, help="Number of programs")
+    parser.add_argument("--units", type=int, default=CorpusSpec.units, help="Units per program")
+    parser.add_argument("--los", type=int, default=CorpusSpec.los, help="Learning outcomes per unit")
+    parser.add_argument("--tasks", type=int, default=CorpusSpec.tasks, help="sequence.json tasks per unit")
+    parser.add_argument("--exercises", type=int, default=CorpusSpec.exercises, help="Exercises per unit")
+    parser.add_argument("--gates", type=int, default=CorpusSpec.gates, help="rubric-gates.json gates per unit")
+    parser.add_argument(
+        "--artifacts", type=int, default=CorpusSpec.artifacts, help="Extra checksummed manifest artifacts per unit"
+    )
+    parser.add_argument(
+        "--artifact-bytes", type=int, default=CorpusSpec.artifact_bytes, help="Size of each extra artifact in bytes"
+    )
+    parser.add_argument(
+        "--defect-rate",
+        type=float,
+        default=CorpusSpec.defect_rate,
+        help="Fraction of units (0..1) that receive one injected defect",
+    )
+    parser.add_argument("--seed", type=int, default=CorpusSpec.seed, help="Seed for defect placement and payloads")
+    parser.add_argument("--program-prefix", default=CorpusSpec.program_prefix, help="Program id prefix")
+    parser.add_argument("--force", action="store_true", help="Replace existing program directories")
+    parser.add_argument("--json", action="store_true", help="Emit JSON summary")
+    args = parser.parse_args()
+
+    if args.programs < 1 or not 1 <= args.units <= MAX_UNITS_PER_PROGRAM:
+        parser.error(f"--programs must be >= 1 and --units between 1 and {MAX_UNITS_PER_PROGRAM}")
+    if args.los < 1:
+        parser.error("--los must be >= 1")
+    if not 1 <= args.tasks <= MAX_TASKS:
+        parser.error(f"--tasks must be between 1 and {MAX_TASKS}")
+    if not 0 <= args.exercises <= args.tasks:
+        parser.error("--exercises must be between 0 and --tasks (each exercise needs a sequence task)")
+    if not 1 <= args.gates <= MAX_GATES:
+        parser.error(f"--gates must be between 1 and {MAX_GATES}")
+    if args.artifacts < 0 or args.artifact_bytes < 0:
+        parser.error("--artifacts and --artifact-bytes must be >= 0")
+    if not 0.0 <= args.defect_rate <= 1.0:
+        parser.error("--defect-rate must be between 0 and 1")
+    return args
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _rubric_required_keys(template_pack_dir: Path, schema_ref: str) -> list[str]:
+    # Same derivation as the validator: item.scoring_rubric.required in the template schema.
+    try:
+        schema = load(template_pack_dir / schema_ref)
+        required = schema["properties"]["item"]["properties"]["scoring_rubric"].get("required", [])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return []
+    return sorted(key.strip() for key in required if isinstance(key, str) and key.strip())
+
+
+def _blueprint_templates(catalog: dict[str, Any], template_pack_dir: Path) -> list[dict[str, Any]]:
+    templates = []
+    for item in catalog.get("templates", []):
+        if not isinstance(item, dict) or not all(isinstance(item.get(key), str) for key in ("template_id", "schema")):
+            continue
+        templates.append(
+            {
+                "template_id": item["template_id"],
+                "exercise_type": str(item.get("exercise_type", item["template_id"].split(".")[0].upper())),
+                "schema": item["schema"],
+                "rules": str(item.get("rules", "")),
+                "rubric_keys": _rubric_required_keys(template_pack_dir, item["schema"]),
+            }
+        )
+        if len(templates) == BLUEPRINT_TEMPLATE_LIMIT:
+            break
+    return templates
+
+
+def _ratios(count: int) -> list[int]:
+    base, extra = divmod(100, count)
+    return [base + (1 if index < extra else 0) for index in range(count)]
+
+
+def _pick_defects(total_units: int, spec: CorpusSpec) -> dict[int, str]:
+    rng = random.Random(spec.seed)
+    chosen = sorted(rng.sample(range(total_units), round(total_units * spec.defect_rate)))
+    kinds = list(DEFECT_KINDS)
+    rng.shuffle(kinds)
+    return {unit_index: kinds[position % len(kinds)] for position, unit_index in enumerate(chosen)}
+
+
+def _write_program(program_dir: Path, program_id: str, units: int) -> None:
+    program_dir.mkdir(parents=True, exist_ok=True)
+    dump_json(
+        program_dir / "program.json",
+        {
+            "program_id": program_id,
+            "title": f"Synthetic program {program_id}",
+            "status": "draft",
+            "created_at": GENERATED_AT,
+            "updated_at": GENERATED_AT,
+            "progress_unit": "study_session",
+            "target_sessions": units * 4,
+            "session_span": 4,
+            "sessions_per_week_assumption": 3,
+            "expected_units": units,
+        },
+    )
+
+
+def _unit_payloads(
+    unit_id: str, spec: CorpusSpec, templates: list[dict[str, Any]], catalog_version: str
+) -> dict[str, dict[str, Any]]:
+    lo_ids = [f"LO{number}" for number in range(1, spec.los + 1)]
+    priorities = {lo_id: PRIORITIES[index % len(PRIORITIES)] for index, lo_id in enumerate(lo_ids)}
+    header = {"contract_version": "1.0.0", "unit_id": unit_id}
+
+    exercises = []
+    for index in range(spec.exercises):
+        template = templates[index % len(templates)]
+        exercises.append(
+            {
+                "exercise_id": f"EX{index + 1:03d}",
+                "lo_id": lo_ids[index % len(lo_ids)],
+                "template_id": template["template_id"],
+                "day": index // 3 + 1,
+                "target_path": f"outputs/module-01/exercises/ex{index + 1:03d}.json",
+                "status": "TODO",
+                "template_schema_ref": template["schema"],
+                "template_rules_ref": template["rules"],
+                "scoring_rubric_required_keys": template["rubric_keys"],
+                "scoring_rubric_source": "template-pack",
+            }
+        )
+
+    tasks = []
+    for index in range(spec.tasks):
+        task: dict[str, Any] = {
+            "task_id": f"S{index + 1:03d}",
+            "title": f"Synthetic task {index + 1}",
+            "target_path": f"outputs/module-01/lessons/lesson-{index + 1:03d}.md",
+            "status": "TODO",
+            "lo_refs": [lo_ids[index % len(lo_ids)]],
+            # A chain with a skip edge every few tasks keeps the graph deep but not purely linear.
+            "depends_on": [f"S{dep + 1:03d}" for dep in sorted({index - 1, index - 3}) if dep >= 0],
+        }
+        if index < len(exercises):
+            exercise = exercises[index]
+            task.update(
+                target_path=exercise["target_path"],
+                exercise_id=exercise["exercise_id"],
+                template_id=exercise["template_id"],
+                lo_refs=[exercise["lo_id"]],
+            )
+        tasks.append(task)
+
+    return {
+        "brief.json": {
+            **header,
+            "title": f"Synthetic unit {unit_id}",
+            "audience": {"primary": "general learners", "entry_level": "beginner", "delivery_context": "self-paced"},
+            "duration_minutes": 60,
+            "learning_outcomes": [
+                {
+                    "lo_id": lo_id,
+                    "priority": priorities[lo_id],
+                    "statement": f"Learner will be able to demonstrate {lo_id} with measurable evidence.",
+                    "evidence": f"Assessment evidence mapped to {lo_id} is available in artifacts.",
+                    "acceptance_criteria": [
+                        f"Given the learning context, When the learner attempts {lo_id} practice, "
+                        "Then observable evidence meets the completion criteria."
+                    ],
+                }
+                for lo_id in lo_ids
+            ],
+            "scope": {"in_scope": [], "out_of_scope": []},
+        },
+        "design.json": {
+            **header,
+            "generated_at": GENERATED_AT,
+            "instructional_strategy": {
+                "primary_method": "retrieval-practice",
+                "secondary_methods": ["worked-examples"],
+                "rationale": "Synthetic corpus default.",
+            },
+            "pedagogy_decisions": {
+                "profile": "corporate-lnd-v1",
+                "confidence_threshold": 0.7,
+                "confidence": 0.7,
+                "candidate_methods": CANDIDATE_METHODS,
+                "scores": {
+                    "learner_fit": 0.0,
+                    "outcome_fit": 0.0,
+                    "evidence_fit": 0.0,
+                    "delivery_fit": 0.0,
+                    "accessibility_fit": 0.0,
+                },
+                "selection_rules": {"max_secondary_methods": 2, "score_delta_threshold": 0.4},
+                "research": {"required": False, "triggers": [], "evidence_refs": []},
+            },
+            "metadata": {"audience": "unspecified", "duration_minutes": 60, "modality": "unspecified"},
+        },
+        "content-model.json": {
+            **header,
+            "course": {"id": "course-01", "title": f"Synthetic course {unit_id}"},
+            "modules": [
+                {
+                    "id": "module-01",
+                    "title": "Synthetic module",
+                    "lessons": [
+                        {
+                            "id": f"lesson-{index + 1:02d}",
+                            "title": f"Synthetic lesson for {lo_id}",
+                            "lo_refs": [lo_id],
+                            "estimated_minutes": max(60 // len(lo_ids), 1),
+                        }
+                        for index, lo_id in enumerate(lo_ids)
+                    ],
+                }
+            ],
+            "dependency_graph": {"nodes": lo_ids, "edges": [], "cycle_check_passed": True},
+            "duration_tolerance": {"lower_percent": -10, "upper_percent": 15},
+        },
+        "design-decisions.json": {
+            **header,
+            "profile": "corporate-lnd-v1",
+            "weights": {
+                "outcome_fit": 0.3,
+                "evidence_fit": 0.25,
+                "learner_fit": 0.2,
+                "delivery_fit": 0.15,
+                "accessibility_fit": 0.1,
+            },
+            "candidate_methods": CANDIDATE_METHODS,
+            "scores": {method: 0.0 for method in CANDIDATE_METHODS},
+            "selected_primary": "",
+            "selected_secondary": [],
+            "rationale": "Synthetic corpus default.",
+            "confidence_threshold": 0.7,
+            "confidence": 0.7,
+            "web_research_triggers": [],
+            "research_evidence_refs": [],
+        },
+        "assessment-blueprint.json": {
+            **header,
+            "subject": "english",
+            "template_pack_version": catalog_version,
+            "target_distribution": [
+                {
+                    "template_id": template["template_id"],
+                    "exercise_type": template["exercise_type"],
+                    "ratio_percent": ratio,
+                }
+                for template, ratio in zip(templates, _ratios(len(templates)))
+            ],
+            "tolerance_percent": 10,
+            "lo_mapping": {
+                lo_id: [templates[(index + offset) % len(templates)]["template_id"] for offset in range(2)]
+                for index, lo_id in enumerate(lo_ids)
+            },
+        },
+        "template-selection.json": {
+            **header,
+            "subject": "english",
+            "catalog_version": catalog_version,
+            "top_k": 3,
+            "selected_templates": [
+                {
+                    "template_id": template["template_id"],
+                    "exercise_type": template["exercise_type"],
+                    "score": 0.8,
+                    "score_breakdown": {
+                        "proficiency_fit": 0.75,
+                        "lo_fit": 1.0,
+                        "level_fit": 1.0,
+                        "duration_fit": 0.4,
+                        "diversity_fit": 0.8,
+                    },
+                    "rationale": f"Selected {template['exercise_type']} for the synthetic corpus.",
+                }
+                for template in templates[:3]
+            ],
+            "selection_rationale": "Synthetic corpus selection.",
+        },
+        "exercise-design.json": {
+            **header,
+            "generated_at": GENERATED_AT,
+            "source_files": {
+                "assessment_blueprint": "assessment-blueprint.json",
+                "template_selection": "template-selection.json",
+            },
+            "exercises": exercises,
+        },
+        "sequence.json": {**header, "tasks": tasks},
+        "rubric-gates.json": {
+            **header,
+            "generated_at": GENERATED_AT,
+            "gates": [
+                {
+                    "gate_id": f"RB{index + 1:03d}",
+                    "group": "alignment",
+                    "status": "TODO",
+                    "severity": "HIGH",
+                    "evidence": "pending",
+                    "checked": False,
+                }
+                for index in range(spec.gates)
+            ],
+        },
+        "audit-report.json": {
+            **header,
+            "gate_decision": "BLOCK",
+            "open_critical": 0,
+            "open_high": 0,
+            "findings": [],
+            "role_readiness": {"teacher_ready": False, "creator_ready": False, "ops_ready": False},
+        },
+        "outputs/manifest.json": {
+            **header,
+            "title": f"Synthetic unit {unit_id}",
+            "locale": "en-US",
+            "generated_at": GENERATED_AT,
+            "outcomes": [
+                {"lo_id": lo_id, "priority": priorities[lo_id], "evidence_refs": [f"brief:{lo_id}"]}
+                for lo_id in lo_ids
+            ],
+            "artifacts": [],
+            "gate_status": {"decision": "BLOCK", "open_critical": 0, "open_high": 0},
+            "interop": {
+                "xapi": {
+                    "version": "2.0.0",
+                    "activity_id_set": [f"https://example.org/xapi/activity/{lo_id}" for lo_id in lo_ids],
+                    "statement_template_refs": [f"https://example.org/xapi/template/{lo_id}" for lo_id in lo_ids],
+                }
+            },
+        },
+    }
+
+
+# Unit artifacts listed (and checksummed) in every manifest, ahead of the synthetic media artifacts.
+_MANIFEST_ARTIFACTS = (
+    "brief.json",
+    "assessment-blueprint.json",
+    "template-selection.json",
+    "exercise-design.json",
+    "rubric-gates.json",
+)
+
+
+def _inject_defect(kind: str, payloads: dict[str, dict[str, Any]], spec: CorpusSpec) -> None:
+    """Apply defects that must be in place before checksums are taken."""
+    tasks = payloads["sequence.json"]["tasks"]
+    if kind == "dependency-cycle":
+        tasks[0]["depends_on"] = [tasks[-1]["task_id"]] if len(tasks) > 1 else [tasks[0]["task_id"]]
+    elif kind == "unknown-lo-ref":
+        tasks[-1]["lo_refs"] = [f"LO{spec.los + 1}"]
+    elif kind == "manifest-lo-mismatch":
+        phantom = f"LO{spec.los + 1}"
+        payloads["outputs/manifest.json"]["outcomes"].append(
+            {"lo_id": phantom, "priority": "P1", "evidence_refs": [f"brief:{phantom}"]}
+        )
+    elif kind == "schema-violation":
+        tasks[0]["status"] = "PENDING"
+
+
+def _write_unit(
+    unit_dir: Path,
+    unit_id: str,
+    spec: CorpusSpec,
+    templates: list[dict[str, Any]],
+    catalog_version: str,
+    defect: str | None,
+) -> int:
+    payloads = _unit_payloads(unit_id, spec, templates, catalog_version)
+    if defect:
+        _inject_defect(defect, payloads, spec)
+
+    (unit_dir / "outputs" / "media").mkdir(parents=True, exist_ok=True)
+    (unit_dir / "rubrics").mkdir(exist_ok=True)
+    written = 0
+    manifest = payloads.pop("outputs/manifest.json")
+    for name, payload in payloads.items():
+        written += dump_json(unit_dir / name, payload)
+
+    rng = random.Random(f"{spec.seed}:{unit_dir.parent.parent.name}:{unit_id}")
+    entries = [
+        {
+            "id": name.replace(".", "-"),
+            "type": name.removesuffix(".json"),
+            "path": name,
+            "media_type": "application/json",
+        }
+        for name in _MANIFEST_ARTIFACTS
+    ]
+    for index in range(spec.artifacts):
+        path = f"outputs/media/asset-{index + 1:03d}.bin"
+        (unit_dir / path).write_bytes(rng.randbytes(spec.artifact_bytes))
+        written += spec.artifact_bytes
+        entries.append(
+            {"id": f"asset-{index + 1:03d}", "type": "media", "path": path, "media_type": "application/octet-stream"}
+        )
+    for entry in entries:
+        entry["checksum"] = f"sha256:{_sha256(unit_dir / entry['path'])}"
+    manifest["artifacts"] = entries
+    written += dump_json(unit_dir / "outputs" / "manifest.json", manifest)
+
+    # Post-manifest defects: the manifest no longer describes what is on disk.
+    if defect == "checksum-mismatch":
+        with (unit_dir / "brief.json").open("a", encoding="utf-8") as handle:
+            handle.write("\n")
+        written += 1
+    elif defect == "missing-artifact":
+        target = unit_dir / "rubric-gates.json"
+        written -= target.stat().st_size
+        target.unlink()
+    return written
+
+
+def generate_corpus(
+    output_root: Path,
+    spec: CorpusSpec,
+    *,
+    catalog: dict[str, Any],
+    template_pack_dir: Path,
+    force: bool = False,
+) -> dict[str, Any]:
+    """Write ``spec.programs`` program trees under ``output_root`` and return a summary.
+
+    The summary lists every generated unit directory and, for defective units, the injected
+    defect kind, so callers can assert the validator's verdict unit by unit.
+    """
+    templates = _blueprint_templates(catalog, template_pack_dir)
+    if not templates:
+        raise ValueError(f"template catalog in {template_pack_dir} has no usable templates")
+    catalog_version = str(catalog.get("catalog_version", "1.0.0")).strip() or "1.0.0"
+
+    program_ids = [f"{spec.program_prefix}-{index + 1:03d}" for index in range(spec.programs)]
+    existing = [program_id for program_id in program_ids if (output_root / program_id).exists()]
+    if existing and not force:
+        raise FileExistsError(f"program directories already exist under {output_root}: {existing}")
+
+    defects = _pick_defects(spec.programs * spec.units, spec)
+    units: list[dict[str, Any]] = []
+    bytes_written = 0
+    for program_index, program_id in enumerate(program_ids):
+        program_dir = output_root / program_id
+        if program_dir.exists():
+            shutil.rmtree(program_dir)
+        _write_program(program_dir, program_id, spec.units)
+        for slot in range(1, spec.units + 1):
+            unit_id = f"{slot:03d}-synthetic-unit-{slot}"
+            unit_dir = program_dir / "units" / unit_id
+            defect = defects.get(program_index * spec.units + slot - 1)
+            bytes_written += _write_unit(unit_dir, unit_id, spec, templates, catalog_version, defect)
+            units.append({"program_id": program_id, "unit_id": unit_id, "unit_dir": str(unit_dir), "defect": defect})
+
+    return {
+        "output_root": str(output_root),
+        "seed": spec.seed,
+        "programs": program_ids,
+        "unit_count": len(units),
+        "defective_unit_count": len(defects),
+        "bytes_written": bytes_written,
+        "units": units,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    repo_root = Path(args.repo_root).resolve()
+    output_root = Path(args.output_root).resolve() if args.output_root else repo_root / "programs"
+
+    template_pack_dir = resolve_template_pack_dir(repo_root, args.template_pack_dir)
+    if template_pack_dir is None:
+        print("ERROR: template pack not found; pass --template-pack-dir or set LCS_TEMPLATE_PACK_DIR", file=sys.stderr)
+        return 1
+    try:
+        catalog = load(template_pack_dir / "catalog.json")
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: invalid template catalog in {template_pack_dir}: {exc}", file=sys.stderr)
+        return 1
+
+    spec = CorpusSpec(
+        programs=args.programs,
+        units=args.units,
+        los=args.los,
+        tasks=args.tasks,
+        exercises=args.exercises,
+        gates=args.gates,
+        artifacts=args.artifacts,
+        artifact_bytes=args.artifact_bytes,
+        defect_rate=args.defect_rate,
+        seed=args.seed,
+        program_prefix=args.program_prefix,
+    )
+    try:
+        summary = generate_corpus(
+            output_root, spec, catalog=catalog, template_pack_dir=template_pack_dir, force=args.force
+        )
+    except (FileExistsError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(summary, separators=(",", ":")))
+    else:
+        print(
+            f"Generated {summary['unit_count']} unit(s) across {len(summary['programs'])} program(s) "
+            f"in {output_root} ({summary['defective_unit_count']} with injected defects, "
+            f"{summary['bytes_written']} bytes)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,8 +9,21 @@ import math
 import os
 import re
 import sys
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
+
+from artifact_models import Brief
+from json_io import dumps, load_json, write_atomic_many
+from keyword_automaton import KeywordAutomaton
+from selection_optimizer import Candidate, SelectionPlan, optimize_selection
+from template_pack_lock import load_lock
+
+try:
+    import numpy as _np  # type: ignore[import-not-found]
+except ImportError:  # NumPy is optional; the pure-Python path yields the same scores.
+    _np = None
 
 
 FORMULA_WEIGHTS = {
@@ -21,6 +34,9 @@ FORMULA_WEIGHTS = {
     "diversity_fit": 0.10,
 }
 
+# Column order of the template x criterion score matrix.
+CRITERIA = tuple(FORMULA_WEIGHTS)
+
 CEFR_ORDER = ["A1", "A2", "B1", "B2", "C1", "C2"]
 
 KEYWORD_HINTS = {
@@ -84,23 +100,17 @@ KEYWORD_HINTS = {
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--repo-root", required=True, help="Factory repository root")
-    parser.add_argument("--unit-dir", required=True, help="Unit directory under programs/<program-id>/units/")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--unit-dir", help="Unit directory under programs/<program-id>/units/")
+    target.add_argument(
+        "--program",
+        help="Select for every unit of programs/<program-id>/units/ in one run, scoring diversity across units",
+    )
     parser.add_argument("--template-pack-dir", help="Override template pack directory")
     parser.add_argument("--json", action="store_true", help="Emit JSON output")
     return parser.parse_args()
 
 
-def load_json(path: Path) -> dict[str, Any] | list[Any] | None:
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:  # noqa: BLE001
-        return None
-
-
-def dump_json(path: Path, payload: dict[str, Any]) -> None:
-    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
-
-
 def resolve_template_pack_dir(repo_root: Path, override: str | None) -> Path | None:
     env_override = os.getenv("LCS_TEMPLATE_PACK_DIR", "").strip()
     if override:
@@ -127,6 +137,31 @@ def resolve_template_pack_dir(repo_root: Path, override: str | None) -> Path | N
     return None
 
 
+def catalog_entries(template_pack_dir: Path, templates: list[Any]) -> list[tuple[str, str, dict[str, Any]]]:
+    """(template_id, exercise_type, entry) for each catalog template with both ids, in catalog order.
+
+    Ids come pre-normalized from catalog.lock.json, rebuilt first if stale.
+    """
+    lock = load_lock(template_pack_dir)
+    if lock is not None:
+        table = [(item["template_id"], item["exercise_type"], item["index"]) for item in lock["templates"]]
+    else:
+        table = [
+            (
+                item.get("template_id", "").strip().lower() if isinstance(item.get("template_id"), str) else "",
+                item.get("exercise_type", "").strip().upper() if isinstance(item.get("exercise_type"), str) else "",
+                index,
+            )
+            for index, item in enumerate(templates)
+            if isinstance(item, dict)
+        ]
+    return [
+        (template_id, exercise_type, templates[index])
+        for template_id, exercise_type, index in table
+        if template_id and exercise_type and index < len(templates) and isinstance(templates[index], dict)
+    ]
+
+
 def derive_contract_version(repo_root: Path) -> str:
     index = load_json(repo_root / "contracts" / "index.json")
     if isinstance(index, dict):
@@ -218,6 +253,34 @@ def _fallback_template_modality(exercise_type: str) -> str:
     return "reading"
 
 
+def _taxonomy_map(catalog: dict[str, Any], key: str) -> dict[str, Any]:
+    taxonomy = catalog.get("taxonomy", {}) if isinstance(catalog.get("taxonomy"), dict) else {}
+    return taxonomy.get(key, {}) if isinstance(taxonomy.get(key), dict) else {}
+
+
+def template_modality(template: dict[str, Any], catalog: dict[str, Any]) -> str:
+    exercise_type = str(template.get("exercise_type", "")).strip().upper()
+    modality = str(_taxonomy_map(catalog, "exercise_type_modality").get(exercise_type, "")).strip().lower()
+    return modality or _fallback_template_modality(exercise_type)
+
+
+def template_domains(template: dict[str, Any], catalog: dict[str, Any]) -> set[str]:
+    exercise_type = str(template.get("exercise_type", "")).strip().upper()
+    domains: set[str] = set()
+    raw_domains = _taxonomy_map(catalog, "exercise_type_domains").get(exercise_type, [])
+    if isinstance(raw_domains, list):
+        domains |= {str(d).strip().lower() for d in raw_domains if isinstance(d, str) and str(d).strip()}
+
+    lo_tags = template.get("lo_tags", [])
+    if isinstance(lo_tags, list):
+        domains |= {str(t).strip().lower() for t in lo_tags if isinstance(t, str) and str(t).strip()}
+    return domains
+
+
+def _normalized_terms(values: list[str]) -> set[str]:
+    return {value.strip().lower() for value in values if isinstance(value, str) and value.strip()}
+
+
 def _proficiency_fit_for_template(
     *,
     template: dict[str, Any],
@@ -228,48 +291,36 @@ def _proficiency_fit_for_template(
     if not requested_modalities and not requested_domains:
         return 0.75
 
-    taxonomy = catalog.get("taxonomy", {}) if isinstance(catalog.get("taxonomy"), dict) else {}
-    modality_map = (
-        taxonomy.get("exercise_type_modality", {})
-        if isinstance(taxonomy.get("exercise_type_modality"), dict)
-        else {}
-    )
-    domain_map = (
-        taxonomy.get("exercise_type_domains", {})
-        if isinstance(taxonomy.get("exercise_type_domains"), dict)
-        else {}
-    )
-
-    exercise_type = str(template.get("exercise_type", "")).strip().upper()
-    template_modality = str(modality_map.get(exercise_type, "")).strip().lower()
-    if not template_modality:
-        template_modality = _fallback_template_modality(exercise_type)
-
-    template_domains: set[str] = set()
-    raw_domains = domain_map.get(exercise_type, [])
-    if isinstance(raw_domains, list):
-        template_domains |= {str(d).strip().lower() for d in raw_domains if isinstance(d, str) and str(d).strip()}
-
-    lo_tags = template.get("lo_tags", [])
-    if isinstance(lo_tags, list):
-        template_domains |= {str(t).strip().lower() for t in lo_tags if isinstance(t, str) and str(t).strip()}
-
-    rm = {m.strip().lower() for m in requested_modalities if isinstance(m, str) and m.strip()}
-    rd = {d.strip().lower() for d in requested_domains if isinstance(d, str) and d.strip()}
+    rm = _normalized_terms(requested_modalities)
+    rd = _normalized_terms(requested_domains)
 
     if rm:
-        modality_score = 1.0 if template_modality in rm else 0.35
+        modality_score = 1.0 if template_modality(template, catalog) in rm else 0.35
     else:
         modality_score = 0.75
 
     if rd:
-        domain_score = 1.0 if (template_domains & rd) else 0.5
+        domain_score = 1.0 if (template_domains(template, catalog) & rd) else 0.5
     else:
         domain_score = 0.75
 
     return round(0.6 * modality_score + 0.4 * domain_score, 4)
 
 
+def coverage_requirements(requested_modalities: list[str], requested_domains: list[str]) -> set[str]:
+    """Requirement keys the selected set must cover, as matched by ``template_coverage``."""
+    return {f"modality:{value}" for value in _normalized_terms(requested_modalities)} | {
+        f"domain:{value}" for value in _normalized_terms(requested_domains)
+    }
+
+
+def template_coverage(template: dict[str, Any], catalog: dict[str, Any]) -> frozenset[str]:
+    return frozenset(
+        {f"modality:{template_modality(template, catalog)}"}
+        | {f"domain:{value}" for value in template_domains(template, catalog)}
+    )
+
+
 def level_fit_for_template(level: str, supported_levels: list[str]) -> float:
     normalized = [str(item).strip().upper() for item in supported_levels if isinstance(item, str)]
     if not normalized:
@@ -295,38 +346,53 @@ def level_fit_for_template(level: str, supported_levels: list[str]) -> float:
     return 0.5
 
 
-def extract_lo_text(brief: dict[str, Any]) -> str:
+def extract_lo_text(brief: Brief | None) -> str:
+    if brief is None:
+        return ""
     chunks: list[str] = []
-    outcomes = brief.get("learning_outcomes", [])
-    if isinstance(outcomes, list):
-        for item in outcomes:
-            if not isinstance(item, dict):
-                continue
-            for key in ("statement", "evidence"):
-                value = item.get(key)
-                if isinstance(value, str):
-                    chunks.append(value)
-            criteria = item.get("acceptance_criteria", [])
-            if isinstance(criteria, list):
-                chunks.extend(str(c) for c in criteria if isinstance(c, str))
+    for outcome in brief.learning_outcomes or ():
+        if outcome.statement is not None:
+            chunks.append(outcome.statement)
+        if outcome.evidence is not None:
+            chunks.append(outcome.evidence)
+        chunks.extend(outcome.acceptance_criteria or ())
     return " ".join(chunks).lower()
 
 
+_KEYWORD_AUTOMATON: KeywordAutomaton | None = None
+
+
+def keyword_automaton() -> KeywordAutomaton:
+    """The KEYWORD_HINTS automaton, built on first use and reused for every unit in the process."""
+    global _KEYWORD_AUTOMATON
+    if _KEYWORD_AUTOMATON is None:
+        _KEYWORD_AUTOMATON = KeywordAutomaton(KEYWORD_HINTS)
+    return _KEYWORD_AUTOMATON
+
+
 def keyword_hits(text: str, exercise_type: str) -> int:
-    hints = KEYWORD_HINTS.get(exercise_type.upper(), [])
-    return sum(text.count(token) for token in hints)
+    return keyword_automaton().counts(text).get(exercise_type.upper(), 0)
 
 
-def lo_fit_for_template(lo_text: str, templates: list[dict[str, Any]], target: dict[str, Any]) -> float:
-    exercise_type = str(target.get("exercise_type", "")).upper()
-    counts = [keyword_hits(lo_text, str(item.get("exercise_type", ""))) for item in templates]
-    my_hits = keyword_hits(lo_text, exercise_type)
+def keyword_hit_vector(text: str) -> dict[str, int]:
+    """keyword_hits() of ``text`` for every KEYWORD_HINTS exercise type, from a single pass."""
+    return keyword_automaton().counts(text)
+
 
-    max_hits = max(counts) if counts else 0
+def lo_fit_scores(hit_vector: dict[str, int], templates: list[Any], targets: list[dict[str, Any]]) -> list[float]:
+    """lo_fit of each of ``targets``, relative to the best keyword match among all catalog ``templates``."""
+
+    def _hits(item: dict[str, Any]) -> int:
+        return hit_vector.get(str(item.get("exercise_type", "")).upper(), 0)
+
+    max_hits = max((_hits(item) for item in templates if isinstance(item, dict)), default=0)
     if max_hits <= 0:
-        return 0.8
+        return [0.8] * len(targets)
+    return [round(0.6 + 0.4 * (_hits(target) / max_hits), 4) for target in targets]
 
-    return round(0.6 + 0.4 * (my_hits / max_hits), 4)
+
+def lo_fit_for_template(lo_text: str, templates: list[dict[str, Any]], target: dict[str, Any]) -> float:
+    return lo_fit_scores(keyword_hit_vector(lo_text), templates, [target])[0]
 
 
 def duration_fit_for_template(duration_minutes: int, lo_count: int, estimated_time: float) -> float:
@@ -338,12 +404,14 @@ def duration_fit_for_template(duration_minutes: int, lo_count: int, estimated_ti
     return round(max(0.4, 1.0 - drift), 4)
 
 
-def diversity_fit_for_template(template_id: str, existing_selection: dict[str, Any] | None) -> float:
-    if not isinstance(existing_selection, dict):
-        return 1.0
-
-    selected = existing_selection.get("selected_templates", [])
-    count = 0
+def diversity_fit_for_template(
+    template_id: str,
+    existing_selection: dict[str, Any] | None,
+    program_usage: Mapping[str, int] | None = None,
+) -> float:
+    """Lower for templates the unit already selected and, in --program mode, other units selected."""
+    count = program_usage.get(template_id, 0) if program_usage is not None else 0
+    selected = existing_selection.get("selected_templates", []) if isinstance(existing_selection, dict) else []
     if isinstance(selected, list):
         for item in selected:
             if not isinstance(item, dict):
@@ -354,6 +422,28 @@ def diversity_fit_for_template(template_id: str, existing_selection: dict[str, A
     return round(max(0.4, 1.0 - 0.2 * count), 4)
 
 
+def weighted_scores(matrix: list[list[float]]) -> list[float]:
+    """FORMULA_WEIGHTS total of each row of a template x CRITERIA score matrix.
+
+    Columns are accumulated left to right, one multiply and one add per cell, so the NumPy
+    and pure-Python paths produce bit-identical floats.
+    """
+    weights = [FORMULA_WEIGHTS[key] for key in CRITERIA]
+    if _np is not None and matrix:
+        values = _np.asarray(matrix, dtype=_np.float64)
+        totals = _np.zeros(len(matrix), dtype=_np.float64)
+        for column, weight in enumerate(weights):
+            totals += weight * values[:, column]
+        return totals.tolist()
+    scores: list[float] = []
+    for row in matrix:
+        score = 0.0
+        for value, weight in zip(row, weights):
+            score += weight * value
+        scores.append(score)
+    return scores
+
+
 def normalize_distribution(values: list[float]) -> list[int]:
     if not values:
         return []
@@ -389,40 +479,58 @@ def build_rationale(score_breakdown: dict[str, float], exercise_type: str) -> st
     return f"Selected {exercise_type} due to {phrase} in weighted scoring."
 
 
-def main() -> int:
-    args = parse_args()
+class SelectorError(RuntimeError):
+    pass
 
-    repo_root = Path(args.repo_root).resolve()
-    unit_dir = Path(args.unit_dir).resolve()
-    if not unit_dir.is_dir():
-        print(f"Unit directory not found: {unit_dir}", file=sys.stderr)
-        return 1
 
-    template_pack_dir = resolve_template_pack_dir(repo_root, args.template_pack_dir)
-    if template_pack_dir is None:
-        payload = {
-            "STATUS": "BLOCK",
-            "REASON": "template-pack-not-found",
-            "UNIT_DIR": str(unit_dir),
-        }
-        print(
-            json.dumps(payload, separators=(",", ":"))
-            if args.json
-            else "Template pack not found; selector blocked."
-        )
-        return 1
+@dataclass
+class SelectorInputs:
+    """Template-pack and repository inputs shared by every unit selected in one run."""
+
+    repo_root: Path
+    template_pack_dir: Path
+    catalog: dict[str, Any]
+    templates: list[Any]
+    entries: list[tuple[str, str, dict[str, Any]]]
+    contract_version: str
+    _registries: tuple[Any, Any] | None = None
 
+    def proficiency_registries(self) -> tuple[Any, Any]:
+        """(crosswalks, pivots), loaded on first use; raises when lcs_cli cannot load them."""
+        if self._registries is None:
+            from lcs_cli.proficiency.registry import load_crosswalks, load_subject_pivots  # type: ignore
+
+            self._registries = (load_crosswalks(self.repo_root), load_subject_pivots(self.repo_root))
+        return self._registries
+
+
+def load_selector_inputs(repo_root: Path, template_pack_dir: Path) -> SelectorInputs:
     catalog_path = template_pack_dir / "catalog.json"
     catalog = load_json(catalog_path)
     if not isinstance(catalog, dict):
-        print(f"Invalid template catalog: {catalog_path}", file=sys.stderr)
-        return 1
-
+        raise SelectorError(f"Invalid template catalog: {catalog_path}")
     templates = catalog.get("templates", [])
     if not isinstance(templates, list) or not templates:
-        print(f"Template catalog has no templates: {catalog_path}", file=sys.stderr)
-        return 1
+        raise SelectorError(f"Template catalog has no templates: {catalog_path}")
+    return SelectorInputs(
+        repo_root=repo_root,
+        template_pack_dir=template_pack_dir,
+        catalog=catalog,
+        templates=templates,
+        entries=catalog_entries(template_pack_dir, templates),
+        contract_version=derive_contract_version(repo_root),
+    )
+
 
+def select_templates(
+    inputs: SelectorInputs,
+    unit_dir: Path,
+    program_usage: Mapping[str, int] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any], SelectionPlan]:
+    """(assessment blueprint, template selection, constraint plan) for ``unit_dir``; nothing is written.
+
+    ``program_usage`` counts the templates already selected for other units of the program.
+    """
     brief = load_json(unit_dir / "brief.json")
     design = load_json(unit_dir / "design.json")
     if not isinstance(brief, dict):
@@ -447,12 +555,10 @@ def main() -> int:
     proficiency_targets = _extract_proficiency_targets(brief)
     if proficiency_targets:
         try:
-            from lcs_cli.proficiency.registry import load_crosswalks, load_subject_pivots  # type: ignore
+            crosswalks, pivots = inputs.proficiency_registries()
             from lcs_cli.proficiency.normalize import normalize_targets_to_pivot  # type: ignore
 
-            crosswalks = load_crosswalks(repo_root)
-            pivots = load_subject_pivots(repo_root)
-            subject_hint = str(catalog.get("subject", "english"))
+            subject_hint = str(inputs.catalog.get("subject", "english"))
             proficiency_context = normalize_targets_to_pivot(
                 brief_targets=proficiency_targets,
                 subject=subject_hint,
@@ -476,44 +582,40 @@ def main() -> int:
         except Exception:  # noqa: BLE001
             proficiency_context = None
     duration_minutes = int(brief.get("duration_minutes", 60)) if isinstance(brief.get("duration_minutes", 60), int) else 60
-    lo_text = extract_lo_text(brief)
-    learning_outcomes = brief.get("learning_outcomes", []) if isinstance(brief.get("learning_outcomes"), list) else []
-    lo_ids = [
-        item.get("lo_id")
-        for item in learning_outcomes
-        if isinstance(item, dict) and isinstance(item.get("lo_id"), str)
-    ]
+    brief_record = Brief.from_json(brief)
+    learning_outcomes = brief_record.learning_outcomes if brief_record is not None else None
+    lo_text = extract_lo_text(brief_record)
+    lo_ids = [outcome.lo_id for outcome in learning_outcomes or () if outcome.lo_id is not None]
     if not lo_ids:
         lo_ids = ["LO1"]
 
-    ranked: list[dict[str, Any]] = []
-    for item in templates:
-        if not isinstance(item, dict):
-            continue
-
-        template_id = str(item.get("template_id", "")).strip().lower()
-        exercise_type = str(item.get("exercise_type", "")).strip().upper()
-        if not template_id or not exercise_type:
-            continue
-
+    entries = inputs.entries
+    lo_fits = lo_fit_scores(keyword_hit_vector(lo_text), inputs.templates, [item for _, _, item in entries])
+    matrix: list[list[float]] = []
+    minutes: list[float] = []
+    for (template_id, _, item), lo_fit in zip(entries, lo_fits):
         estimated_time = float(item.get("estimated_time_minutes", 3))
-        score_breakdown = {
+        minutes.append(estimated_time)
+        criteria = {
             "proficiency_fit": _proficiency_fit_for_template(
                 template=item,
-                catalog=catalog,
+                catalog=inputs.catalog,
                 requested_modalities=requested_modalities,
                 requested_domains=requested_domains,
             ),
-            "lo_fit": lo_fit_for_template(lo_text, templates, item),
+            "lo_fit": lo_fit,
             "level_fit": level_fit_for_template(level, item.get("supported_levels", [])),
             "duration_fit": duration_fit_for_template(duration_minutes, len(lo_ids), estimated_time),
-            "diversity_fit": diversity_fit_for_template(template_id, existing_selection),
+            "diversity_fit": diversity_fit_for_template(template_id, existing_selection, program_usage),
         }
+        matrix.append([criteria[key] for key in CRITERIA])
 
-        score = 0.0
-        for key, weight in FORMULA_WEIGHTS.items():
-            score += weight * score_breakdown[key]
-
+    ranked: list[dict[str, Any]] = []
+    candidates: list[Candidate] = []
+    for (template_id, exercise_type, item), row, score, estimated_time in zip(
+        entries, matrix, weighted_scores(matrix), minutes
+    ):
+        score_breakdown = dict(zip(CRITERIA, row))
         ranked.append(
             {
                 "template_id": template_id,
@@ -523,22 +625,31 @@ def main() -> int:
                 "rationale": build_rationale(score_breakdown, exercise_type),
             }
         )
+        candidates.append(
+            Candidate(
+                key=template_id,
+                exercise_type=exercise_type,
+                score=ranked[-1]["score"],
+                minutes=estimated_time,
+                covers=template_coverage(item, inputs.catalog),
+            )
+        )
 
-    ranked.sort(key=lambda value: (-value["score"], value["template_id"]))
-
+    # Up to top_k templates: requested modalities/domains covered, one per exercise type, within
+    # the unit's minutes; the highest summed score among those sets.
     top_k = min(3, len(ranked))
-    selected = ranked[:top_k]
+    plan = optimize_selection(
+        candidates,
+        k=top_k,
+        requirements=coverage_requirements(requested_modalities, requested_domains),
+        budget=float(duration_minutes) if duration_minutes > 0 else None,
+    )
+    selected = [ranked[index] for index in plan.chosen]
 
     default_ratios: list[float] = []
     all_template_ids: list[str] = []
     all_exercise_types: list[str] = []
-    for item in templates:
-        if not isinstance(item, dict):
-            continue
-        template_id = str(item.get("template_id", "")).strip().lower()
-        exercise_type = str(item.get("exercise_type", "")).strip().upper()
-        if not template_id or not exercise_type:
-            continue
+    for template_id, exercise_type, item in entries:
         all_template_ids.append(template_id)
         all_exercise_types.append(exercise_type)
         value = item.get("default_ratio_percent")
@@ -557,9 +668,9 @@ def main() -> int:
         for idx in range(len(all_template_ids))
     ]
 
-    contract_version = derive_contract_version(repo_root)
-    catalog_version = str(catalog.get("catalog_version", "1.0.0"))
-    subject = str(catalog.get("subject", "english"))
+    contract_version = inputs.contract_version
+    catalog_version = str(inputs.catalog.get("catalog_version", "1.0.0"))
+    subject = str(inputs.catalog.get("subject", "english"))
 
     blueprint = {
         "contract_version": contract_version,
@@ -582,11 +693,130 @@ def main() -> int:
     }
     if proficiency_context is not None:
         selection["proficiency_context"] = proficiency_context
+    return blueprint, selection, plan
+
+
+def describe_plan(summary: dict[str, Any]) -> str:
+    """One-line text form of ``SelectionPlan.summary()``."""
+    parts = [f"covered {len(summary['covered'])}/{len(summary['requested'])}"]
+    if summary["uncovered"]:
+        parts.append("uncovered " + ", ".join(summary["uncovered"]))
+    budget = summary["budget_minutes"]
+    parts.append(f"minutes {summary['minutes']:g}" + (f"/{budget:g}" if budget is not None else ""))
+    if summary["budget_relaxed"]:
+        parts.append("budget relaxed")
+    if not summary["exhaustive"]:
+        parts.append("search truncated")
+    return "; ".join(parts)
+
+
+def _selection_files(
+    unit_dir: Path, blueprint: dict[str, Any], selection: dict[str, Any]
+) -> list[tuple[Path, bytes]]:
+    return [
+        (unit_dir / "assessment-blueprint.json", dumps(blueprint).encode("utf-8")),
+        (unit_dir / "template-selection.json", dumps(selection).encode("utf-8")),
+    ]
+
+
+def _program_units(repo_root: Path, program: str) -> list[Path]:
+    units_root = repo_root / "programs" / program / "units"
+    if not units_root.is_dir():
+        return []
+    return sorted(path.resolve() for path in units_root.iterdir() if path.is_dir())
+
+
+def _run_program(inputs: SelectorInputs, program: str, units: list[Path], as_json: bool) -> int:
+    # Units are selected in path order; each one's picks count against the units after it.
+    usage: Counter[str] = Counter()
+    files: list[tuple[Path, bytes]] = []
+    results: list[dict[str, Any]] = []
+    for unit_dir in units:
+        blueprint, selection, plan = select_templates(inputs, unit_dir, usage)
+        selected_ids = [item["template_id"] for item in selection["selected_templates"]]
+        usage.update(selected_ids)
+        files.extend(_selection_files(unit_dir, blueprint, selection))
+        results.append(
+            {
+                "UNIT_DIR": str(unit_dir),
+                "ASSESSMENT_BLUEPRINT_FILE": str(unit_dir / "assessment-blueprint.json"),
+                "TEMPLATE_SELECTION_FILE": str(unit_dir / "template-selection.json"),
+                "TOP_K": selection["top_k"],
+                "SELECTED_TEMPLATES": selected_ids,
+                "SELECTION_CONSTRAINTS": plan.summary(),
+            }
+        )
+    # Every unit's files are staged before any is replaced, so a failed write changes none of them.
+    write_atomic_many(files)
+
+    template_usage = dict(sorted(usage.items(), key=lambda item: (-item[1], item[0])))
+    if as_json:
+        payload = {
+            "STATUS": "PASS",
+            "PROGRAM": program,
+            "TEMPLATE_PACK_DIR": str(inputs.template_pack_dir),
+            "UNIT_COUNT": len(results),
+            "UNITS": results,
+            "TEMPLATE_USAGE": template_usage,
+        }
+        print(json.dumps(payload, separators=(",", ":")))
+    else:
+        print("STATUS: PASS")
+        print(f"PROGRAM: {program}")
+        print(f"TEMPLATE_PACK_DIR: {inputs.template_pack_dir}")
+        print(f"UNIT_COUNT: {len(results)}")
+        for result in results:
+            print(f"UNIT: {result['UNIT_DIR']} -> {', '.join(result['SELECTED_TEMPLATES'])}")
+            print(f"  SELECTION_CONSTRAINTS: {describe_plan(result['SELECTION_CONSTRAINTS'])}")
+        print("TEMPLATE_USAGE: " + ", ".join(f"{key}={value}" for key, value in template_usage.items()))
+    return 0
+
+
+def main() -> int:
+    args = parse_args()
+
+    repo_root = Path(args.repo_root).resolve()
+    if args.program:
+        units = _program_units(repo_root, args.program)
+        if not units:
+            print(f"No units found for program: {args.program}", file=sys.stderr)
+            return 1
+        target = {"PROGRAM": args.program}
+    else:
+        unit_dir = Path(args.unit_dir).resolve()
+        if not unit_dir.is_dir():
+            print(f"Unit directory not found: {unit_dir}", file=sys.stderr)
+            return 1
+        target = {"UNIT_DIR": str(unit_dir)}
+
+    template_pack_dir = resolve_template_pack_dir(repo_root, args.template_pack_dir)
+    if template_pack_dir is None:
+        payload = {
+            "STATUS": "BLOCK",
+            "REASON": "template-pack-not-found",
+            **target,
+        }
+        print(
+            json.dumps(payload, separators=(",", ":"))
+            if args.json
+            else "Template pack not found; selector blocked."
+        )
+        return 1
+
+    try:
+        inputs = load_selector_inputs(repo_root, template_pack_dir)
+    except SelectorError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+
+    if args.program:
+        return _run_program(inputs, args.program, units, args.json)
 
+    blueprint, selection, plan = select_templates(inputs, unit_dir)
     blueprint_path = unit_dir / "assessment-blueprint.json"
     selection_path = unit_dir / "template-selection.json"
-    dump_json(blueprint_path, blueprint)
-    dump_json(selection_path, selection)
+    write_atomic_many(_selection_files(unit_dir, blueprint, selection))
+    top_k = selection["top_k"]
 
     payload = {
         "STATUS": "PASS",
@@ -595,6 +825,7 @@ def main() -> int:
         "ASSESSMENT_BLUEPRINT_FILE": str(blueprint_path),
         "TEMPLATE_SELECTION_FILE": str(selection_path),
         "TOP_K": top_k,
+        "SELECTION_CONSTRAINTS": plan.summary(),
     }
 
     if args.json:
@@ -606,6 +837,7 @@ def main() -> int:
         print(f"ASSESSMENT_BLUEPRINT_FILE: {blueprint_path}")
         print(f"TEMPLATE_SELECTION_FILE: {selection_path}")
         print(f"TOP_K: {top_k}")
+        print(f"SELECTION_CONSTRAINTS: {describe_plan(plan.summary())}")
 
     return 0
 
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Shared JSON reading and writing for the factory scripts.
+
+Reads take the file's bytes once and parse them with orjson or msgspec when
+either is importable, falling back to the stdlib. Accelerated parsers accept a
+slightly different input set than ``json`` (e.g. they reject NaN), so a
+document they refuse is re-parsed with the stdlib before it is reported as
+invalid, and parsed values and error messages never depend on the backend.
+
+Writes always encode with the stdlib, so output bytes are identical whichever
+backend is installed, and land atomically through a temp file in the target
+directory plus ``os.replace``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+_BACKEND_ENV = "LCS_JSON_BACKEND"
+
+
+def _select_backend() -> tuple[str, Callable[[bytes], Any] | None]:
+    requested = os.getenv(_BACKEND_ENV, "").strip().lower()
+    if requested in {"", "orjson"}:
+        try:
+            import orjson  # type: ignore[import-not-found]
+
+            return "orjson", orjson.loads
+        except ImportError:
+            pass
+    if requested in {"", "msgspec"}:
+        try:
+            import msgspec  # type: ignore[import-not-found]
+
+            return "msgspec", msgspec.json.Decoder().decode
+        except ImportError:
+            pass
+    return "json", None
+
+
+BACKEND, _fast_loads = _select_backend()
+
+# Some orjson releases decode integers beyond 64 bits as floats instead of rejecting them; documents
+# with digit runs that long are rare, so hand them straight to the stdlib.
+_LONG_DIGITS = re.compile(rb"\d{19,}")
+
+_stats_lock = threading.Lock()
+_STATS = {"reads": 0, "bytes_read": 0, "parses": 0, "parse_ns": 0, "writes": 0, "bytes_written": 0}
+
+
+def _count(**deltas: int) -> None:
+    with _stats_lock:
+        for key, value in deltas.items():
+            _STATS[key] += value
+
+
+def io_stats() -> dict[str, Any]:
+    """Process-wide counters since start (or the last ``reset_io_stats``)."""
+    with _stats_lock:
+        snapshot = dict(_STATS)
+    parse_ns = snapshot.pop("parse_ns")
+    return {"backend": BACKEND, **snapshot, "parse_ms": round(parse_ns / 1e6, 3)}
+
+
+def reset_io_stats() -> None:
+    with _stats_lock:
+        for key in _STATS:
+            _STATS[key] = 0
+
+
+def loads(raw: bytes | str) -> Any:
+    """Parse a JSON document; raises ``ValueError`` (``json.JSONDecodeError`` or ``UnicodeDecodeError``)."""
+    started = time.perf_counter_ns()
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    try:
+        if _fast_loads is not None and not _LONG_DIGITS.search(raw):
+            try:
+                return _fast_loads(raw)
+            except Exception:  # noqa: BLE001 - backend error types differ; the stdlib has the final say.
+                # Let the stdlib decide, so acceptance and error text match the fallback backend.
+                pass
+        return json.loads(raw.decode("utf-8"))
+    finally:
+        _count(parses=1, parse_ns=time.perf_counter_ns() - started)
+
+
+def read_bytes(path: Path) -> bytes:
+    raw = Path(path).read_bytes()
+    _count(reads=1, bytes_read=len(raw))
+    return raw
+
+
+def load(path: Path) -> Any:
+    """Read and parse ``path``; raises ``OSError`` or ``ValueError``."""
+    return loads(read_bytes(path))
+
+
+def load_json(path: Path) -> Any | None:
+    """Parsed document, or None when the file is missing, unreadable or not valid JSON."""
+    try:
+        return load(path)
+    except (OSError, ValueError, RecursionError):
+        return None
+
+
+def load_json_object(path: Path) -> dict[str, Any] | None:
+    payload = load_json(path)
+    return payload if isinstance(payload, dict) else None
+
+
+def dumps(payload: Any, *, indent: int | None = 2, sort_keys: bool = False, ensure_ascii: bool = True) -> str:
+    """Canonical text: ``indent`` spaces plus a trailing newline, or compact when ``indent`` is None."""
+    if indent is None:
+        return json.dumps(payload, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+    return json.dumps(payload, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii) + "\n"
+
+
+def _stage(path: Path, data: bytes) -> Path:
+    """Write ``data`` to a temp file beside ``path``, ready to be moved over it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per thread so concurrent writers in one process never share a temp file; the .tmp
+    # suffix keeps watchers (unit_watcher.is_ignored) from reacting to it.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        mode = None
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+        if mode is not None:
+            # Match write_text(), which keeps an existing file's permissions.
+            os.chmod(tmp_path, mode)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path
+
+
+def write_atomic(path: Path, data: bytes) -> int:
+    """Replace ``path`` with ``data`` so readers never observe a partial file. Returns bytes written."""
+    return write_atomic_many([(path, data)])
+
+
+def write_atomic_many(files: Iterable[tuple[Path, bytes]]) -> int:
+    """Replace several files: all are staged before any is moved into place. Returns bytes written.
+
+    A failure while staging (disk full, permissions) leaves every target untouched. Each
+    replacement is atomic; the batch as a whole is not, so a crash between two renames can
+    still leave the earlier targets updated.
+    """
+    staged: list[tuple[Path, Path, int]] = []
+    try:
+        for path, data in files:
+            path = Path(path)
+            staged.append((_stage(path, data), path, len(data)))
+        for tmp_path, path, _ in staged:
+            os.replace(tmp_path, path)
+    except BaseException:
+        for tmp_path, _, _ in staged:
+            tmp_path.unlink(missing_ok=True)
+        raise
+    written = sum(size for _, _, size in staged)
+    _count(writes=len(staged), bytes_written=written)
+    return written
+
+
+def dump_json(
+    path: Path, payload: Any, *, indent: int | None = 2, sort_keys: bool = False, ensure_ascii: bool = True
+) -> int:
+    """Write ``dumps(payload, ...)`` to ``path`` atomically; returns bytes written."""
+    text = dumps(payload, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+    return write_atomic(path, text.encode("utf-8"))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Aho-Corasick matching of categorized hint tokens in one pass over the text.
+
+The selector's ``KEYWORD_HINTS`` and the trend fetcher's topic hints are tables of
+``category -> tokens``. Scanning a text once per token costs O(tokens x text). A
+``KeywordAutomaton`` is built once per vocabulary. It then reads the text once, whatever
+the number of tokens, and returns every category's hit count.
+
+Counts follow ``str.count``: each token's occurrences are counted left to right without
+overlapping. A token listed in several categories (or twice in one) counts for each listing.
+Matching is case-sensitive; callers pass lowercased text, as the tables are lowercase.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Mapping
+
+
+class KeywordAutomaton:
+    """A deterministic Aho-Corasick automaton over the tokens of ``categories``."""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]) -> None:
+        self.categories = tuple(categories)
+        token_ids: dict[str, int] = {}
+        # token id -> category index per listing (a token can be listed more than once).
+        listings: list[list[int]] = []
+        for index, category in enumerate(self.categories):
+            for token in categories[category]:
+                if not token:
+                    raise ValueError(f"empty hint token in category {category!r}")
+                token_id = token_ids.setdefault(token, len(token_ids))
+                if token_id == len(listings):
+                    listings.append([])
+                listings[token_id].append(index)
+        self._token_lengths = [len(token) for token in token_ids]
+        self._listings = listings
+
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for token, token_id in token_ids.items():
+            state = 0
+            for char in token:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(token_id)
+
+        # Breadth-first: complete every state's transitions over the token alphabet, so matching
+        # never walks failure links, and fold each state's suffix outputs into its own.
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+            delta[state] = dict(delta[fail[state]])
+            for char, next_state in goto[state].items():
+                fail[next_state] = delta[fail[state]].get(char, 0)
+                delta[state][char] = next_state
+                queue.append(next_state)
+        self._delta = delta
+        self._outputs = [tuple(items) for items in outputs]
+
+    def counts(self, text: str) -> dict[str, int]:
+        """Hit count of every category in ``text`` (zero included), in category order."""
+        totals = [0] * len(self.categories)
+        last_end: dict[int, int] = {}
+        delta, outputs, lengths = self._delta, self._outputs, self._token_lengths
+        state = 0
+        for end, char in enumerate(text, start=1):
+            state = delta[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            for token_id in outputs[state]:
+                # Same-token matches arrive in order; skipping overlaps reproduces str.count.
+                if end - lengths[token_id] >= last_end.get(token_id, 0):
+                    last_end[token_id] = end
+                    for index in self._listings[token_id]:
+                        totals[index] += 1
+        return dict(zip(self.categories, totals))
+
+    def present(self, text: str) -> set[str]:
+        """Categories with at least one token in ``text``."""
+        return {category for category, count in self.counts(text).items() if count}
@@ -11,6 +11,8 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from json_io import load as _load_json
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -23,10 +25,6 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def _to_non_negative_int(value: Any, default: int = 0) -> int:
     try:
         parsed = int(value)
@@ -17,6 +17,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from artifact_models import ManifestGateStatus
+from json_io import load_json_object
+
 TIMESTAMP_SUFFIX = re.compile(r"-\d{8}-\d{4}(?:-\d{2})?$")
 UNIT_SLOT_PATTERN = re.compile(r"^(\d{3})-")
 DESIGN_REQUIRED_FILES = (
@@ -72,11 +75,7 @@ def parse_program_timestamp(program_id: str) -> datetime | None:
 
 
 def read_json(path: Path) -> dict[str, Any]:
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
-    return payload if isinstance(payload, dict) else {}
+    return load_json_object(path) or {}
 
 
 def read_context(path: Path) -> str:
@@ -187,12 +186,9 @@ def unit_workflow_status(program_id: str, unit_dir: Path, active_unit: str) -> d
     audit_complete = audit_json.is_file()
 
     manifest_payload = read_json(manifest_file) if manifest_file.is_file() else {}
-    gate_status = manifest_payload.get("gate_status", {}) if isinstance(manifest_payload, dict) else {}
-    gate_decision = ""
-    if isinstance(gate_status, dict):
-        raw_decision = gate_status.get("decision", "")
-        if isinstance(raw_decision, str):
-            gate_decision = raw_decision.upper()
+    # Only gate_status is needed, so decode just that record rather than the whole manifest.
+    gate_status = ManifestGateStatus.from_json(manifest_payload.get("gate_status"))
+    gate_decision = gate_status.decision.upper() if gate_status is not None and gate_status.decision else ""
 
     if not brief_json_file.is_file():
         stage = "define"
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Opt-in cProfile + tracemalloc capture for validator phases (`--profile`)."""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+TOP_FUNCTIONS = 10
+# Collapsed-stack frames below this many microseconds are folded into their parent.
+MIN_STACK_US = 10
+MAX_STACK_DEPTH = 64
+
+_FunctionKey = tuple[str, int, str]
+
+
+def _label(func: _FunctionKey) -> str:
+    filename, line, name = func
+    if filename == "~":
+        # Builtins are reported by cProfile as ('~', 0, "<built-in method ...>").
+        return name
+    return f"{Path(filename).name}:{line}({name})"
+
+
+def _top_functions(stats: pstats.Stats, limit: int) -> list[dict[str, Any]]:
+    entries = stats.stats  # type: ignore[attr-defined]
+    ranked = sorted(entries.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        {
+            "function": _label(func),
+            "calls": total_calls,
+            "primitive_calls": primitive_calls,
+            "self_ms": round(self_time * 1000, 3),
+            "cumulative_ms": round(cumulative * 1000, 3),
+        }
+        for func, (primitive_calls, total_calls, self_time, cumulative, _callers) in ranked
+    ]
+
+
+def collapsed_stacks(stats: pstats.Stats, root: str) -> list[str]:
+    """Approximate collapsed stacks (``a;b;c <microseconds>``) from cProfile's caller graph.
+
+    cProfile records caller->callee edges rather than full stacks, so each function's time is
+    split across its call paths in proportion to the cumulative time of each incoming edge (the
+    usual gprof-style attribution). Recursive edges are cut.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    callees: dict[_FunctionKey, list[tuple[_FunctionKey, float]]] = {}
+    for func, (_cc, _nc, _tt, _ct, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    roots = [func for func, (_cc, _nc, _tt, _ct, callers) in entries.items() if not callers]
+
+    totals: dict[str, float] = {}
+
+    def _walk(func: _FunctionKey, share: float, path: tuple[str, ...], seen: frozenset[_FunctionKey]) -> None:
+        _cc, _nc, self_time, cumulative, _callers = entries[func]
+        if cumulative <= 0 or share * 1e6 < MIN_STACK_US:
+            return
+        path = path + (_label(func),)
+        share = min(share, cumulative)
+        ratio = share / cumulative
+        self_share = min(self_time * ratio, share)
+        children = callees.get(func, [])
+        # Recursion inflates per-edge cumulative times; never hand children more than this frame owns.
+        child_total = sum(edge_time for _callee, edge_time in children) * ratio
+        if child_total > share - self_share:
+            ratio *= (share - self_share) / child_total
+        if len(path) < MAX_STACK_DEPTH:
+            for callee, edge_time in children:
+                if callee in seen:
+                    self_share += edge_time * ratio
+                    continue
+                child_share = edge_time * ratio
+                if child_share * 1e6 < MIN_STACK_US:
+                    self_share += child_share
+                    continue
+                _walk(callee, child_share, path, seen | {callee})
+        else:
+            self_share = share
+        key = ";".join(path)
+        totals[key] = totals.get(key, 0.0) + self_share
+
+    for func in roots:
+        _walk(func, entries[func][3], (root,), frozenset({func}))
+    return [f"{stack} {round(value * 1e6)}" for stack, value in sorted(totals.items()) if round(value * 1e6) > 0]
+
+
+@dataclass(frozen=True)
+class PhaseProfile:
+    """Profile of one phase call: the JSON ``profile`` block plus collapsed stacks for flamegraphs."""
+
+    block: dict[str, Any]
+    stacks: list[str]
+
+
+def profile_call(label: str, func: Callable[..., T], *args: Any) -> tuple[T, PhaseProfile]:
+    """Run ``func(*args)`` under cProfile and tracemalloc.
+
+    Callers must not profile concurrently: tracemalloc is process-wide and only one cProfile
+    profiler can be active at a time, so profiled pipelines run their phases sequentially.
+    """
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    profiler = cProfile.Profile()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    profiler.enable()
+    try:
+        result = func(*args)
+    finally:
+        profiler.disable()
+        wall_ms = (time.perf_counter() - wall_start) * 1000
+        cpu_ms = (time.process_time() - cpu_start) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+
+    allocated_bytes = 0
+    allocated_blocks = 0
+    for diff in after.compare_to(before, "lineno"):
+        if diff.size_diff > 0:
+            allocated_bytes += diff.size_diff
+        if diff.count_diff > 0:
+            allocated_blocks += diff.count_diff
+
+    stats = pstats.Stats(profiler)
+    block = {
+        "wall_ms": round(wall_ms, 3),
+        "cpu_ms": round(cpu_ms, 3),
+        "function_calls": stats.total_calls,  # type: ignore[attr-defined]
+        "top_functions": _top_functions(stats, TOP_FUNCTIONS),
+        "memory": {
+            "peak_bytes": max(peak - baseline, 0),
+            "allocated_bytes": allocated_bytes,
+            "allocated_blocks": allocated_blocks,
+        },
+    }
+    return result, PhaseProfile(block, collapsed_stacks(stats, label))
+
+
+def write_collapsed(path: Path, stacks: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(f"{line}\n" for line in stacks), encoding="utf-8")
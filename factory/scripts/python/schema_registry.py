@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Process-wide registry of compiled LCS contract schemas."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from json_io import dump_json, load, loads
+
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+    from referencing import Registry
+
+
+SCHEMA_GLOB = "*.schema.json"
+DISK_CACHE_FILE = "schema-registry.json"
+DISK_CACHE_VERSION = 1
+
+# Compiled validators survive registry reloads as long as the schema bytes and
+# the rest of the bundle (cross-schema $refs) are unchanged.
+_COMPILED: dict[tuple[str, str, str], Draft202012Validator] = {}
+_SHARED: dict[str, "SchemaRegistry"] = {}
+
+
+@dataclass(frozen=True)
+class SchemaEntry:
+    name: str
+    path: Path
+    schema_id: str
+    sha256: str
+    size: int
+    mtime_ns: int
+    contents: Any
+
+
+def _stat_signature(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+class SchemaRegistry:
+    """Load every ``*.schema.json`` in a directory once and compile on demand."""
+
+    def __init__(self, schemas_dir: Path, *, cache_dir: Path | None = None) -> None:
+        self.schemas_dir = schemas_dir
+        self.cache_dir = cache_dir
+        self.entries: dict[str, SchemaEntry] = {}
+        self.load_errors: dict[str, str] = {}
+        self.stats = {
+            "schemas_parsed": 0,
+            "disk_cache_hits": 0,
+            "compiled": 0,
+            "compile_cache_hits": 0,
+        }
+        self._validators: dict[str, Draft202012Validator] = {}
+        self._load()
+        self.bundle_digest = self._compute_bundle_digest()
+        # Built on first compile so fully cached validation runs never import jsonschema.
+        self._registry: Registry | None = None
+
+    @classmethod
+    def shared(cls, schemas_dir: Path, *, cache_dir: Path | None = None) -> "SchemaRegistry":
+        key = str(schemas_dir.resolve())
+        registry = _SHARED.get(key)
+        if registry is None or registry.is_stale():
+            registry = cls(schemas_dir, cache_dir=cache_dir)
+            _SHARED[key] = registry
+        return registry
+
+    def _load(self) -> None:
+        cached = self._read_disk_cache()
+        for path in sorted(self.schemas_dir.glob(SCHEMA_GLOB)):
+            if not path.is_file():
+                continue
+            size, mtime_ns = _stat_signature(path)
+            hit = cached.get(path.name)
+            if hit is not None and hit.get("size") == size and hit.get("mtime_ns") == mtime_ns:
+                self.entries[path.name] = SchemaEntry(
+                    name=path.name,
+                    path=path,
+                    schema_id=str(hit.get("schema_id", "")),
+                    sha256=str(hit.get("sha256", "")),
+                    size=size,
+                    mtime_ns=mtime_ns,
+                    contents=hit.get("contents"),
+                )
+                self.stats["disk_cache_hits"] += 1
+                continue
+
+            raw = path.read_bytes()
+            try:
+                contents = loads(raw)
+            except Exception as exc:  # noqa: BLE001
+                self.load_errors[path.name] = f"{path}: invalid schema JSON ({exc})"
+                continue
+            self.stats["schemas_parsed"] += 1
+            schema_id = contents.get("$id", "") if isinstance(contents, dict) else ""
+            self.entries[path.name] = SchemaEntry(
+                name=path.name,
+                path=path,
+                schema_id=schema_id if isinstance(schema_id, str) else "",
+                sha256=hashlib.sha256(raw).hexdigest(),
+                size=size,
+                mtime_ns=mtime_ns,
+                contents=contents,
+            )
+
+        if self.stats["schemas_parsed"]:
+            self._write_disk_cache()
+
+    def _disk_cache_path(self) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / DISK_CACHE_FILE
+
+    def _read_disk_cache(self) -> dict[str, dict[str, Any]]:
+        cache_path = self._disk_cache_path()
+        if cache_path is None or not cache_path.is_file():
+            return {}
+        try:
+            payload = load(cache_path)
+        except Exception:  # noqa: BLE001
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != DISK_CACHE_VERSION:
+            return {}
+        if payload.get("schemas_dir") != str(self.schemas_dir.resolve()):
+            return {}
+        entries = payload.get("entries", {})
+        return entries if isinstance(entries, dict) else {}
+
+    def _write_disk_cache(self) -> None:
+        cache_path = self._disk_cache_path()
+        if cache_path is None:
+            return
+        payload = {
+            "version": DISK_CACHE_VERSION,
+            "schemas_dir": str(self.schemas_dir.resolve()),
+            "entries": {
+                name: {
+                    "schema_id": entry.schema_id,
+                    "sha256": entry.sha256,
+                    "size": entry.size,
+                    "mtime_ns": entry.mtime_ns,
+                    "contents": entry.contents,
+                }
+                for name, entry in self.entries.items()
+            },
+        }
+        try:
+            dump_json(cache_path, payload, indent=None)
+        except OSError:
+            # The disk cache is an optimization; an unwritable cache dir must not fail validation.
+            pass
+
+    def _compute_bundle_digest(self) -> str:
+        digest = hashlib.sha256()
+        for name in sorted(self.entries):
+            entry = self.entries[name]
+            digest.update(f"{name}\0{entry.schema_id}\0{entry.sha256}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _build_referencing_registry(self) -> Registry:
+        from referencing import Registry, Resource
+        from referencing.jsonschema import DRAFT202012
+
+        resources: list[tuple[str, Resource]] = []
+        for entry in self.entries.values():
+            if not isinstance(entry.contents, dict):
+                continue
+            resource = Resource.from_contents(entry.contents, default_specification=DRAFT202012)
+            if entry.schema_id:
+                resources.append((entry.schema_id, resource))
+            # File-name URIs let schemas reference siblings as "brief.schema.json#/...".
+            resources.append((entry.name, resource))
+        return Registry().with_resources(resources).crawl()
+
+    def is_stale(self) -> bool:
+        current = {path.name for path in self.schemas_dir.glob(SCHEMA_GLOB) if path.is_file()}
+        if current != set(self.entries) | set(self.load_errors):
+            return True
+        for entry in self.entries.values():
+            try:
+                if _stat_signature(entry.path) != (entry.size, entry.mtime_ns):
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def schema_versions(self) -> dict[str, str]:
+        return {name: entry.sha256 for name, entry in sorted(self.entries.items())}
+
+    def validator_for(self, name: str) -> Draft202012Validator | None:
+        validator = self._validators.get(name)
+        if validator is not None:
+            return validator
+
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+
+        key = (entry.schema_id or entry.name, entry.sha256, self.bundle_digest)
+        validator = _COMPILED.get(key)
+        if validator is None:
+            from jsonschema import Draft202012Validator
+
+            if self._registry is None:
+                self._registry = self._build_referencing_registry()
+            validator = Draft202012Validator(entry.contents, registry=self._registry)
+            _COMPILED[key] = validator
+            self.stats["compiled"] += 1
+        else:
+            self.stats["compile_cache_hits"] += 1
+        self._validators[name] = validator
+        return validator
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Choose the best set of K templates under coverage, time and exercise-type constraints.
+
+Hard constraints: at most one template per exercise type, and the summed estimated minutes
+must fit the budget. Within those, sets are compared lexicographically on:
+
+1. the number of requested requirements covered (``modality:<m>`` / ``domain:<d>``),
+2. the number of templates chosen (up to K),
+3. the summed template score.
+
+Requirements that no affordable template covers are reported, not enforced. If no single
+template fits the budget, the budget is dropped so a selection is never empty.
+
+The search is a depth-first branch-and-bound over the candidates in rank order (score
+descending, then key). A template that another of the same exercise type beats on score,
+minutes and coverage is dropped up front, so catalogs of thousands of templates shrink to a
+small pool. The first best set found in rank order wins ties, so results are deterministic.
+``node_limit`` caps the search; when it is hit the best set so far is returned and the plan
+says so.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+DEFAULT_NODE_LIMIT = 200_000
+
+
+@dataclass(frozen=True)
+class Candidate:
+    key: str
+    exercise_type: str
+    score: float
+    minutes: float
+    covers: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class SelectionPlan:
+    # Indices into the candidates passed to optimize_selection(), in rank order.
+    chosen: tuple[int, ...]
+    requested: tuple[str, ...]
+    covered: tuple[str, ...]
+    minutes: float
+    budget: float | None
+    budget_relaxed: bool = False
+    exhaustive: bool = True
+    uncovered: tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "uncovered", tuple(item for item in self.requested if item not in self.covered))
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "requested": list(self.requested),
+            "covered": list(self.covered),
+            "uncovered": list(self.uncovered),
+            "minutes": round(self.minutes, 4),
+            "budget_minutes": self.budget,
+            "budget_relaxed": self.budget_relaxed,
+            "exhaustive": self.exhaustive,
+        }
+
+
+def _rank_order(candidates: Sequence[Candidate]) -> list[int]:
+    return sorted(range(len(candidates)), key=lambda index: (-candidates[index].score, candidates[index].key))
+
+
+def _pool(
+    candidates: Sequence[Candidate], order: list[int], bits: dict[str, int], budget: float | None
+) -> list[tuple[int, int]]:
+    """(candidate index, coverage mask) of every template worth considering, in rank order."""
+    pool: list[tuple[int, int]] = []
+    # (exercise type, mask) -> the fewest minutes among better-ranked templates kept for it.
+    fastest: dict[tuple[str, int], float] = {}
+    for index in order:
+        candidate = candidates[index]
+        if budget is not None and candidate.minutes > budget:
+            continue
+        mask = 0
+        for requirement in candidate.covers:
+            mask |= bits.get(requirement, 0)
+        slot = (candidate.exercise_type, mask)
+        # Only one template per exercise type can be chosen, so a better-ranked one with the same
+        # coverage and no more minutes can always stand in for this one.
+        if slot in fastest and fastest[slot] <= candidate.minutes:
+            continue
+        fastest[slot] = candidate.minutes
+        pool.append((index, mask))
+    return pool
+
+
+def optimize_selection(
+    candidates: Sequence[Candidate],
+    *,
+    k: int,
+    requirements: Iterable[str] = (),
+    budget: float | None = None,
+    node_limit: int = DEFAULT_NODE_LIMIT,
+) -> SelectionPlan:
+    """The best set of at most ``k`` candidates; see the module docstring for the ordering."""
+    requested = tuple(sorted(set(requirements)))
+    order = _rank_order(candidates)
+    budget_relaxed = False
+    if budget is not None and not any(candidates[index].minutes <= budget for index in order):
+        budget, budget_relaxed = None, bool(candidates)
+
+    affordable = [candidates[index] for index in order if budget is None or candidates[index].minutes <= budget]
+    coverable = [item for item in requested if any(item in candidate.covers for candidate in affordable)]
+    bits = {item: 1 << position for position, item in enumerate(coverable)}
+    pool = _pool(candidates, order, bits, budget)
+
+    size = len(pool)
+    scores = [candidates[index].score for index, _ in pool]
+    suffix_mask = [0] * (size + 1)
+    suffix_max_cover = [0] * (size + 1)
+    for position in range(size - 1, -1, -1):
+        mask = pool[position][1]
+        suffix_mask[position] = suffix_mask[position + 1] | mask
+        suffix_max_cover[position] = max(suffix_max_cover[position + 1], bin(mask).count("1"))
+
+    best_value: tuple[int, int, float] = (0, 0, 0.0)
+    best_chosen: tuple[int, ...] = ()
+    best_minutes = 0.0
+    nodes = 0
+    exhaustive = True
+
+    def _bound(start: int, mask: int, taken: int, score: float) -> tuple[int, int, float]:
+        # Optimistic: any remaining templates, ignoring exercise types and minutes.
+        slots = min(k - taken, size - start)
+        missing = bin(suffix_mask[start] & ~mask).count("1")
+        cover = bin(mask).count("1") + min(missing, slots * suffix_max_cover[start])
+        return cover, taken + slots, score + sum(scores[start : start + slots])
+
+    def _search(start: int, chosen: list[int], types: set[str], mask: int, minutes: float, score: float) -> None:
+        nonlocal best_value, best_chosen, best_minutes, nodes, exhaustive
+        value = (bin(mask).count("1"), len(chosen), score)
+        if value > best_value:
+            best_value, best_chosen, best_minutes = value, tuple(chosen), minutes
+        if len(chosen) >= k:
+            return
+        for position in range(start, size):
+            # Bounds only shrink as ``position`` grows, so nothing later can win either.
+            if _bound(position, mask, len(chosen), score) <= best_value:
+                return
+            nodes += 1
+            if nodes > node_limit:
+                exhaustive = False
+                return
+            index, candidate_mask = pool[position]
+            candidate = candidates[index]
+            if candidate.exercise_type in types:
+                continue
+            if budget is not None and minutes + candidate.minutes > budget:
+                continue
+            chosen.append(index)
+            types.add(candidate.exercise_type)
+            _search(
+                position + 1,
+                chosen,
+                types,
+                mask | candidate_mask,
+                minutes + candidate.minutes,
+                score + candidate.score,
+            )
+            types.discard(candidate.exercise_type)
+            chosen.pop()
+            if not exhaustive:
+                return
+
+    if k > 0:
+        _search(0, [], set(), 0, 0.0, 0.0)
+
+    covered = {item for index in best_chosen for item in candidates[index].covers}
+    return SelectionPlan(
+        chosen=best_chosen,
+        requested=requested,
+        covered=tuple(item for item in requested if item in covered),
+        minutes=best_minutes,
+        budget=budget if not budget_relaxed else None,
+        budget_relaxed=budget_relaxed,
+        exhaustive=exhaustive,
+    )
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Index and analyze the task dependency graph declared in sequence.json.
+
+Everything here is iterative and linear in tasks + dependency edges, so very
+long ``depends_on`` chains never approach Python's recursion limit.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Iterable, NamedTuple
+
+
+# Cycle reports beyond this many are summarized as a count.
+MAX_REPORTED_CYCLES = 5
+# Shared stand-in for an omitted lo_refs/depends_on; never mutated.
+_NO_ITEMS: list[Any] = []
+
+
+class SequenceTask(NamedTuple):
+    # A NamedTuple rather than a frozen dataclass: one is built per task, and sequences can be huge.
+    position: int
+    task_id: str
+    # The declared lists, unfiltered and uncopied; None when the field is not a list
+    # (schema validation reports that separately). Non-string entries are ignored by readers.
+    lo_refs: list[Any] | None
+    depends_on: list[Any] | None
+
+
+@dataclass
+class SequenceAnalysis:
+    order: list[str] = field(default_factory=list)
+    cycles: list[list[str]] = field(default_factory=list)
+    cyclic_task_count: int = 0
+    critical_path: list[str] = field(default_factory=list)
+
+    @property
+    def acyclic(self) -> bool:
+        return not self.cycles
+
+    @property
+    def critical_path_length(self) -> int:
+        return len(self.critical_path)
+
+
+class SequenceGraph:
+    """Task index built in one pass over ``sequence.json`` tasks.
+
+    Only dict tasks with a string ``task_id`` are indexed; ``position`` is the task's
+    index in the original ``tasks`` array so messages can point at ``tasks[i]``.
+    """
+
+    def __init__(self, tasks: list[Any]) -> None:
+        self.tasks: list[SequenceTask] = []
+        self.duplicate_ids: set[str] = set()
+        self._ids: dict[str, int] = {}
+        # Last declaration wins for a duplicated id, matching dict-assignment semantics.
+        self._edges: dict[str, list[Any]] = {}
+
+        for position, task in enumerate(tasks):
+            if not isinstance(task, dict):
+                continue
+            task_id = task.get("task_id")
+            if not isinstance(task_id, str):
+                continue
+            lo_refs = task.get("lo_refs", _NO_ITEMS)
+            depends_on = task.get("depends_on", _NO_ITEMS)
+            self._add(
+                SequenceTask(
+                    position,
+                    task_id,
+                    lo_refs if isinstance(lo_refs, list) else None,
+                    depends_on if isinstance(depends_on, list) else None,
+                )
+            )
+
+    def _add(self, entry: Any) -> None:
+        task_id = entry.task_id
+        if task_id in self._ids:
+            self.duplicate_ids.add(task_id)
+        else:
+            self._ids[task_id] = len(self._ids)
+        self.tasks.append(entry)
+        if entry.depends_on is not None:
+            self._edges[task_id] = entry.depends_on
+
+    @classmethod
+    def from_sequence(cls, sequence: Any) -> "SequenceGraph | None":
+        if not isinstance(sequence, dict) or not isinstance(sequence.get("tasks", []), list):
+            return None
+        return cls(sequence.get("tasks", []))
+
+    @classmethod
+    def from_records(cls, tasks: Iterable[Any]) -> "SequenceGraph":
+        """Index already-decoded ``artifact_models.SequenceTask`` records without re-reading the raw dicts.
+
+        The records expose the same ``position``/``task_id``/``lo_refs``/``depends_on`` fields as
+        ``SequenceTask``; those without a string ``task_id`` are skipped, as in the constructor.
+        """
+        graph = cls([])
+        for task in tasks:
+            if task.task_id is not None:
+                graph._add(task)
+        return graph
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._ids
+
+    def unknown_dependencies(self, task: SequenceTask) -> list[str]:
+        return sorted({dep for dep in task.depends_on or () if isinstance(dep, str) and dep not in self._ids})
+
+    def analyze(self) -> SequenceAnalysis:
+        """Kahn topological sort, exact cycle paths for what it cannot order, and the critical path.
+
+        Edges point from a dependency to its dependent; dependencies on unknown task ids are ignored
+        here (they are reported by ``unknown_dependencies``).
+        """
+        names = list(self._edges)
+        node_of = {name: node for node, name in enumerate(names)}
+        count = len(names)
+        # requires[node] lists the nodes it depends on; dependents is the reverse adjacency Kahn walks.
+        # A repeated dependency adds matching entries on both sides, so Kahn's counts stay balanced.
+        requires: list[list[int]] = [
+            [node_of[dep] for dep in self._edges[name] if isinstance(dep, str) and dep in node_of] for name in names
+        ]
+        dependents: list[list[int]] = [[] for _ in range(count)]
+        indegree = [len(deps) for deps in requires]
+        for node, deps in enumerate(requires):
+            for dep_node in deps:
+                dependents[dep_node].append(node)
+
+        # Longest chain ending at each node, counted in tasks, with its predecessor for reconstruction.
+        depth = [1] * count
+        previous = [-1] * count
+        ready = deque(node for node in range(count) if indegree[node] == 0)
+        order: list[int] = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for child in dependents[node]:
+                if depth[node] + 1 > depth[child]:
+                    depth[child] = depth[node] + 1
+                    previous[child] = node
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+
+        analysis = SequenceAnalysis(order=[names[node] for node in order])
+        if order:
+            tail = max(order, key=depth.__getitem__)
+            path: list[int] = []
+            while tail != -1:
+                path.append(tail)
+                tail = previous[tail]
+            analysis.critical_path = [names[node] for node in reversed(path)]
+
+        if len(order) < count:
+            blocked = [indegree[node] > 0 for node in range(count)]
+            analysis.cyclic_task_count = sum(blocked)
+            for component in _strongly_connected(requires, blocked):
+                cycle = _cycle_in(component, requires)
+                if cycle:
+                    analysis.cycles.append([names[node] for node in cycle])
+        return analysis
+
+
+def _strongly_connected(edges: list[list[int]], active: list[bool]) -> list[list[int]]:
+    """Iterative Tarjan SCC over the ``active`` nodes; returns components in discovery order."""
+    index_of = [-1] * len(edges)
+    lowlink = [0] * len(edges)
+    on_stack = [False] * len(edges)
+    stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+
+    for start in range(len(edges)):
+        if not active[start] or index_of[start] != -1:
+            continue
+        work: list[tuple[int, int]] = [(start, 0)]
+        while work:
+            node, edge_index = work.pop()
+            if edge_index == 0:
+                index_of[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            recurse = False
+            neighbours = edges[node]
+            while edge_index < len(neighbours):
+                neighbour = neighbours[edge_index]
+                edge_index += 1
+                if not active[neighbour]:
+                    continue
+                if index_of[neighbour] == -1:
+                    work.append((node, edge_index))
+                    work.append((neighbour, 0))
+                    recurse = True
+                    break
+                if on_stack[neighbour]:
+                    lowlink[node] = min(lowlink[node], index_of[neighbour])
+            if recurse:
+                continue
+            if lowlink[node] == index_of[node]:
+                component: list[int] = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+    return components
+
+
+def _cycle_in(component: list[int], edges: list[list[int]]) -> list[int]:
+    """One concrete cycle (first node repeated at the end) inside a strongly connected component."""
+    members = set(component)
+    start = min(component)
+    if len(component) == 1:
+        return [start, start] if start in edges[start] else []
+    # BFS from start's successors back to start yields a shortest cycle through start.
+    parent: dict[int, int] = {}
+    queue = deque()
+    for neighbour in edges[start]:
+        if neighbour in members and neighbour not in parent:
+            parent[neighbour] = start
+            queue.append(neighbour)
+    while queue:
+        node = queue.popleft()
+        for neighbour in edges[node]:
+            if neighbour == start:
+                chain = [node]
+                while parent[chain[-1]] != start:
+                    chain.append(parent[chain[-1]])
+                return [start, *reversed(chain), start]
+            if neighbour in members and neighbour not in parent:
+                parent[neighbour] = node
+                queue.append(neighbour)
+    return []
+
+
+def format_cycle(cycle: list[str]) -> str:
+    return " -> ".join(cycle)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Build or check ``catalog.lock.json``, the pre-resolved index of a template pack.
+
+The lock records the catalog's size, mtime and sha256. It also records every template's
+normalized ``template_id`` and ``exercise_type``. Each ``schema``/``rules`` reference is
+stored resolved against the pack, with whether it exists and its size and sha256.
+
+Readers trust the lock while ``catalog.json`` and the directories holding the referenced
+files keep the stat signatures recorded in it. That is a handful of ``stat`` calls instead of
+a resolve and an ``is_file`` per reference. Adding, removing or renaming a referenced file
+changes its directory's mtime, so a stale lock is noticed and rebuilt. Editing a referenced
+file in place does not change which references exist, so the lock stays valid for
+reference checks. ``--check`` re-hashes everything to report drifted digests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+from json_io import dump_json, load, loads, read_bytes
+
+LOCK_FILENAME = "catalog.lock.json"
+LOCK_VERSION = 1
+
+
+def _stat_signature(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _pack_relative(path: Path, pack_dir: Path) -> str:
+    try:
+        return path.relative_to(pack_dir).as_posix() or "."
+    except ValueError:
+        return str(path)
+
+
+def _file_entry(path: Path) -> dict[str, Any]:
+    try:
+        data = path.read_bytes() if path.is_file() else None
+    except OSError:
+        data = None
+    if data is None:
+        return {"exists": False, "size": None, "sha256": None}
+    return {"exists": True, "size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+
+
+def build_lock(template_pack_dir: Path) -> dict[str, Any] | None:
+    """Index ``catalog.json``; None when it is missing or is not a JSON object with a templates list."""
+    pack_dir = template_pack_dir.resolve()
+    catalog_path = pack_dir / "catalog.json"
+    # Stat before reading: an edit in between then shows up as a stale lock, never a wrong one.
+    catalog_signature = _stat_signature(catalog_path)
+    try:
+        raw = read_bytes(catalog_path)
+        catalog = loads(raw)
+    except (OSError, ValueError):
+        return None
+    templates = catalog.get("templates") if isinstance(catalog, dict) else None
+    if not isinstance(templates, list) or catalog_signature is None:
+        return None
+
+    entries: list[dict[str, Any]] = []
+    refs: dict[str, dict[str, Any]] = {}
+    dirs: set[Path] = set()
+    for index, item in enumerate(templates):
+        if not isinstance(item, dict):
+            continue
+        template_id = item.get("template_id")
+        exercise_type = item.get("exercise_type")
+        entries.append(
+            {
+                "index": index,
+                "template_id": template_id.strip().lower() if isinstance(template_id, str) else "",
+                "exercise_type": exercise_type.strip().upper() if isinstance(exercise_type, str) else "",
+            }
+        )
+        for label in ("schema", "rules"):
+            ref = item.get(label)
+            if not isinstance(ref, str) or not ref or ref in refs:
+                continue
+            resolved = (pack_dir / ref).resolve()
+            refs[ref] = {"path": _pack_relative(resolved, pack_dir), **_file_entry(resolved)}
+            # Writing the lock itself touches the pack root, so files there are checked one by one.
+            if resolved.parent != pack_dir:
+                dirs.add(resolved.parent)
+
+    signatures = {_pack_relative(path, pack_dir): _stat_signature(path) for path in sorted(dirs)}
+    return {
+        "lock_version": LOCK_VERSION,
+        "catalog": {
+            "path": "catalog.json",
+            "size": catalog_signature[0],
+            "mtime_ns": catalog_signature[1],
+            "sha256": hashlib.sha256(raw).hexdigest(),
+        },
+        "directories": signatures,
+        "templates": entries,
+        "refs": refs,
+    }
+
+
+def is_fresh(lock: Any, template_pack_dir: Path) -> bool:
+    """True while the catalog and every directory holding a referenced file keep their recorded stats.
+
+    References directly in the pack root are checked for existence instead.
+    """
+    if not isinstance(lock, dict) or lock.get("lock_version") != LOCK_VERSION:
+        return False
+    pack_dir = template_pack_dir.resolve()
+    catalog = lock.get("catalog")
+    directories = lock.get("directories")
+    if not isinstance(catalog, dict) or not isinstance(directories, dict):
+        return False
+    if _stat_signature(pack_dir / "catalog.json") != [catalog.get("size"), catalog.get("mtime_ns")]:
+        return False
+    for relative, signature in directories.items():
+        if _stat_signature(pack_dir / relative) != signature:
+            return False
+    for entry in lock.get("refs", {}).values():
+        path = pack_dir / entry["path"]
+        if path.parent == pack_dir and path.is_file() != entry["exists"]:
+            return False
+    return True
+
+
+_LOCKS: dict[str, dict[str, Any]] = {}
+
+
+def load_lock(template_pack_dir: Path, *, write: bool = True) -> dict[str, Any] | None:
+    """The pack's lock, rebuilt (and rewritten when ``write``) if it is missing or stale.
+
+    A read-only pack still gets an in-memory lock. The result is memoized per process
+    and re-validated with the same stat check on every call.
+    """
+    pack_dir = template_pack_dir.resolve()
+    key = str(pack_dir)
+    cached = _LOCKS.get(key)
+    if cached is not None and is_fresh(cached, pack_dir):
+        return cached
+    lock_path = pack_dir / LOCK_FILENAME
+    try:
+        lock = load(lock_path)
+    except (OSError, ValueError):
+        lock = None
+    if not is_fresh(lock, pack_dir):
+        lock = build_lock(pack_dir)
+        if lock is None:
+            _LOCKS.pop(key, None)
+            return None
+        if write:
+            try:
+                dump_json(lock_path, lock)
+            except OSError:
+                pass
+    _LOCKS[key] = lock
+    return lock
+
+
+def drift(lock: dict[str, Any], template_pack_dir: Path) -> list[str]:
+    """Human-readable differences between ``lock`` and a freshly built index (digests included)."""
+    current = build_lock(template_pack_dir)
+    if current is None:
+        return ["catalog.json is missing or invalid"]
+    problems: list[str] = []
+    if current["catalog"]["sha256"] != lock.get("catalog", {}).get("sha256"):
+        problems.append("catalog.json changed")
+    if current["templates"] != lock.get("templates"):
+        problems.append("template table changed")
+    recorded = lock.get("refs", {})
+    for ref, entry in current["refs"].items():
+        previous = recorded.get(ref)
+        if previous is None:
+            problems.append(f"{ref}: not in lock")
+        elif (previous.get("exists"), previous.get("sha256")) != (entry["exists"], entry["sha256"]):
+            problems.append(f"{ref}: {'content changed' if entry['exists'] else 'missing'}")
+    problems.extend(f"{ref}: no longer referenced" for ref in recorded if ref not in current["refs"])
+    return problems
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repo-root", default=".", help="Repository root used to locate the template pack")
+    parser.add_argument("--template-pack-dir", help="Template pack directory (default: the validator's resolution)")
+    parser.add_argument("--check", action="store_true", help="Verify the lock, digests included; exit 1 on drift")
+    parser.add_argument("--json", action="store_true", help="Emit JSON output")
+    return parser.parse_args()
+
+
+def _default_pack_dir(repo_root: Path) -> Path | None:
+    env_path = os.getenv("LCS_TEMPLATE_PACK_DIR", "").strip()
+    candidates = [Path(env_path).expanduser()] if env_path else []
+    candidates += [
+        repo_root / ".lcs" / "template-pack" / "v1",
+        repo_root / "subjects" / "english" / ".lcs" / "template-pack" / "v1",
+        repo_root.parent / "subjects" / "english" / ".lcs" / "template-pack" / "v1",
+    ]
+    return next((path.resolve() for path in candidates if path.is_dir()), None)
+
+
+def main() -> int:
+    args = parse_args()
+    if args.template_pack_dir:
+        pack_dir: Path | None = Path(args.template_pack_dir).expanduser().resolve()
+    else:
+        pack_dir = _default_pack_dir(Path(args.repo_root).resolve())
+    if pack_dir is None or not pack_dir.is_dir():
+        print("ERROR: template pack not found", file=sys.stderr)
+        return 1
+    lock_path = pack_dir / LOCK_FILENAME
+
+    if args.check:
+        try:
+            lock = load(lock_path)
+        except (OSError, ValueError):
+            lock = None
+        problems = drift(lock, pack_dir) if isinstance(lock, dict) else [f"{LOCK_FILENAME} is missing or invalid"]
+        status = "PASS" if not problems else "STALE"
+        if args.json:
+            print(json.dumps({"STATUS": status, "LOCK_FILE": str(lock_path), "PROBLEMS": problems}))
+        else:
+            print(f"STATUS: {status}")
+            for problem in problems:
+                print(f"  - {problem}")
+        return 0 if not problems else 1
+
+    lock = build_lock(pack_dir)
+    if lock is None:
+        print(f"ERROR: {pack_dir / 'catalog.json'} is missing or invalid", file=sys.stderr)
+        return 1
+    dump_json(lock_path, lock)
+    missing = sorted(ref for ref, entry in lock["refs"].items() if not entry["exists"])
+    if args.json:
+        payload = {
+            "STATUS": "PASS",
+            "LOCK_FILE": str(lock_path),
+            "TEMPLATES": len(lock["templates"]),
+            "REFS": len(lock["refs"]),
+            "MISSING_REFS": missing,
+        }
+        print(json.dumps(payload))
+    else:
+        print(f"Wrote {lock_path} ({len(lock['templates'])} templates, {len(lock['refs'])} references)")
+        for ref in missing:
+            print(f"  - missing: {ref}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Directory watchers for `validate_artifact_contracts.py --watch`.
+
+Linux uses inotify through ctypes (no third-party dependency); every other
+platform, or a kernel that refuses inotify, falls back to stat polling.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+
+DEFAULT_DEBOUNCE_MS = 50
+DEFAULT_POLL_INTERVAL = 0.25
+
+# Editor swap/backup files and our own atomic-write temporaries never affect validation.
+_IGNORED_SUFFIXES = (".swp", ".swx", ".tmp", "~")
+_IGNORED_DIRS = {"__pycache__", ".git"}
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_ignored(path: Path) -> bool:
+    return path.name.endswith(_IGNORED_SUFFIXES) or any(part in _IGNORED_DIRS for part in path.parts)
+
+
+class PollingWatcher:
+    """Detect changes by diffing (size, mtime_ns, inode) snapshots of every file under the roots."""
+
+    backend = "polling"
+
+    def __init__(self, roots: Iterable[Path], interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.roots = [Path(root) for root in roots]
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int, int]]:
+        snapshot: dict[Path, tuple[int, int, int]] = {}
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [name for name in dirnames if name not in _IGNORED_DIRS]
+                for name in filenames:
+                    path = Path(dirpath) / name
+                    if is_ignored(path):
+                        continue
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        return snapshot
+
+    def poll(self, timeout: float | None) -> set[Path]:
+        """Return paths that changed since the last call, waiting up to ``timeout`` seconds (None = forever)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {
+                path
+                for path in current.keys() | self._snapshot.keys()
+                if current.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = current
+            if changed:
+                return changed
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return set()
+                time.sleep(min(self.interval, remaining))
+            else:
+                time.sleep(self.interval)
+
+    def close(self) -> None:
+        return None
+
+
+class InotifyWatcher:
+    """Recursive inotify watch; new subdirectories are added as they appear."""
+
+    backend = "inotify"
+
+    def __init__(self, roots: Iterable[Path]) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or libc_name is None:
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        try:
+            for root in roots:
+                self._add_tree(Path(root))
+        except OSError:
+            self.close()
+            raise
+
+    def _add_dir(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._dirs[wd] = directory
+
+    def _add_tree(self, root: Path) -> None:
+        self._add_dir(root)
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [name for name in dirnames if name not in _IGNORED_DIRS]
+            for name in dirnames:
+                self._add_dir(Path(dirpath) / name)
+
+    def _drain(self) -> set[Path]:
+        changed: set[Path] = set()
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buffer):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                path = directory / os.fsdecode(name) if name else directory
+                if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    try:
+                        self._add_tree(path)
+                    except OSError:
+                        pass
+                if not is_ignored(path):
+                    changed.add(path)
+
+    def poll(self, timeout: float | None) -> set[Path]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        return self._drain() if readable else set()
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(
+    roots: Iterable[Path], *, poll_interval: float = DEFAULT_POLL_INTERVAL, polling: bool = False
+) -> InotifyWatcher | PollingWatcher:
+    roots = [Path(root) for root in roots if Path(root).is_dir()]
+    if not polling:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            # No inotify (non-Linux, exhausted max_user_watches, seccomp): poll instead.
+            pass
+    return PollingWatcher(roots, interval=poll_interval)
+
+
+def watch(
+    watcher: InotifyWatcher | PollingWatcher,
+    on_change: Callable[[set[Path]], None],
+    *,
+    debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+) -> None:
+    """Call ``on_change`` once per burst of changes, after ``debounce_ms`` of quiet. Runs until interrupted."""
+    debounce = max(debounce_ms, 0) / 1000
+    while True:
+        changed = watcher.poll(None)
+        while changed:
+            more = watcher.poll(debounce)
+            if not more:
+                break
+            changed |= more
+        if changed:
+            on_change(changed)
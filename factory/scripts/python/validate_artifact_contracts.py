@@ -4,17 +4,47 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import hashlib
+import heapq
+import importlib.util
 import json
 import os
+import re
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+from artifact_models import Brief, ExerciseDesign, Manifest, Sequence
+from artifact_store import ArtifactStore
+from json_io import load_json, loads
+from schema_registry import SchemaRegistry
+from sequence_graph import MAX_REPORTED_CYCLES, SequenceGraph, format_cycle
+from template_pack_lock import LOCK_FILENAME, load_lock
+from unit_watcher import DEFAULT_DEBOUNCE_MS, open_watcher, watch
+from validation_cache import (
+    CHECKSUM_CACHE_FILE,
+    DEFAULT_CACHE_SUBDIR,
+    ChecksumCache,
+    MemoryPhaseCache,
+    PhaseCache,
+    checksum_cache,
+    configure_checksum_cache,
+    file_digest,
+    fingerprint,
+)
+from validation_findings import Finding, dedupe_findings
 
-from jsonschema import Draft202012Validator
+if TYPE_CHECKING:
+    from phase_profiler import PhaseProfile
+    from validation_history import HistoryStore
 
 
 @dataclass(frozen=True)
@@ -38,6 +68,10 @@ REQUIRED_CONTRACTS = (
 RESPONSE_VERSION = "1.0.0"
 PIPELINE_NAME = "artifact-contract-validation.v1"
 PIPELINE_MODE = "collect-all-per-phase"
+PIPELINE_MODE_FAIL_FAST = "fail-fast"
+PIPELINE_MODES = (PIPELINE_MODE, PIPELINE_MODE_FAIL_FAST)
+# JSON Schema errors reported per artifact; the rest are counted in one SCHEMA_ERRORS_TRUNCATED finding.
+DEFAULT_MAX_SCHEMA_ERRORS = 100
 PIPELINE_PHASES = (
     "preflight",
     "artifact_schema",
@@ -51,12 +85,103 @@ PIPELINE_PHASES = (
 )
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--repo-root", required=True, help="Repository root path")
-    parser.add_argument("--unit-dir", required=True, help="Unit directory under programs/<program-id>/units/")
+    parser.add_argument("--unit-dir", help="Unit directory under programs/<program-id>/units/")
+    parser.add_argument("--program", help="Batch mode: validate every unit under programs/<program>/units/")
+    parser.add_argument("--units-glob", help="Batch mode: glob (relative to --repo-root) selecting unit directories")
+    parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REF",
+        help="Batch mode: only units with files changed since this git ref (all units when a shared input changed);"
+        " narrows --program/--units-glob, otherwise covers programs/*/units/*",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, min(8, os.cpu_count() or 1)),
+        help="Batch mode: worker processes (1 validates in-process)",
+    )
+    parser.add_argument(
+        "--phase-workers",
+        type=int,
+        default=DEFAULT_PHASE_WORKERS,
+        help="Threads used to run independent validation phases (1 runs phases sequentially)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=PIPELINE_MODES,
+        default=os.getenv("LCS_VALIDATION_MODE", PIPELINE_MODE),
+        help="collect-all-per-phase runs every phase; fail-fast stops after the first BLOCK phase",
+    )
+    parser.add_argument(
+        "--max-findings",
+        type=int,
+        default=None,
+        help="Stop after the phase in which this many CRITICAL/HIGH findings have been collected",
+    )
+    parser.add_argument(
+        "--max-schema-errors",
+        type=int,
+        default=os.getenv("LCS_MAX_SCHEMA_ERRORS", str(DEFAULT_MAX_SCHEMA_ERRORS)),
+        help="JSON Schema errors reported per artifact before the rest are summarized (0 reports all)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: revalidate --unit-dir after each change, re-running only phases whose inputs changed",
+    )
+    parser.add_argument(
+        "--watch-debounce-ms",
+        type=int,
+        default=DEFAULT_DEBOUNCE_MS,
+        help="Quiet period that ends a burst of file changes in --watch mode",
+    )
+    parser.add_argument(
+        "--watch-polling",
+        action="store_true",
+        help="Use stat polling instead of inotify in --watch mode",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile each phase (cProfile + tracemalloc); phases run sequentially and steps gain a profile block",
+    )
+    parser.add_argument(
+        "--profile-out",
+        default=None,
+        help="Directory for collapsed-stack files (<unit>.collapsed) readable by flamegraph tools; implies --profile",
+    )
     parser.add_argument("--json", action="store_true", help="Emit JSON output")
-    return parser.parse_args()
+    parser.add_argument(
+        "--schema-cache-dir",
+        default=os.getenv("LCS_SCHEMA_CACHE_DIR", ""),
+        help="Optional directory for the on-disk schema registry cache",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=os.getenv("LCS_VALIDATION_CACHE", "").strip().lower() in {"1", "true", "yes"},
+        help="Replay per-phase results from .lcs/cache/validation/ when phase inputs are unchanged",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.getenv("LCS_VALIDATION_CACHE_DIR", ""),
+        help="Phase cache directory (implies --cache)",
+    )
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        default=os.getenv("LCS_VALIDATION_HISTORY", "").strip().lower() in {"1", "true", "yes"},
+        help="Record each run's steps and findings in .lcs/state/validation.db (query with validation_history.py)",
+    )
+    parser.add_argument(
+        "--history-db",
+        default=os.getenv("LCS_VALIDATION_HISTORY_DB", ""),
+        help="Validation history database (implies --history)",
+    )
+    return parser.parse_args(argv)
 
 
 def _resolve_schemas_dir(repo_root: Path) -> Path | None:
@@ -70,8 +195,16 @@ def _resolve_schemas_dir(repo_root: Path) -> Path | None:
     return None
 
 
+_PACK_DIRS: dict[tuple[str, str], Path] = {}
+
+
 def _resolve_template_pack_dir(repo_root: Path) -> Path | None:
     env_path = os.getenv("LCS_TEMPLATE_PACK_DIR", "").strip()
+    # Every unit in a batch resolves the same pack; re-probe the candidates only if it disappears.
+    key = (str(repo_root), env_path)
+    cached = _PACK_DIRS.get(key)
+    if cached is not None and cached.is_dir():
+        return cached
     candidates: list[Path] = []
     if env_path:
         candidates.append(Path(env_path).expanduser())
@@ -87,6 +220,7 @@ def _resolve_template_pack_dir(repo_root: Path) -> Path | None:
     for candidate in candidates:
         resolved = candidate.resolve()
         if resolved.is_dir():
+            _PACK_DIRS[key] = resolved
             return resolved
     return None
 
@@ -97,32 +231,62 @@ def _normalize_template_id(value: Any) -> str:
     return value.strip().lower()
 
 
-def _validate_json(artifact_path: Path, schema_path: Path) -> list[str]:
-    errors: list[str] = []
+def _schema_error_key(error: Any) -> tuple[Any, ...]:
+    # str(error) renders the offending instance and schema in full; order by where the error is
+    # (instance path, keyword, schema path) and its one-line message instead.
+    return (
+        tuple((0, part, "") if isinstance(part, int) else (1, 0, str(part)) for part in error.path),
+        str(error.validator),
+        tuple(str(part) for part in error.schema_path),
+        error.message,
+    )
 
-    try:
-        artifact = json.loads(artifact_path.read_text(encoding="utf-8"))
-    except Exception as exc:  # noqa: BLE001
-        return [f"{artifact_path}: invalid JSON ({exc})"]
 
-    try:
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    except Exception as exc:  # noqa: BLE001
-        return [f"{schema_path}: invalid schema JSON ({exc})"]
+def _validate_json(
+    artifact_path: Path,
+    schema_path: Path,
+    registry: SchemaRegistry,
+    store: ArtifactStore,
+    max_errors: int | None = DEFAULT_MAX_SCHEMA_ERRORS,
+) -> tuple[list[str], int]:
+    """Schema error messages for one artifact, plus how many were left out beyond ``max_errors``.
+
+    Only the first ``max_errors`` errors in sort order are ever held, so memory stays bounded
+    however broken the artifact is; None or 0 keeps them all.
+    """
+    record = store.get(artifact_path)
+    if record is None:
+        return [f"{artifact_path}: invalid JSON (file not found)"], 0
+    if not record.ok:
+        return [f"{artifact_path}: invalid JSON ({record.error})"], 0
+    artifact = record.payload
+
+    load_error = registry.load_errors.get(schema_path.name)
+    if load_error:
+        return [load_error], 0
+
+    validator = registry.validator_for(schema_path.name)
+    if validator is None:
+        return [f"{schema_path}: schema is not registered in {registry.schemas_dir}"], 0
+
+    total = 0
+
+    def _counted(errors: Any) -> Any:
+        nonlocal total
+        for error in errors:
+            total += 1
+            yield error
+
+    if max_errors:
+        kept = heapq.nsmallest(max_errors, _counted(validator.iter_errors(artifact)), key=_schema_error_key)
+    else:
+        kept = sorted(_counted(validator.iter_errors(artifact)), key=_schema_error_key)
 
-    validator = Draft202012Validator(schema)
-    for error in sorted(validator.iter_errors(artifact), key=str):
+    messages = []
+    for error in kept:
         location = "/".join(str(p) for p in error.path) or "<root>"
-        errors.append(f"{artifact_path}: {location}: {error.message}")
-
-    return errors
-
-
-def _load_json(path: Path) -> dict | list | None:
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:  # noqa: BLE001
-        return None
+        messages.append(f"{artifact_path}: {location}: {error.message}")
+    return messages, total - len(kept)
 
 
 def _sha256_file(path: Path) -> str:
@@ -133,7 +297,13 @@ def _sha256_file(path: Path) -> str:
     return digest.hexdigest()
 
 
-def _cross_artifact_checks(unit_dir: Path, artifacts: dict[str, dict | list]) -> list[str]:
+def _cross_artifact_checks(
+    unit_dir: Path,
+    artifacts: dict[str, dict | list],
+    checksums: ChecksumCache | None = None,
+    checksum_stats: dict[str, int] | None = None,
+    sequence_stats: dict[str, Any] | None = None,
+) -> list[str]:
     errors: list[str] = []
 
     expected_unit_id = unit_dir.name
@@ -146,242 +316,163 @@ def _cross_artifact_checks(unit_dir: Path, artifacts: dict[str, dict | list]) ->
                 f"{unit_dir / name}: unit_id '{unit_id}' does not match unit directory '{expected_unit_id}'"
             )
 
-    brief = artifacts.get("brief.json")
+    # Typed records for the artifacts walked field by field below; design and audit are only spot-read.
+    brief = Brief.from_json(artifacts.get("brief.json"))
     design = artifacts.get("design.json")
-    exercise_design = artifacts.get("exercise-design.json")
-    sequence = artifacts.get("sequence.json")
+    exercise_design = ExerciseDesign.from_json(artifacts.get("exercise-design.json"))
+    sequence = Sequence.from_json(artifacts.get("sequence.json"))
     audit = artifacts.get("audit-report.json")
-    manifest = artifacts.get("outputs/manifest.json")
+    manifest = Manifest.from_json(artifacts.get("outputs/manifest.json"))
 
     brief_lo_ids: set[str] = set()
     brief_lo_priorities: dict[str, str] = {}
-    if isinstance(brief, dict):
-        learning_outcomes = brief.get("learning_outcomes", [])
-        if isinstance(learning_outcomes, list):
-            duplicates = set()
-            for item in learning_outcomes:
-                if not isinstance(item, dict):
-                    continue
-                lo_id = item.get("lo_id")
-                if not isinstance(lo_id, str):
-                    continue
-                if lo_id in brief_lo_ids:
-                    duplicates.add(lo_id)
-                brief_lo_ids.add(lo_id)
-                priority = item.get("priority")
-                if isinstance(priority, str):
-                    brief_lo_priorities[lo_id] = priority
-            if duplicates:
-                errors.append(f"{unit_dir / 'brief.json'}: duplicate LO IDs found: {sorted(duplicates)}")
-            if learning_outcomes and not any(
-                isinstance(item, dict) and item.get("priority") == "P1"
-                for item in learning_outcomes
-            ):
-                errors.append(f"{unit_dir / 'brief.json'}: at least one learning outcome must have priority P1")
-
-    if isinstance(sequence, dict):
-        tasks = sequence.get("tasks", [])
-        if isinstance(tasks, list):
-            task_ids: list[str] = []
-            seen_task_ids: set[str] = set()
-            duplicate_task_ids: set[str] = set()
-
-            for task in tasks:
-                if not isinstance(task, dict):
-                    continue
-                task_id = task.get("task_id")
-                if not isinstance(task_id, str):
-                    continue
-                task_ids.append(task_id)
-                if task_id in seen_task_ids:
-                    duplicate_task_ids.add(task_id)
-                seen_task_ids.add(task_id)
+    if brief is not None and brief.learning_outcomes is not None:
+        learning_outcomes = brief.learning_outcomes
+        duplicates = set()
+        for outcome in learning_outcomes:
+            lo_id = outcome.lo_id
+            if lo_id is None:
+                continue
+            if lo_id in brief_lo_ids:
+                duplicates.add(lo_id)
+            brief_lo_ids.add(lo_id)
+            if outcome.priority is not None:
+                brief_lo_priorities[lo_id] = outcome.priority
+        if duplicates:
+            errors.append(f"{unit_dir / 'brief.json'}: duplicate LO IDs found: {sorted(duplicates)}")
+        if learning_outcomes and not any(outcome.priority == "P1" for outcome in learning_outcomes):
+            errors.append(f"{unit_dir / 'brief.json'}: at least one learning outcome must have priority P1")
+
+    sequence_graph = (
+        SequenceGraph.from_records(sequence.tasks) if sequence is not None and sequence.tasks is not None else None
+    )
+    if sequence_graph is not None:
+        sequence_path = unit_dir / "sequence.json"
+        if sequence_graph.duplicate_ids:
+            errors.append(f"{sequence_path}: duplicate task IDs found: {sorted(sequence_graph.duplicate_ids)}")
 
-            if duplicate_task_ids:
+        for task in sequence_graph.tasks:
+            if task.lo_refs is None:
+                continue
+            unknown_refs = sorted(ref for ref in task.lo_refs if isinstance(ref, str) and ref not in brief_lo_ids)
+            if unknown_refs:
+                errors.append(f"{sequence_path}: tasks[{task.position}] references unknown LO IDs: {unknown_refs}")
+            if task.depends_on is None:
+                continue
+            unknown_dependencies = sequence_graph.unknown_dependencies(task)
+            if unknown_dependencies:
                 errors.append(
-                    f"{unit_dir / 'sequence.json'}: duplicate task IDs found: {sorted(duplicate_task_ids)}"
+                    f"{sequence_path}: tasks[{task.position}] has unknown dependencies: {unknown_dependencies}"
+                )
+            if task.task_id in task.depends_on:
+                errors.append(
+                    f"{sequence_path}: tasks[{task.position}] task_id '{task.task_id}' cannot depend on itself"
                 )
 
-            task_id_set = set(task_ids)
-            graph: dict[str, list[str]] = {}
-            for index, task in enumerate(tasks):
-                if not isinstance(task, dict):
-                    continue
-                task_id = task.get("task_id")
-                if not isinstance(task_id, str):
-                    continue
-                lo_refs = task.get("lo_refs", [])
-                if not isinstance(lo_refs, list):
-                    continue
-                unknown_refs = sorted(ref for ref in lo_refs if isinstance(ref, str) and ref not in brief_lo_ids)
-                if unknown_refs:
-                    errors.append(
-                        f"{unit_dir / 'sequence.json'}: tasks[{index}] references unknown LO IDs: {unknown_refs}"
-                    )
-                depends_on = task.get("depends_on", [])
-                if not isinstance(depends_on, list):
-                    continue
-                graph[task_id] = [dep for dep in depends_on if isinstance(dep, str)]
-                unknown_dependencies = sorted(dep for dep in depends_on if isinstance(dep, str) and dep not in task_id_set)
-                if unknown_dependencies:
-                    errors.append(
-                        f"{unit_dir / 'sequence.json'}: tasks[{index}] has unknown dependencies: {unknown_dependencies}"
-                    )
-                if task_id in depends_on:
-                    errors.append(
-                        f"{unit_dir / 'sequence.json'}: tasks[{index}] task_id '{task_id}' cannot depend on itself"
-                    )
+        analysis = sequence_graph.analyze()
+        for cycle in analysis.cycles[:MAX_REPORTED_CYCLES]:
+            errors.append(f"{sequence_path}: dependency cycle detected in tasks graph: {format_cycle(cycle)}")
+        if len(analysis.cycles) > MAX_REPORTED_CYCLES:
+            errors.append(
+                f"{sequence_path}: dependency cycle detected in tasks graph: "
+                f"{len(analysis.cycles) - MAX_REPORTED_CYCLES} more cycle(s) not shown"
+            )
+        if sequence_stats is not None:
+            sequence_stats.update(
+                {
+                    "tasks": len(sequence_graph.tasks),
+                    "cycles": len(analysis.cycles),
+                    "cyclic_tasks": analysis.cyclic_task_count,
+                    "critical_path_length": analysis.critical_path_length,
+                }
+            )
 
-            visited: dict[str, int] = {}
-            cycle_detected = False
-
-            def _visit(node: str) -> None:
-                nonlocal cycle_detected
-                if cycle_detected:
-                    return
-                state = visited.get(node, 0)
-                if state == 1:
-                    cycle_detected = True
-                    return
-                if state == 2:
-                    return
-                visited[node] = 1
-                for neighbor in graph.get(node, []):
-                    if neighbor in graph:
-                        _visit(neighbor)
-                visited[node] = 2
-
-            for task_id in graph:
-                if visited.get(task_id, 0) == 0:
-                    _visit(task_id)
-                if cycle_detected:
-                    break
-
-            if cycle_detected:
-                errors.append(f"{unit_dir / 'sequence.json'}: dependency cycle detected in tasks graph")
-
-    if isinstance(sequence, dict) and isinstance(exercise_design, dict):
-        tasks = sequence.get("tasks", [])
-        exercises = exercise_design.get("exercises", [])
-
-        exercise_index: dict[str, dict[str, str]] = {}
-        if isinstance(exercises, list):
-            for exercise in exercises:
-                if not isinstance(exercise, dict):
-                    continue
-                exercise_id = exercise.get("exercise_id")
-                target_path = exercise.get("target_path")
-                template_id = exercise.get("template_id")
-                if (
-                    isinstance(exercise_id, str)
-                    and isinstance(target_path, str)
-                    and isinstance(template_id, str)
-                ):
-                    exercise_index[exercise_id] = {
-                        "target_path": target_path,
-                        "template_id": template_id,
-                    }
-
-        if isinstance(tasks, list) and tasks and exercise_index:
-            tasks_by_target: dict[str, list[tuple[int, dict[str, Any]]]] = {}
-            for index, task in enumerate(tasks):
-                if not isinstance(task, dict):
-                    continue
-                target_path = task.get("target_path")
-                if isinstance(target_path, str):
-                    tasks_by_target.setdefault(target_path, []).append((index, task))
-
-                declared_exercise_ids: set[str] = set()
-                single_exercise_id = task.get("exercise_id")
-                if isinstance(single_exercise_id, str):
-                    declared_exercise_ids.add(single_exercise_id)
-                exercise_refs = task.get("exercise_refs", [])
-                if isinstance(exercise_refs, list):
-                    declared_exercise_ids.update(ref for ref in exercise_refs if isinstance(ref, str))
-
-                declared_template_ids: set[str] = set()
-                single_template_id = task.get("template_id")
-                if isinstance(single_template_id, str):
-                    declared_template_ids.add(single_template_id)
-                template_ids = task.get("template_ids", [])
-                if isinstance(template_ids, list):
-                    declared_template_ids.update(ref for ref in template_ids if isinstance(ref, str))
+    if sequence is not None and exercise_design is not None:
+        exercise_index = {
+            exercise.exercise_id: exercise
+            for exercise in exercise_design.exercises or ()
+            if exercise.exercise_id is not None
+            and exercise.target_path is not None
+            and exercise.template_id is not None
+        }
+
+        tasks = sequence.tasks
+        if tasks and exercise_index:
+            sequence_path = unit_dir / "sequence.json"
+            # Declared exercise/template ids per task, gathered once and reused by the per-exercise pass.
+            tasks_by_target: dict[str, list[tuple[set[str], set[str]]]] = {}
+            for task in tasks:
+                index = task.position
+                target_path = task.target_path
+
+                declared_exercise_ids = set(task.exercise_refs or ())
+                if task.exercise_id is not None:
+                    declared_exercise_ids.add(task.exercise_id)
+                declared_template_ids = set(task.template_ids or ())
+                if task.template_id is not None:
+                    declared_template_ids.add(task.template_id)
+                if target_path is not None:
+                    tasks_by_target.setdefault(target_path, []).append((declared_exercise_ids, declared_template_ids))
 
                 if declared_template_ids and not declared_exercise_ids:
                     errors.append(
-                        f"{unit_dir / 'sequence.json'}: tasks[{index}] declares template metadata but has no "
+                        f"{sequence_path}: tasks[{index}] declares template metadata but has no "
                         "exercise_id/exercise_refs mapping"
                     )
 
                 if declared_exercise_ids and not declared_template_ids:
                     errors.append(
-                        f"{unit_dir / 'sequence.json'}: tasks[{index}] declares exercise mapping but has no "
+                        f"{sequence_path}: tasks[{index}] declares exercise mapping but has no "
                         "template_id/template_ids metadata"
                     )
 
                 for exercise_id in sorted(declared_exercise_ids):
-                    exercise_meta = exercise_index.get(exercise_id)
-                    if exercise_meta is None:
+                    exercise = exercise_index.get(exercise_id)
+                    if exercise is None:
                         errors.append(
-                            f"{unit_dir / 'sequence.json'}: tasks[{index}] references unknown exercise_id "
-                            f"'{exercise_id}'"
+                            f"{sequence_path}: tasks[{index}] references unknown exercise_id '{exercise_id}'"
                         )
                         continue
 
-                    if not isinstance(target_path, str) or target_path != exercise_meta["target_path"]:
+                    if target_path != exercise.target_path:
                         errors.append(
-                            f"{unit_dir / 'sequence.json'}: tasks[{index}] exercise '{exercise_id}' must target "
-                            f"'{exercise_meta['target_path']}'"
+                            f"{sequence_path}: tasks[{index}] exercise '{exercise_id}' must target "
+                            f"'{exercise.target_path}'"
                         )
 
-                    expected_template_id = exercise_meta["template_id"]
-                    if declared_template_ids and expected_template_id not in declared_template_ids:
+                    if declared_template_ids and exercise.template_id not in declared_template_ids:
                         errors.append(
-                            f"{unit_dir / 'sequence.json'}: tasks[{index}] exercise '{exercise_id}' requires "
-                            f"template metadata '{expected_template_id}'"
+                            f"{sequence_path}: tasks[{index}] exercise '{exercise_id}' requires "
+                            f"template metadata '{exercise.template_id}'"
                         )
 
-            for exercise_id, exercise_meta in sorted(exercise_index.items()):
-                matched_tasks = tasks_by_target.get(exercise_meta["target_path"], [])
+            for exercise_id, exercise in sorted(exercise_index.items()):
+                matched_tasks = tasks_by_target.get(exercise.target_path, [])
                 if not matched_tasks:
                     errors.append(
-                        f"{unit_dir / 'sequence.json'}: missing task for exercise '{exercise_id}' "
-                        f"target_path '{exercise_meta['target_path']}'"
+                        f"{sequence_path}: missing task for exercise '{exercise_id}' "
+                        f"target_path '{exercise.target_path}'"
                     )
                     continue
 
                 has_exercise_mapping = False
                 has_template_mapping = False
-                for _, task in matched_tasks:
-                    mapped_ids: set[str] = set()
-                    if isinstance(task.get("exercise_id"), str):
-                        mapped_ids.add(task["exercise_id"])
-                    refs = task.get("exercise_refs", [])
-                    if isinstance(refs, list):
-                        mapped_ids.update(ref for ref in refs if isinstance(ref, str))
-
+                for mapped_ids, mapped_templates in matched_tasks:
                     if exercise_id not in mapped_ids:
                         continue
-
                     has_exercise_mapping = True
-                    mapped_templates: set[str] = set()
-                    if isinstance(task.get("template_id"), str):
-                        mapped_templates.add(task["template_id"])
-                    template_refs = task.get("template_ids", [])
-                    if isinstance(template_refs, list):
-                        mapped_templates.update(ref for ref in template_refs if isinstance(ref, str))
-                    if exercise_meta["template_id"] in mapped_templates:
+                    if exercise.template_id in mapped_templates:
                         has_template_mapping = True
 
                 if not has_exercise_mapping:
                     errors.append(
-                        f"{unit_dir / 'sequence.json'}: tasks targeting '{exercise_meta['target_path']}' must include "
+                        f"{sequence_path}: tasks targeting '{exercise.target_path}' must include "
                         f"exercise mapping for '{exercise_id}'"
                     )
                 if not has_template_mapping:
                     errors.append(
-                        f"{unit_dir / 'sequence.json'}: exercise '{exercise_id}' must include template metadata "
-                        f"'{exercise_meta['template_id']}' in mapped task(s)"
+                        f"{sequence_path}: exercise '{exercise_id}' must include template metadata "
+                        f"'{exercise.template_id}' in mapped task(s)"
                     )
 
     if isinstance(design, dict):
@@ -402,45 +493,32 @@ def _cross_artifact_checks(unit_dir: Path, artifacts: dict[str, dict | list]) ->
                     f"{unit_dir / 'design.json'}: pedagogy_decisions confidence/threshold must be numeric"
                 )
 
-    if isinstance(manifest, dict):
-        outcomes = manifest.get("outcomes", [])
+    if manifest is not None:
+        manifest_path = unit_dir / "outputs/manifest.json"
+        outcomes = manifest.outcomes or ()
         manifest_lo_priorities: dict[str, str] = {}
         manifest_lo_duplicates: set[str] = set()
-        manifest_lo_ids = {
-            item.get("lo_id")
-            for item in outcomes
-            if isinstance(item, dict) and isinstance(item.get("lo_id"), str)
-        }
-        if isinstance(outcomes, list):
-            seen_manifest_lo_ids: set[str] = set()
-            for index, item in enumerate(outcomes):
-                if not isinstance(item, dict):
-                    continue
-                lo_id = item.get("lo_id")
-                if not isinstance(lo_id, str):
-                    continue
-                if lo_id in seen_manifest_lo_ids:
-                    manifest_lo_duplicates.add(lo_id)
-                seen_manifest_lo_ids.add(lo_id)
-                priority = item.get("priority")
-                if isinstance(priority, str):
-                    manifest_lo_priorities[lo_id] = priority
-                evidence_refs = item.get("evidence_refs", [])
-                if isinstance(evidence_refs, list) and f"brief:{lo_id}" not in evidence_refs:
-                    errors.append(
-                        f"{unit_dir / 'outputs/manifest.json'}: outcomes[{index}] must include evidence_refs entry "
-                        f"'brief:{lo_id}'"
-                    )
+        manifest_lo_ids: set[str] = set()
+        for outcome in outcomes:
+            lo_id = outcome.lo_id
+            if lo_id is None:
+                continue
+            if lo_id in manifest_lo_ids:
+                manifest_lo_duplicates.add(lo_id)
+            manifest_lo_ids.add(lo_id)
+            if outcome.priority is not None:
+                manifest_lo_priorities[lo_id] = outcome.priority
+            if outcome.evidence_refs is not None and f"brief:{lo_id}" not in outcome.evidence_refs:
+                errors.append(
+                    f"{manifest_path}: outcomes[{outcome.position}] must include evidence_refs entry 'brief:{lo_id}'"
+                )
 
         if manifest_lo_duplicates:
-            errors.append(
-                f"{unit_dir / 'outputs/manifest.json'}: duplicate outcome LO IDs found: "
-                f"{sorted(manifest_lo_duplicates)}"
-            )
+            errors.append(f"{manifest_path}: duplicate outcome LO IDs found: {sorted(manifest_lo_duplicates)}")
 
         if brief_lo_ids and manifest_lo_ids != brief_lo_ids:
             errors.append(
-                f"{unit_dir / 'outputs/manifest.json'}: LO IDs {sorted(manifest_lo_ids)} "
+                f"{manifest_path}: LO IDs {sorted(manifest_lo_ids)} "
                 f"must exactly match brief LO IDs {sorted(brief_lo_ids)}"
             )
 
@@ -450,71 +528,69 @@ def _cross_artifact_checks(unit_dir: Path, artifacts: dict[str, dict | list]) ->
                 manifest_priority = manifest_lo_priorities.get(lo_id)
                 if manifest_priority and brief_priority != manifest_priority:
                     errors.append(
-                        f"{unit_dir / 'outputs/manifest.json'}: LO {lo_id} priority {manifest_priority} "
+                        f"{manifest_path}: LO {lo_id} priority {manifest_priority} "
                         f"must match brief priority {brief_priority}"
                     )
 
-        artifacts_section = manifest.get("artifacts", [])
-        if isinstance(artifacts_section, list):
-            seen_artifact_ids: set[str] = set()
-            seen_artifact_paths: set[str] = set()
-            for index, artifact in enumerate(artifacts_section):
-                if not isinstance(artifact, dict):
-                    continue
-                artifact_id = artifact.get("id")
-                if isinstance(artifact_id, str):
-                    if artifact_id in seen_artifact_ids:
-                        errors.append(
-                            f"{unit_dir / 'outputs/manifest.json'}: duplicate artifacts[{index}].id '{artifact_id}'"
-                        )
-                    seen_artifact_ids.add(artifact_id)
-                path_value = artifact.get("path")
-                if not isinstance(path_value, str):
-                    continue
-                if path_value in seen_artifact_paths:
-                    errors.append(
-                        f"{unit_dir / 'outputs/manifest.json'}: duplicate artifacts[{index}].path '{path_value}'"
-                    )
-                seen_artifact_paths.add(path_value)
-                artifact_path = (unit_dir / path_value).resolve()
-                try:
-                    artifact_path.relative_to(unit_dir.resolve())
-                except ValueError:
-                    errors.append(
-                        f"{unit_dir / 'outputs/manifest.json'}: artifacts[{index}] path escapes unit dir: {path_value}"
-                    )
-                    continue
-                if not artifact_path.exists():
-                    errors.append(
-                        f"{unit_dir / 'outputs/manifest.json'}: artifacts[{index}] path does not exist: {path_value}"
-                    )
-                    continue
-                checksum = artifact.get("checksum")
-                if isinstance(checksum, str) and checksum.lower().startswith("sha256:"):
-                    actual_checksum = _sha256_file(artifact_path)
-                    if checksum.split(":", 1)[1].lower() != actual_checksum:
-                        errors.append(
-                            f"{unit_dir / 'outputs/manifest.json'}: artifacts[{index}] checksum mismatch for "
-                            f"path '{path_value}'"
-                        )
+        manifest_artifacts = manifest.artifacts or ()
+        unit_root = unit_dir.resolve()
+        digests: dict[Path, str] = {}
+        if checksums is not None:
+            # Hash every checksummed artifact up front so large media files are digested concurrently.
+            candidates = (
+                (unit_dir / artifact.path).resolve()
+                for artifact in manifest_artifacts
+                if artifact.path is not None
+                and artifact.checksum is not None
+                and artifact.checksum.lower().startswith("sha256:")
+            )
+            digests = checksums.digest_many(
+                (path for path in candidates if path.is_relative_to(unit_root)),
+                stats=checksum_stats,
+            )
+        seen_artifact_ids: set[str] = set()
+        seen_artifact_paths: set[str] = set()
+        for artifact in manifest_artifacts:
+            index = artifact.position
+            if artifact.id is not None:
+                if artifact.id in seen_artifact_ids:
+                    errors.append(f"{manifest_path}: duplicate artifacts[{index}].id '{artifact.id}'")
+                seen_artifact_ids.add(artifact.id)
+            path_value = artifact.path
+            if path_value is None:
+                continue
+            if path_value in seen_artifact_paths:
+                errors.append(f"{manifest_path}: duplicate artifacts[{index}].path '{path_value}'")
+            seen_artifact_paths.add(path_value)
+            artifact_path = (unit_dir / path_value).resolve()
+            if not artifact_path.is_relative_to(unit_root):
+                errors.append(f"{manifest_path}: artifacts[{index}] path escapes unit dir: {path_value}")
+                continue
+            if not artifact_path.exists():
+                errors.append(f"{manifest_path}: artifacts[{index}] path does not exist: {path_value}")
+                continue
+            checksum = artifact.checksum
+            if checksum is not None and checksum.lower().startswith("sha256:"):
+                actual_checksum = digests.get(artifact_path) or _sha256_file(artifact_path)
+                if checksum.split(":", 1)[1].lower() != actual_checksum:
+                    errors.append(f"{manifest_path}: artifacts[{index}] checksum mismatch for path '{path_value}'")
 
-    if isinstance(audit, dict) and isinstance(manifest, dict):
+    if isinstance(audit, dict) and manifest is not None:
         audit_decision = audit.get("gate_decision")
-        manifest_gate = manifest.get("gate_status", {})
-        if isinstance(manifest_gate, dict):
-            manifest_decision = manifest_gate.get("decision")
-            if isinstance(audit_decision, str) and isinstance(manifest_decision, str):
+        manifest_gate = manifest.gate_status
+        if manifest_gate is not None:
+            manifest_decision = manifest_gate.decision
+            if isinstance(audit_decision, str) and manifest_decision is not None:
                 if audit_decision != manifest_decision:
                     errors.append(
                         f"{unit_dir / 'audit-report.json'} gate_decision '{audit_decision}' "
-                        f"must match {unit_dir / 'outputs/manifest.json'} gate_status.decision '{manifest_decision}'"
+                        f"must match {manifest_path} gate_status.decision '{manifest_decision}'"
                     )
 
-            audit_critical = audit.get("open_critical")
-            audit_high = audit.get("open_high")
-            manifest_critical = manifest_gate.get("open_critical")
-            manifest_high = manifest_gate.get("open_high")
-            if audit_critical != manifest_critical or audit_high != manifest_high:
+            if (
+                audit.get("open_critical") != manifest_gate.open_critical
+                or audit.get("open_high") != manifest_gate.open_high
+            ):
                 errors.append(
                     f"{unit_dir / 'audit-report.json'} open counters must match manifest gate_status counters"
                 )
@@ -578,12 +654,13 @@ def _validate_exercise_design_contract(
     unit_dir: Path,
     template_pack_dir: Path,
     catalog: dict[str, Any],
-) -> tuple[list[dict[str, Any]], list[str]]:
-    findings: list[dict[str, Any]] = []
+    store: ArtifactStore,
+) -> tuple[list[Finding], list[str]]:
+    findings: list[Finding] = []
     outputs: list[str] = []
 
     exercise_design_path = unit_dir / "exercise-design.json"
-    payload = _load_json(exercise_design_path)
+    payload = store.payload(exercise_design_path)
     if not isinstance(payload, dict):
         findings.append(
             _build_finding(
@@ -640,7 +717,8 @@ def _validate_exercise_design_contract(
                     code="TMP_EXERCISE_TEMPLATE_UNKNOWN",
                     category="TEMPLATE",
                     severity="HIGH",
-                    message=f"exercise references unknown template_id '{template_id or 'missing'}'",
+                    message="exercise references unknown template_id '{}'",
+                    message_args=(template_id or "missing",),
                     path=f"{exercise_design_path}#/exercises/{index}",
                     rule_id="exercise-template-known",
                 )
@@ -659,7 +737,8 @@ def _validate_exercise_design_contract(
                     code="TMP_EXERCISE_SCHEMA_REF_MISMATCH",
                     category="TEMPLATE",
                     severity="HIGH",
-                    message=f"template_schema_ref '{actual_schema_ref}' must match catalog schema '{expected_schema_ref}'",
+                    message="template_schema_ref '{}' must match catalog schema '{}'",
+                    message_args=(actual_schema_ref, expected_schema_ref),
                     path=f"{exercise_design_path}#/exercises/{index}/template_schema_ref",
                     rule_id="exercise-template-schema-ref",
                 )
@@ -671,7 +750,8 @@ def _validate_exercise_design_contract(
                     code="TMP_EXERCISE_RULES_REF_MISMATCH",
                     category="TEMPLATE",
                     severity="HIGH",
-                    message=f"template_rules_ref '{actual_rules_ref}' must match catalog rules '{expected_rules_ref}'",
+                    message="template_rules_ref '{}' must match catalog rules '{}'",
+                    message_args=(actual_rules_ref, expected_rules_ref),
                     path=f"{exercise_design_path}#/exercises/{index}/template_rules_ref",
                     rule_id="exercise-template-rules-ref",
                 )
@@ -696,21 +776,23 @@ def _validate_exercise_design_contract(
                     code="TMP_EXERCISE_TEMPLATE_SCHEMA_MISSING",
                     category="TEMPLATE",
                     severity="HIGH",
-                    message=f"template schema file not found for template '{template_id}'",
+                    message="template schema file not found for template '{}'",
+                    message_args=(template_id,),
                     path=str(schema_path),
                     rule_id="exercise-template-schema-file",
                 )
             )
             continue
 
-        schema_payload = _load_json(schema_path)
+        schema_payload = store.payload(schema_path)
         if not isinstance(schema_payload, dict):
             findings.append(
                 _build_finding(
                     code="TMP_EXERCISE_TEMPLATE_SCHEMA_INVALID_JSON",
                     category="TEMPLATE",
                     severity="HIGH",
-                    message=f"template schema is invalid JSON for template '{template_id}'",
+                    message="template schema is invalid JSON for template '{}'",
+                    message_args=(template_id,),
                     path=str(schema_path),
                     rule_id="exercise-template-schema-json",
                 )
@@ -741,10 +823,8 @@ def _validate_exercise_design_contract(
                     code="TMP_EXERCISE_SCORING_RUBRIC_KEYS_MISMATCH",
                     category="TEMPLATE",
                     severity="HIGH",
-                    message=(
-                        f"scoring_rubric_required_keys {normalized_provided} do not match template schema "
-                        f"required keys {expected_rubric_keys}"
-                    ),
+                    message="scoring_rubric_required_keys {} do not match template schema required keys {}",
+                    message_args=(normalized_provided, expected_rubric_keys),
                     path=f"{exercise_design_path}#/exercises/{index}/scoring_rubric_required_keys",
                     rule_id="exercise-scoring-rubric-keys-match-template",
                 )
@@ -768,26 +848,19 @@ def _build_finding(
     path: str = "",
     rule_id: str = "",
     details: dict[str, Any] | None = None,
-) -> dict[str, Any]:
-    return {
-        "code": code,
-        "category": category,
-        "severity": severity,
-        "path": path,
-        "rule_id": rule_id,
-        "message": message,
-        "details": details or {},
-        "status": "OPEN",
-    }
+    message_args: tuple[Any, ...] | None = None,
+) -> Finding:
+    # With message_args, message is a str.format template rendered only when the finding is read.
+    return Finding(code, category, severity, message, path, rule_id, details, message_args=message_args)
 
 
-def _phase_status(findings: list[dict[str, Any]], default: str = "PASS") -> tuple[str, str]:
+def _phase_status(findings: list[Finding], default: str = "PASS") -> tuple[str, str]:
     if not findings:
         return default, "INFO"
 
-    if any(item["severity"] in {"CRITICAL", "HIGH"} for item in findings):
+    if any(item.blocking for item in findings):
         return "BLOCK", "HIGH"
-    if any(item["severity"] in {"MEDIUM", "LOW"} for item in findings):
+    if any(item.severity in {"MEDIUM", "LOW"} for item in findings):
         return "WARN", "MEDIUM"
     return "PASS", "INFO"
 
@@ -804,8 +877,11 @@ def _build_step(
     findings_ref: list[int] | None = None,
     duration_ms: int = 0,
     next_action: str = "",
+    metadata: dict[str, Any] | None = None,
+    cached: bool = False,
+    profile: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    return {
+    step = {
         "step_id": step_id,
         "phase": phase,
         "status": status,
@@ -817,6 +893,13 @@ def _build_step(
         "duration_ms": duration_ms,
         "next_action": next_action,
     }
+    if metadata:
+        step["metadata"] = metadata
+    if cached:
+        step["cached"] = True
+    if profile is not None:
+        step["profile"] = profile
+    return step
 
 
 def _normalize_severity(value: Any) -> str:
@@ -826,23 +909,15 @@ def _normalize_severity(value: Any) -> str:
     return "MEDIUM"
 
 
-def _dedupe_findings(findings: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    deduped: list[dict[str, Any]] = []
-    seen: set[tuple[str, str, str]] = set()
-    for item in findings:
-        key = (str(item.get("code", "")), str(item.get("path", "")), str(item.get("message", "")))
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(item)
-    return deduped
-
-
 def _validate_template_catalog(
     *,
     template_pack_dir: Path,
-) -> tuple[dict[str, Any] | None, list[dict[str, Any]], list[str]]:
-    findings: list[dict[str, Any]] = []
+    lock: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any] | None, list[Finding], list[str]]:
+    """Check catalog.json; a fresh ``lock`` (catalog.lock.json) answers the reference checks."""
+    findings: list[Finding] = []
+    lock_refs = lock.get("refs", {}) if lock is not None else {}
+    lock_root = template_pack_dir.resolve()
     outputs: list[str] = []
     catalog_path = template_pack_dir / "catalog.json"
     if not catalog_path.is_file():
@@ -858,7 +933,7 @@ def _validate_template_catalog(
         )
         return None, findings, outputs
 
-    payload = _load_json(catalog_path)
+    payload = load_json(catalog_path)
     if not isinstance(payload, dict):
         findings.append(
             _build_finding(
@@ -921,7 +996,8 @@ def _validate_template_catalog(
                     code="TMP_CATALOG_TEMPLATE_ID_DUPLICATE",
                     category="TEMPLATE",
                     severity="HIGH",
-                    message=f"Duplicate template_id '{template_id}'",
+                    message="Duplicate template_id '{}'",
+                    message_args=(template_id,),
                     path=f"{catalog_path}#/templates/{index}",
                     rule_id="template-id-unique",
                 )
@@ -939,20 +1015,28 @@ def _validate_template_catalog(
                         code="TMP_CATALOG_REF_MISSING",
                         category="TEMPLATE",
                         severity="HIGH",
-                        message=f"Template '{template_id}' is missing {label} reference",
+                        message="Template '{}' is missing {} reference",
+                        message_args=(template_id, label),
                         path=f"{catalog_path}#/templates/{index}",
                         rule_id="template-ref-required",
                     )
                 )
                 continue
-            resolved = (template_pack_dir / rel_path).resolve()
-            if not resolved.is_file():
+            locked = lock_refs.get(rel_path)
+            if locked is not None:
+                resolved = lock_root / locked["path"]
+                exists = bool(locked["exists"])
+            else:
+                resolved = (template_pack_dir / rel_path).resolve()
+                exists = resolved.is_file()
+            if not exists:
                 findings.append(
                     _build_finding(
                         code="TMP_CATALOG_REF_NOT_FOUND",
                         category="TEMPLATE",
                         severity="HIGH",
-                        message=f"Template '{template_id}' {label} reference does not exist",
+                        message="Template '{}' {} reference does not exist",
+                        message_args=(template_id, label),
                         path=str(resolved),
                         rule_id="template-ref-exists",
                     )
@@ -962,12 +1046,77 @@ def _validate_template_catalog(
     return payload, findings, outputs
 
 
+_CATALOG_CACHE: dict[str, tuple[tuple[Any, ...], tuple[dict[str, Any] | None, list[Finding], list[str]]]] = {}
+
+
+def _load_template_catalog(
+    template_pack_dir: Path,
+) -> tuple[dict[str, Any] | None, list[Finding], list[str]]:
+    """Memoized _validate_template_catalog keyed by the pack's catalog.lock.json stat signatures.
+
+    Batch workers validate many units against the same pack, so the catalog is
+    parsed and checked once per process. The lock is rebuilt when stale, and its
+    resolved references replace a resolve()/is_file() per template. Callers
+    receive deep copies because findings are later mutated into per-unit reports.
+    """
+    catalog_path = template_pack_dir / "catalog.json"
+    lock = load_lock(template_pack_dir)
+    if lock is None:
+        return _validate_template_catalog(template_pack_dir=template_pack_dir)
+
+    key = str(catalog_path.resolve())
+    signature = (lock["catalog"]["size"], lock["catalog"]["mtime_ns"], repr(lock["directories"]))
+    cached = _CATALOG_CACHE.get(key)
+    if cached is None or cached[0] != signature:
+        cached = (signature, _validate_template_catalog(template_pack_dir=template_pack_dir, lock=lock))
+        _CATALOG_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+_PROFICIENCY_FIXTURES = (
+    "proficiency.framework-registry.v1.json",
+    "proficiency.crosswalks.v1.json",
+    "proficiency.subject-pivots.v1.json",
+)
+_PROFICIENCY_CACHE: dict[str, tuple[tuple[tuple[int, int], ...], tuple[dict[str, Any], dict[str, Any], dict[str, Any]]]] = {}
+
+
+def _load_proficiency_fixtures(repo_root: Path) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Framework registry, crosswalks and subject pivots, memoized by the fixture files' stat signatures.
+
+    The proficiency engine only reads these payloads, so they are shared without copying.
+    """
+    from lcs_cli.proficiency.registry import (  # type: ignore
+        load_crosswalks,
+        load_framework_registry,
+        load_subject_pivots,
+    )
+
+    fixtures_dir = repo_root / "contracts" / "fixtures"
+    signature: list[tuple[int, int]] = []
+    for name in _PROFICIENCY_FIXTURES:
+        try:
+            stat = (fixtures_dir / name).stat()
+        except OSError:
+            signature.append((-1, -1))
+        else:
+            signature.append((stat.st_size, stat.st_mtime_ns))
+    key = str(repo_root.resolve())
+    cached = _PROFICIENCY_CACHE.get(key)
+    if cached is None or cached[0] != tuple(signature):
+        loaded = (load_framework_registry(repo_root), load_crosswalks(repo_root), load_subject_pivots(repo_root))
+        cached = (tuple(signature), loaded)
+        _PROFICIENCY_CACHE[key] = cached
+    return cached[1]
+
+
 def _validate_blueprint_schema(
     *,
     unit_dir: Path,
     catalog: dict[str, Any],
-) -> tuple[list[dict[str, Any]], list[str], dict[str, Any] | None, dict[str, Any] | None]:
-    findings: list[dict[str, Any]] = []
+    store: ArtifactStore,
+) -> tuple[list[Finding], list[str], dict[str, Any] | None, dict[str, Any] | None]:
+    findings: list[Finding] = []
     outputs: list[str] = []
 
     blueprint_path = unit_dir / "assessment-blueprint.json"
@@ -976,8 +1125,8 @@ def _validate_blueprint_schema(
     if not blueprint_path.is_file() and not selection_path.is_file():
         return findings, outputs, None, None
 
-    blueprint = _load_json(blueprint_path) if blueprint_path.is_file() else None
-    selection = _load_json(selection_path) if selection_path.is_file() else None
+    blueprint = store.payload(blueprint_path)
+    selection = store.payload(selection_path)
 
     if blueprint_path.is_file() and not isinstance(blueprint, dict):
         findings.append(
@@ -1055,7 +1204,8 @@ def _validate_blueprint_schema(
                             code="TMP_BLUEPRINT_TEMPLATE_UNKNOWN",
                             category="TEMPLATE",
                             severity="HIGH",
-                            message=f"target_distribution template_id '{template_id}' is not in catalog",
+                            message="target_distribution template_id '{}' is not in catalog",
+                            message_args=(template_id,),
                             path=f"{blueprint_path}#/target_distribution/{index}",
                             rule_id="blueprint-template-known",
                         )
@@ -1118,7 +1268,8 @@ def _validate_blueprint_schema(
                             code="TMP_SELECTION_TEMPLATE_UNKNOWN",
                             category="TEMPLATE",
                             severity="HIGH",
-                            message=f"selected template '{template_id}' is not in catalog",
+                            message="selected template '{}' is not in catalog",
+                            message_args=(template_id,),
                             path=f"{selection_path}#/selected_templates/{index}",
                             rule_id="selection-template-known",
                         )
@@ -1133,8 +1284,8 @@ def _validate_template_rules(
     brief: dict[str, Any] | None,
     blueprint: dict[str, Any] | None,
     selection: dict[str, Any] | None,
-) -> tuple[list[dict[str, Any]], list[str]]:
-    findings: list[dict[str, Any]] = []
+) -> tuple[list[Finding], list[str]]:
+    findings: list[Finding] = []
     outputs: list[str] = []
 
     if blueprint is None and selection is None:
@@ -1177,7 +1328,8 @@ def _validate_template_rules(
                                 code="TMP_BLUEPRINT_LO_UNMAPPED",
                                 category="TEMPLATE",
                                 severity="MEDIUM",
-                                message=f"LO '{lo_id}' has no mapped template in assessment blueprint",
+                                message="LO '{}' has no mapped template in assessment blueprint",
+                                message_args=(lo_id,),
                                 path=str(unit_dir / "assessment-blueprint.json"),
                                 rule_id="blueprint-lo-coverage",
                             )
@@ -1229,29 +1381,58 @@ def _validate_template_rules(
     return findings, outputs
 
 
-def _validate_template_rules_with_validator(
+TEMPLATE_VALIDATOR_ENTRYPOINT = "validate"
+_TEMPLATE_VALIDATOR_DECLARES_ENTRYPOINT = re.compile(rf"^def {TEMPLATE_VALIDATOR_ENTRYPOINT}\(", re.MULTILINE)
+_TEMPLATE_VALIDATOR_PLUGINS: dict[tuple[str, str, str], Callable[..., Any] | None] = {}
+
+
+def _load_template_validator_plugin(validator_path: Path, catalog_version: str) -> Callable[..., Any] | None:
+    """Return the pack's in-process ``validate(unit_payloads, pack)`` entrypoint, if it has one.
+
+    Plugins are imported once per (validator path, catalog version, validator sha256).
+    Legacy validators are plain scripts that print JSON at import time, so only files
+    that declare a top-level ``validate`` function are imported; everything else keeps
+    the subprocess contract.
+    """
+    try:
+        raw = validator_path.read_bytes()
+    except OSError:
+        return None
+
+    key = (str(validator_path.resolve()), catalog_version, hashlib.sha256(raw).hexdigest())
+    if key in _TEMPLATE_VALIDATOR_PLUGINS:
+        return _TEMPLATE_VALIDATOR_PLUGINS[key]
+
+    entrypoint: Callable[..., Any] | None = None
+    if _TEMPLATE_VALIDATOR_DECLARES_ENTRYPOINT.search(raw.decode("utf-8", errors="replace")):
+        module_name = f"lcs_template_pack_validator_{key[2][:16]}"
+        spec = importlib.util.spec_from_file_location(module_name, validator_path)
+        if spec is not None and spec.loader is not None:
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)
+            except Exception:  # noqa: BLE001
+                module = None
+            candidate = getattr(module, TEMPLATE_VALIDATOR_ENTRYPOINT, None) if module is not None else None
+            if callable(candidate):
+                entrypoint = candidate
+
+    _TEMPLATE_VALIDATOR_PLUGINS[key] = entrypoint
+    return entrypoint
+
+
+def _catalog_version(catalog: dict[str, Any] | None) -> str:
+    if not isinstance(catalog, dict):
+        return ""
+    return str(catalog.get("catalog_version", catalog.get("version", ""))).strip()
+
+
+def _run_template_validator_subprocess(
     *,
+    validator_path: Path,
     template_pack_dir: Path,
     unit_dir: Path,
-) -> tuple[list[dict[str, Any]], list[str]]:
-    findings: list[dict[str, Any]] = []
-    outputs: list[str] = []
-
-    validator_path = template_pack_dir / "validators" / "validate_template_pack.py"
-    if not validator_path.is_file():
-        findings.append(
-            _build_finding(
-                code="TMP_VALIDATOR_SCRIPT_MISSING",
-                category="TEMPLATE",
-                severity="HIGH",
-                message="Template pack validator script is missing",
-                path=str(validator_path),
-                rule_id="template-validator-script-required",
-            )
-        )
-        return findings, outputs
-
-    outputs.append(str(validator_path))
+) -> tuple[dict[str, Any] | None, list[Finding], int]:
     command = [
         sys.executable,
         str(validator_path),
@@ -1265,7 +1446,7 @@ def _validate_template_rules_with_validator(
     try:
         process = subprocess.run(command, capture_output=True, text=True, check=False)
     except Exception as exc:  # noqa: BLE001
-        findings.append(
+        return None, [
             _build_finding(
                 code="TMP_VALIDATOR_EXEC_FAILED",
                 category="SYSTEM",
@@ -1274,12 +1455,11 @@ def _validate_template_rules_with_validator(
                 path=str(validator_path),
                 rule_id="template-validator-exec",
             )
-        )
-        return findings, outputs
+        ], -1
 
     stdout = process.stdout.strip()
     if not stdout:
-        findings.append(
+        return None, [
             _build_finding(
                 code="TMP_VALIDATOR_NO_OUTPUT",
                 category="SYSTEM",
@@ -1289,13 +1469,12 @@ def _validate_template_rules_with_validator(
                 rule_id="template-validator-json-output",
                 details={"stderr": process.stderr.strip(), "returncode": process.returncode},
             )
-        )
-        return findings, outputs
+        ], process.returncode
 
     try:
-        payload = json.loads(stdout)
+        payload = loads(stdout)
     except Exception as exc:  # noqa: BLE001
-        findings.append(
+        return None, [
             _build_finding(
                 code="TMP_VALIDATOR_OUTPUT_INVALID",
                 category="SYSTEM",
@@ -1305,8 +1484,106 @@ def _validate_template_rules_with_validator(
                 rule_id="template-validator-json-output",
                 details={"stdout": stdout[:300], "returncode": process.returncode},
             )
+        ], process.returncode
+
+    return payload, [], process.returncode
+
+
+def _run_template_validator_plugin(
+    *,
+    entrypoint: Callable[..., Any],
+    validator_path: Path,
+    template_pack_dir: Path,
+    unit_dir: Path,
+    catalog: dict[str, Any] | None,
+    unit_payloads: Mapping[str, Any],
+) -> tuple[dict[str, Any] | None, list[Finding]]:
+    pack = {
+        "template_pack_dir": str(template_pack_dir),
+        "unit_dir": str(unit_dir),
+        "catalog": catalog,
+        "catalog_version": _catalog_version(catalog),
+    }
+    try:
+        result = entrypoint(unit_payloads, pack)
+    except Exception as exc:  # noqa: BLE001
+        return None, [
+            _build_finding(
+                code="TMP_VALIDATOR_EXEC_FAILED",
+                category="SYSTEM",
+                severity="HIGH",
+                message=f"Template validator plugin raised: {exc}",
+                path=str(validator_path),
+                rule_id="template-validator-exec",
+            )
+        ]
+
+    if isinstance(result, dict):
+        return result, []
+    if result is None:
+        return {"FINDINGS": []}, []
+    if isinstance(result, (list, tuple)):
+        return {"FINDINGS": list(result)}, []
+    return None, [
+        _build_finding(
+            code="TMP_VALIDATOR_OUTPUT_INVALID",
+            category="SYSTEM",
+            severity="HIGH",
+            message=f"Template validator plugin returned {type(result).__name__}; expected a findings list",
+            path=str(validator_path),
+            rule_id="template-validator-json-output",
         )
-        return findings, outputs
+    ]
+
+
+def _validate_template_rules_with_validator(
+    *,
+    template_pack_dir: Path,
+    unit_dir: Path,
+    catalog: dict[str, Any] | None = None,
+    unit_payloads: Mapping[str, Any] | None = None,
+) -> tuple[list[Finding], list[str], str]:
+    findings: list[Finding] = []
+    outputs: list[str] = []
+
+    validator_path = template_pack_dir / "validators" / "validate_template_pack.py"
+    if not validator_path.is_file():
+        findings.append(
+            _build_finding(
+                code="TMP_VALIDATOR_SCRIPT_MISSING",
+                category="TEMPLATE",
+                severity="HIGH",
+                message="Template pack validator script is missing",
+                path=str(validator_path),
+                rule_id="template-validator-script-required",
+            )
+        )
+        return findings, outputs, ""
+
+    outputs.append(str(validator_path))
+    entrypoint = _load_template_validator_plugin(validator_path, _catalog_version(catalog))
+    block_details: dict[str, Any] = {}
+    if entrypoint is not None:
+        mode = "in-process"
+        payload, errors = _run_template_validator_plugin(
+            entrypoint=entrypoint,
+            validator_path=validator_path,
+            template_pack_dir=template_pack_dir,
+            unit_dir=unit_dir,
+            catalog=catalog,
+            unit_payloads=unit_payloads if unit_payloads is not None else MappingProxyType({}),
+        )
+    else:
+        mode = "subprocess"
+        payload, errors, returncode = _run_template_validator_subprocess(
+            validator_path=validator_path,
+            template_pack_dir=template_pack_dir,
+            unit_dir=unit_dir,
+        )
+        block_details = {"returncode": returncode}
+    if payload is None:
+        findings.extend(errors)
+        return findings, outputs, mode
 
     raw_findings = payload.get("FINDINGS", [])
     if raw_findings and not isinstance(raw_findings, list):
@@ -1320,7 +1597,7 @@ def _validate_template_rules_with_validator(
                 rule_id="template-validator-findings-list",
             )
         )
-        return findings, outputs
+        return findings, outputs, mode
 
     for item in raw_findings if isinstance(raw_findings, list) else []:
         if not isinstance(item, dict):
@@ -1348,7 +1625,7 @@ def _validate_template_rules_with_validator(
         )
 
     status = str(payload.get("STATUS", "")).strip().upper()
-    has_blocking = any(item["severity"] in {"CRITICAL", "HIGH"} for item in findings)
+    has_blocking = any(item.blocking for item in findings)
     if status == "BLOCK" and not has_blocking:
         findings.append(
             _build_finding(
@@ -1358,14 +1635,14 @@ def _validate_template_rules_with_validator(
                 message="Template validator returned BLOCK without mapped blocking findings",
                 path=str(validator_path),
                 rule_id="template-validator-block-state",
-                details={"returncode": process.returncode},
+                details=block_details,
             )
         )
 
-    return findings, outputs
+    return findings, outputs, mode
 
 
-def _build_phase_summary(steps: list[dict[str, Any]], findings: list[dict[str, Any]], decision: str) -> dict[str, Any]:
+def _build_phase_summary(steps: list[dict[str, Any]], findings: list[Finding], decision: str) -> dict[str, Any]:
     by_phase: dict[str, dict[str, Any]] = {}
     for step in steps:
         phase = step["phase"]
@@ -1376,8 +1653,8 @@ def _build_phase_summary(steps: list[dict[str, Any]], findings: list[dict[str, A
             "duration_ms": step.get("duration_ms", 0),
         }
 
-    open_critical = sum(1 for item in findings if item["severity"] == "CRITICAL")
-    open_high = sum(1 for item in findings if item["severity"] == "HIGH")
+    open_critical = sum(1 for item in findings if item.severity == "CRITICAL")
+    open_high = sum(1 for item in findings if item.severity == "HIGH")
 
     return {
         "decision": decision,
@@ -1393,32 +1670,28 @@ def _build_phase_summary(steps: list[dict[str, Any]], findings: list[dict[str, A
 def _build_agent_report(
     *,
     steps: list[dict[str, Any]],
-    findings: list[dict[str, Any]],
+    findings: list[Finding],
     decision: str,
     unit_dir: Path,
 ) -> dict[str, Any]:
     blocking_steps = [step["step_id"] for step in steps if step["status"] == "BLOCK"]
     top_issues = [
         {
-            "code": finding["code"],
-            "severity": finding["severity"],
-            "message": finding["message"],
-            "path": finding.get("path", ""),
+            "code": finding.code,
+            "severity": finding.severity,
+            "message": finding.message,
+            "path": finding.path,
         }
         for finding in findings[:5]
     ]
     ordered_fix_plan = [
         {
-            "code": finding["code"],
-            "priority": "P0" if finding["severity"] in {"CRITICAL", "HIGH"} else "P1",
-            "action": (
-                f"Fix {finding['code']}"
-                if not finding.get("path")
-                else f"Fix {finding['code']} at {finding['path']}"
-            ),
+            "code": finding.code,
+            "priority": "P0" if finding.blocking else "P1",
+            "action": f"Fix {finding.code}" if not finding.path else f"Fix {finding.code} at {finding.path}",
         }
         for finding in findings
-        if finding["severity"] in {"CRITICAL", "HIGH", "MEDIUM"}
+        if finding.severity in {"CRITICAL", "HIGH", "MEDIUM"}
     ]
 
     if decision == "PASS":
@@ -1438,67 +1711,156 @@ def _build_agent_report(
     }
 
 
-def main() -> int:
-    args = parse_args()
+@dataclass
+class PhaseResult:
+    status: str
+    severity: str
+    message: str
+    inputs: list[str] = field(default_factory=list)
+    outputs: list[str] = field(default_factory=list)
+    findings: list[Finding] = field(default_factory=list)
+    next_action: str = ""
+    metadata: dict[str, Any] = field(default_factory=dict)
+    # Contributions to the top-level VALIDATED/MISSING_*/ERRORS lists.
+    exports: dict[str, list[str]] = field(default_factory=dict)
+    cached: bool = False
+    duration_ms: int = 0
+    # Set only under --profile; never cached.
+    profile: PhaseProfile | None = None
+
+    def to_cache(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "severity": self.severity,
+            "message": self.message,
+            "inputs": self.inputs,
+            "outputs": self.outputs,
+            "findings": [item.to_dict() for item in self.findings],
+            "next_action": self.next_action,
+            "metadata": self.metadata,
+            "exports": self.exports,
+        }
 
-    repo_root = Path(args.repo_root).resolve()
-    unit_dir = Path(args.unit_dir).resolve()
-    schemas_dir = _resolve_schemas_dir(repo_root)
+    @classmethod
+    def from_cache(cls, data: dict[str, Any]) -> "PhaseResult":
+        return cls(
+            status=str(data.get("status", "")),
+            severity=str(data.get("severity", "")),
+            message=str(data.get("message", "")),
+            inputs=list(data.get("inputs", [])),
+            outputs=list(data.get("outputs", [])),
+            findings=[Finding.from_dict(item) for item in data.get("findings", []) if isinstance(item, dict)],
+            next_action=str(data.get("next_action", "")),
+            metadata=dict(data.get("metadata", {})),
+            exports={key: list(value) for key, value in dict(data.get("exports", {})).items()},
+            cached=True,
+        )
 
-    missing_files: list[str] = []
-    missing_schemas: list[str] = []
-    validated: list[str] = []
-    errors: list[str] = []
-    artifacts: dict[str, dict | list] = {}
 
-    findings: list[dict[str, Any]] = []
-    steps: list[dict[str, Any]] = []
+@dataclass
+class ValidationContext:
+    repo_root: Path
+    unit_dir: Path
+    store: ArtifactStore
+    schemas_dir: Path | None
+    template_pack_dir: Path | None
+    schema_cache_dir: Path | None = None
+    schema_registry: SchemaRegistry | None = None
+    max_schema_errors: int | None = DEFAULT_MAX_SCHEMA_ERRORS
+    results: dict[str, PhaseResult] = field(default_factory=dict)
+    profile: bool = False
+    _catalog: tuple[dict[str, Any] | None] | None = None
+    _catalog_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def export(self, phase: str, key: str) -> list[str]:
+        result = self.results.get(phase)
+        return result.exports.get(key, []) if result is not None else []
+
+    def artifacts(self) -> dict[str, dict | list]:
+        validated = set(self.export("artifact_schema", "validated"))
+        artifacts: dict[str, dict | list] = {}
+        for pair in REQUIRED_CONTRACTS:
+            artifact_path = self.unit_dir / pair.artifact
+            if str(artifact_path) not in validated:
+                continue
+            loaded = self.store.payload(artifact_path)
+            if loaded is not None:
+                artifacts[pair.artifact] = loaded
+        return artifacts
 
-    phase_start = time.perf_counter()
-    preflight_findings: list[dict[str, Any]] = []
-    if schemas_dir is None:
-        missing_schemas.append(str(repo_root / "contracts" / "schemas"))
-        preflight_findings.append(
+    def artifact(self, name: str) -> Any:
+        if str(self.unit_dir / name) not in self.export("artifact_schema", "validated"):
+            return None
+        return self.store.payload(self.unit_dir / name)
+
+    def remember_catalog(self, payload: dict[str, Any] | None) -> None:
+        self._catalog = (payload,)
+
+    def catalog(self) -> dict[str, Any] | None:
+        with self._catalog_lock:
+            if self._catalog is None:
+                payload = _load_template_catalog(self.template_pack_dir)[0] if self.template_pack_dir else None
+                self._catalog = (payload,)
+            return self._catalog[0]
+
+
+@dataclass(frozen=True)
+class PhaseSpec:
+    step_id: str
+    phase: str
+    run: Callable[[ValidationContext], PhaseResult]
+    # Files/directories whose contents determine the phase result; None disables caching.
+    inputs: Callable[[ValidationContext], list[Path]] | None = None
+    # Phases whose results this phase reads; independent phases may run concurrently.
+    depends_on: tuple[str, ...] = ()
+
+
+def _run_preflight(ctx: ValidationContext) -> PhaseResult:
+    findings: list[Finding] = []
+    missing_schemas: list[str] = []
+    if ctx.schemas_dir is not None:
+        ctx.schema_registry = SchemaRegistry.shared(ctx.schemas_dir, cache_dir=ctx.schema_cache_dir)
+    else:
+        missing_schemas.append(str(ctx.repo_root / "contracts" / "schemas"))
+        findings.append(
             _build_finding(
                 code="SCHEMA_DIR_NOT_FOUND",
                 category="IO",
                 severity="CRITICAL",
                 message="Schema directory not found (expected contracts/schemas)",
-                path=str(repo_root),
+                path=str(ctx.repo_root),
                 rule_id="schema-dir-required",
             )
         )
-    preflight_status, preflight_severity = _phase_status(preflight_findings)
-    if preflight_findings:
-        findings.extend(preflight_findings)
-        preflight_refs = list(range(len(findings) - len(preflight_findings), len(findings)))
-    else:
-        preflight_refs = []
-    steps.append(
-        _build_step(
-            step_id="PRE_001",
-            phase="preflight",
-            status=preflight_status,
-            severity=preflight_severity,
-            message="Resolved validator inputs and schema bundle",
-            inputs=[str(repo_root), str(unit_dir)],
-            outputs=[str(schemas_dir)] if schemas_dir else [],
-            findings_ref=preflight_refs,
-            duration_ms=int((time.perf_counter() - phase_start) * 1000),
-            next_action="Ensure contracts/schemas exists before re-running." if preflight_status == "BLOCK" else "",
-        )
+    status, severity = _phase_status(findings)
+    return PhaseResult(
+        status=status,
+        severity=severity,
+        message="Resolved validator inputs and schema bundle",
+        inputs=[str(ctx.repo_root), str(ctx.unit_dir)],
+        outputs=[str(ctx.schemas_dir)] if ctx.schemas_dir else [],
+        findings=findings,
+        next_action="Ensure contracts/schemas exists before re-running." if status == "BLOCK" else "",
+        exports={"missing_schemas": missing_schemas},
     )
 
-    phase_start = time.perf_counter()
-    schema_phase_findings: list[dict[str, Any]] = []
-    if schemas_dir is not None:
+
+def _run_artifact_schema(ctx: ValidationContext) -> PhaseResult:
+    unit_dir = ctx.unit_dir
+    findings: list[Finding] = []
+    missing_files: list[str] = []
+    missing_schemas: list[str] = []
+    validated: list[str] = []
+    errors: list[str] = []
+    loaded_names: list[str] = []
+    if ctx.schemas_dir is not None and ctx.schema_registry is not None:
         for pair in REQUIRED_CONTRACTS:
             artifact_path = unit_dir / pair.artifact
-            schema_path = schemas_dir / pair.schema
+            schema_path = ctx.schemas_dir / pair.schema
 
             if not schema_path.is_file():
                 missing_schemas.append(str(schema_path))
-                schema_phase_findings.append(
+                findings.append(
                     _build_finding(
                         code="SCHEMA_FILE_MISSING",
                         category="SCHEMA",
@@ -1512,7 +1874,7 @@ def main() -> int:
 
             if not artifact_path.is_file():
                 missing_files.append(str(artifact_path))
-                schema_phase_findings.append(
+                findings.append(
                     _build_finding(
                         code="ARTIFACT_FILE_MISSING",
                         category="IO",
@@ -1525,10 +1887,13 @@ def main() -> int:
                 continue
 
             validated.append(str(artifact_path))
-            schema_errors = _validate_json(artifact_path, schema_path)
+            loaded_names.append(pair.artifact)
+            schema_errors, truncated = _validate_json(
+                artifact_path, schema_path, ctx.schema_registry, ctx.store, ctx.max_schema_errors
+            )
             errors.extend(schema_errors)
             for msg in schema_errors:
-                schema_phase_findings.append(
+                findings.append(
                     _build_finding(
                         code="SCHEMA_VALIDATION_ERROR",
                         category="SCHEMA",
@@ -1538,12 +1903,23 @@ def main() -> int:
                         rule_id=pair.schema,
                     )
                 )
-
-            loaded = _load_json(artifact_path)
-            if loaded is not None:
-                artifacts[pair.artifact] = loaded
+            if truncated:
+                msg = f"{artifact_path}: {truncated} more schema errors truncated (limit {ctx.max_schema_errors})"
+                errors.append(msg)
+                findings.append(
+                    _build_finding(
+                        code="SCHEMA_ERRORS_TRUNCATED",
+                        category="SCHEMA",
+                        severity="HIGH",
+                        message=msg,
+                        path=str(artifact_path),
+                        rule_id=pair.schema,
+                        details={"reported": len(schema_errors), "truncated": truncated},
+                    )
+                )
+        status, severity = _phase_status(findings, default="PASS")
     else:
-        schema_phase_findings.append(
+        findings.append(
             _build_finding(
                 code="SCHEMA_PHASE_SKIPPED",
                 category="SYSTEM",
@@ -1553,33 +1929,42 @@ def main() -> int:
                 rule_id="artifact-schema-skip",
             )
         )
-
-    schema_status, schema_severity = _phase_status(schema_phase_findings, default="PASS")
-    findings.extend(schema_phase_findings)
-    schema_refs = list(range(len(findings) - len(schema_phase_findings), len(findings))) if schema_phase_findings else []
-    steps.append(
-        _build_step(
-            step_id="ART_SCHEMA_001",
-            phase="artifact_schema",
-            status=schema_status if schemas_dir is not None else "BLOCK",
-            severity=schema_severity if schemas_dir is not None else "HIGH",
-            message="Validated required artifact JSON files against schema contracts",
-            inputs=[str(unit_dir / pair.artifact) for pair in REQUIRED_CONTRACTS],
-            outputs=validated,
-            findings_ref=schema_refs,
-            duration_ms=int((time.perf_counter() - phase_start) * 1000),
-            next_action="Fix missing files/schemas and schema violations." if schema_status != "PASS" else "",
-        )
+        status, severity = "BLOCK", "HIGH"
+
+    return PhaseResult(
+        status=status,
+        severity=severity,
+        message="Validated required artifact JSON files against schema contracts",
+        inputs=[str(unit_dir / pair.artifact) for pair in REQUIRED_CONTRACTS],
+        outputs=validated,
+        findings=findings,
+        next_action="Fix missing files/schemas and schema violations." if status != "PASS" else "",
+        metadata=ctx.store.metadata(loaded_names),
+        exports={
+            "validated": validated,
+            "missing_files": missing_files,
+            "missing_schemas": missing_schemas,
+            "errors": errors,
+        },
     )
 
-    phase_start = time.perf_counter()
-    consistency_findings: list[dict[str, Any]] = []
-    consistency_errors: list[str] = []
-    if schemas_dir is not None and not missing_files and not missing_schemas and not errors:
-        consistency_errors = _cross_artifact_checks(unit_dir, artifacts)
-        errors.extend(consistency_errors)
-        for msg in consistency_errors:
-            consistency_findings.append(
+
+def _run_artifact_consistency(ctx: ValidationContext) -> PhaseResult:
+    unit_dir = ctx.unit_dir
+    findings: list[Finding] = []
+    errors: list[str] = []
+    schema_clean = not (
+        ctx.export("artifact_schema", "missing_files")
+        or ctx.export("preflight", "missing_schemas")
+        or ctx.export("artifact_schema", "missing_schemas")
+        or ctx.export("artifact_schema", "errors")
+    )
+    checksum_stats = {"files_hashed": 0, "bytes_hashed": 0, "files_cached": 0, "bytes_cached": 0}
+    sequence_stats: dict[str, Any] = {}
+    if ctx.schemas_dir is not None and schema_clean:
+        errors = _cross_artifact_checks(unit_dir, ctx.artifacts(), checksum_cache(), checksum_stats, sequence_stats)
+        for msg in errors:
+            findings.append(
                 _build_finding(
                     code="CONSISTENCY_CHECK_FAILED",
                     category="CONSISTENCY",
@@ -1589,160 +1974,114 @@ def main() -> int:
                     rule_id="cross-artifact-consistency",
                 )
             )
-        consistency_status, consistency_severity = _phase_status(consistency_findings)
+        status, severity = _phase_status(findings)
     else:
-        consistency_status = "SKIP"
-        consistency_severity = "INFO"
-
-    findings.extend(consistency_findings)
-    consistency_refs = (
-        list(range(len(findings) - len(consistency_findings), len(findings))) if consistency_findings else []
-    )
-    steps.append(
-        _build_step(
-            step_id="ART_CONS_001",
-            phase="artifact_consistency",
-            status=consistency_status,
-            severity=consistency_severity,
-            message=(
-                "Cross-artifact consistency checks completed"
-                if consistency_status != "SKIP"
-                else "Cross-artifact consistency skipped (schema phase not clean)"
-            ),
-            inputs=[str(unit_dir / pair.artifact) for pair in REQUIRED_CONTRACTS],
-            outputs=["cross-artifact-consistency"],
-            findings_ref=consistency_refs,
-            duration_ms=int((time.perf_counter() - phase_start) * 1000),
-            next_action="Resolve cross-artifact mismatch before publish." if consistency_status == "BLOCK" else "",
-        )
+        status, severity = "SKIP", "INFO"
+
+    return PhaseResult(
+        status=status,
+        severity=severity,
+        message=(
+            "Cross-artifact consistency checks completed"
+            if status != "SKIP"
+            else "Cross-artifact consistency skipped (schema phase not clean)"
+        ),
+        inputs=[str(unit_dir / pair.artifact) for pair in REQUIRED_CONTRACTS],
+        outputs=["cross-artifact-consistency"],
+        findings=findings,
+        next_action="Resolve cross-artifact mismatch before publish." if status == "BLOCK" else "",
+        metadata={
+            **({"checksums": checksum_stats} if any(checksum_stats.values()) else {}),
+            **({"sequence": sequence_stats} if sequence_stats else {}),
+        },
+        exports={"errors": errors},
     )
 
-    template_pack_dir = _resolve_template_pack_dir(repo_root)
 
-    phase_start = time.perf_counter()
-    catalog_payload: dict[str, Any] | None = None
-    catalog_phase_findings: list[dict[str, Any]] = []
-    catalog_outputs: list[str] = []
-    if template_pack_dir is not None:
-        catalog_payload, catalog_phase_findings, catalog_outputs = _validate_template_catalog(
-            template_pack_dir=template_pack_dir
-        )
-        catalog_status, catalog_severity = _phase_status(catalog_phase_findings)
+def _run_template_catalog(ctx: ValidationContext) -> PhaseResult:
+    findings: list[Finding] = []
+    outputs: list[str] = []
+    if ctx.template_pack_dir is not None:
+        catalog_payload, findings, outputs = _load_template_catalog(ctx.template_pack_dir)
+        ctx.remember_catalog(catalog_payload)
     else:
-        catalog_phase_findings.append(
+        findings.append(
             _build_finding(
                 code="TMP_PACK_DIR_MISSING",
                 category="TEMPLATE",
                 severity="HIGH",
                 message="Template pack directory not found; fail-closed policy blocks workflow",
-                path=str(repo_root),
+                path=str(ctx.repo_root),
                 rule_id="template-pack-required",
             )
         )
-        catalog_status, catalog_severity = _phase_status(catalog_phase_findings)
-
-    findings.extend(catalog_phase_findings)
-    catalog_refs = list(range(len(findings) - len(catalog_phase_findings), len(findings))) if catalog_phase_findings else []
-    steps.append(
-        _build_step(
-            step_id="TMP_CAT_001",
-            phase="template_catalog",
-            status=catalog_status,
-            severity=catalog_severity,
-            message=(
-                "Template catalog loaded"
-                if catalog_status != "SKIP"
-                else "Template catalog not found"
-            ),
-            inputs=[str(template_pack_dir)] if template_pack_dir else [],
-            outputs=catalog_outputs,
-            findings_ref=catalog_refs,
-            duration_ms=int((time.perf_counter() - phase_start) * 1000),
-            next_action="Add/repair template-pack catalog.json." if catalog_status == "BLOCK" else "",
-        )
+    status, severity = _phase_status(findings)
+
+    return PhaseResult(
+        status=status,
+        severity=severity,
+        message="Template catalog loaded" if status != "SKIP" else "Template catalog not found",
+        inputs=[str(ctx.template_pack_dir)] if ctx.template_pack_dir else [],
+        outputs=outputs,
+        findings=findings,
+        next_action="Add/repair template-pack catalog.json." if status == "BLOCK" else "",
     )
 
-    phase_start = time.perf_counter()
-    template_schema_findings: list[dict[str, Any]] = []
-    template_schema_outputs: list[str] = []
-    blueprint_payload: dict[str, Any] | None = None
-    selection_payload: dict[str, Any] | None = None
+
+def _run_template_schema(ctx: ValidationContext) -> PhaseResult:
+    unit_dir = ctx.unit_dir
+    findings: list[Finding] = []
+    outputs: list[str] = []
+    catalog_payload = ctx.catalog()
     if catalog_payload is not None:
-        (
-            template_schema_findings,
-            template_schema_outputs,
-            blueprint_payload,
-            selection_payload,
-        ) = _validate_blueprint_schema(unit_dir=unit_dir, catalog=catalog_payload)
-        if template_pack_dir is not None:
+        findings, outputs, _, _ = _validate_blueprint_schema(unit_dir=unit_dir, catalog=catalog_payload, store=ctx.store)
+        if ctx.template_pack_dir is not None:
             exercise_design_findings, exercise_design_outputs = _validate_exercise_design_contract(
                 unit_dir=unit_dir,
-                template_pack_dir=template_pack_dir,
+                template_pack_dir=ctx.template_pack_dir,
                 catalog=catalog_payload,
+                store=ctx.store,
             )
-            template_schema_findings.extend(exercise_design_findings)
-            template_schema_outputs.extend(exercise_design_outputs)
-        if not template_schema_outputs and not template_schema_findings:
-            template_schema_status, template_schema_severity = "SKIP", "INFO"
+            findings.extend(exercise_design_findings)
+            outputs.extend(exercise_design_outputs)
+        if not outputs and not findings:
+            status, severity = "SKIP", "INFO"
         else:
-            template_schema_status, template_schema_severity = _phase_status(template_schema_findings)
+            status, severity = _phase_status(findings)
     else:
-        template_schema_status, template_schema_severity = "SKIP", "INFO"
-
-    findings.extend(template_schema_findings)
-    template_schema_refs = (
-        list(range(len(findings) - len(template_schema_findings), len(findings)))
-        if template_schema_findings
-        else []
-    )
-    steps.append(
-        _build_step(
-            step_id="TMP_SCHEMA_001",
-            phase="template_schema",
-            status=template_schema_status,
-            severity=template_schema_severity,
-            message=(
-                "Template schema checks completed"
-                if template_schema_status != "SKIP"
-                else "Template schema checks skipped"
-            ),
-            inputs=[
-                str(unit_dir / "assessment-blueprint.json"),
-                str(unit_dir / "template-selection.json"),
-                str(unit_dir / "exercise-design.json"),
-            ],
-            outputs=template_schema_outputs,
-            findings_ref=template_schema_refs,
-            duration_ms=int((time.perf_counter() - phase_start) * 1000),
-            next_action=(
-                "Fix template blueprint/selection schema errors before authoring."
-                if template_schema_status == "BLOCK"
-                else ""
-            ),
-        )
+        status, severity = "SKIP", "INFO"
+
+    return PhaseResult(
+        status=status,
+        severity=severity,
+        message="Template schema checks completed" if status != "SKIP" else "Template schema checks skipped",
+        inputs=[
+            str(unit_dir / "assessment-blueprint.json"),
+            str(unit_dir / "template-selection.json"),
+            str(unit_dir / "exercise-design.json"),
+        ],
+        outputs=outputs,
+        findings=findings,
+        next_action="Fix template blueprint/selection schema errors before authoring." if status == "BLOCK" else "",
     )
 
-    brief_payload = artifacts.get("brief.json") if isinstance(artifacts.get("brief.json"), dict) else None
 
-    phase_start = time.perf_counter()
-    prof_findings: list[dict[str, Any]] = []
-    prof_outputs: list[str] = []
-    prof_status: str = "SKIP"
-    prof_severity: str = "INFO"
+def _run_proficiency_rules(ctx: ValidationContext) -> PhaseResult:
+    repo_root = ctx.repo_root
+    unit_dir = ctx.unit_dir
+    findings: list[Finding] = []
+    outputs: list[str] = []
+    status: str = "SKIP"
+    severity: str = "INFO"
 
+    brief_payload = ctx.artifact("brief.json")
     if isinstance(brief_payload, dict) and isinstance(brief_payload.get("proficiency_targets"), list):
+        catalog_payload = ctx.catalog()
         try:
-            from lcs_cli.proficiency.registry import (  # type: ignore
-                load_crosswalks,
-                load_framework_registry,
-                load_subject_pivots,
-            )
             from lcs_cli.proficiency.normalize import normalize_targets_to_pivot  # type: ignore
             from lcs_cli.proficiency.validate import validate_proficiency_targets  # type: ignore
 
-            registry = load_framework_registry(repo_root)
-            crosswalks = load_crosswalks(repo_root)
-            pivots = load_subject_pivots(repo_root)
+            registry, crosswalks, pivots = _load_proficiency_fixtures(repo_root)
             subject = str((catalog_payload or {}).get("subject", "")).strip() if isinstance(catalog_payload, dict) else ""
             targets = brief_payload.get("proficiency_targets", [])
 
@@ -1756,14 +2095,14 @@ def main() -> int:
                 if not isinstance(issue, dict):
                     continue
                 code = str(issue.get("code", "PROF_TARGET_INVALID")).strip() or "PROF_TARGET_INVALID"
-                severity = str(issue.get("severity", "HIGH")).strip().upper() or "HIGH"
+                issue_severity = str(issue.get("severity", "HIGH")).strip().upper() or "HIGH"
                 message = str(issue.get("message", "Invalid proficiency target")).strip() or "Invalid proficiency target"
                 details = issue.get("details", {})
-                prof_findings.append(
+                findings.append(
                     _build_finding(
                         code=code,
                         category="PROFICIENCY",
-                        severity=severity,
+                        severity=issue_severity,
                         message=message,
                         path=str(unit_dir / "brief.json"),
                         rule_id="proficiency-targets",
@@ -1781,7 +2120,7 @@ def main() -> int:
             pivot_targets = normalized.get("pivot_targets", [])
             unmapped_targets = normalized.get("unmapped_targets", [])
             if not isinstance(pivot_targets, list) or not pivot_targets:
-                prof_findings.append(
+                findings.append(
                     _build_finding(
                         code="PROF_NORMALIZE_EMPTY",
                         category="PROFICIENCY",
@@ -1797,7 +2136,7 @@ def main() -> int:
                     )
                 )
             elif isinstance(unmapped_targets, list) and unmapped_targets:
-                prof_findings.append(
+                findings.append(
                     _build_finding(
                         code="PROF_TARGET_UNMAPPED",
                         category="PROFICIENCY",
@@ -1809,13 +2148,13 @@ def main() -> int:
                     )
                 )
 
-            if prof_findings:
-                prof_status, prof_severity = _phase_status(prof_findings)
+            if findings:
+                status, severity = _phase_status(findings)
             else:
-                prof_status, prof_severity = "PASS", "INFO"
-            prof_outputs.append("proficiency.rules")
+                status, severity = "PASS", "INFO"
+            outputs.append("proficiency.rules")
         except Exception as exc:  # noqa: BLE001
-            prof_findings.append(
+            findings.append(
                 _build_finding(
                     code="PROF_ENGINE_FAILED",
                     category="SYSTEM",
@@ -1825,92 +2164,87 @@ def main() -> int:
                     rule_id="proficiency-engine",
                 )
             )
-            prof_status, prof_severity = _phase_status(prof_findings)
-
-    findings.extend(prof_findings)
-    prof_refs = list(range(len(findings) - len(prof_findings), len(findings))) if prof_findings else []
-    steps.append(
-        _build_step(
-            step_id="PROF_RULE_001",
-            phase="proficiency_rules",
-            status=prof_status,
-            severity=prof_severity,
-            message=(
-                "Proficiency target checks completed" if prof_status != "SKIP" else "Proficiency target checks skipped"
-            ),
-            inputs=[str(unit_dir / "brief.json")] + ([str(template_pack_dir / "catalog.json")] if template_pack_dir else []),
-            outputs=prof_outputs,
-            findings_ref=prof_refs,
-            duration_ms=int((time.perf_counter() - phase_start) * 1000),
-            next_action=("Fix proficiency_targets before authoring." if prof_status == "BLOCK" else ""),
-        )
+            status, severity = _phase_status(findings)
+
+    template_pack_dir = ctx.template_pack_dir
+    return PhaseResult(
+        status=status,
+        severity=severity,
+        message="Proficiency target checks completed" if status != "SKIP" else "Proficiency target checks skipped",
+        inputs=[str(unit_dir / "brief.json")] + ([str(template_pack_dir / "catalog.json")] if template_pack_dir else []),
+        outputs=outputs,
+        findings=findings,
+        next_action="Fix proficiency_targets before authoring." if status == "BLOCK" else "",
     )
 
-    phase_start = time.perf_counter()
-    template_rule_findings: list[dict[str, Any]] = []
-    template_rule_outputs: list[str] = []
+
+def _run_template_rules(ctx: ValidationContext) -> PhaseResult:
+    unit_dir = ctx.unit_dir
+    findings: list[Finding] = []
+    outputs: list[str] = []
+    metadata: dict[str, Any] = {}
+    catalog_payload = ctx.catalog()
+    blueprint_payload = ctx.store.payload(unit_dir / "assessment-blueprint.json") if catalog_payload is not None else None
+    selection_payload = ctx.store.payload(unit_dir / "template-selection.json") if catalog_payload is not None else None
+    blueprint_payload = blueprint_payload if isinstance(blueprint_payload, dict) else None
+    selection_payload = selection_payload if isinstance(selection_payload, dict) else None
     if catalog_payload is not None and (blueprint_payload is not None or selection_payload is not None):
-        template_rule_findings, template_rule_outputs = _validate_template_rules(
+        brief_payload = ctx.artifact("brief.json")
+        findings, outputs = _validate_template_rules(
             unit_dir=unit_dir,
-            brief=brief_payload,
+            brief=brief_payload if isinstance(brief_payload, dict) else None,
             blueprint=blueprint_payload,
             selection=selection_payload,
         )
-        if template_pack_dir is not None:
-            validator_findings, validator_outputs = _validate_template_rules_with_validator(
-                template_pack_dir=template_pack_dir,
+        if ctx.template_pack_dir is not None:
+            validator_findings, validator_outputs, validator_mode = _validate_template_rules_with_validator(
+                template_pack_dir=ctx.template_pack_dir,
                 unit_dir=unit_dir,
+                catalog=catalog_payload,
+                unit_payloads=ctx.store.views([pair.artifact for pair in REQUIRED_CONTRACTS]),
             )
-            template_rule_findings.extend(validator_findings)
-            template_rule_outputs.extend(validator_outputs)
-            template_rule_findings = _dedupe_findings(template_rule_findings)
-        if template_rule_findings:
-            template_rule_status, template_rule_severity = _phase_status(template_rule_findings)
+            findings.extend(validator_findings)
+            outputs.extend(validator_outputs)
+            findings = dedupe_findings(findings)
+            if validator_mode:
+                metadata["template_validator_mode"] = validator_mode
+        if findings:
+            status, severity = _phase_status(findings)
         else:
-            template_rule_status, template_rule_severity = "PASS", "INFO"
+            status, severity = "PASS", "INFO"
     else:
-        template_rule_status, template_rule_severity = "SKIP", "INFO"
-
-    findings.extend(template_rule_findings)
-    template_rule_refs = (
-        list(range(len(findings) - len(template_rule_findings), len(findings))) if template_rule_findings else []
-    )
-    steps.append(
-        _build_step(
-            step_id="TMP_RULE_001",
-            phase="template_rules",
-            status=template_rule_status,
-            severity=template_rule_severity,
-            message=(
-                "Template semantic checks completed"
-                if template_rule_status != "SKIP"
-                else "Template semantic checks skipped"
-            ),
-            inputs=[
-                str(unit_dir / "assessment-blueprint.json"),
-                str(unit_dir / "template-selection.json"),
-                str(unit_dir / "exercise-design.json"),
-            ],
-            outputs=template_rule_outputs,
-            findings_ref=template_rule_refs,
-            duration_ms=int((time.perf_counter() - phase_start) * 1000),
-            next_action=(
-                "Address template semantic warnings for better LO coverage and distribution."
-                if template_rule_status in {"WARN", "BLOCK"}
-                else ""
-            ),
-        )
+        status, severity = "SKIP", "INFO"
+
+    return PhaseResult(
+        status=status,
+        severity=severity,
+        message="Template semantic checks completed" if status != "SKIP" else "Template semantic checks skipped",
+        inputs=[
+            str(unit_dir / "assessment-blueprint.json"),
+            str(unit_dir / "template-selection.json"),
+            str(unit_dir / "exercise-design.json"),
+        ],
+        outputs=outputs,
+        findings=findings,
+        next_action=(
+            "Address template semantic warnings for better LO coverage and distribution."
+            if status in {"WARN", "BLOCK"}
+            else ""
+        ),
+        metadata=metadata,
     )
 
-    phase_start = time.perf_counter()
-    rubric_audit_findings: list[dict[str, Any]] = []
-    audit_payload = artifacts.get("audit-report.json")
+
+def _run_rubric_audit(ctx: ValidationContext) -> PhaseResult:
+    unit_dir = ctx.unit_dir
+    findings: list[Finding] = []
+    audit_payload = ctx.artifact("audit-report.json")
     if isinstance(audit_payload, dict):
         gate_decision = str(audit_payload.get("gate_decision", "BLOCK")).upper()
         open_critical = int(audit_payload.get("open_critical", 0))
         open_high = int(audit_payload.get("open_high", 0))
         if gate_decision == "BLOCK" or open_critical > 0 or open_high > 0:
-            rubric_audit_findings.append(
+            findings.append(
                 _build_finding(
                     code="AUDIT_GATE_BLOCK",
                     category="GATE",
@@ -1927,37 +2261,355 @@ def main() -> int:
                     },
                 )
             )
-        rubric_status, rubric_severity = _phase_status(rubric_audit_findings)
+        status, severity = _phase_status(findings)
     else:
-        rubric_status, rubric_severity = "SKIP", "INFO"
+        status, severity = "SKIP", "INFO"
+
+    return PhaseResult(
+        status=status,
+        severity=severity,
+        message="Rubric/audit parity snapshot collected" if status != "SKIP" else "Rubric/audit snapshot skipped",
+        inputs=[str(unit_dir / "audit-report.json")],
+        outputs=["audit-gate-preview"] if status != "SKIP" else [],
+        findings=findings,
+        next_action="Resolve audit blockers before /lcs.author." if status in {"WARN", "BLOCK"} else "",
+    )
+
 
-    findings.extend(rubric_audit_findings)
-    rubric_refs = (
-        list(range(len(findings) - len(rubric_audit_findings), len(findings))) if rubric_audit_findings else []
+def _unit_required_inputs(ctx: ValidationContext) -> list[Path]:
+    return [ctx.unit_dir / pair.artifact for pair in REQUIRED_CONTRACTS]
+
+
+def _unit_tree_inputs(ctx: ValidationContext) -> list[Path]:
+    # Manifest checksums and pack validators may read any file in the unit.
+    return [ctx.unit_dir]
+
+
+def _template_pack_inputs(ctx: ValidationContext) -> list[Path]:
+    if ctx.template_pack_dir is None or not ctx.template_pack_dir.is_dir():
+        return [ctx.template_pack_dir] if ctx.template_pack_dir else []
+    # catalog.lock.json is derived from the rest of the pack and rewritten whenever it goes stale.
+    return sorted(path for path in ctx.template_pack_dir.iterdir() if path.name != LOCK_FILENAME)
+
+
+def _template_schema_inputs(ctx: ValidationContext) -> list[Path]:
+    return [
+        ctx.unit_dir / "assessment-blueprint.json",
+        ctx.unit_dir / "template-selection.json",
+        ctx.unit_dir / "exercise-design.json",
+    ] + _template_pack_inputs(ctx)
+
+
+def _proficiency_inputs(ctx: ValidationContext) -> list[Path]:
+    fixtures = ctx.repo_root / "contracts" / "fixtures"
+    return [
+        ctx.unit_dir / "brief.json",
+        fixtures / "proficiency.framework-registry.v1.json",
+        fixtures / "proficiency.crosswalks.v1.json",
+        fixtures / "proficiency.subject-pivots.v1.json",
+        ctx.repo_root / "src" / "lcs_cli" / "proficiency",
+    ] + ([ctx.template_pack_dir / "catalog.json"] if ctx.template_pack_dir else [])
+
+
+def _template_rules_inputs(ctx: ValidationContext) -> list[Path]:
+    return _unit_tree_inputs(ctx) + _template_pack_inputs(ctx)
+
+
+def _rubric_audit_inputs(ctx: ValidationContext) -> list[Path]:
+    return [ctx.unit_dir / "audit-report.json"]
+
+
+# Declaration order is the output order of STEPS/FINDINGS; depends_on is the execution DAG.
+PIPELINE_STEPS = (
+    PhaseSpec("PRE_001", "preflight", _run_preflight),
+    PhaseSpec(
+        "ART_SCHEMA_001", "artifact_schema", _run_artifact_schema, _unit_required_inputs, depends_on=("preflight",)
+    ),
+    PhaseSpec(
+        "ART_CONS_001",
+        "artifact_consistency",
+        _run_artifact_consistency,
+        _unit_tree_inputs,
+        depends_on=("preflight", "artifact_schema"),
+    ),
+    PhaseSpec("TMP_CAT_001", "template_catalog", _run_template_catalog, _template_pack_inputs),
+    PhaseSpec(
+        "TMP_SCHEMA_001",
+        "template_schema",
+        _run_template_schema,
+        _template_schema_inputs,
+        depends_on=("template_catalog",),
+    ),
+    PhaseSpec(
+        "PROF_RULE_001",
+        "proficiency_rules",
+        _run_proficiency_rules,
+        _proficiency_inputs,
+        depends_on=("artifact_schema", "template_catalog"),
+    ),
+    PhaseSpec(
+        "TMP_RULE_001",
+        "template_rules",
+        _run_template_rules,
+        _template_rules_inputs,
+        depends_on=("artifact_schema", "template_catalog"),
+    ),
+    PhaseSpec(
+        "RUBRIC_001", "rubric_audit", _run_rubric_audit, _rubric_audit_inputs, depends_on=("artifact_schema",)
+    ),
+)
+DEFAULT_PHASE_WORKERS = 4
+
+_VALIDATOR_VERSION: str | None = None
+
+
+# Modules whose code decides validation results (cache invalidation, --changed-since escalation).
+_VALIDATOR_SOURCES = (
+    Path(__file__).name,
+    "artifact_models.py",
+    "artifact_store.py",
+    "json_io.py",
+    "schema_registry.py",
+    "sequence_graph.py",
+    "template_pack_lock.py",
+    "validation_cache.py",
+    "validation_findings.py",
+)
+
+
+def _validator_version() -> str:
+    """Digest of the validator sources; any code change invalidates cached phase results."""
+    global _VALIDATOR_VERSION
+    if _VALIDATOR_VERSION is None:
+        scripts_dir = Path(__file__).resolve().parent
+        digest = hashlib.sha256(RESPONSE_VERSION.encode("utf-8"))
+        for name in _VALIDATOR_SOURCES:
+            digest.update(file_digest(scripts_dir / name).encode("utf-8"))
+        _VALIDATOR_VERSION = digest.hexdigest()
+    return _VALIDATOR_VERSION
+
+
+def _phase_ancestors(phase: str) -> set[str]:
+    specs = {spec.phase: spec for spec in PIPELINE_STEPS}
+    ancestors: set[str] = set()
+    stack = list(specs[phase].depends_on)
+    while stack:
+        dep = stack.pop()
+        if dep not in ancestors:
+            ancestors.add(dep)
+            stack.extend(specs[dep].depends_on)
+    return ancestors
+
+
+def _phase_fingerprint(ctx: ValidationContext, spec: PhaseSpec) -> str:
+    assert spec.inputs is not None
+    # Only phases downstream of preflight see the schema registry (and may run concurrently with
+    # it otherwise), so the bundle digest is part of their fingerprint alone.
+    uses_schemas = "preflight" in _phase_ancestors(spec.phase)
+    salt = (
+        _validator_version(),
+        spec.phase,
+        str(ctx.unit_dir),
+        str(ctx.template_pack_dir or ""),
+        ctx.schema_registry.bundle_digest if uses_schemas and ctx.schema_registry is not None else "",
+        # The error cap changes what the schema phase reports.
+        str(ctx.max_schema_errors or 0) if spec.phase == "artifact_schema" else "",
     )
-    steps.append(
-        _build_step(
-            step_id="RUBRIC_001",
-            phase="rubric_audit",
-            status=rubric_status,
-            severity=rubric_severity,
-            message=(
-                "Rubric/audit parity snapshot collected"
-                if rubric_status != "SKIP"
-                else "Rubric/audit snapshot skipped"
-            ),
-            inputs=[str(unit_dir / "audit-report.json")],
-            outputs=["audit-gate-preview"] if rubric_status != "SKIP" else [],
-            findings_ref=rubric_refs,
-            duration_ms=int((time.perf_counter() - phase_start) * 1000),
-            next_action="Resolve audit blockers before /lcs.author." if rubric_status in {"WARN", "BLOCK"} else "",
-        )
+    return fingerprint(salt, spec.inputs(ctx))
+
+
+def _run_phase(ctx: ValidationContext, spec: PhaseSpec, cache: PhaseCache | None) -> PhaseResult:
+    if ctx.profile:
+        # Imported on demand: cProfile/pstats cost more to import than a fully cached run.
+        from phase_profiler import profile_call
+
+        result, profile = profile_call(spec.step_id, _run_phase_unprofiled, ctx, spec, cache)
+        result.profile = profile
+        return result
+    return _run_phase_unprofiled(ctx, spec, cache)
+
+
+def _run_phase_unprofiled(ctx: ValidationContext, spec: PhaseSpec, cache: PhaseCache | None) -> PhaseResult:
+    phase_start = time.perf_counter()
+    key = ""
+    result: PhaseResult | None = None
+    if cache is not None and spec.inputs is not None:
+        key = _phase_fingerprint(ctx, spec)
+        cached = cache.load(ctx.unit_dir, spec.phase, key)
+        if cached is not None:
+            result = PhaseResult.from_cache(cached)
+    if result is None:
+        result = spec.run(ctx)
+        if key:
+            cache.store(ctx.unit_dir, spec.phase, key, result.to_cache())
+    result.duration_ms = int((time.perf_counter() - phase_start) * 1000)
+    return result
+
+
+def _pipeline_cutoff(
+    results: dict[str, PhaseResult],
+    *,
+    mode: str,
+    max_findings: int | None,
+) -> tuple[int, str]:
+    """Return the declaration index of the last phase to keep and why the pipeline stops there.
+
+    Only completed phases are considered. A fail-fast BLOCK bounds everything after it even when
+    earlier phases are still running; the finding budget needs the completed prefix of the pipeline.
+    """
+    blocking = 0
+    contiguous = True
+    for index, spec in enumerate(PIPELINE_STEPS):
+        result = results.get(spec.phase)
+        if result is None:
+            contiguous = False
+            continue
+        if mode == PIPELINE_MODE_FAIL_FAST and result.status == "BLOCK":
+            return index, PIPELINE_MODE_FAIL_FAST
+        if contiguous and max_findings is not None:
+            blocking += sum(1 for item in result.findings if item.blocking)
+            if blocking >= max_findings:
+                return index, "max-findings"
+    return len(PIPELINE_STEPS), ""
+
+
+def _run_phase_graph(
+    ctx: ValidationContext,
+    cache: PhaseCache | None,
+    workers: int,
+    *,
+    mode: str = PIPELINE_MODE,
+    max_findings: int | None = None,
+) -> None:
+    """Run PIPELINE_STEPS as a DAG, starting each phase once its dependencies have finished.
+
+    Phases past the current stop point (fail-fast BLOCK or exhausted finding budget) are never started.
+    """
+    order = {spec.phase: index for index, spec in enumerate(PIPELINE_STEPS)}
+    if workers <= 1:
+        for index, spec in enumerate(PIPELINE_STEPS):
+            ctx.results[spec.phase] = _run_phase(ctx, spec, cache)
+            if _pipeline_cutoff(ctx.results, mode=mode, max_findings=max_findings)[0] <= index:
+                return
+        return
+
+    pending = {spec.phase: spec for spec in PIPELINE_STEPS}
+    running: dict[Future[PhaseResult], str] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lcs-phase") as executor:
+        while pending or running:
+            cutoff, _ = _pipeline_cutoff(ctx.results, mode=mode, max_findings=max_findings)
+            for phase in [phase for phase in pending if order[phase] > cutoff]:
+                del pending[phase]
+            ready = [
+                phase
+                for phase, spec in pending.items()
+                if all(dep in ctx.results for dep in spec.depends_on)
+            ]
+            for phase in ready:
+                running[executor.submit(_run_phase, ctx, pending.pop(phase), cache)] = phase
+            if not running:
+                if pending:
+                    raise RuntimeError(f"validation phase graph has unsatisfiable dependencies: {sorted(pending)}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                ctx.results[running.pop(future)] = future.result()
+
+
+def validate_unit(
+    *,
+    repo_root: Path,
+    unit_dir: Path,
+    schema_cache_dir: Path | None = None,
+    cache_dir: Path | None = None,
+    phase_workers: int = DEFAULT_PHASE_WORKERS,
+    mode: str = PIPELINE_MODE,
+    max_findings: int | None = None,
+    max_schema_errors: int | None = DEFAULT_MAX_SCHEMA_ERRORS,
+    phase_cache: PhaseCache | None = None,
+    profile: bool = False,
+    profile_out: Path | None = None,
+    store: ArtifactStore | None = None,
+) -> dict[str, Any]:
+    """Validate one unit directory and return the validation-pipeline response payload.
+
+    ``phase_cache`` overrides the on-disk cache selected by ``cache_dir``; watch mode passes a
+    long-lived cache so unchanged phases replay across runs. ``profile`` runs phases
+    sequentially under cProfile/tracemalloc and adds a ``profile`` block to each phase step;
+    ``profile_out`` also writes the unit's collapsed stacks there. ``store`` lets a caller that
+    goes on to read the same artifacts (the author gate) share their parsed payloads.
+    """
+    ctx = ValidationContext(
+        repo_root=repo_root,
+        unit_dir=unit_dir,
+        store=store if store is not None else ArtifactStore(unit_dir),
+        schemas_dir=_resolve_schemas_dir(repo_root),
+        template_pack_dir=_resolve_template_pack_dir(repo_root),
+        schema_cache_dir=schema_cache_dir,
+        max_schema_errors=max_schema_errors,
+        profile=profile or profile_out is not None,
     )
+    if ctx.profile:
+        phase_workers = 1
+    cache = phase_cache
+    if cache is None and cache_dir is not None:
+        cache = PhaseCache(cache_dir)
+    cache_baseline = dict(cache.stats) if cache is not None else {}
+    checksums = configure_checksum_cache(cache_dir / CHECKSUM_CACHE_FILE if cache_dir is not None else None)
+    checksum_baseline = dict(checksums.stats)
+
+    missing_files: list[str] = []
+    missing_schemas: list[str] = []
+    validated: list[str] = []
+    errors: list[str] = []
+    findings: list[Finding] = []
+    steps: list[dict[str, Any]] = []
+
+    _run_phase_graph(ctx, cache, phase_workers, mode=mode, max_findings=max_findings)
+    cutoff, stop_reason = _pipeline_cutoff(ctx.results, mode=mode, max_findings=max_findings)
+    for index, spec in enumerate(PIPELINE_STEPS):
+        if index > cutoff:
+            stopped_at = PIPELINE_STEPS[cutoff].step_id
+            steps.append(
+                _build_step(
+                    step_id=spec.step_id,
+                    phase=spec.phase,
+                    status="SKIP",
+                    severity="INFO",
+                    message=f"Skipped: pipeline stopped after {stopped_at} ({stop_reason})",
+                    metadata={"skipped_reason": stop_reason, "stopped_at": stopped_at},
+                )
+            )
+            continue
+        result = ctx.results[spec.phase]
+        validated.extend(result.exports.get("validated", []))
+        missing_files.extend(result.exports.get("missing_files", []))
+        missing_schemas.extend(result.exports.get("missing_schemas", []))
+        errors.extend(result.exports.get("errors", []))
+        refs = list(range(len(findings), len(findings) + len(result.findings)))
+        findings.extend(result.findings)
+        steps.append(
+            _build_step(
+                step_id=spec.step_id,
+                phase=spec.phase,
+                status=result.status,
+                severity=result.severity,
+                message=result.message,
+                inputs=result.inputs,
+                outputs=result.outputs,
+                findings_ref=refs,
+                duration_ms=result.duration_ms,
+                next_action=result.next_action,
+                metadata=result.metadata,
+                cached=result.cached,
+                profile=result.profile.block if result.profile is not None else None,
+            )
+        )
 
     phase_start = time.perf_counter()
-    blocking_findings = [item for item in findings if item["severity"] in {"CRITICAL", "HIGH"}]
+    blocking_findings = [item for item in findings if item.blocking]
     decision = "PASS" if not blocking_findings else "BLOCK"
-    gate_findings: list[dict[str, Any]] = []
+    gate_findings: list[Finding] = []
     if decision == "BLOCK":
         gate_findings.append(
             _build_finding(
@@ -1991,6 +2643,23 @@ def main() -> int:
     )
 
     phase_start = time.perf_counter()
+    final_metadata = ctx.store.metadata()
+    if cache is not None:
+        final_metadata["phase_cache"] = {key: cache.stats[key] - cache_baseline.get(key, 0) for key in cache.stats}
+    final_metadata["checksums"] = {key: checksums.stats[key] - checksum_baseline.get(key, 0) for key in checksums.stats}
+    if profile_out is not None:
+        from phase_profiler import write_collapsed
+
+        stacks = [
+            line
+            for spec in PIPELINE_STEPS
+            if spec.phase in ctx.results and ctx.results[spec.phase].profile is not None
+            for line in ctx.results[spec.phase].profile.stacks
+        ]
+        collapsed_path = profile_out / f"{unit_dir.name}.collapsed"
+        write_collapsed(collapsed_path, stacks)
+        final_metadata["profile_out"] = str(collapsed_path)
+    checksums.save()
     steps.append(
         _build_step(
             step_id="FINAL_001",
@@ -2001,6 +2670,7 @@ def main() -> int:
             inputs=["pipeline-steps", "pipeline-findings"],
             outputs=["PHASE_SUMMARY", "AGENT_REPORT"],
             duration_ms=int((time.perf_counter() - phase_start) * 1000),
+            metadata=final_metadata,
         )
     )
     phase_summary = _build_phase_summary(steps=steps, findings=findings, decision=decision)
@@ -2017,41 +2687,366 @@ def main() -> int:
         "RESPONSE_VERSION": RESPONSE_VERSION,
         "PIPELINE": {
             "name": PIPELINE_NAME,
-            "mode": PIPELINE_MODE,
+            "mode": mode,
             "phases": list(PIPELINE_PHASES),
         },
         "STEPS": steps,
-        "FINDINGS": findings,
+        "FINDINGS": [item.to_dict() for item in findings],
         "PHASE_SUMMARY": phase_summary,
         "AGENT_REPORT": agent_report,
     }
 
-    if args.json:
-        print(json.dumps(payload, separators=(",", ":")))
+    return payload
+
+
+def _print_text_report(payload: dict[str, Any]) -> None:
+    print(f"STATUS: {payload['STATUS']}")
+    print(f"UNIT_DIR: {payload['UNIT_DIR']}")
+    print(f"VALIDATED: {len(payload['VALIDATED'])}")
+    print(f"RESPONSE_VERSION: {payload['RESPONSE_VERSION']}")
+    print(f"PIPELINE: {payload['PIPELINE']['name']}")
+    if payload["MISSING_SCHEMAS"]:
+        print("MISSING_SCHEMAS:")
+        for item in payload["MISSING_SCHEMAS"]:
+            print(f"  - {item}")
+    if payload["MISSING_FILES"]:
+        print("MISSING_FILES:")
+        for item in payload["MISSING_FILES"]:
+            print(f"  - {item}")
+    if payload["ERRORS"]:
+        print("ERRORS:")
+        for item in payload["ERRORS"]:
+            print(f"  - {item}")
+    if payload["FINDINGS"]:
+        print("FINDINGS:")
+        for item in payload["FINDINGS"]:
+            print(f"  - [{item['severity']}] {item['code']}: {item['message']}")
+
+
+def _discover_units(repo_root: Path, *, program: str | None, units_glob: str | None) -> list[Path]:
+    units: set[Path] = set()
+    if program:
+        units_root = repo_root / "programs" / program / "units"
+        if units_root.is_dir():
+            units.update(path.resolve() for path in units_root.iterdir() if path.is_dir())
+    if units_glob:
+        units.update(path.resolve() for path in repo_root.glob(units_glob) if path.is_dir())
+    return sorted(units)
+
+
+def _init_batch_worker(repo_root: Path, schema_cache_dir: Path | None) -> None:
+    # Warm the per-process caches once so every unit handled by this worker skips setup.
+    schemas_dir = _resolve_schemas_dir(repo_root)
+    if schemas_dir is not None:
+        SchemaRegistry.shared(schemas_dir, cache_dir=schema_cache_dir)
+    template_pack_dir = _resolve_template_pack_dir(repo_root)
+    if template_pack_dir is not None:
+        catalog, _, _ = _load_template_catalog(template_pack_dir)
+        validator_path = template_pack_dir / "validators" / "validate_template_pack.py"
+        if validator_path.is_file():
+            _load_template_validator_plugin(validator_path, _catalog_version(catalog))
+
+
+def _validate_unit_json(repo_root: Path, unit_dir: Path, unit_options: dict[str, Any]) -> tuple[str, str]:
+    payload = validate_unit(repo_root=repo_root, unit_dir=unit_dir, **unit_options)
+    return payload["STATUS"], json.dumps(payload, separators=(",", ":"))
+
+
+def _open_history(repo_root: Path, history_db: str) -> HistoryStore | None:
+    # Imported on demand: the history store is only needed when --history is switched on.
+    from validation_history import HistoryError, HistoryStore, resolve_history_db
+
+    try:
+        return HistoryStore(resolve_history_db(repo_root, history_db))
+    except (HistoryError, OSError, sqlite3.Error) as exc:
+        print(f"WARNING: validation history disabled: {exc}", file=sys.stderr)
+        return None
+
+
+def _record_history(history: HistoryStore | None, payload: dict[str, Any]) -> None:
+    if history is None:
+        return
+    from validation_history import keep_days_from_env
+
+    try:
+        history.record(payload)
+        history.prune_daily(keep_days_from_env())
+    except sqlite3.Error as exc:
+        # History is a side record; never fail a validation run over it.
+        print(f"WARNING: could not record validation history: {exc}", file=sys.stderr)
+
+
+def _run_batch(
+    *,
+    repo_root: Path,
+    unit_dirs: list[Path],
+    unit_options: dict[str, Any],
+    workers: int,
+    as_json: bool,
+    history: HistoryStore | None = None,
+    changed_since: dict[str, Any] | None = None,
+) -> int:
+    """Validate many units; ``unit_options`` are forwarded to validate_unit() for every unit.
+
+    ``changed_since`` is the --changed-since selection summary; with it an empty unit list passes.
+    """
+    schema_cache_dir = unit_options.get("schema_cache_dir")
+    batch_start = time.perf_counter()
+    statuses: dict[str, str] = {}
+    failed_units: dict[str, str] = {}
+
+    def _emit(unit_dir: Path, status: str, line: str) -> None:
+        statuses[str(unit_dir)] = status
+        if history is not None:
+            _record_history(history, loads(line))
+        if as_json:
+            print(line, flush=True)
+        else:
+            print(f"{status} {unit_dir}", flush=True)
+
+    if workers <= 1 or len(unit_dirs) <= 1:
+        _init_batch_worker(repo_root, schema_cache_dir)
+        for unit_dir in unit_dirs:
+            status, line = _validate_unit_json(repo_root, unit_dir, unit_options)
+            _emit(unit_dir, status, line)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(repo_root, schema_cache_dir),
+        ) as executor:
+            futures = {
+                executor.submit(_validate_unit_json, repo_root, unit_dir, unit_options): unit_dir
+                for unit_dir in unit_dirs
+            }
+            for future in as_completed(futures):
+                unit_dir = futures[future]
+                try:
+                    status, line = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    failed_units[str(unit_dir)] = str(exc)
+                    statuses[str(unit_dir)] = "BLOCK"
+                    continue
+                _emit(unit_dir, status, line)
+
+    blocked_units = sorted(unit for unit, status in statuses.items() if status != "PASS")
+    summary: dict[str, Any] = {
+        "status": "PASS" if (unit_dirs or changed_since is not None) and not blocked_units else "BLOCK",
+        "unit_count": len(unit_dirs),
+        "pass_count": len(unit_dirs) - len(blocked_units),
+        "block_count": len(blocked_units),
+        "blocked_units": blocked_units,
+        "failed_units": failed_units,
+        "workers": max(1, min(workers, len(unit_dirs))),
+        "duration_ms": int((time.perf_counter() - batch_start) * 1000),
+    }
+    if changed_since is not None:
+        summary["changed_since"] = changed_since
+    if as_json:
+        print(json.dumps({"BATCH_SUMMARY": summary}, separators=(",", ":")), flush=True)
+    else:
+        print(f"BATCH_STATUS: {summary['status']}")
+        print(f"UNITS: {summary['unit_count']} (pass={summary['pass_count']}, block={summary['block_count']})")
+        if changed_since is not None:
+            escalated_by = changed_since["escalated_by"]
+            scope = f"escalated by {escalated_by}" if escalated_by else "changed units only"
+            print(f"CHANGED_SINCE: {changed_since['ref']} ({changed_since['changed_paths']} path(s), {scope})")
+        for unit in blocked_units:
+            print(f"  - BLOCK {unit}")
+    return 0 if summary["status"] == "PASS" else 1
+
+
+def _emit_payload(payload: dict[str, Any], as_json: bool) -> None:
+    if as_json:
+        print(json.dumps(payload, separators=(",", ":")), flush=True)
+    else:
+        _print_text_report(payload)
+        sys.stdout.flush()
+
+
+def _run_watch(
+    *,
+    repo_root: Path,
+    unit_dir: Path,
+    unit_options: dict[str, Any],
+    as_json: bool,
+    debounce_ms: int,
+    polling: bool,
+    history: HistoryStore | None = None,
+) -> int:
+    """Validate once, then again after every debounced change under ``unit_dir``.
+
+    Schemas, the template catalog, pack plugins and proficiency fixtures stay loaded in this
+    process, and an in-memory phase cache (or the --cache store) replays every phase whose
+    inputs are unchanged. JSON output is one response per line.
+    """
+    options = dict(unit_options)
+    cache_dir = options.get("cache_dir")
+    options["phase_cache"] = PhaseCache(cache_dir) if cache_dir is not None else MemoryPhaseCache()
+    watcher = open_watcher([unit_dir], polling=polling)
+    print(f"Watching {unit_dir} ({watcher.backend}); press Ctrl+C to stop", file=sys.stderr, flush=True)
+
+    last_status = "BLOCK"
+
+    def _revalidate(changed: set[Path]) -> None:
+        nonlocal last_status
+        if changed:
+            names = sorted({_relative_label(path, unit_dir) for path in changed})
+            print(f"Changed: {', '.join(names)}", file=sys.stderr, flush=True)
+        payload = validate_unit(repo_root=repo_root, unit_dir=unit_dir, **options)
+        last_status = payload["STATUS"]
+        _emit_payload(payload, as_json)
+        _record_history(history, payload)
+
+    try:
+        _revalidate(set())
+        watch(watcher, _revalidate, debounce_ms=debounce_ms)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0 if last_status == "PASS" else 1
+
+
+def _relative_label(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix() or "."
+    except ValueError:
+        return str(path)
+
+
+def unit_options_from_args(args: argparse.Namespace, repo_root: Path) -> dict[str, Any]:
+    """validate_unit() keyword arguments for parsed CLI ``args`` (defaults come from LCS_* variables)."""
+    cache_dir: Path | None = None
+    if args.cache_dir:
+        cache_dir = Path(args.cache_dir).expanduser().resolve()
+    elif args.cache:
+        cache_dir = repo_root / DEFAULT_CACHE_SUBDIR
+    return {
+        "schema_cache_dir": Path(args.schema_cache_dir).expanduser().resolve() if args.schema_cache_dir else None,
+        "cache_dir": cache_dir,
+        "phase_workers": args.phase_workers,
+        "mode": args.mode,
+        "max_findings": args.max_findings,
+        "max_schema_errors": args.max_schema_errors,
+        "profile": args.profile,
+        "profile_out": Path(args.profile_out).expanduser().resolve() if args.profile_out else None,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+
+    repo_root = Path(args.repo_root).resolve()
+    if args.max_findings is not None and args.max_findings < 1:
+        print("ERROR: --max-findings must be >= 1", file=sys.stderr)
+        return 2
+    if args.max_schema_errors < 0:
+        print("ERROR: --max-schema-errors must be >= 0", file=sys.stderr)
+        return 2
+    unit_options = unit_options_from_args(args, repo_root)
+    history = _open_history(repo_root, args.history_db) if args.history or args.history_db else None
+    try:
+        return _run(args, repo_root, unit_options, history)
+    finally:
+        if history is not None:
+            history.close()
+
+
+def _shared_inputs(repo_root: Path) -> list[Path]:
+    """Files and directories every unit's validation reads; a change to any of them affects all units."""
+    scripts_dir = Path(__file__).resolve().parent
+    fixtures_dir = repo_root / "contracts" / "fixtures"
+    inputs = [scripts_dir / name for name in _VALIDATOR_SOURCES]
+    inputs += [fixtures_dir / name for name in _PROFICIENCY_FIXTURES]
+    inputs.append(repo_root / "src" / "lcs_cli" / "proficiency")
+    for resolved in (_resolve_schemas_dir(repo_root), _resolve_template_pack_dir(repo_root)):
+        if resolved is not None:
+            inputs.append(resolved)
+    return inputs
+
+
+def _run_changed_since(
+    args: argparse.Namespace, repo_root: Path, unit_options: dict[str, Any], history: HistoryStore | None
+) -> int:
+    # Imported on demand: only --changed-since shells out to git.
+    from changed_units import ChangedUnitsError, git_changed_paths, select_changed_units
+
+    if args.program or args.units_glob:
+        all_units = _discover_units(repo_root, program=args.program, units_glob=args.units_glob)
     else:
-        print(f"STATUS: {status}")
-        print(f"UNIT_DIR: {unit_dir}")
-        print(f"VALIDATED: {len(validated)}")
-        print(f"RESPONSE_VERSION: {RESPONSE_VERSION}")
-        print(f"PIPELINE: {PIPELINE_NAME}")
-        if missing_schemas:
-            print("MISSING_SCHEMAS:")
-            for item in missing_schemas:
-                print(f"  - {item}")
-        if missing_files:
-            print("MISSING_FILES:")
-            for item in missing_files:
-                print(f"  - {item}")
-        if errors:
-            print("ERRORS:")
-            for item in errors:
-                print(f"  - {item}")
-        if findings:
-            print("FINDINGS:")
-            for item in findings:
-                print(f"  - [{item['severity']}] {item['code']}: {item['message']}")
+        all_units = _discover_units(repo_root, program=None, units_glob="programs/*/units/*")
+    try:
+        changed = git_changed_paths(repo_root, args.changed_since)
+    except ChangedUnitsError as exc:
+        print(f"ERROR: --changed-since: {exc}", file=sys.stderr)
+        return 2
+    scope = select_changed_units(
+        repo_root,
+        changed,
+        ref=args.changed_since,
+        shared_inputs=_shared_inputs(repo_root),
+        all_units=all_units,
+    )
+    return _run_batch(
+        repo_root=repo_root,
+        unit_dirs=scope.units,
+        unit_options=unit_options,
+        workers=args.workers,
+        as_json=args.json,
+        history=history,
+        changed_since=scope.summary(),
+    )
+
+
+def _run(args: argparse.Namespace, repo_root: Path, unit_options: dict[str, Any], history: HistoryStore | None) -> int:
+    if args.changed_since:
+        if args.watch or args.unit_dir:
+            print("ERROR: --changed-since cannot be combined with --unit-dir/--watch", file=sys.stderr)
+            return 2
+        return _run_changed_since(args, repo_root, unit_options, history)
+
+    if args.program or args.units_glob:
+        if args.watch:
+            print("ERROR: --watch requires --unit-dir", file=sys.stderr)
+            return 2
+        if args.unit_dir:
+            print("ERROR: --unit-dir cannot be combined with --program/--units-glob", file=sys.stderr)
+            return 2
+        unit_dirs = _discover_units(repo_root, program=args.program, units_glob=args.units_glob)
+        if not unit_dirs:
+            print("ERROR: no unit directories matched --program/--units-glob", file=sys.stderr)
+            return 1
+        return _run_batch(
+            repo_root=repo_root,
+            unit_dirs=unit_dirs,
+            unit_options=unit_options,
+            workers=args.workers,
+            as_json=args.json,
+            history=history,
+        )
+
+    if not args.unit_dir:
+        print("ERROR: one of --unit-dir, --program, --units-glob or --changed-since is required", file=sys.stderr)
+        return 2
+
+    unit_dir = Path(args.unit_dir).resolve()
+    if args.watch:
+        return _run_watch(
+            repo_root=repo_root,
+            unit_dir=unit_dir,
+            unit_options=unit_options,
+            as_json=args.json,
+            debounce_ms=args.watch_debounce_ms,
+            polling=args.watch_polling,
+            history=history,
+        )
+
+    payload = validate_unit(repo_root=repo_root, unit_dir=unit_dir, **unit_options)
+    _emit_payload(payload, args.json)
+    _record_history(history, payload)
 
-    return 0 if status == "PASS" else 1
+    return 0 if payload["STATUS"] == "PASS" else 1
 
 
 if __name__ == "__main__":
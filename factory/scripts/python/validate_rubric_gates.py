@@ -8,7 +8,9 @@ import json
 import re
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from json_io import load_json_object as _load_json
 
 
 MD_GATE_LINE_RE = re.compile(
@@ -30,14 +32,6 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _load_json(path: Path) -> dict[str, Any] | None:
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return None
-    return payload if isinstance(payload, dict) else None
-
-
 def _parse_md_gate_ids(rubrics_dir: Path) -> tuple[list[str], list[str]]:
     parse_errors: list[str] = []
     gate_ids: list[str] = []
@@ -58,11 +52,13 @@ def _parse_md_gate_ids(rubrics_dir: Path) -> tuple[list[str], list[str]]:
     return gate_ids, parse_errors
 
 
-def main() -> int:
-    args = parse_args()
-    rubric_gates_file = Path(args.rubric_gates_file).resolve()
-    rubrics_dir = Path(args.rubrics_dir).resolve() if args.rubrics_dir else None
-
+def evaluate_rubric_gates(
+    rubric_gates_file: Path,
+    rubrics_dir: Path | None = None,
+    *,
+    load: Callable[[Path], dict[str, Any] | None] = _load_json,
+) -> dict[str, Any]:
+    """Rubric gate report for ``rubric_gates_file``; ``load`` lets callers share an already parsed file."""
     blockers: list[str] = []
     parse_errors: list[str] = []
     parity_warnings: list[str] = []
@@ -74,7 +70,7 @@ def main() -> int:
     if not rubric_gates_file.is_file():
         blockers.append(f"Missing rubric gates artifact: {rubric_gates_file}")
     else:
-        payload = _load_json(rubric_gates_file)
+        payload = load(rubric_gates_file)
         if payload is None:
             parse_errors.append(f"{rubric_gates_file}: invalid JSON object")
         else:
@@ -136,7 +132,7 @@ def main() -> int:
                 )
 
     status = "PASS" if not blockers and not parse_errors else "BLOCK"
-    payload = {
+    return {
         "STATUS": status,
         "RUBRIC_GATES_FILE": str(rubric_gates_file),
         "RUBRICS_DIR": str(rubrics_dir) if rubrics_dir else "",
@@ -150,14 +146,26 @@ def main() -> int:
         "BLOCKERS": blockers,
     }
 
+
+def main() -> int:
+    args = parse_args()
+    rubric_gates_file = Path(args.rubric_gates_file).resolve()
+    rubrics_dir = Path(args.rubrics_dir).resolve() if args.rubrics_dir else None
+
+    payload = evaluate_rubric_gates(rubric_gates_file, rubrics_dir)
+    status = payload["STATUS"]
+    parse_errors = payload["PARSE_ERRORS"]
+    parity_warnings = payload["PARITY_WARNINGS"]
+    blockers = payload["BLOCKERS"]
+
     if args.json:
         print(json.dumps(payload, separators=(",", ":")))
     else:
         print(f"STATUS: {status}")
         print(f"RUBRIC_GATES_FILE: {rubric_gates_file}")
-        print(f"GATE_COUNT: {gate_count}")
-        print(f"UNCHECKED_COUNT: {unchecked_count}")
-        print(f"NON_PASS_COUNT: {non_pass_count}")
+        print(f"GATE_COUNT: {payload['GATE_COUNT']}")
+        print(f"UNCHECKED_COUNT: {payload['UNCHECKED_COUNT']}")
+        print(f"NON_PASS_COUNT: {payload['NON_PASS_COUNT']}")
         print(f"PARSE_ERROR_COUNT: {len(parse_errors)}")
         if parse_errors:
             print("PARSE_ERRORS:")
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""On-disk caches for artifact validation: file checksums and per-phase results."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable
+
+from json_io import dump_json, load
+
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_SUBDIR = Path(".lcs") / "cache" / "validation"
+
+CHECKSUM_CACHE_FILE = "checksums.json"
+CHECKSUM_CACHE_VERSION = 1
+# Files at least this large are hashed on the thread pool; hashlib releases the GIL while digesting.
+PARALLEL_HASH_MIN_BYTES = 4 * 1024 * 1024
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _sha256_path(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+class ChecksumCache:
+    """sha256 digests keyed by (path, size, mtime_ns, inode), optionally persisted as JSON."""
+
+    def __init__(self, cache_file: Path | None = None) -> None:
+        self.cache_file = cache_file
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.stats = {"files_hashed": 0, "bytes_hashed": 0, "files_cached": 0, "bytes_cached": 0}
+        if cache_file is not None:
+            self._entries = self._read(cache_file)
+
+    @staticmethod
+    def _read(cache_file: Path) -> dict[str, dict[str, Any]]:
+        try:
+            payload = load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != CHECKSUM_CACHE_VERSION:
+            return {}
+        entries = payload.get("entries", {})
+        return entries if isinstance(entries, dict) else {}
+
+    def _lookup(self, path: Path, stat: os.stat_result) -> str | None:
+        entry = self._entries.get(str(path))
+        if (
+            isinstance(entry, dict)
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("inode") == stat.st_ino
+        ):
+            return str(entry.get("sha256", "")) or None
+        return None
+
+    def _count(self, stats: dict[str, int] | None, kind: str, size: int) -> None:
+        for target in (self.stats, stats) if stats is not None else (self.stats,):
+            target[f"files_{kind}"] = target.get(f"files_{kind}", 0) + 1
+            target[f"bytes_{kind}"] = target.get(f"bytes_{kind}", 0) + size
+
+    def _remember(
+        self, path: Path, stat: os.stat_result, digest: str, stats: dict[str, int] | None = None
+    ) -> None:
+        with self._lock:
+            self._entries[str(path)] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "inode": stat.st_ino,
+                "sha256": digest,
+            }
+            self._dirty = True
+            self._count(stats, "hashed", stat.st_size)
+
+    def _cached(self, path: Path, stats: dict[str, int] | None = None) -> tuple[os.stat_result, str | None]:
+        stat = path.stat()
+        with self._lock:
+            digest = self._lookup(path, stat)
+            if digest is not None:
+                self._count(stats, "cached", stat.st_size)
+        return stat, digest
+
+    def digest(self, path: Path) -> str:
+        stat, digest = self._cached(path)
+        if digest is None:
+            digest = _sha256_path(path)
+            self._remember(path, stat, digest)
+        return digest
+
+    def digest_many(self, paths: Iterable[Path], stats: dict[str, int] | None = None) -> dict[Path, str]:
+        """Digest existing regular files, hashing large cache misses concurrently.
+
+        ``stats`` (if given) receives this call's files/bytes hashed vs served from cache.
+        """
+        digests: dict[Path, str] = {}
+        misses: list[tuple[Path, os.stat_result]] = []
+        for path in dict.fromkeys(paths):
+            try:
+                if not path.is_file():
+                    continue
+                stat, digest = self._cached(path, stats)
+            except OSError:
+                continue
+            if digest is not None:
+                digests[path] = digest
+            elif stat.st_size >= PARALLEL_HASH_MIN_BYTES:
+                misses.append((path, stat))
+            else:
+                digests[path] = _sha256_path(path)
+                self._remember(path, stat, digests[path], stats)
+
+        if len(misses) == 1:
+            path, stat = misses[0]
+            digests[path] = _sha256_path(path)
+            self._remember(path, stat, digests[path], stats)
+        elif misses:
+            with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(misses))) as executor:
+                for (path, stat), digest in zip(misses, executor.map(lambda item: _sha256_path(item[0]), misses)):
+                    digests[path] = digest
+                    self._remember(path, stat, digest, stats)
+        return digests
+
+    def save(self) -> None:
+        if self.cache_file is None or not self._dirty:
+            return
+        with self._lock:
+            # Merge with entries written by concurrent runs (e.g. batch workers) before replacing.
+            merged = self._read(self.cache_file)
+            merged.update(self._entries)
+            payload = {"version": CHECKSUM_CACHE_VERSION, "entries": merged}
+            try:
+                dump_json(self.cache_file, payload, indent=None)
+            except OSError:
+                return
+            self._dirty = False
+
+
+_CHECKSUMS = ChecksumCache()
+
+
+def checksum_cache() -> ChecksumCache:
+    return _CHECKSUMS
+
+
+def configure_checksum_cache(cache_file: Path | None) -> ChecksumCache:
+    """Bind the process-wide checksum cache to ``cache_file`` (None keeps it in memory only)."""
+    global _CHECKSUMS
+    if _CHECKSUMS.cache_file != cache_file:
+        _CHECKSUMS.save()
+        _CHECKSUMS = ChecksumCache(cache_file)
+    return _CHECKSUMS
+
+
+def file_digest(path: Path) -> str:
+    try:
+        return _CHECKSUMS.digest(path)
+    except OSError:
+        return "missing"
+
+
+def expand_inputs(paths: Iterable[Path]) -> list[Path]:
+    """Expand directories to the files beneath them; keep missing paths so absence is fingerprinted."""
+    expanded: set[Path] = set()
+    for path in paths:
+        if path.is_dir():
+            expanded.update(
+                item
+                for item in path.rglob("*")
+                if item.is_file() and "__pycache__" not in item.parts
+            )
+        else:
+            expanded.add(path)
+    return sorted(expanded)
+
+
+def fingerprint(salt: Iterable[str], paths: Iterable[Path]) -> str:
+    hasher = hashlib.sha256()
+    for part in salt:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    for path in expand_inputs(paths):
+        hasher.update(f"{path}\0{file_digest(path)}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class PhaseCache:
+    """One JSON record per (unit, phase); a fingerprint mismatch is a miss and is overwritten."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    def _record_path(self, unit_dir: Path, phase: str) -> Path:
+        unit_key = hashlib.sha256(str(unit_dir).encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / unit_key / f"{phase}.json"
+
+    def load(self, unit_dir: Path, phase: str, key: str) -> dict[str, Any] | None:
+        record_path = self._record_path(unit_dir, phase)
+        try:
+            record = load(record_path)
+        except (OSError, ValueError):
+            self.stats["misses"] += 1
+            return None
+        if (
+            not isinstance(record, dict)
+            or record.get("version") != CACHE_VERSION
+            or record.get("fingerprint") != key
+            or not isinstance(record.get("result"), dict)
+        ):
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return record["result"]
+
+    def store(self, unit_dir: Path, phase: str, key: str, result: dict[str, Any]) -> None:
+        record_path = self._record_path(unit_dir, phase)
+        record = {
+            "version": CACHE_VERSION,
+            "unit_dir": str(unit_dir),
+            "phase": phase,
+            "fingerprint": key,
+            "result": result,
+        }
+        try:
+            dump_json(record_path, record, indent=None)
+        except OSError:
+            # The cache is an optimization; an unwritable cache dir must not fail validation.
+            return
+        self.stats["writes"] += 1
+
+
+class MemoryPhaseCache(PhaseCache):
+    """Process-local PhaseCache for long-running (watch mode) validators; nothing touches disk.
+
+    Records are deep-copied in both directions because callers mutate findings while
+    assembling a response, just as a JSON round-trip through PhaseCache would isolate them.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(Path())
+        self._records: dict[tuple[str, str], tuple[str, dict[str, Any]]] = {}
+
+    def load(self, unit_dir: Path, phase: str, key: str) -> dict[str, Any] | None:
+        record = self._records.get((str(unit_dir), phase))
+        if record is None or record[0] != key:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return copy.deepcopy(record[1])
+
+    def store(self, unit_dir: Path, phase: str, key: str, result: dict[str, Any]) -> None:
+        self._records[(str(unit_dir), phase)] = (key, copy.deepcopy(result))
+        self.stats["writes"] += 1
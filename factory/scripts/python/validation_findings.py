@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Compact finding records for the artifact contract validator.
+
+A broken template pack can report thousands of findings per unit, so each one
+is a ``__slots__`` object rather than an eight-key dict: code, category,
+severity, rule_id and status are interned (they repeat across every finding),
+and a message built from a ``str.format`` template is only rendered the first
+time something reads it. ``to_dict()`` produces the entry emitted in the
+``FINDINGS`` array, with the same keys in the same order as before.
+"""
+
+from __future__ import annotations
+
+from sys import intern
+from typing import Any, Mapping
+
+# Key order of a serialized finding; part of the validator's JSON contract.
+FINDING_KEYS = ("code", "category", "severity", "path", "rule_id", "message", "details", "status")
+
+
+class Finding:
+    """One validator finding.
+
+    Also readable as a mapping (``finding["code"]``, ``finding.get("path")``)
+    for callers written against the dict form.
+    """
+
+    __slots__ = ("code", "category", "severity", "path", "rule_id", "details", "status", "_message", "_args")
+
+    def __init__(
+        self,
+        code: str,
+        category: str,
+        severity: str,
+        message: str,
+        path: str = "",
+        rule_id: str = "",
+        details: dict[str, Any] | None = None,
+        status: str = "OPEN",
+        message_args: tuple[Any, ...] | None = None,
+    ) -> None:
+        self.code = intern(code)
+        self.category = intern(category)
+        self.severity = intern(severity)
+        self.path = path
+        self.rule_id = intern(rule_id)
+        # None stands for an empty details object; most findings carry none.
+        self.details = details or None
+        self.status = intern(status)
+        self._message = message
+        # When set, ``message`` is a str.format template rendered on first read.
+        self._args = message_args
+
+    @property
+    def message(self) -> str:
+        if self._args is not None:
+            self._message = self._message.format(*self._args)
+            self._args = None
+        return self._message
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        """Identity used to drop repeated findings: code, path and rendered message."""
+        return (self.code, self.path, self.message)
+
+    @property
+    def blocking(self) -> bool:
+        return self.severity in ("CRITICAL", "HIGH")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "code": self.code,
+            "category": self.category,
+            "severity": self.severity,
+            "path": self.path,
+            "rule_id": self.rule_id,
+            "message": self.message,
+            "details": self.details if self.details is not None else {},
+            "status": self.status,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Finding:
+        details = data.get("details")
+        return cls(
+            str(data.get("code", "")),
+            str(data.get("category", "")),
+            str(data.get("severity", "")),
+            str(data.get("message", "")),
+            str(data.get("path", "")),
+            str(data.get("rule_id", "")),
+            details if isinstance(details, dict) else None,
+            str(data.get("status", "OPEN")),
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in FINDING_KEYS:
+            raise KeyError(key)
+        if key == "details":
+            return self.details or {}
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self) -> str:
+        return f"Finding({self.code!r}, severity={self.severity!r}, path={self.path!r}, message={self.message!r})"
+
+
+def dedupe_findings(findings: list[Finding]) -> list[Finding]:
+    """Keep the first finding for each ``key``, preserving order."""
+    deduped: list[Finding] = []
+    seen: set[tuple[str, str, str]] = set()
+    for item in findings:
+        key = item.key
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append(item)
+    return deduped
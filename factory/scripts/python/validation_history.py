@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""Opt-in SQLite history of artifact validation runs (``--history``).
+
+validate_artifact_contracts.py appends each validation-pipeline response, with its steps and
+findings, to ``.lcs/state/validation.db``. The ``findings`` and ``runs`` actions answer from
+indexes on unit, program, code, severity and time, so nothing is re-validated.
+
+Retention keeps full detail for ``--keep-days`` (default 30). Older runs are folded into
+per-day rollups and then deleted. Queries that reach back past the retention window read the
+rollups, which only have day resolution.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+DEFAULT_HISTORY_DB = Path(".lcs") / "state" / "validation.db"
+DEFAULT_KEEP_DAYS = 30
+SCHEMA_VERSION = 1
+DAY_SECONDS = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    recorded_at INTEGER NOT NULL,
+    program_id TEXT NOT NULL,
+    unit_id TEXT NOT NULL,
+    unit_dir TEXT NOT NULL,
+    status TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    response_version TEXT NOT NULL,
+    finding_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (recorded_at);
+CREATE INDEX IF NOT EXISTS runs_by_unit ON runs (unit_id, recorded_at);
+CREATE INDEX IF NOT EXISTS runs_by_program ON runs (program_id, recorded_at);
+
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    step_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    status TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    finding_count INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    cached INTEGER NOT NULL,
+    PRIMARY KEY (run_id, step_id)
+) WITHOUT ROWID;
+
+-- Run time, program and unit are copied onto each finding so code/severity queries need no join.
+CREATE TABLE IF NOT EXISTS findings (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    ordinal INTEGER NOT NULL,
+    recorded_at INTEGER NOT NULL,
+    program_id TEXT NOT NULL,
+    unit_id TEXT NOT NULL,
+    code TEXT NOT NULL,
+    category TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    path TEXT NOT NULL,
+    rule_id TEXT NOT NULL,
+    message TEXT NOT NULL,
+    PRIMARY KEY (run_id, ordinal)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS findings_by_code ON findings (code, recorded_at);
+CREATE INDEX IF NOT EXISTS findings_by_severity ON findings (severity, recorded_at);
+CREATE INDEX IF NOT EXISTS findings_by_unit ON findings (unit_id, recorded_at);
+CREATE INDEX IF NOT EXISTS findings_by_program ON findings (program_id, recorded_at);
+
+CREATE TABLE IF NOT EXISTS run_rollups (
+    day TEXT NOT NULL,
+    program_id TEXT NOT NULL,
+    unit_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    run_count INTEGER NOT NULL,
+    PRIMARY KEY (day, program_id, unit_id, status)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS finding_rollups (
+    day TEXT NOT NULL,
+    program_id TEXT NOT NULL,
+    unit_id TEXT NOT NULL,
+    code TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    occurrences INTEGER NOT NULL,
+    run_count INTEGER NOT NULL,
+    PRIMARY KEY (day, program_id, unit_id, code, severity)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS finding_rollups_by_code ON finding_rollups (code, day);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+_RELATIVE = re.compile(r"^(\d+)\s*([mhdw])$")
+_UNIT_SECONDS = {"m": 60, "h": 3600, "d": DAY_SECONDS, "w": 7 * DAY_SECONDS}
+
+
+class HistoryError(ValueError):
+    pass
+
+
+def parse_since(value: str, *, now: float | None = None) -> int:
+    """Unix seconds for ``7d``/``12h``/``30m``/``2w`` ago, or for an ISO 8601 date or date-time (UTC if naive)."""
+    text = value.strip().lower()
+    match = _RELATIVE.match(text)
+    if match:
+        current = time.time() if now is None else now
+        return int(current) - int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        raise HistoryError(f"unrecognized time '{value}' (use e.g. 7d, 12h or 2026-01-31)") from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _day(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d")
+
+
+def _iso(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def unit_identity(unit_dir: str) -> tuple[str, str]:
+    """(program_id, unit_id) for ``programs/<program>/units/<unit>``; program is empty elsewhere."""
+    path = Path(unit_dir)
+    program_id = path.parent.parent.name if path.parent.name == "units" else ""
+    return program_id, path.name
+
+
+class HistoryStore:
+    """Append-only run history plus rollups; one connection, used from one thread."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self._conn.close()
+            raise HistoryError(f"{self.db_path}: unsupported history schema version {version}")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> HistoryStore:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def record(self, payload: Mapping[str, Any], *, recorded_at: float | None = None) -> int:
+        """Store one validation-pipeline response; returns its run id."""
+        timestamp = int(time.time() if recorded_at is None else recorded_at)
+        unit_dir = str(payload.get("UNIT_DIR", ""))
+        program_id, unit_id = unit_identity(unit_dir)
+        findings = [item for item in payload.get("FINDINGS", []) if isinstance(item, dict)]
+        steps = [item for item in payload.get("STEPS", []) if isinstance(item, dict)]
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (recorded_at, program_id, unit_id, unit_dir, status, mode, response_version,"
+                " finding_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    timestamp,
+                    program_id,
+                    unit_id,
+                    unit_dir,
+                    str(payload.get("STATUS", "")),
+                    str(payload.get("PIPELINE", {}).get("mode", "")),
+                    str(payload.get("RESPONSE_VERSION", "")),
+                    len(findings),
+                ),
+            )
+            run_id = int(cursor.lastrowid)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO steps VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        str(step.get("step_id", "")),
+                        str(step.get("phase", "")),
+                        str(step.get("status", "")),
+                        str(step.get("severity", "")),
+                        len(step.get("findings_ref", [])),
+                        int(step.get("duration_ms", 0)),
+                        int(bool(step.get("cached"))),
+                    )
+                    for step in steps
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        ordinal,
+                        timestamp,
+                        program_id,
+                        unit_id,
+                        str(item.get("code", "")),
+                        str(item.get("category", "")),
+                        str(item.get("severity", "")),
+                        str(item.get("path", "")),
+                        str(item.get("rule_id", "")),
+                        str(item.get("message", "")),
+                    )
+                    for ordinal, item in enumerate(findings)
+                ],
+            )
+        return run_id
+
+    def prune(self, keep_days: int = DEFAULT_KEEP_DAYS, *, now: float | None = None) -> dict[str, Any]:
+        """Fold runs recorded before the last ``keep_days`` whole days into rollups and delete them."""
+        current = int(time.time() if now is None else now)
+        # Cut at a UTC day boundary so every rolled-up day is complete.
+        cutoff = (current // DAY_SECONDS - keep_days) * DAY_SECONDS
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO run_rollups (day, program_id, unit_id, status, run_count)
+                SELECT date(recorded_at, 'unixepoch'), program_id, unit_id, status, COUNT(*)
+                FROM runs WHERE recorded_at < ?
+                GROUP BY 1, 2, 3, 4
+                ON CONFLICT (day, program_id, unit_id, status) DO UPDATE SET
+                    run_count = run_count + excluded.run_count
+                """,
+                (cutoff,),
+            )
+            self._conn.execute(
+                """
+                INSERT INTO finding_rollups (day, program_id, unit_id, code, severity, occurrences, run_count)
+                SELECT date(recorded_at, 'unixepoch'), program_id, unit_id, code, severity,
+                    COUNT(*), COUNT(DISTINCT run_id)
+                FROM findings WHERE recorded_at < ?
+                GROUP BY 1, 2, 3, 4, 5
+                ON CONFLICT (day, program_id, unit_id, code, severity) DO UPDATE SET
+                    occurrences = occurrences + excluded.occurrences,
+                    run_count = run_count + excluded.run_count
+                """,
+                (cutoff,),
+            )
+            deleted = self._conn.execute("DELETE FROM runs WHERE recorded_at < ?", (cutoff,)).rowcount
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_pruned_day', ?)", (_day(current),)
+            )
+        return {"runs_rolled_up": deleted, "cutoff": _iso(cutoff), "keep_days": keep_days}
+
+    def prune_daily(self, keep_days: int = DEFAULT_KEEP_DAYS, *, now: float | None = None) -> dict[str, Any] | None:
+        """``prune`` at most once per UTC day; recorders call this after each write."""
+        current = int(time.time() if now is None else now)
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'last_pruned_day'").fetchone()
+        if row is not None and row[0] == _day(current):
+            return None
+        return self.prune(keep_days, now=current)
+
+    def findings(
+        self,
+        *,
+        code: str | None = None,
+        severity: str | None = None,
+        unit: str | None = None,
+        program: str | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Matching findings grouped by (program, unit, code, severity), most recently seen first.
+
+        Detail rows report ``first_seen``/``last_seen`` as UTC timestamps; rolled-up days
+        contribute their date.
+        """
+        filters = {
+            "code": code,
+            "severity": severity.upper() if severity else None,
+            "unit_id": unit,
+            "program_id": program,
+        }
+        clauses = [f"{column} = ?" for column, value in filters.items() if value]
+        params: list[Any] = [value for value in filters.values() if value]
+        detail_where = list(clauses)
+        detail_params = list(params)
+        rollup_where = list(clauses)
+        rollup_params = list(params)
+        if since is not None:
+            detail_where.append("recorded_at >= ?")
+            detail_params.append(since)
+            rollup_where.append("day >= ?")
+            rollup_params.append(_day(since))
+        if until is not None:
+            detail_where.append("recorded_at < ?")
+            detail_params.append(until)
+            rollup_where.append("day <= ?")
+            rollup_params.append(_day(until))
+
+        groups: dict[tuple[str, str, str, str], dict[str, Any]] = {}
+
+        def _merge(key: tuple[str, str, str, str], occurrences: int, runs: int, first: str, last: str) -> None:
+            entry = groups.get(key)
+            if entry is None:
+                program_id, unit_id, finding_code, finding_severity = key
+                groups[key] = {
+                    "program_id": program_id,
+                    "unit_id": unit_id,
+                    "code": finding_code,
+                    "severity": finding_severity,
+                    "occurrences": occurrences,
+                    "runs": runs,
+                    "first_seen": first,
+                    "last_seen": last,
+                }
+                return
+            entry["occurrences"] += occurrences
+            entry["runs"] += runs
+            entry["first_seen"] = min(entry["first_seen"], first)
+            entry["last_seen"] = max(entry["last_seen"], last)
+
+        for program_id, unit_id, finding_code, finding_severity, occurrences, runs, first, last in self._conn.execute(
+            "SELECT program_id, unit_id, code, severity, COUNT(*), COUNT(DISTINCT run_id),"
+            " MIN(recorded_at), MAX(recorded_at) FROM findings"
+            + (f" WHERE {' AND '.join(detail_where)}" if detail_where else "")
+            + " GROUP BY program_id, unit_id, code, severity",
+            detail_params,
+        ):
+            _merge((program_id, unit_id, finding_code, finding_severity), occurrences, runs, _iso(first), _iso(last))
+        for program_id, unit_id, finding_code, finding_severity, occurrences, runs, first, last in self._conn.execute(
+            "SELECT program_id, unit_id, code, severity, SUM(occurrences), SUM(run_count), MIN(day), MAX(day)"
+            " FROM finding_rollups"
+            + (f" WHERE {' AND '.join(rollup_where)}" if rollup_where else "")
+            + " GROUP BY program_id, unit_id, code, severity",
+            rollup_params,
+        ):
+            _merge((program_id, unit_id, finding_code, finding_severity), occurrences, runs, first, last)
+
+        rows = sorted(
+            groups.values(),
+            key=lambda row: (row["last_seen"], row["program_id"], row["unit_id"], row["code"], row["severity"]),
+            reverse=True,
+        )
+        return rows[:limit] if limit else rows
+
+    def runs(
+        self,
+        *,
+        unit: str | None = None,
+        program: str | None = None,
+        status: str | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Retained runs, newest first, with a per-severity finding count."""
+        filters = {"unit_id": unit, "program_id": program, "status": status.upper() if status else None}
+        where = [f"{column} = ?" for column, value in filters.items() if value]
+        params: list[Any] = [value for value in filters.values() if value]
+        if since is not None:
+            where.append("recorded_at >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("recorded_at < ?")
+            params.append(until)
+        query = (
+            "SELECT run_id, recorded_at, program_id, unit_id, status, mode, finding_count FROM runs"
+            + (f" WHERE {' AND '.join(where)}" if where else "")
+            + " ORDER BY recorded_at DESC, run_id DESC"
+            + (" LIMIT ?" if limit else "")
+        )
+        rows = [
+            {
+                "run_id": run_id,
+                "recorded_at": _iso(recorded_at),
+                "program_id": program_id,
+                "unit_id": unit_id,
+                "status": run_status,
+                "mode": mode,
+                "finding_count": finding_count,
+                "by_severity": {},
+            }
+            for run_id, recorded_at, program_id, unit_id, run_status, mode, finding_count in self._conn.execute(
+                query, params + ([limit] if limit else [])
+            )
+        ]
+        by_id = {row["run_id"]: row for row in rows}
+        for chunk in _chunks(list(by_id), 500):
+            for run_id, finding_severity, count in self._conn.execute(
+                "SELECT run_id, severity, COUNT(*) FROM findings"
+                f" WHERE run_id IN ({', '.join('?' * len(chunk))}) GROUP BY run_id, severity",
+                chunk,
+            ):
+                by_id[run_id]["by_severity"][finding_severity] = count
+        return rows
+
+
+def _chunks(values: list[Any], size: int) -> Iterable[list[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def resolve_history_db(repo_root: Path, db: str | None = None) -> Path:
+    if db:
+        return Path(db).expanduser().resolve()
+    configured = os.getenv("LCS_VALIDATION_HISTORY_DB", "")
+    return Path(configured).expanduser().resolve() if configured else repo_root / DEFAULT_HISTORY_DB
+
+
+def keep_days_from_env() -> int:
+    try:
+        return max(0, int(os.getenv("LCS_VALIDATION_HISTORY_KEEP_DAYS", str(DEFAULT_KEEP_DAYS))))
+    except ValueError:
+        return DEFAULT_KEEP_DAYS
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("action", choices=["findings", "runs", "prune"])
+    parser.add_argument("--repo-root", default=".", help="Repository root path")
+    parser.add_argument("--db", help=f"History database (default <repo-root>/{DEFAULT_HISTORY_DB.as_posix()})")
+    parser.add_argument("--code", help="findings: only this finding code")
+    parser.add_argument("--severity", help="findings: only this severity")
+    parser.add_argument("--status", help="runs: only runs with this STATUS")
+    parser.add_argument("--unit", help="Only this unit id")
+    parser.add_argument("--program", help="Only this program id")
+    parser.add_argument("--since", help="Start of the window: 7d, 12h, 30m, 2w or an ISO date/date-time")
+    parser.add_argument("--until", help="End of the window (exclusive), same formats as --since")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum rows to print")
+    parser.add_argument(
+        "--keep-days",
+        type=int,
+        default=keep_days_from_env(),
+        help="prune: days of full detail to keep (LCS_VALIDATION_HISTORY_KEEP_DAYS)",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON output")
+    return parser.parse_args()
+
+
+def _print_table(rows: list[dict[str, Any]], columns: list[str]) -> None:
+    if not rows:
+        print("No matching history.")
+        return
+    widths = {column: max(len(column), *(len(str(row[column])) for row in rows)) for column in columns}
+    print("  ".join(column.upper().ljust(widths[column]) for column in columns).rstrip())
+    for row in rows:
+        print("  ".join(str(row[column]).ljust(widths[column]) for column in columns).rstrip())
+
+
+def main() -> int:
+    args = parse_args()
+    db_path = resolve_history_db(Path(args.repo_root).resolve(), args.db)
+    if args.action != "prune" and not db_path.is_file():
+        print(f"ERROR: no validation history at {db_path}; run the validator with --history first", file=sys.stderr)
+        return 1
+    try:
+        since = parse_since(args.since) if args.since else None
+        until = parse_since(args.until) if args.until else None
+        with HistoryStore(db_path) as store:
+            if args.action == "prune":
+                payload: Any = store.prune(max(0, args.keep_days))
+            elif args.action == "runs":
+                payload = store.runs(
+                    unit=args.unit, program=args.program, status=args.status, since=since, until=until, limit=args.limit
+                )
+            else:
+                payload = store.findings(
+                    code=args.code,
+                    severity=args.severity,
+                    unit=args.unit,
+                    program=args.program,
+                    since=since,
+                    until=until,
+                    limit=args.limit,
+                )
+    except (HistoryError, sqlite3.Error) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(payload, indent=2))
+    elif args.action == "prune":
+        print(f"Rolled up {payload['runs_rolled_up']} run(s) recorded before {payload['cutoff']}")
+    elif args.action == "runs":
+        _print_table(payload, ["recorded_at", "program_id", "unit_id", "status", "finding_count"])
+    else:
+        _print_table(payload, ["last_seen", "program_id", "unit_id", "code", "severity", "occurrences", "runs"])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
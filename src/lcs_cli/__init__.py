@@ -1607,6 +1607,167 @@ def version():
     console.print()
 
 
+# ===== Validate Commands =====
+
+validate_app = typer.Typer(
+    name="validate",
+    help="Validate unit artifacts against LCS contracts",
+    add_completion=False,
+    invoke_without_command=True,
+)
+app.add_typer(validate_app, name="validate")
+
+VALIDATOR_TOOL = "validate_artifact_contracts.py"
+HISTORY_TOOL = "validation_history.py"
+
+
+def _read_context_value(project_root: Path, name: str) -> str:
+    context_file = project_root / ".lcs" / "context" / name
+    try:
+        return context_file.read_text(encoding="utf-8").splitlines()[0].strip()
+    except (OSError, IndexError):
+        return ""
+
+
+def resolve_python_tool(project_root: Path, tool_name: str) -> Path | None:
+    """Locate a factory python tool in a source checkout or an installed project (.lcs/scripts)."""
+    for candidate in (
+        project_root / "factory" / "scripts" / "python" / tool_name,
+        project_root / ".lcs" / "scripts" / tool_name,
+    ):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def resolve_current_unit_dir(project_root: Path) -> Path | None:
+    """Current unit from LCS_PROGRAM/LCS_UNIT or .lcs/context, as the shell scripts resolve it."""
+    program = os.getenv("LCS_PROGRAM") or _read_context_value(project_root, "current-program")
+    unit = os.getenv("LCS_UNIT") or _read_context_value(project_root, "current-unit")
+    if not program:
+        return None
+    units_dir = project_root / "programs" / program / "units"
+    if not unit and units_dir.is_dir():
+        matches = [item.name for item in units_dir.iterdir() if item.is_dir() and re.match(r"^\d{3}-", item.name)]
+        unit = matches[0] if len(matches) == 1 else ""
+    return units_dir / unit if unit else None
+
+
+@validate_app.callback()
+def validate(
+    ctx: typer.Context,
+    unit_dir: Optional[Path] = typer.Option(None, "--unit-dir", help="Unit directory (defaults to the current unit)"),
+    program: Optional[str] = typer.Option(None, "--program", help="Validate every unit under programs/<id>/units"),
+    units_glob: Optional[str] = typer.Option(None, "--units-glob", help="Validate unit directories matching a glob"),
+    changed_since: Optional[str] = typer.Option(
+        None, "--changed-since", help="Validate only units changed since a git ref (all units if shared inputs changed)"
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Emit JSON output"),
+    watch: bool = typer.Option(False, "--watch", help="Revalidate after each change, re-running only affected phases"),
+    mode: Optional[str] = typer.Option(None, "--mode", help="collect-all-per-phase or fail-fast"),
+    max_findings: Optional[int] = typer.Option(None, "--max-findings", help="Stop after this many CRITICAL/HIGH findings"),
+    max_schema_errors: Optional[int] = typer.Option(
+        None, "--max-schema-errors", help="Schema errors reported per artifact before the rest are summarized (0 = all)"
+    ),
+    cache: bool = typer.Option(False, "--cache", help="Reuse cached phase results from .lcs/cache/validation"),
+    history: bool = typer.Option(False, "--history", help="Record each run in .lcs/state/validation.db"),
+    profile: bool = typer.Option(False, "--profile", help="Add per-phase cProfile/tracemalloc profiles to each step"),
+    profile_out: Optional[Path] = typer.Option(None, "--profile-out", help="Write collapsed-stack flamegraph files here"),
+):
+    """Validate unit artifacts (runs validate_artifact_contracts.py)."""
+    if ctx.invoked_subcommand is not None:
+        return
+
+    project_root = Path.cwd()
+    validator = resolve_python_tool(project_root, VALIDATOR_TOOL)
+    if validator is None:
+        console.print(f"[red]Error:[/red] Could not locate {VALIDATOR_TOOL}")
+        console.print("Run this command from a LCS project root")
+        raise typer.Exit(1)
+
+    args = [sys.executable, str(validator), "--repo-root", str(project_root)]
+    if program or units_glob or changed_since:
+        if program:
+            args += ["--program", program]
+        if units_glob:
+            args += ["--units-glob", units_glob]
+        if changed_since:
+            args += ["--changed-since", changed_since]
+    else:
+        target = unit_dir or resolve_current_unit_dir(project_root)
+        if target is None:
+            console.print("[red]Error:[/red] No current unit; pass --unit-dir or set LCS_PROGRAM/LCS_UNIT")
+            raise typer.Exit(1)
+        args += ["--unit-dir", str(target)]
+    if watch:
+        args.append("--watch")
+    if mode:
+        args += ["--mode", mode]
+    if max_findings is not None:
+        args += ["--max-findings", str(max_findings)]
+    if max_schema_errors is not None:
+        args += ["--max-schema-errors", str(max_schema_errors)]
+    if cache:
+        args.append("--cache")
+    if history:
+        args.append("--history")
+    if profile:
+        args.append("--profile")
+    if profile_out is not None:
+        args += ["--profile-out", str(profile_out)]
+    if json_output:
+        args.append("--json")
+
+    try:
+        result = subprocess.run(args, cwd=project_root)
+    except KeyboardInterrupt:
+        raise typer.Exit(130)
+    raise typer.Exit(result.returncode)
+
+
+@validate_app.command("history")
+def validate_history(
+    code: Optional[str] = typer.Option(None, "--code", help="Only findings with this code"),
+    severity: Optional[str] = typer.Option(None, "--severity", help="Only findings with this severity"),
+    unit: Optional[str] = typer.Option(None, "--unit", help="Only this unit id"),
+    program: Optional[str] = typer.Option(None, "--program", help="Only this program id"),
+    since: Optional[str] = typer.Option(None, "--since", help="Window start: 7d, 12h, 30m, 2w or an ISO date"),
+    until: Optional[str] = typer.Option(None, "--until", help="Window end (exclusive), same formats as --since"),
+    limit: Optional[int] = typer.Option(None, "--limit", help="Maximum rows to print"),
+    runs: bool = typer.Option(False, "--runs", help="List recorded runs instead of grouped findings"),
+    prune: bool = typer.Option(False, "--prune", help="Fold runs older than --keep-days into daily rollups"),
+    keep_days: Optional[int] = typer.Option(None, "--keep-days", help="Days of full detail kept by --prune"),
+    json_output: bool = typer.Option(False, "--json", help="Emit JSON output"),
+):
+    """Query recorded validation runs without re-validating (runs validation_history.py)."""
+    project_root = Path.cwd()
+    tool = resolve_python_tool(project_root, HISTORY_TOOL)
+    if tool is None:
+        console.print(f"[red]Error:[/red] Could not locate {HISTORY_TOOL}")
+        console.print("Run this command from a LCS project root")
+        raise typer.Exit(1)
+
+    action = "prune" if prune else "runs" if runs else "findings"
+    args = [sys.executable, str(tool), action, "--repo-root", str(project_root)]
+    for flag, value in (
+        ("--code", code),
+        ("--severity", severity),
+        ("--unit", unit),
+        ("--program", program),
+        ("--since", since),
+        ("--until", until),
+        ("--limit", limit),
+        ("--keep-days", keep_days),
+    ):
+        if value is not None:
+            args += [flag, str(value)]
+    if json_output:
+        args.append("--json")
+
+    result = subprocess.run(args, cwd=project_root)
+    raise typer.Exit(result.returncode)
+
+
 # ===== Extension Commands =====
 
 extension_app = typer.Typer(
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from typing import Any, NamedTuple
 
 
 CEFR_ORDER = ["A1", "A2", "B1", "B2", "C1", "C2"]
@@ -46,6 +45,63 @@ def _normalize_cefr_values(values: list[str]) -> dict[str, Any]:
     return {"min": CEFR_ORDER[indices[0]], "max": CEFR_ORDER[indices[-1]]}
 
 
+class _PivotMapping(NamedTuple):
+    """A crosswalk mapping into the pivot framework, with its fields normalized once."""
+
+    dimension: str
+    min_value: float
+    max_value: float
+    cefr_value: str
+
+
+def _index_pivot_mappings(mappings: list[Any], pivot_framework_id: str) -> dict[tuple[str, str], list[_PivotMapping]]:
+    """Usable numeric-range mappings into the pivot framework, keyed by source (framework_id, scale_id).
+
+    Each bucket keeps declaration order, so matched CEFR values come out in the same order as a full scan.
+    """
+    index: dict[tuple[str, str], list[_PivotMapping]] = {}
+    for mapping in mappings:
+        if not isinstance(mapping, dict):
+            continue
+        frm = mapping.get("from", {})
+        to = mapping.get("to", {})
+        if not isinstance(frm, dict) or not isinstance(to, dict):
+            continue
+        if str(to.get("framework_id", "")).strip() != pivot_framework_id:
+            continue
+
+        frm_target = frm.get("target", {})
+        if not isinstance(frm_target, dict):
+            continue
+        # We only support numeric ranges for V1 mappings.
+        if _target_value(frm_target) is not None:
+            continue
+        frm_rng = _target_range(frm_target)
+        if frm_rng is None:
+            continue
+        frm_min, frm_max = frm_rng
+        if not (_is_number(frm_min) and _is_number(frm_max)):
+            continue
+
+        to_target = to.get("target", {})
+        if not isinstance(to_target, dict):
+            continue
+        cefr_value = _target_value(to_target)
+        if not isinstance(cefr_value, str) or cefr_value.strip().upper() not in CEFR_ORDER:
+            continue
+
+        key = (str(frm.get("framework_id", "")).strip(), str(frm.get("scale_id", "")).strip())
+        index.setdefault(key, []).append(
+            _PivotMapping(
+                dimension=str(frm.get("dimension", "")).strip(),
+                min_value=float(frm_min),
+                max_value=float(frm_max),
+                cefr_value=cefr_value.strip().upper(),
+            )
+        )
+    return index
+
+
 def normalize_targets_to_pivot(
     brief_targets: list[dict[str, Any]],
     subject: str,
@@ -81,6 +137,7 @@ def normalize_targets_to_pivot(
         }
 
     mappings = crosswalks.get("mappings", []) if isinstance(crosswalks.get("mappings"), list) else []
+    mapping_index = _index_pivot_mappings(mappings, pivot_framework_id)
 
     for target in brief_targets:
         if not isinstance(target, dict):
@@ -107,61 +164,23 @@ def normalize_targets_to_pivot(
 
         matched_cefr_values: list[str] = []
 
-        for mapping in mappings:
-            if not isinstance(mapping, dict):
-                continue
-            frm = mapping.get("from", {})
-            to = mapping.get("to", {})
-            if not isinstance(frm, dict) or not isinstance(to, dict):
-                continue
-
-            if str(to.get("framework_id", "")).strip() != pivot_framework_id:
-                continue
-            if str(frm.get("framework_id", "")).strip() != framework_id:
+        for mapping in mapping_index.get((framework_id, scale_id), ()):
+            if dimension and mapping.dimension and dimension != mapping.dimension:
                 continue
-            if str(frm.get("scale_id", "")).strip() != scale_id:
-                continue
-
-            map_dim = str(frm.get("dimension", "")).strip()
-            if dimension and map_dim and dimension != map_dim:
-                continue
-            if not dimension and map_dim:
+            if not dimension and mapping.dimension:
                 # If target is dimensionless, accept only dimensionless mappings.
                 continue
 
-            frm_target = frm.get("target", {})
-            if not isinstance(frm_target, dict):
-                continue
-
-            frm_val = _target_value(frm_target)
-            frm_rng = _target_range(frm_target)
-            # We only support numeric ranges for V1 mappings.
-            if frm_val is not None:
-                continue
-            if frm_rng is None:
-                continue
-
-            frm_min, frm_max = frm_rng
-            if not (_is_number(frm_min) and _is_number(frm_max)):
-                continue
-
             intersects = False
             if t_value is not None and _is_number(t_value):
-                intersects = _range_contains(float(t_value), float(frm_min), float(frm_max))
+                intersects = _range_contains(float(t_value), mapping.min_value, mapping.max_value)
             elif t_range is not None:
                 t_min, t_max = t_range
                 if _is_number(t_min) and _is_number(t_max):
-                    intersects = _ranges_overlap(float(t_min), float(t_max), float(frm_min), float(frm_max))
-
-            if not intersects:
-                continue
+                    intersects = _ranges_overlap(float(t_min), float(t_max), mapping.min_value, mapping.max_value)
 
-            to_target = to.get("target", {})
-            if not isinstance(to_target, dict):
-                continue
-            cefr_value = _target_value(to_target)
-            if isinstance(cefr_value, str) and cefr_value.strip().upper() in CEFR_ORDER:
-                matched_cefr_values.append(cefr_value.strip().upper())
+            if intersects:
+                matched_cefr_values.append(mapping.cefr_value)
 
         if matched_cefr_values:
             pivot_targets.append(
@@ -1,8 +1,10 @@
 import json
 import os
+import queue
 import shutil
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 
@@ -145,6 +147,11 @@ def test_artifact_contract_validator_passes_for_generated_contracts():
         assert payload["PIPELINE"]["mode"] == "collect-all-per-phase"
         assert isinstance(payload["STEPS"], list) and len(payload["STEPS"]) >= 1
         assert isinstance(payload["AGENT_REPORT"], dict)
+        final_step = next(step for step in payload["STEPS"] if step["step_id"] == "FINAL_001")
+        parse_counts = final_step["metadata"]["parse_counts"]
+        assert parse_counts["brief.json"] == 1
+        assert parse_counts["exercise-design.json"] == 1
+        assert all(count == 1 for count in parse_counts.values())
         if _template_pack_available():
             template_rule_step = next(step for step in payload["STEPS"] if step["step_id"] == "TMP_RULE_001")
             assert any(str(output).endswith("validate_template_pack.py") for output in template_rule_step["outputs"])
@@ -152,6 +159,366 @@ def test_artifact_contract_validator_passes_for_generated_contracts():
         shutil.rmtree(unit_dir, ignore_errors=True)
 
 
+def _strip_timings(payload: dict) -> dict:
+    for step in payload.get("STEPS", []):
+        step.pop("duration_ms", None)
+    for phase in payload.get("PHASE_SUMMARY", {}).get("by_phase", {}).values():
+        phase.pop("duration_ms", None)
+    return payload
+
+
+def test_artifact_contract_validator_batch_mode_matches_single_unit_output():
+    unit_ids = ["996-batch-pass", "996-batch-missing-rubric-gates"]
+    unit_dirs = [_prepare_unit(unit_id) for unit_id in unit_ids]
+    env = os.environ.copy()
+    env["LCS_PROGRAM"] = PROGRAM_ID
+
+    try:
+        for unit_id in unit_ids:
+            env["LCS_UNIT"] = unit_id
+            _run_setup_design(env)
+        (unit_dirs[1] / "rubric-gates.json").unlink(missing_ok=True)
+
+        proc = subprocess.run(
+            [
+                sys.executable,
+                str(ROOT / "factory/scripts/python/validate_artifact_contracts.py"),
+                "--repo-root",
+                str(ROOT),
+                "--units-glob",
+                f"programs/{PROGRAM_ID}/units/996-batch-*",
+                "--workers",
+                "2",
+                "--json",
+            ],
+            cwd=ROOT,
+            env=env,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        assert proc.returncode != 0
+        lines = [json.loads(line) for line in proc.stdout.strip().splitlines()]
+        summary = lines[-1]["BATCH_SUMMARY"]
+        assert summary["unit_count"] == 2
+        assert summary["block_count"] == 1
+        assert summary["blocked_units"] == [str(unit_dirs[1].resolve())]
+
+        batch_payloads = {payload["UNIT_DIR"]: payload for payload in lines[:-1]}
+        for unit_dir in unit_dirs:
+            single = json.loads(_run_contract_validator(unit_dir, env, check=False).stdout.strip())
+            assert _strip_timings(batch_payloads[str(unit_dir.resolve())]) == _strip_timings(single)
+    finally:
+        for unit_dir in unit_dirs:
+            shutil.rmtree(unit_dir, ignore_errors=True)
+
+
+def test_artifact_contract_validator_replays_unchanged_phases_from_cache(tmp_path: Path):
+    unit_id = "996-artifact-contract-cache"
+    unit_dir = _prepare_unit(unit_id)
+    env = os.environ.copy()
+    env["LCS_UNIT"] = unit_id
+    env["LCS_PROGRAM"] = PROGRAM_ID
+    cmd = [
+        sys.executable,
+        str(ROOT / "factory/scripts/python/validate_artifact_contracts.py"),
+        "--repo-root",
+        str(ROOT),
+        "--unit-dir",
+        str(unit_dir),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        "--json",
+    ]
+
+    def _run() -> dict:
+        proc = subprocess.run(cmd, cwd=ROOT, env=env, check=False, capture_output=True, text=True)
+        return json.loads(proc.stdout.strip())
+
+    def _comparable(payload: dict) -> dict:
+        for step in payload["STEPS"]:
+            step.pop("cached", None)
+            step.pop("metadata", None)
+        return _strip_timings(payload)
+
+    try:
+        _run_setup_design(env)
+        cold = _run()
+        warm = _run()
+        assert not any(step.get("cached") for step in cold["STEPS"])
+        cached_phases = {step["phase"] for step in warm["STEPS"] if step.get("cached")}
+        assert {"artifact_schema", "artifact_consistency", "template_rules", "rubric_audit"} <= cached_phases
+        assert "preflight" not in cached_phases
+        assert _comparable(warm) == _comparable(cold)
+
+        audit_path = unit_dir / "audit-report.json"
+        audit_path.write_text(audit_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        changed = _run()
+        changed_cached = {step["phase"] for step in changed["STEPS"] if step.get("cached")}
+        assert "rubric_audit" not in changed_cached
+        assert "template_catalog" in changed_cached
+    finally:
+        shutil.rmtree(unit_dir, ignore_errors=True)
+
+
+def test_artifact_contract_validator_parallel_phases_match_sequential_order():
+    unit_id = "996-artifact-contract-phase-dag"
+    unit_dir = _prepare_unit(unit_id)
+    env = os.environ.copy()
+    env["LCS_UNIT"] = unit_id
+    env["LCS_PROGRAM"] = PROGRAM_ID
+
+    def _run(phase_workers: str) -> dict:
+        proc = subprocess.run(
+            [
+                sys.executable,
+                str(ROOT / "factory/scripts/python/validate_artifact_contracts.py"),
+                "--repo-root",
+                str(ROOT),
+                "--unit-dir",
+                str(unit_dir),
+                "--phase-workers",
+                phase_workers,
+                "--json",
+            ],
+            cwd=ROOT,
+            env=env,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        return _strip_timings(json.loads(proc.stdout.strip()))
+
+    try:
+        _run_setup_design(env)
+        (unit_dir / "rubric-gates.json").unlink(missing_ok=True)
+        sequential = _run("1")
+        parallel = _run("4")
+        assert sequential["STATUS"] == "BLOCK"
+        assert [step["step_id"] for step in parallel["STEPS"]] == [step["step_id"] for step in sequential["STEPS"]]
+        assert parallel == sequential
+    finally:
+        shutil.rmtree(unit_dir, ignore_errors=True)
+
+
+def test_artifact_contract_validator_watch_reruns_only_changed_phases():
+    unit_id = "996-artifact-contract-watch"
+    unit_dir = _prepare_unit(unit_id)
+    env = os.environ.copy()
+    env["LCS_UNIT"] = unit_id
+    env["LCS_PROGRAM"] = PROGRAM_ID
+
+    _run_setup_design(env)
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            str(ROOT / "factory/scripts/python/validate_artifact_contracts.py"),
+            "--repo-root",
+            str(ROOT),
+            "--unit-dir",
+            str(unit_dir),
+            "--watch",
+            "--json",
+        ],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    lines: queue.Queue[str] = queue.Queue()
+    threading.Thread(target=lambda: [lines.put(line) for line in proc.stdout], daemon=True).start()
+
+    try:
+        initial = json.loads(lines.get(timeout=60))
+        assert not any(step.get("cached") for step in initial["STEPS"])
+
+        brief_path = unit_dir / "brief.json"
+        brief_path.write_text(brief_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        rerun = json.loads(lines.get(timeout=60))
+        cached = {step["step_id"] for step in rerun["STEPS"] if step.get("cached")}
+        assert "ART_SCHEMA_001" not in cached
+        assert {"TMP_CAT_001", "TMP_SCHEMA_001"} <= cached
+        # The manifest still records the old brief.json checksum, so the edit is caught.
+        assert rerun["STATUS"] == "BLOCK"
+        assert any("checksum mismatch for path 'brief.json'" in error for error in rerun["ERRORS"])
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+        shutil.rmtree(unit_dir, ignore_errors=True)
+
+
+def test_artifact_contract_validator_profile_adds_step_profiles_and_collapsed_stacks(tmp_path: Path):
+    unit_id = "996-artifact-contract-profile"
+    unit_dir = _prepare_unit(unit_id)
+    env = os.environ.copy()
+    env["LCS_UNIT"] = unit_id
+    env["LCS_PROGRAM"] = PROGRAM_ID
+
+    try:
+        _run_setup_design(env)
+        proc = subprocess.run(
+            [
+                sys.executable,
+                str(ROOT / "factory/scripts/python/validate_artifact_contracts.py"),
+                "--repo-root",
+                str(ROOT),
+                "--unit-dir",
+                str(unit_dir),
+                "--profile-out",
+                str(tmp_path),
+                "--json",
+            ],
+            cwd=ROOT,
+            env=env,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        payload = json.loads(proc.stdout.strip())
+        phase_steps = [step for step in payload["STEPS"] if step["phase"] not in {"gate_eval", "finalize"}]
+        assert all("profile" in step for step in phase_steps)
+        schema_profile = next(step["profile"] for step in phase_steps if step["step_id"] == "ART_SCHEMA_001")
+        assert schema_profile["top_functions"]
+        assert schema_profile["memory"]["peak_bytes"] > 0
+
+        collapsed = tmp_path / f"{unit_id}.collapsed"
+        assert payload["STEPS"][-1]["metadata"]["profile_out"] == str(collapsed)
+        roots = {line.split(";", 1)[0] for line in collapsed.read_text(encoding="utf-8").splitlines()}
+        assert "ART_SCHEMA_001" in roots
+    finally:
+        shutil.rmtree(unit_dir, ignore_errors=True)
+
+
+def test_artifact_contract_validator_fail_fast_skips_phases_after_first_block():
+    unit_id = "996-artifact-contract-fail-fast"
+    unit_dir = _prepare_unit(unit_id)
+    env = os.environ.copy()
+    env["LCS_UNIT"] = unit_id
+    env["LCS_PROGRAM"] = PROGRAM_ID
+
+    def _run(*extra: str) -> dict:
+        proc = subprocess.run(
+            [
+                sys.executable,
+                str(ROOT / "factory/scripts/python/validate_artifact_contracts.py"),
+                "--repo-root",
+                str(ROOT),
+                "--unit-dir",
+                str(unit_dir),
+                "--json",
+                *extra,
+            ],
+            cwd=ROOT,
+            env=env,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        assert proc.returncode != 0
+        return json.loads(proc.stdout.strip())
+
+    try:
+        _run_setup_design(env)
+        (unit_dir / "rubric-gates.json").unlink(missing_ok=True)
+        collect_all = _run()
+        fail_fast = _run("--mode", "fail-fast")
+        budgeted = _run("--max-findings", "1")
+
+        assert collect_all["PIPELINE"]["mode"] == "collect-all-per-phase"
+        assert fail_fast["PIPELINE"]["mode"] == "fail-fast"
+        assert fail_fast["STATUS"] == "BLOCK"
+        step_ids = [step["step_id"] for step in collect_all["STEPS"]]
+        assert [step["step_id"] for step in fail_fast["STEPS"]] == step_ids
+
+        statuses = [step["status"] for step in fail_fast["STEPS"]]
+        first_block = statuses.index("BLOCK")
+        skipped = [step for step in fail_fast["STEPS"][first_block + 1 :] if step["phase"] not in {"gate_eval", "finalize"}]
+        assert skipped and all(step["status"] == "SKIP" for step in skipped)
+        assert all(step["metadata"]["skipped_reason"] == "fail-fast" for step in skipped)
+        assert len(fail_fast["FINDINGS"]) <= len(collect_all["FINDINGS"])
+
+        assert budgeted["PIPELINE"]["mode"] == "collect-all-per-phase"
+        assert any(step["status"] == "SKIP" for step in budgeted["STEPS"])
+    finally:
+        shutil.rmtree(unit_dir, ignore_errors=True)
+
+
+def test_artifact_contract_validator_caps_schema_errors_per_artifact(tmp_path: Path):
+    unit_dir = tmp_path / "997-schema-error-cap"
+    unit_dir.mkdir()
+    sequence_path = unit_dir / "sequence.json"
+    sequence_path.write_text(
+        json.dumps({"unit_id": unit_dir.name, "tasks": [{"task_id": index} for index in range(50)]}),
+        encoding="utf-8",
+    )
+
+    def _run(*extra: str) -> dict:
+        proc = subprocess.run(
+            [
+                sys.executable,
+                str(ROOT / "factory/scripts/python/validate_artifact_contracts.py"),
+                "--repo-root",
+                str(ROOT),
+                "--unit-dir",
+                str(unit_dir),
+                "--json",
+                *extra,
+            ],
+            cwd=ROOT,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        assert proc.returncode != 0
+        return json.loads(proc.stdout.strip())
+
+    uncapped = _run("--max-schema-errors", "0")
+    capped = _run("--max-schema-errors", "5")
+
+    all_errors = [msg for msg in uncapped["ERRORS"] if msg.startswith(str(sequence_path))]
+    assert len(all_errors) > 5
+    assert not any(item["code"] == "SCHEMA_ERRORS_TRUNCATED" for item in uncapped["FINDINGS"])
+
+    # The cap keeps the first errors of the full, deterministically ordered list.
+    assert capped["ERRORS"][:5] == all_errors[:5]
+    assert capped["ERRORS"][5] == f"{sequence_path}: {len(all_errors) - 5} more schema errors truncated (limit 5)"
+    truncated = [item for item in capped["FINDINGS"] if item["code"] == "SCHEMA_ERRORS_TRUNCATED"]
+    assert [item["details"] for item in truncated] == [{"reported": 5, "truncated": len(all_errors) - 5}]
+    assert truncated[0]["severity"] == "HIGH"
+
+
+def test_artifact_contract_validator_records_history_and_answers_queries(tmp_path: Path):
+    unit_dir = tmp_path / "998-history"
+    unit_dir.mkdir()
+    db_path = tmp_path / "state" / "validation.db"
+
+    def _script(name: str, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(ROOT / "factory/scripts/python" / name), "--repo-root", str(ROOT), *args],
+            cwd=ROOT,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+    for _ in range(2):
+        validated = _script(
+            "validate_artifact_contracts.py", "--unit-dir", str(unit_dir), "--json", "--history-db", str(db_path)
+        )
+        assert validated.returncode != 0
+    codes = {item["code"] for item in json.loads(validated.stdout.strip())["FINDINGS"]}
+
+    query = _script("validation_history.py", "findings", "--db", str(db_path), "--since", "1d", "--json")
+    assert query.returncode == 0, query.stderr
+    rows = json.loads(query.stdout)
+    assert {row["code"] for row in rows} == codes
+    assert all(row["unit_id"] == unit_dir.name and row["runs"] == 2 for row in rows)
+
+    missing = _script("validation_history.py", "runs", "--db", str(tmp_path / "absent.db"))
+    assert missing.returncode == 1
+
+
 def test_stage_loader_blocks_when_previous_step_json_is_missing():
     unit_id = "996-stage-loader-block-missing-brief"
     unit_dir = _prepare_unit(unit_id)
@@ -545,6 +912,7 @@ def test_artifact_contract_validator_blocks_when_sequence_has_dependency_cycle()
         payload = json.loads(proc.stdout.strip())
         assert payload["STATUS"] == "BLOCK"
         assert any("dependency cycle detected" in msg for msg in payload["ERRORS"])
+        assert any(msg.endswith("S001 -> S002 -> S001") for msg in payload["ERRORS"])
     finally:
         shutil.rmtree(unit_dir, ignore_errors=True)
 
@@ -0,0 +1,87 @@
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+SCHEMAS_DIR = ROOT / "contracts" / "schemas"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+for name in ("artifact_models", "generate_artifact_models"):
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+artifact_models = sys.modules["artifact_models"]
+generate_artifact_models = sys.modules["generate_artifact_models"]
+
+
+def test_generated_models_match_contract_schemas() -> None:
+    rendered = generate_artifact_models.render_models(SCHEMAS_DIR)
+    assert (SCRIPTS_DIR / "artifact_models.py").read_text(encoding="utf-8") == rendered
+
+    result = subprocess.run(
+        [sys.executable, str(SCRIPTS_DIR / "generate_artifact_models.py"), "--check"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_check_flags_stale_module(tmp_path: Path) -> None:
+    stale = tmp_path / "artifact_models.py"
+    stale.write_text("# stale\n", encoding="utf-8")
+    result = subprocess.run(
+        [sys.executable, str(SCRIPTS_DIR / "generate_artifact_models.py"), "--check", "--output", str(stale)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 1
+    assert "out of date" in result.stderr
+
+
+def test_decoders_type_check_fields_and_keep_positions() -> None:
+    brief = artifact_models.Brief.from_json(
+        {
+            "unit_id": "001-unit",
+            "duration_minutes": "90",
+            "audience": ["not", "an", "object"],
+            "learning_outcomes": [
+                "not an object",
+                {"lo_id": "LO1", "priority": "P1", "acceptance_criteria": ["Given a When b Then c", 7]},
+                {"lo_id": 2, "statement": "Learner will be able to x"},
+            ],
+        }
+    )
+
+    assert brief.unit_id == "001-unit"
+    assert brief.duration_minutes is None
+    assert brief.audience is None
+    assert brief.scope is None
+    assert brief.proficiency_targets == []
+    first, second = brief.learning_outcomes
+    assert (first.position, first.lo_id, first.priority) == (1, "LO1", "P1")
+    assert first.acceptance_criteria == ["Given a When b Then c"]
+    assert (second.position, second.lo_id, second.acceptance_criteria) == (2, None, [])
+    assert not hasattr(first, "__dict__")
+
+    assert artifact_models.Brief.from_json(["not", "a", "brief"]) is None
+    assert artifact_models.Sequence.from_json({"tasks": {"S001": {}}}).tasks is None
+    depends_on = ["S001", "S002"]
+    task = artifact_models.SequenceTask.from_json({"task_id": "S003", "depends_on": depends_on}, 0)
+    assert task.depends_on is depends_on
+    gate = artifact_models.ManifestGateStatus.from_json({"decision": "PASS", "open_critical": 0.0, "open_high": True})
+    assert (gate.decision, gate.open_critical, gate.open_high) == ("PASS", 0.0, None)
+    assert set(artifact_models.ARTIFACT_MODELS) == {
+        "brief.json",
+        "design.json",
+        "sequence.json",
+        "exercise-design.json",
+        "outputs/manifest.json",
+    }
@@ -0,0 +1,52 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+SCRIPT_PATH = SCRIPTS_DIR / "artifact_store.py"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+spec = importlib.util.spec_from_file_location("artifact_store", SCRIPT_PATH)
+artifact_store = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = artifact_store
+spec.loader.exec_module(artifact_store)
+
+
+def test_store_parses_each_artifact_once(tmp_path: Path) -> None:
+    (tmp_path / "brief.json").write_text(json.dumps({"unit_id": "u1"}), encoding="utf-8")
+    store = artifact_store.ArtifactStore(tmp_path)
+
+    first = store.payload("brief.json")
+    second = store.payload(tmp_path / "brief.json")
+
+    assert first is second
+    assert store.parse_counts == {"brief.json": 1}
+    assert store.stats["hits"] == 1
+    assert len(store.sha256("brief.json")) == 64
+
+
+def test_store_reports_invalid_json_and_missing_files(tmp_path: Path) -> None:
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    store = artifact_store.ArtifactStore(tmp_path)
+
+    record = store.get("broken.json")
+    assert record is not None and not record.ok
+    assert store.payload("broken.json") is None
+    assert store.get("missing.json") is None
+
+
+def test_store_views_are_read_only(tmp_path: Path) -> None:
+    (tmp_path / "brief.json").write_text(json.dumps({"unit_id": "u1"}), encoding="utf-8")
+    store = artifact_store.ArtifactStore(tmp_path)
+    store.payload("brief.json")
+
+    views = store.views()
+    assert views["brief.json"] == {"unit_id": "u1"}
+    with pytest.raises(TypeError):
+        views["brief.json"] = {}  # type: ignore[index]
@@ -0,0 +1,98 @@
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+SCRIPT_PATH = SCRIPTS_DIR / "author_gates.py"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+spec = importlib.util.spec_from_file_location("author_gates", SCRIPT_PATH)
+author_gates = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = author_gates
+spec.loader.exec_module(author_gates)
+
+
+def _write_unit(unit_dir: Path, *, audit: object | None) -> None:
+    (unit_dir / "rubrics").mkdir(parents=True)
+    rubric = {
+        "gates": [
+            {"gate_id": "RB001", "group": "alignment", "status": "FAIL", "severity": "HIGH", "checked": False},
+        ]
+    }
+    (unit_dir / "rubric-gates.json").write_text(json.dumps(rubric), encoding="utf-8")
+    if audit is not None:
+        (unit_dir / "audit-report.json").write_text(json.dumps(audit), encoding="utf-8")
+
+
+def test_report_keeps_gate_key_order_and_shell_blocker_order(tmp_path: Path) -> None:
+    unit_dir = tmp_path / "programs" / "prog" / "units" / "001-unit"
+    _write_unit(unit_dir, audit={"gate_decision": "block", "open_critical": 2, "open_high": 0})
+
+    report = author_gates.evaluate_author_gates(ROOT, unit_dir)
+
+    assert [key for key in report if not key.startswith("_")] == list(author_gates.GATE_KEYS)
+    assert report["STATUS"] == "BLOCK"
+    assert report["UNIT_DIR"] == str(unit_dir)
+    assert report["CONTRACT_STATUS"] == "BLOCK"
+    assert (report["RUBRIC_BLOCKERS"], report["RUBRIC_UNCHECKED"]) == (1, 1)
+    assert (report["AUDIT_DECISION"], report["AUDIT_OPEN_CRITICAL"]) == ("BLOCK", 2)
+    assert report["_blockers"][1:] == [
+        "Rubric has 1 non-pass status item(s)",
+        "Rubric has 1 unchecked item(s)",
+        "Audit decision is BLOCK",
+        "Audit has 2 open CRITICAL finding(s)",
+    ]
+    assert report["BLOCKERS"] == ";".join(report["_blockers"])
+
+
+def test_unusable_audit_reports_are_blockers_not_crashes(tmp_path: Path) -> None:
+    missing = tmp_path / "missing"
+    _write_unit(missing, audit=None)
+    listed = tmp_path / "listed"
+    _write_unit(listed, audit=[1])
+    invalid = tmp_path / "invalid"
+    _write_unit(invalid, audit={"gate_decision": "MAYBE", "open_critical": 0, "open_high": 0})
+
+    assert f"Missing audit report JSON: {missing / 'audit-report.json'}" in (
+        author_gates.evaluate_author_gates(ROOT, missing)["_blockers"]
+    )
+    assert "Audit JSON invalid: invalid-audit-fields:'list' object has no attribute 'get'" in (
+        author_gates.evaluate_author_gates(ROOT, listed)["_blockers"]
+    )
+    invalid_report = author_gates.evaluate_author_gates(ROOT, invalid)
+    assert "Audit JSON invalid: missing-or-invalid-gate_decision" in invalid_report["_blockers"]
+    assert invalid_report["AUDIT_DECISION"] == "MISSING"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is required")
+def test_changed_since_reports_each_touched_unit_then_a_summary(tmp_path: Path) -> None:
+    for unit in ("001-a", "002-b"):
+        _write_unit(tmp_path / "programs" / "prog" / "units" / unit, audit=None)
+    git = ["git", "-c", "user.name=lcs", "-c", "user.email=lcs@example.invalid"]
+    subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "base"], cwd=tmp_path, check=True)
+    (tmp_path / "programs/prog/units/002-b/brief.json").write_text("{}", encoding="utf-8")
+
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--repo-root", str(tmp_path), "--changed-since", "HEAD", "--json"],
+        cwd=tmp_path,
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 1, proc.stderr
+    lines = [json.loads(line) for line in proc.stdout.strip().splitlines()]
+    unit_dir = str(tmp_path.resolve() / "programs/prog/units/002-b")
+    assert [line["UNIT_DIR"] for line in lines[:-1]] == [unit_dir]
+    assert lines[-1]["GATES_SUMMARY"]["blocked_units"] == [unit_dir]
+    assert lines[-1]["GATES_SUMMARY"]["unit_count"] == 1
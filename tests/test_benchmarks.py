@@ -0,0 +1,67 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = ROOT / "benchmarks" / "run_benchmarks.py"
+
+spec = importlib.util.spec_from_file_location("run_benchmarks", SCRIPT_PATH)
+run_benchmarks = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = run_benchmarks
+spec.loader.exec_module(run_benchmarks)
+
+
+def _payload(**metrics: float) -> dict:
+    return {"results": {"small": {"validate_artifact_contracts": metrics}}}
+
+
+def test_compare_results_flags_only_regressions_beyond_threshold() -> None:
+    baseline = _payload(units_per_sec=10.0, p50_ms=100.0, p95_ms=200.0, peak_rss_bytes=40_000_000)
+    current = _payload(units_per_sec=7.0, p50_ms=115.0, p95_ms=150.0, peak_rss_bytes=60_000_000)
+    current["results"]["medium"] = {"validate_artifact_contracts": {"units_per_sec": 0.1}}
+
+    regressions = run_benchmarks.compare_results(baseline, current, 20.0)
+
+    assert {(item["metric"], item["change_percent"]) for item in regressions} == {
+        ("units_per_sec", -30.0),
+        ("peak_rss_bytes", 50.0),
+    }
+    assert run_benchmarks.compare_results(baseline, current, 60.0) == []
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 21)]
+    assert run_benchmarks.percentile(values, 50) == 10.0
+    assert run_benchmarks.percentile(values, 95) == 19.0
+    assert run_benchmarks.percentile([3.0], 95) == 3.0
+
+
+def test_run_suite_records_metrics_for_small_corpus(tmp_path: Path) -> None:
+    template_pack_dir = run_benchmarks.resolve_template_pack_dir(ROOT, None)
+    if template_pack_dir is None:
+        pytest.skip("template pack is not available")
+
+    payload = run_benchmarks.run_suite(
+        sizes=["small"],
+        benchmarks=["validate_rubric_gates", "manage_program_context"],
+        seed=0,
+        repeat=1,
+        template_pack_dir=template_pack_dir,
+        work_dir=tmp_path,
+    )
+
+    results = payload["results"]["small"]
+    assert set(results) == {"validate_rubric_gates", "manage_program_context"}
+    assert results["validate_rubric_gates"]["runs"] == 5
+    assert results["manage_program_context"] == {**results["manage_program_context"], "runs": 1, "units": 5}
+    for metrics in results.values():
+        assert metrics["units_per_sec"] > 0
+        assert metrics["p95_ms"] >= metrics["p50_ms"] > 0
+        if sys.platform.startswith("linux"):
+            # A Python child, measured on its own rather than inheriting the runner's footprint.
+            assert 5_000_000 < metrics["peak_rss_bytes"] < 500_000_000
+    assert run_benchmarks.compare_results(payload, payload, 0.0) == []
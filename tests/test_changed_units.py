@@ -0,0 +1,114 @@
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = ROOT / "factory" / "scripts" / "python" / "changed_units.py"
+
+spec = importlib.util.spec_from_file_location("changed_units", SCRIPT_PATH)
+changed_units = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = changed_units
+spec.loader.exec_module(changed_units)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is required")
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=lcs", "-c", "user.email=lcs@example.invalid", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    for unit in ("prog-a/units/001-a", "prog-a/units/002-b", "prog-b/units/001-c"):
+        unit_dir = tmp_path / "programs" / unit
+        unit_dir.mkdir(parents=True)
+        (unit_dir / "brief.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "contracts" / "schemas").mkdir(parents=True)
+    (tmp_path / "contracts" / "schemas" / "brief.schema.json").write_text("{}", encoding="utf-8")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    return tmp_path.resolve()
+
+
+def _all_units(repo: Path) -> list[Path]:
+    return sorted(path for path in repo.glob("programs/*/units/*") if path.is_dir())
+
+
+def test_changed_unit_files_select_only_their_units(repo: Path) -> None:
+    (repo / "programs/prog-a/units/002-b/brief.json").write_text('{"title": "x"}', encoding="utf-8")
+    (repo / "programs/prog-b/units/001-c/design.json").write_text("{}", encoding="utf-8")
+
+    changed = changed_units.git_changed_paths(repo, "HEAD")
+    scope = changed_units.select_changed_units(
+        repo, changed, ref="HEAD", shared_inputs=[repo / "contracts" / "schemas"], all_units=_all_units(repo)
+    )
+
+    assert scope.units == [repo / "programs/prog-a/units/002-b", repo / "programs/prog-b/units/001-c"]
+    assert scope.summary() == {"ref": "HEAD", "changed_paths": 2, "escalated_by": None, "unit_count": 2}
+
+    # --program narrows the candidates; units outside it are never selected.
+    program_units = _all_units(repo)[:2]
+    narrowed = changed_units.select_changed_units(repo, changed, ref="HEAD", shared_inputs=[], all_units=program_units)
+    assert narrowed.units == [repo / "programs/prog-a/units/002-b"]
+
+
+def test_shared_input_change_escalates_to_every_unit(repo: Path) -> None:
+    (repo / "programs/prog-a/units/001-a/brief.json").write_text('{"title": "x"}', encoding="utf-8")
+    (repo / "contracts/schemas/brief.schema.json").write_text('{"type": "object"}', encoding="utf-8")
+
+    scope = changed_units.select_changed_units(
+        repo,
+        changed_units.git_changed_paths(repo, "HEAD"),
+        ref="HEAD",
+        shared_inputs=[repo / "contracts" / "schemas"],
+        all_units=_all_units(repo),
+    )
+
+    assert scope.escalated_by == "contracts/schemas/brief.schema.json"
+    assert scope.units == _all_units(repo)
+
+
+def test_validator_changed_since_validates_only_touched_units(repo: Path) -> None:
+    def _validate(ref: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [
+                sys.executable,
+                str(ROOT / "factory/scripts/python/validate_artifact_contracts.py"),
+                "--repo-root",
+                str(repo),
+                "--changed-since",
+                ref,
+                "--workers",
+                "1",
+                "--json",
+            ],
+            cwd=repo,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+    untouched = _validate("HEAD")
+    assert untouched.returncode == 0, untouched.stderr
+    assert json.loads(untouched.stdout)["BATCH_SUMMARY"]["unit_count"] == 0
+
+    (repo / "programs/prog-b/units/001-c/brief.json").write_text('{"title": "x"}', encoding="utf-8")
+    touched = _validate("HEAD")
+    lines = [json.loads(line) for line in touched.stdout.strip().splitlines()]
+    assert [line["UNIT_DIR"] for line in lines[:-1]] == [str(repo / "programs/prog-b/units/001-c")]
+    assert lines[-1]["BATCH_SUMMARY"]["changed_since"]["changed_paths"] == 1
+
+    assert _validate("no-such-ref").returncode == 2
@@ -0,0 +1,119 @@
+import importlib.util
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = ROOT / "factory" / "scripts" / "python" / "json_io.py"
+
+
+def _load_module(name: str, monkeypatch: pytest.MonkeyPatch, backend: str | None = None):
+    if backend is None:
+        monkeypatch.delenv("LCS_JSON_BACKEND", raising=False)
+    else:
+        monkeypatch.setenv("LCS_JSON_BACKEND", backend)
+    spec = importlib.util.spec_from_file_location(name, SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def json_io(monkeypatch: pytest.MonkeyPatch):
+    module = _load_module("json_io_default", monkeypatch)
+    module.reset_io_stats()
+    return module
+
+
+def test_backends_agree_on_values_and_errors(json_io, monkeypatch: pytest.MonkeyPatch) -> None:
+    stdlib_io = _load_module("json_io_stdlib", monkeypatch, backend="json")
+    assert stdlib_io.BACKEND == "json"
+
+    samples = [
+        b'{"unit_id": "001-a", "score": 0.5, "tags": ["x", "\\u00e9"], "ok": true, "none": null}',
+        b'{"big": 123456789012345678901234567890}',
+        b'{"value": NaN}',
+        "{\"title\": \"café\"}".encode("utf-8"),
+    ]
+    for raw in samples:
+        expected = stdlib_io.loads(raw)
+        actual = json_io.loads(raw)
+        assert json.dumps(actual, sort_keys=True) == json.dumps(expected, sort_keys=True)
+
+    for raw in [b'{"a": 1,}', b"", b"\xff\xfe"]:
+        with pytest.raises(ValueError) as fast_error:
+            json_io.loads(raw)
+        with pytest.raises(ValueError) as stdlib_error:
+            stdlib_io.loads(raw)
+        assert str(fast_error.value) == str(stdlib_error.value)
+
+
+def test_dump_json_is_deterministic_and_atomic(json_io, tmp_path: Path) -> None:
+    payload = {"b": [1, 2.5, None], "a": "café"}
+    target = tmp_path / "nested" / "out.json"
+
+    written = json_io.dump_json(target, payload)
+
+    expected = json.dumps(payload, indent=2) + "\n"
+    assert target.read_text(encoding="utf-8") == expected
+    assert written == len(expected.encode("utf-8"))
+    assert json_io.dumps(payload, indent=None, sort_keys=True) == '{"a":"caf\\u00e9","b":[1,2.5,null]}'
+
+    os.chmod(target, 0o640)
+    json_io.dump_json(target, {"replaced": True})
+    assert json.loads(target.read_text(encoding="utf-8")) == {"replaced": True}
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert sorted(path.name for path in target.parent.iterdir()) == ["out.json"]
+
+
+def test_load_json_tolerates_missing_and_invalid_files(json_io, tmp_path: Path) -> None:
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json", encoding="utf-8")
+    listing = tmp_path / "list.json"
+    listing.write_text("[1, 2]", encoding="utf-8")
+
+    assert json_io.load_json(tmp_path / "missing.json") is None
+    assert json_io.load_json(bad) is None
+    assert json_io.load_json(listing) == [1, 2]
+    assert json_io.load_json_object(listing) is None
+    with pytest.raises(ValueError):
+        json_io.load(bad)
+
+
+def test_io_stats_count_reads_parses_and_writes(json_io, tmp_path: Path) -> None:
+    target = tmp_path / "stats.json"
+    written = json_io.dump_json(target, {"a": 1})
+    json_io.load(target)
+    json_io.load(target)
+
+    stats = json_io.io_stats()
+    assert stats["backend"] == json_io.BACKEND
+    assert stats["writes"] == 1 and stats["bytes_written"] == written
+    assert stats["reads"] == 2 and stats["bytes_read"] == 2 * written
+    assert stats["parses"] == 2 and stats["parse_ms"] >= 0
+
+    json_io.reset_io_stats()
+    assert json_io.io_stats()["reads"] == 0
+
+
+def test_write_atomic_many_replaces_nothing_when_staging_fails(json_io, tmp_path: Path) -> None:
+    first = tmp_path / "a.json"
+    first.write_text("old\n", encoding="utf-8")
+    blocked = tmp_path / "not-a-dir"
+    blocked.write_text("", encoding="utf-8")
+
+    with pytest.raises(OSError):
+        json_io.write_atomic_many([(first, b"new\n"), (blocked / "b.json", b"{}\n")])
+    assert first.read_text(encoding="utf-8") == "old\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.json", "not-a-dir"]
+
+    second = tmp_path / "nested" / "b.json"
+    assert json_io.write_atomic_many([(first, b"new\n"), (second, b"{}\n")]) == 7
+    assert (first.read_text(encoding="utf-8"), second.read_text(encoding="utf-8")) == ("new\n", "{}\n")
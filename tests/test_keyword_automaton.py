@@ -0,0 +1,54 @@
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def _load(name: str):
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+keyword_automaton = _load("keyword_automaton")
+fetch_trending_topics = _load("fetch_trending_topics")
+
+
+def test_counts_match_str_count_including_overlaps_and_shared_tokens() -> None:
+    rnd = random.Random(3)
+    for _ in range(500):
+        categories = {
+            f"c{index}": ["".join(rnd.choice("ab") for _ in range(rnd.randint(1, 4))) for _ in range(rnd.randint(1, 4))]
+            for index in range(rnd.randint(1, 4))
+        }
+        text = "".join(rnd.choice("abc") for _ in range(rnd.randint(0, 40)))
+        automaton = keyword_automaton.KeywordAutomaton(categories)
+
+        expected = {name: sum(text.count(token) for token in tokens) for name, tokens in categories.items()}
+        assert automaton.counts(text) == expected
+        assert automaton.present(text) == {name for name, count in expected.items() if count}
+
+    with pytest.raises(ValueError):
+        keyword_automaton.KeywordAutomaton({"broken": ["ok", ""]})
+
+
+def test_topic_hints_keep_the_classification_precedence() -> None:
+    assert fetch_trending_topics.classify_topic("AI in school", "") == "technology"
+    assert fetch_trending_topics.pedagogical_fit("AI in school", "") == "high"
+    assert fetch_trending_topics.classify_topic("Lakers vs Celtics", "NBA score") == "sports"
+    assert fetch_trending_topics.pedagogical_fit("Lakers vs Celtics", "NBA score") == "low"
+    # Substring hits count, as before: "heat" in "Miami Heat".
+    assert fetch_trending_topics.classify_topic("Miami Heat", "") == "climate"
+    assert fetch_trending_topics.classify_topic("Royal wedding", "") == "general"
+    assert fetch_trending_topics.pedagogical_fit("Royal wedding", "") == "medium"
@@ -0,0 +1,50 @@
+import importlib.util
+import sys
+import tracemalloc
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = ROOT / "factory" / "scripts" / "python" / "phase_profiler.py"
+
+spec = importlib.util.spec_from_file_location("phase_profiler", SCRIPT_PATH)
+phase_profiler = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = phase_profiler
+spec.loader.exec_module(phase_profiler)
+
+
+def _fib(n: int) -> int:
+    return n if n < 2 else _fib(n - 1) + _fib(n - 2)
+
+
+def _phase() -> list[bytes]:
+    _fib(18)
+    return [bytes(1024) for _ in range(200)]
+
+
+def test_profile_call_reports_functions_memory_and_stacks() -> None:
+    result, profile = phase_profiler.profile_call("ART_SCHEMA_001", _phase)
+
+    assert len(result) == 200
+    assert not tracemalloc.is_tracing()
+    block = profile.block
+    assert any(entry["function"].endswith("(_fib)") for entry in block["top_functions"])
+    fib = next(entry for entry in block["top_functions"] if entry["function"].endswith("(_fib)"))
+    assert fib["calls"] > fib["primitive_calls"] == 1
+    assert block["memory"]["allocated_bytes"] >= 200 * 1024
+    assert block["memory"]["peak_bytes"] >= 200 * 1024
+
+    assert profile.stacks
+    for line in profile.stacks:
+        stack, micros = line.rsplit(" ", 1)
+        assert stack.startswith("ART_SCHEMA_001;")
+        assert int(micros) > 0
+    # Attributed time never exceeds what was measured, even through recursion.
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in profile.stacks) <= block["wall_ms"] * 1000 * 1.05
+
+
+def test_write_collapsed_creates_flamegraph_input(tmp_path: Path) -> None:
+    target = tmp_path / "profiles" / "001-unit.collapsed"
+    phase_profiler.write_collapsed(target, ["PRE_001;main 12", "PRE_001;main;load 30"])
+    assert target.read_text(encoding="utf-8") == "PRE_001;main 12\nPRE_001;main;load 30\n"
@@ -32,6 +32,8 @@ def test_ensure_program_context_does_not_reuse_unrelated_current_program(tmp_pat
     shutil.copy(ROOT / "factory/scripts/bash/load-stage-context.sh", scripts_dir / "load-stage-context.sh")
     shutil.copy(ROOT / "factory/scripts/python/load_stage_context.py", generic_scripts_dir / "load_stage_context.py")
     shutil.copy(ROOT / "factory/scripts/python/manage_program_context.py", generic_scripts_dir / "manage_program_context.py")
+    shutil.copy(ROOT / "factory/scripts/python/json_io.py", generic_scripts_dir / "json_io.py")
+    shutil.copy(ROOT / "factory/scripts/python/artifact_models.py", generic_scripts_dir / "artifact_models.py")
     shutil.copy(ROOT / "factory/config/stage-context-map.v1.json", config_dir / "stage-context-map.v1.json")
     shutil.copy(ROOT / "factory/templates/charter-template.md", templates_dir / "charter-template.md")
 
@@ -68,6 +70,8 @@ def test_manage_program_context_recommend_activate_and_list_units(tmp_path: Path
     shutil.copy(ROOT / "factory/scripts/bash/common.sh", bash_scripts_dir / "common.sh")
     shutil.copy(ROOT / "factory/scripts/bash/manage-program-context.sh", bash_scripts_dir / "manage-program-context.sh")
     shutil.copy(ROOT / "factory/scripts/python/manage_program_context.py", generic_scripts_dir / "manage_program_context.py")
+    shutil.copy(ROOT / "factory/scripts/python/json_io.py", generic_scripts_dir / "json_io.py")
+    shutil.copy(ROOT / "factory/scripts/python/artifact_models.py", generic_scripts_dir / "artifact_models.py")
 
     writing = "ielts-writing-5-0-to-7-5-in-30-days-20260215-2122"
     speaking = "ielts-speaking-5-0-to-6-5-in-30-days-20260215-1834"
@@ -143,6 +147,8 @@ def test_manage_program_context_workflow_status_generates_follow_up_tasks(tmp_pa
     shutil.copy(ROOT / "factory/scripts/bash/common.sh", bash_scripts_dir / "common.sh")
     shutil.copy(ROOT / "factory/scripts/bash/manage-program-context.sh", bash_scripts_dir / "manage-program-context.sh")
     shutil.copy(ROOT / "factory/scripts/python/manage_program_context.py", generic_scripts_dir / "manage_program_context.py")
+    shutil.copy(ROOT / "factory/scripts/python/json_io.py", generic_scripts_dir / "json_io.py")
+    shutil.copy(ROOT / "factory/scripts/python/artifact_models.py", generic_scripts_dir / "artifact_models.py")
 
     program_id = "ielts-writing-5-0-to-7-5-in-30-days-20260215-2122"
     program_dir = programs_dir / program_id
@@ -229,6 +235,8 @@ def test_manage_program_context_resolve_unit_next_intent_activates_next_unit(tmp
     shutil.copy(ROOT / "factory/scripts/bash/common.sh", bash_scripts_dir / "common.sh")
     shutil.copy(ROOT / "factory/scripts/bash/manage-program-context.sh", bash_scripts_dir / "manage-program-context.sh")
     shutil.copy(ROOT / "factory/scripts/python/manage_program_context.py", generic_scripts_dir / "manage_program_context.py")
+    shutil.copy(ROOT / "factory/scripts/python/json_io.py", generic_scripts_dir / "json_io.py")
+    shutil.copy(ROOT / "factory/scripts/python/artifact_models.py", generic_scripts_dir / "artifact_models.py")
 
     program_id = "ielts-writing-5-0-to-7-5-in-30-days-20260215-2122"
     program_dir = programs_dir / program_id
@@ -306,6 +314,8 @@ def test_manage_program_context_resolve_program_falls_back_to_single_existing_pr
     shutil.copy(ROOT / "factory/scripts/bash/common.sh", bash_scripts_dir / "common.sh")
     shutil.copy(ROOT / "factory/scripts/bash/manage-program-context.sh", bash_scripts_dir / "manage-program-context.sh")
     shutil.copy(ROOT / "factory/scripts/python/manage_program_context.py", generic_scripts_dir / "manage_program_context.py")
+    shutil.copy(ROOT / "factory/scripts/python/json_io.py", generic_scripts_dir / "json_io.py")
+    shutil.copy(ROOT / "factory/scripts/python/artifact_models.py", generic_scripts_dir / "artifact_models.py")
 
     existing_program = "ielts-speaking-5-0-to-6-5-in-30-days-20260215-2233"
     (programs_dir / existing_program / "units" / "001-speaking").mkdir(parents=True)
@@ -351,6 +361,8 @@ def test_manage_program_context_resolve_program_falls_back_to_latest_existing_pr
     shutil.copy(ROOT / "factory/scripts/bash/common.sh", bash_scripts_dir / "common.sh")
     shutil.copy(ROOT / "factory/scripts/bash/manage-program-context.sh", bash_scripts_dir / "manage-program-context.sh")
     shutil.copy(ROOT / "factory/scripts/python/manage_program_context.py", generic_scripts_dir / "manage_program_context.py")
+    shutil.copy(ROOT / "factory/scripts/python/json_io.py", generic_scripts_dir / "json_io.py")
+    shutil.copy(ROOT / "factory/scripts/python/artifact_models.py", generic_scripts_dir / "artifact_models.py")
 
     older = "ielts-writing-5-0-to-7-5-in-30-days-20260215-2122"
     latest = "ielts-writing-5-0-to-7-5-in-30-days-20260215-2233"
@@ -0,0 +1,91 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+SCRIPT_PATH = SCRIPTS_DIR / "schema_registry.py"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+spec = importlib.util.spec_from_file_location("schema_registry", SCRIPT_PATH)
+schema_registry = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = schema_registry
+spec.loader.exec_module(schema_registry)
+
+
+def _write_schema(path: Path, payload: dict) -> None:
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def test_registry_loads_every_contract_schema_once() -> None:
+    registry = schema_registry.SchemaRegistry(ROOT / "contracts" / "schemas")
+    expected = sorted(path.name for path in (ROOT / "contracts" / "schemas").glob("*.schema.json"))
+
+    assert sorted(registry.entries) == expected
+    assert registry.load_errors == {}
+    assert registry.stats["schemas_parsed"] == len(expected)
+    assert registry.entries["brief.schema.json"].schema_id == "lcs.artifact.brief.v1"
+
+    first = registry.validator_for("brief.schema.json")
+    second = registry.validator_for("brief.schema.json")
+    assert first is second
+
+
+def test_compiled_validators_are_reused_across_registry_instances(tmp_path: Path) -> None:
+    _write_schema(tmp_path / "item.schema.json", {"$id": "test.item.v1", "type": "object"})
+
+    first = schema_registry.SchemaRegistry(tmp_path).validator_for("item.schema.json")
+    reloaded = schema_registry.SchemaRegistry(tmp_path)
+    second = reloaded.validator_for("item.schema.json")
+
+    assert first is second
+    assert reloaded.stats["compile_cache_hits"] == 1
+
+
+def test_cross_schema_refs_resolve_through_registry(tmp_path: Path) -> None:
+    _write_schema(
+        tmp_path / "common.schema.json",
+        {"$id": "test.common.v1", "$defs": {"lo_id": {"type": "string", "pattern": "^LO[0-9]+$"}}},
+    )
+    _write_schema(
+        tmp_path / "unit.schema.json",
+        {
+            "$id": "test.unit.v1",
+            "type": "object",
+            "properties": {"lo_id": {"$ref": "test.common.v1#/$defs/lo_id"}},
+        },
+    )
+
+    validator = schema_registry.SchemaRegistry(tmp_path).validator_for("unit.schema.json")
+
+    assert list(validator.iter_errors({"lo_id": "LO1"})) == []
+    assert len(list(validator.iter_errors({"lo_id": "bad"}))) == 1
+
+
+def test_disk_cache_skips_schema_parsing_on_next_load(tmp_path: Path) -> None:
+    schemas_dir = tmp_path / "schemas"
+    cache_dir = tmp_path / "cache"
+    schemas_dir.mkdir()
+    _write_schema(schemas_dir / "item.schema.json", {"$id": "test.item.v1", "type": "object"})
+
+    cold = schema_registry.SchemaRegistry(schemas_dir, cache_dir=cache_dir)
+    warm = schema_registry.SchemaRegistry(schemas_dir, cache_dir=cache_dir)
+
+    assert cold.stats["schemas_parsed"] == 1
+    assert warm.stats["schemas_parsed"] == 0
+    assert warm.stats["disk_cache_hits"] == 1
+    assert warm.bundle_digest == cold.bundle_digest
+
+
+def test_invalid_schema_json_is_reported_per_file(tmp_path: Path) -> None:
+    (tmp_path / "broken.schema.json").write_text("{", encoding="utf-8")
+    _write_schema(tmp_path / "item.schema.json", {"$id": "test.item.v1", "type": "object"})
+
+    registry = schema_registry.SchemaRegistry(tmp_path)
+
+    assert "broken.schema.json" in registry.load_errors
+    assert "invalid schema JSON" in registry.load_errors["broken.schema.json"]
+    assert registry.validator_for("item.schema.json") is not None
@@ -0,0 +1,111 @@
+import importlib.util
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+spec = importlib.util.spec_from_file_location("selection_optimizer", SCRIPTS_DIR / "selection_optimizer.py")
+optimizer = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = optimizer
+spec.loader.exec_module(optimizer)
+
+Candidate = optimizer.Candidate
+
+
+def _reference(candidates: list, k: int, requirements: set[str], budget: float | None) -> tuple[int, ...]:
+    # Every feasible set, compared as the optimizer does; the first in rank order wins ties.
+    if budget is not None and not any(item.minutes <= budget for item in candidates):
+        budget = None
+    order = sorted(range(len(candidates)), key=lambda index: (-candidates[index].score, candidates[index].key))
+    best, best_value = (), None
+    for size in range(min(k, len(order)) + 1):
+        for combo in itertools.combinations(order, size):
+            chosen = [candidates[index] for index in combo]
+            if len({item.exercise_type for item in chosen}) < size:
+                continue
+            if budget is not None and sum(item.minutes for item in chosen) > budget:
+                continue
+            covered = set().union(*(item.covers for item in chosen)) & requirements
+            score = 0.0
+            for item in chosen:
+                score += item.score
+            value = (len(covered), size, score)
+            if best_value is None or value > best_value:
+                best, best_value = combo, value
+    return tuple(sorted(best, key=order.index))
+
+
+def _random_candidates(rnd: random.Random, count: int, types: int, requirements: list[str]) -> list:
+    return [
+        Candidate(
+            key=f"t{index:05d}",
+            exercise_type=f"TYPE_{rnd.randrange(types)}",
+            score=rnd.choice([0.6, 0.7, 0.75, 0.8, round(rnd.uniform(0.4, 1.0), 4)]),
+            minutes=rnd.choice([1.0, 2.0, 3.0, 4.5, 7.0, 12.0]),
+            covers=frozenset(rnd.sample(requirements, rnd.randint(0, 2))),
+        )
+        for index in range(count)
+    ]
+
+
+def test_optimizer_matches_exhaustive_search() -> None:
+    rnd = random.Random(5)
+    pool = ["modality:reading", "modality:speaking", "domain:grammar", "domain:vocab", "domain:fluency"]
+    for _ in range(400):
+        candidates = _random_candidates(rnd, rnd.randint(0, 9), rnd.randint(1, 5), pool)
+        requirements = set(rnd.sample(pool, rnd.randint(0, 4)))
+        k = rnd.randint(1, 3)
+        budget = rnd.choice([None, 0.5, 4.0, 8.0, 20.0])
+        plan = optimizer.optimize_selection(candidates, k=k, requirements=requirements, budget=budget)
+        assert plan.chosen == _reference(candidates, k, requirements, budget)
+        assert plan.exhaustive
+
+
+def test_unconstrained_selection_is_the_ranked_top_k() -> None:
+    candidates = [
+        Candidate("b", "MCQ", 0.8, 3.0),
+        Candidate("a", "MCQ", 0.9, 3.0),
+        Candidate("c", "GAP_FILL", 0.8, 3.0),
+        Candidate("d", "MATCHING", 0.7, 3.0),
+    ]
+    # One template per exercise type: "b" gives way to the lower-scored "d".
+    assert optimizer.optimize_selection(candidates, k=3).chosen == (1, 2, 3)
+
+    plan = optimizer.optimize_selection(
+        candidates + [Candidate("e", "READ_ALOUD", 0.1, 3.0, frozenset({"modality:speaking"}))],
+        k=3,
+        requirements={"modality:speaking", "domain:inference"},
+        budget=9.0,
+    )
+    assert plan.chosen == (1, 2, 4)
+    assert plan.covered == ("modality:speaking",)
+    assert plan.uncovered == ("domain:inference",)
+
+    relaxed = optimizer.optimize_selection(candidates, k=3, budget=1.0)
+    assert relaxed.chosen == (1, 2, 3)
+    assert relaxed.budget_relaxed and relaxed.budget is None
+
+
+def test_large_catalogs_solve_quickly_and_deterministically() -> None:
+    rnd = random.Random(9)
+    requirements = [f"domain:d{index}" for index in range(6)] + ["modality:speaking", "modality:writing"]
+    candidates = _random_candidates(rnd, 5000, 40, requirements)
+
+    started = time.perf_counter()
+    plan = optimizer.optimize_selection(candidates, k=3, requirements=requirements, budget=15.0)
+    elapsed = time.perf_counter() - started
+
+    assert plan.exhaustive
+    assert len(plan.chosen) == 3
+    assert elapsed < 1.0
+    shuffled = candidates[:]
+    rnd.shuffle(shuffled)
+    again = optimizer.optimize_selection(shuffled, k=3, requirements=requirements, budget=15.0)
+    assert [shuffled[index].key for index in again.chosen] == [candidates[index].key for index in plan.chosen]
@@ -0,0 +1,79 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = ROOT / "factory" / "scripts" / "python" / "sequence_graph.py"
+
+spec = importlib.util.spec_from_file_location("sequence_graph", SCRIPT_PATH)
+sequence_graph = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = sequence_graph
+spec.loader.exec_module(sequence_graph)
+
+
+def _task(task_id: str, *depends_on: str) -> dict:
+    return {"task_id": task_id, "lo_refs": ["LO1"], "depends_on": list(depends_on)}
+
+
+def test_analyze_reports_exact_cycle_paths_and_critical_path() -> None:
+    graph = sequence_graph.SequenceGraph(
+        [
+            _task("S001", "S002"),
+            _task("S002", "S003"),
+            _task("S003", "S001"),
+            _task("S004", "S004"),
+            _task("S005"),
+            _task("S006", "S005", "S005"),
+            _task("S007", "S006", "S404"),
+            "not-a-task",
+        ]
+    )
+    analysis = graph.analyze()
+
+    assert [sequence_graph.format_cycle(cycle) for cycle in analysis.cycles] == [
+        "S001 -> S002 -> S003 -> S001",
+        "S004 -> S004",
+    ]
+    assert analysis.cyclic_task_count == 4
+    assert analysis.order == ["S005", "S006", "S007"]
+    assert analysis.critical_path == ["S005", "S006", "S007"]
+    assert graph.unknown_dependencies(graph.tasks[6]) == ["S404"]
+    assert graph.tasks[6].position == 6
+
+
+def test_duplicate_ids_are_indexed_once() -> None:
+    graph = sequence_graph.SequenceGraph([_task("S001"), _task("S001", "S002"), _task("S002")])
+    assert graph.duplicate_ids == {"S001"}
+    assert "S002" in graph and "S003" not in graph
+    assert graph.analyze().acyclic
+
+
+def test_long_chains_do_not_recurse() -> None:
+    count = 100_000
+    tasks = [_task(f"S{index:06d}", *([f"S{index - 1:06d}"] if index else [])) for index in range(count)]
+    analysis = sequence_graph.SequenceGraph(tasks).analyze()
+    assert analysis.acyclic
+    assert analysis.critical_path_length == count
+
+    tasks[0]["depends_on"] = [f"S{count - 1:06d}"]
+    analysis = sequence_graph.SequenceGraph(tasks).analyze()
+    assert analysis.cyclic_task_count == count
+    assert len(analysis.cycles) == 1
+    assert len(analysis.cycles[0]) == count + 1
+
+
+def test_from_records_matches_raw_task_index() -> None:
+    sys.path.insert(0, str(SCRIPT_PATH.parent))
+    from artifact_models import Sequence
+
+    tasks = [_task("S001"), "not a task", {"task_id": 7}, _task("S002", "S001", "S404"), _task("S001", "S002")]
+    raw = sequence_graph.SequenceGraph(tasks)
+    typed = sequence_graph.SequenceGraph.from_records(Sequence.from_json({"tasks": tasks}).tasks)
+
+    assert [(task.position, task.task_id) for task in typed.tasks] == [(0, "S001"), (3, "S002"), (4, "S001")]
+    assert [(task.position, task.task_id) for task in raw.tasks] == [(0, "S001"), (3, "S002"), (4, "S001")]
+    assert typed.duplicate_ids == raw.duplicate_ids == {"S001"}
+    assert typed.unknown_dependencies(typed.tasks[1]) == ["S404"]
+    assert typed.analyze().cycles == raw.analyze().cycles
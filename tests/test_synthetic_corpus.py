@@ -0,0 +1,77 @@
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+GENERATOR = ROOT / "factory" / "scripts" / "python" / "generate_synthetic_corpus.py"
+VALIDATOR = ROOT / "factory" / "scripts" / "python" / "validate_artifact_contracts.py"
+
+
+def _generate(*args: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, str(GENERATOR), "--repo-root", str(ROOT), "--json", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode == 1 and "template pack not found" in result.stderr:
+        pytest.skip("template pack is not available")
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+def _tree_digest(root: Path) -> dict[str, str]:
+    return {
+        str(path.relative_to(root)): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_synthetic_corpus_is_deterministic_and_injects_requested_defect_fraction(tmp_path: Path) -> None:
+    args = ("--units", "20", "--los", "4", "--tasks", "30", "--exercises", "9", "--defect-rate", "0.25", "--seed", "7")
+    first = _generate("--output-root", str(tmp_path / "a"), *args)
+    second = _generate("--output-root", str(tmp_path / "b"), *args)
+
+    assert first["unit_count"] == 20
+    assert first["defective_unit_count"] == 5
+    assert [unit["defect"] for unit in first["units"]] == [unit["defect"] for unit in second["units"]]
+    assert _tree_digest(tmp_path / "a") == _tree_digest(tmp_path / "b")
+
+    unit_dir = Path(first["units"][0]["unit_dir"])
+    sequence = json.loads((unit_dir / "sequence.json").read_text(encoding="utf-8"))
+    assert len(sequence["tasks"]) == 30
+    manifest = json.loads((unit_dir / "outputs" / "manifest.json").read_text(encoding="utf-8"))
+    media = [item for item in manifest["artifacts"] if item["type"] == "media"]
+    assert len(media) == 2 and all((unit_dir / item["path"]).stat().st_size == 4096 for item in media)
+
+
+def test_validator_passes_clean_synthetic_units_and_blocks_injected_defects() -> None:
+    prefix = "synthetic-corpus-test"
+    program_dir = ROOT / "programs" / f"{prefix}-001"
+    try:
+        summary = _generate(
+            "--program-prefix", prefix, "--units", "8", "--defect-rate", "0.75", "--seed", "11", "--artifacts", "3"
+        )
+        defects = {unit["unit_dir"]: unit["defect"] for unit in summary["units"]}
+        assert sum(1 for defect in defects.values() if defect) == 6
+
+        result = subprocess.run(
+            [sys.executable, str(VALIDATOR), "--repo-root", str(ROOT), "--program", f"{prefix}-001", "--json"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+        lines = [json.loads(line) for line in result.stdout.splitlines() if line.strip()]
+        statuses = {line["UNIT_DIR"]: line["STATUS"] for line in lines if "UNIT_DIR" in line}
+        assert statuses.keys() == defects.keys()
+        for unit_dir, defect in defects.items():
+            assert statuses[unit_dir] == ("BLOCK" if defect else "PASS"), (unit_dir, defect)
+    finally:
+        shutil.rmtree(program_dir, ignore_errors=True)
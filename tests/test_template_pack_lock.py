@@ -0,0 +1,101 @@
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+SCRIPT_PATH = SCRIPTS_DIR / "template_pack_lock.py"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+spec = importlib.util.spec_from_file_location("template_pack_lock", SCRIPT_PATH)
+template_pack_lock = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = template_pack_lock
+spec.loader.exec_module(template_pack_lock)
+
+
+def _write_pack(pack_dir: Path) -> None:
+    (pack_dir / "schemas").mkdir(parents=True)
+    (pack_dir / "rules").mkdir()
+    (pack_dir / "schemas" / "mcq.v1.schema.json").write_text("{}", encoding="utf-8")
+    (pack_dir / "rules" / "mcq.v1.rules.md").write_text("# MCQ\n", encoding="utf-8")
+    catalog = {
+        "catalog_version": "1.0.0",
+        "templates": [
+            {
+                "template_id": " MCQ.v1 ",
+                "exercise_type": "mcq",
+                "schema": "schemas/mcq.v1.schema.json",
+                "rules": "rules/mcq.v1.rules.md",
+            },
+            {
+                "template_id": "tfng.v1",
+                "exercise_type": "TFNG",
+                "schema": "schemas/tfng.v1.schema.json",
+                "rules": "rules/mcq.v1.rules.md",
+            },
+        ],
+    }
+    (pack_dir / "catalog.json").write_text(json.dumps(catalog), encoding="utf-8")
+
+
+def test_lock_indexes_normalized_ids_and_resolved_references(tmp_path: Path) -> None:
+    pack_dir = tmp_path / "pack"
+    _write_pack(pack_dir)
+
+    lock = template_pack_lock.load_lock(pack_dir)
+
+    assert (pack_dir / template_pack_lock.LOCK_FILENAME).is_file()
+    assert [(item["template_id"], item["exercise_type"]) for item in lock["templates"]] == [
+        ("mcq.v1", "MCQ"),
+        ("tfng.v1", "TFNG"),
+    ]
+    assert lock["refs"]["schemas/mcq.v1.schema.json"]["exists"] is True
+    assert lock["refs"]["schemas/mcq.v1.schema.json"]["size"] == 2
+    assert lock["refs"]["schemas/tfng.v1.schema.json"] == {
+        "path": "schemas/tfng.v1.schema.json",
+        "exists": False,
+        "size": None,
+        "sha256": None,
+    }
+    assert template_pack_lock.is_fresh(lock, pack_dir)
+
+
+def test_lock_goes_stale_when_a_referenced_directory_changes_and_is_rebuilt(tmp_path: Path) -> None:
+    pack_dir = tmp_path / "pack"
+    _write_pack(pack_dir)
+    lock = template_pack_lock.load_lock(pack_dir)
+
+    (pack_dir / "schemas" / "tfng.v1.schema.json").write_text("{}", encoding="utf-8")
+
+    assert not template_pack_lock.is_fresh(lock, pack_dir)
+    rebuilt = template_pack_lock.load_lock(pack_dir)
+    assert rebuilt["refs"]["schemas/tfng.v1.schema.json"]["exists"] is True
+    on_disk = json.loads((pack_dir / template_pack_lock.LOCK_FILENAME).read_text(encoding="utf-8"))
+    assert on_disk == rebuilt
+
+
+def test_check_reports_in_place_edits_that_the_stat_check_allows(tmp_path: Path) -> None:
+    pack_dir = tmp_path / "pack"
+    _write_pack(pack_dir)
+
+    def _run(*extra: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(SCRIPT_PATH), "--template-pack-dir", str(pack_dir), "--json", *extra],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+    built = _run()
+    assert built.returncode == 0, built.stderr
+    assert json.loads(built.stdout)["MISSING_REFS"] == ["schemas/tfng.v1.schema.json"]
+    assert _run("--check").returncode == 0
+
+    (pack_dir / "rules" / "mcq.v1.rules.md").write_text("# MCQ (edited)\n", encoding="utf-8")
+    checked = _run("--check")
+    assert checked.returncode == 1
+    assert json.loads(checked.stdout)["PROBLEMS"] == ["rules/mcq.v1.rules.md: content changed"]
@@ -0,0 +1,144 @@
+import importlib.util
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+SCRIPT_PATH = SCRIPTS_DIR / "generate_template_selection.py"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+spec = importlib.util.spec_from_file_location("generate_template_selection", SCRIPT_PATH)
+selection = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = selection
+spec.loader.exec_module(selection)
+
+
+def _reference_hits(text: str, exercise_type: str) -> int:
+    return sum(text.count(token) for token in selection.KEYWORD_HINTS.get(exercise_type.upper(), []))
+
+
+def _reference_lo_fit(lo_text: str, templates: list[dict], target: dict) -> float:
+    # The per-template formula the hit vector replaces: rescan the text for every catalog entry.
+    counts = [_reference_hits(lo_text, str(item.get("exercise_type", ""))) for item in templates]
+    max_hits = max(counts) if counts else 0
+    if max_hits <= 0:
+        return 0.8
+    return round(0.6 + 0.4 * (_reference_hits(lo_text, str(target.get("exercise_type", ""))) / max_hits), 4)
+
+
+def test_lo_fit_scores_match_the_per_template_formula() -> None:
+    rnd = random.Random(7)
+    tokens = [token for hints in selection.KEYWORD_HINTS.values() for token in hints]
+    types = [*selection.KEYWORD_HINTS, "UNKNOWN", "mcq", ""]
+    templates = [{"exercise_type": rnd.choice(types)} for _ in range(120)]
+    for _ in range(25):
+        lo_text = " ".join(rnd.choice([*tokens, "learner", "the"]) for _ in range(rnd.randint(0, 30))).lower()
+        expected = [_reference_lo_fit(lo_text, templates, item) for item in templates]
+        assert selection.lo_fit_scores(selection.keyword_hit_vector(lo_text), templates, templates) == expected
+
+    assert selection.lo_fit_scores({}, [], [{"exercise_type": "MCQ"}]) == [0.8]
+
+
+def test_weighted_scores_are_bit_identical_to_the_scalar_sum(monkeypatch) -> None:
+    rnd = random.Random(11)
+    matrix = [[round(rnd.uniform(0.3, 1.0), 4) for _ in selection.CRITERIA] for _ in range(200)]
+    expected = []
+    for row in matrix:
+        score = 0.0
+        for key, weight in selection.FORMULA_WEIGHTS.items():
+            score += weight * row[selection.CRITERIA.index(key)]
+        expected.append(score)
+
+    assert selection.weighted_scores(matrix) == expected
+    monkeypatch.setattr(selection, "_np", None)
+    assert selection.weighted_scores(matrix) == expected
+    assert selection.weighted_scores([]) == []
+
+
+def _write_program(repo: Path, unit_count: int) -> Path:
+    pack = repo / "pack"
+    pack.mkdir(parents=True)
+    types = ["MCQ", "GAP_FILL", "MATCHING", "TRUE_FALSE", "ORDERING", "SHORT_ANSWER"]
+    templates = [{"template_id": f"t{index}", "exercise_type": kind} for index, kind in enumerate(types, start=1)]
+    (pack / "catalog.json").write_text(json.dumps({"templates": templates}), encoding="utf-8")
+    brief = {"duration_minutes": 30, "learning_outcomes": [{"lo_id": "LO1", "statement": "Learners practise."}]}
+    for index in range(1, unit_count + 1):
+        unit_dir = repo / "programs" / "prog" / "units" / f"{index:03d}-unit"
+        unit_dir.mkdir(parents=True)
+        (unit_dir / "brief.json").write_text(json.dumps(brief), encoding="utf-8")
+    return pack
+
+
+def test_program_mode_scores_diversity_across_units(tmp_path: Path) -> None:
+    pack = _write_program(tmp_path, 3)
+    units_root = tmp_path / "programs" / "prog" / "units"
+
+    def _select(*target: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(SCRIPT_PATH), "--repo-root", str(tmp_path), "--template-pack-dir", str(pack), *target],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+    _select("--unit-dir", str(units_root / "001-unit"))
+    single_unit = (units_root / "001-unit" / "template-selection.json").read_text(encoding="utf-8")
+
+    payload = json.loads(_select("--program", "prog", "--json").stdout)
+
+    # Equally scored templates: every unit after the first avoids what earlier units already picked.
+    assert [unit["SELECTED_TEMPLATES"] for unit in payload["UNITS"]] == [
+        ["t1", "t2", "t3"],
+        ["t4", "t5", "t6"],
+        ["t1", "t2", "t3"],
+    ]
+    assert payload["TEMPLATE_USAGE"] == {"t1": 2, "t2": 2, "t3": 2, "t4": 1, "t5": 1, "t6": 1}
+    assert (units_root / "001-unit" / "template-selection.json").read_text(encoding="utf-8") == single_unit
+
+    written = {path: path.read_bytes() for path in sorted(units_root.glob("*/*.json"))}
+    _select("--program", "prog", "--json")
+    assert {path: path.read_bytes() for path in sorted(units_root.glob("*/*.json"))} == written
+
+
+def test_selection_keeps_exercise_types_distinct_and_within_the_budget(tmp_path: Path) -> None:
+    pack = tmp_path / "pack"
+    pack.mkdir()
+    templates = [
+        {"template_id": "mcq.a", "exercise_type": "MCQ", "estimated_time_minutes": 4},
+        {"template_id": "mcq.b", "exercise_type": "MCQ", "estimated_time_minutes": 4},
+        {"template_id": "gap.a", "exercise_type": "GAP_FILL", "estimated_time_minutes": 4},
+        {"template_id": "match.a", "exercise_type": "MATCHING", "estimated_time_minutes": 30},
+    ]
+    (pack / "catalog.json").write_text(json.dumps({"templates": templates}), encoding="utf-8")
+    unit_dir = tmp_path / "unit"
+    unit_dir.mkdir()
+    brief = {"duration_minutes": 12, "learning_outcomes": [{"lo_id": "LO1", "statement": "Learners practise."}]}
+    (unit_dir / "brief.json").write_text(json.dumps(brief), encoding="utf-8")
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(SCRIPT_PATH),
+            "--repo-root",
+            str(tmp_path),
+            "--template-pack-dir",
+            str(pack),
+            "--unit-dir",
+            str(unit_dir),
+            "--json",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    written = json.loads((unit_dir / "template-selection.json").read_text(encoding="utf-8"))
+    assert [item["template_id"] for item in written["selected_templates"]] == ["gap.a", "mcq.a"]
+    assert written["top_k"] == 3
+    constraints = json.loads(result.stdout)["SELECTION_CONSTRAINTS"]
+    assert constraints["minutes"] == 8 and constraints["budget_minutes"] == 12
@@ -0,0 +1,92 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+SCRIPT_PATH = SCRIPTS_DIR / "validate_artifact_contracts.py"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+spec = importlib.util.spec_from_file_location("validate_artifact_contracts", SCRIPT_PATH)
+validator = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = validator
+spec.loader.exec_module(validator)
+
+
+def _write_pack(pack_dir: Path, validator_source: str) -> None:
+    (pack_dir / "validators").mkdir(parents=True)
+    (pack_dir / "validators" / "validate_template_pack.py").write_text(validator_source, encoding="utf-8")
+
+
+def test_plugin_validator_runs_in_process_with_parsed_payloads(tmp_path: Path) -> None:
+    pack_dir = tmp_path / "pack"
+    _write_pack(
+        pack_dir,
+        "CALLS = []\n"
+        "\n"
+        "def validate(unit_payloads, pack):\n"
+        "    CALLS.append(pack['catalog_version'])\n"
+        "    brief = unit_payloads['brief.json']\n"
+        "    return [{'code': 'PACK_RULE', 'severity': 'medium', 'message': brief['unit_id'], 'path': 'brief.json'}]\n",
+    )
+
+    findings, outputs, mode = validator._validate_template_rules_with_validator(
+        template_pack_dir=pack_dir,
+        unit_dir=tmp_path / "unit",
+        catalog={"catalog_version": "1.0.0"},
+        unit_payloads={"brief.json": {"unit_id": "u1"}},
+    )
+
+    assert mode == "in-process"
+    assert outputs == [str(pack_dir / "validators" / "validate_template_pack.py")]
+    assert [(item["code"], item["severity"], item["message"]) for item in findings] == [("PACK_RULE", "MEDIUM", "u1")]
+
+
+def test_plugin_validator_is_loaded_once_per_pack_version(tmp_path: Path) -> None:
+    pack_dir = tmp_path / "pack"
+    _write_pack(pack_dir, "def validate(unit_payloads, pack):\n    return []\n")
+    validator_path = pack_dir / "validators" / "validate_template_pack.py"
+
+    first = validator._load_template_validator_plugin(validator_path, "1.0.0")
+    second = validator._load_template_validator_plugin(validator_path, "1.0.0")
+    other_version = validator._load_template_validator_plugin(validator_path, "2.0.0")
+
+    assert first is not None
+    assert first is second
+    assert other_version is not first
+
+
+def test_validator_without_plugin_interface_falls_back_to_subprocess(tmp_path: Path) -> None:
+    pack_dir = tmp_path / "pack"
+    payload = {"STATUS": "BLOCK", "FINDINGS": [{"code": "LEGACY", "severity": "HIGH", "message": "legacy"}]}
+    _write_pack(pack_dir, f"import json\nprint(json.dumps({payload!r}))\n")
+
+    findings, _, mode = validator._validate_template_rules_with_validator(
+        template_pack_dir=pack_dir,
+        unit_dir=tmp_path / "unit",
+        catalog={"catalog_version": "1.0.0"},
+        unit_payloads={},
+    )
+
+    assert mode == "subprocess"
+    assert [item["code"] for item in findings] == ["LEGACY"]
+
+
+def test_plugin_exceptions_become_blocking_findings(tmp_path: Path) -> None:
+    pack_dir = tmp_path / "pack"
+    _write_pack(pack_dir, "def validate(unit_payloads, pack):\n    raise RuntimeError('boom')\n")
+
+    findings, _, mode = validator._validate_template_rules_with_validator(
+        template_pack_dir=pack_dir,
+        unit_dir=tmp_path / "unit",
+        catalog={"catalog_version": "1.0.0"},
+        unit_payloads={},
+    )
+
+    assert mode == "in-process"
+    assert findings[0]["code"] == "TMP_VALIDATOR_EXEC_FAILED"
+    assert "boom" in findings[0]["message"]
+    json.dumps([item.to_dict() for item in findings])
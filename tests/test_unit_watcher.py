@@ -0,0 +1,62 @@
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = ROOT / "factory" / "scripts" / "python" / "unit_watcher.py"
+
+spec = importlib.util.spec_from_file_location("unit_watcher", SCRIPT_PATH)
+unit_watcher = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = unit_watcher
+spec.loader.exec_module(unit_watcher)
+
+
+def _backends(tmp_path: Path):
+    yield unit_watcher.open_watcher([tmp_path], polling=True, poll_interval=0.01)
+    if sys.platform.startswith("linux"):
+        yield unit_watcher.InotifyWatcher([tmp_path])
+
+
+def test_watchers_report_changed_files_and_ignore_editor_temporaries(tmp_path: Path) -> None:
+    (tmp_path / "rubrics").mkdir()
+    brief = tmp_path / "brief.json"
+    brief.write_text("{}", encoding="utf-8")
+
+    for watcher in _backends(tmp_path):
+        try:
+            assert watcher.poll(0.05) == set()
+            brief.write_text('{"title": "changed"}', encoding="utf-8")
+            (tmp_path / "rubrics" / ".gates.json.swp").write_text("x", encoding="utf-8")
+            changed = watcher.poll(2)
+            changed |= watcher.poll(0.1)
+            assert brief in changed, watcher.backend
+            assert not any(path.name.endswith(".swp") for path in changed)
+        finally:
+            watcher.close()
+
+
+def test_watch_debounces_a_burst_of_changes_into_one_callback(tmp_path: Path) -> None:
+    watcher = unit_watcher.open_watcher([tmp_path], polling=True, poll_interval=0.01)
+    calls: list[set[Path]] = []
+
+    def _on_change(changed: set[Path]) -> None:
+        calls.append(changed)
+        raise KeyboardInterrupt
+
+    def _burst() -> None:
+        for index in range(3):
+            (tmp_path / f"exercise-{index}.json").write_text("{}", encoding="utf-8")
+
+    timer = threading.Timer(0.05, _burst)
+    timer.start()
+    with pytest.raises(KeyboardInterrupt):
+        unit_watcher.watch(watcher, _on_change, debounce_ms=200)
+    timer.join()
+
+    assert len(calls) == 1
+    assert {path.name for path in calls[0]} == {"exercise-0.json", "exercise-1.json", "exercise-2.json"}
@@ -0,0 +1,66 @@
+import hashlib
+import importlib.util
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "factory" / "scripts" / "python"
+SCRIPT_PATH = SCRIPTS_DIR / "validation_cache.py"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+spec = importlib.util.spec_from_file_location("validation_cache", SCRIPT_PATH)
+validation_cache = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = validation_cache
+spec.loader.exec_module(validation_cache)
+
+
+def test_checksum_cache_persists_digests_keyed_by_stat(tmp_path: Path) -> None:
+    media = tmp_path / "lesson.mp4"
+    media.write_bytes(b"x" * 4096)
+    cache_file = tmp_path / "cache" / "checksums.json"
+
+    cold = validation_cache.ChecksumCache(cache_file)
+    assert cold.digest(media) == hashlib.sha256(media.read_bytes()).hexdigest()
+    cold.save()
+
+    warm = validation_cache.ChecksumCache(cache_file)
+    warm.digest(media)
+    assert warm.stats["files_hashed"] == 0
+    assert warm.stats["bytes_cached"] == 4096
+
+    media.write_bytes(b"y" * 10)
+    changed = validation_cache.ChecksumCache(cache_file)
+    assert changed.digest(media) == hashlib.sha256(b"y" * 10).hexdigest()
+    assert changed.stats["files_hashed"] == 1
+
+
+def test_digest_many_hashes_large_misses_in_parallel_and_reports_bytes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(validation_cache, "PARALLEL_HASH_MIN_BYTES", 1)
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"clip-{index}.bin"
+        path.write_bytes(bytes([index]) * 1000)
+        paths.append(path)
+    cache = validation_cache.ChecksumCache()
+
+    stats: dict[str, int] = {}
+    digests = cache.digest_many(paths + [tmp_path / "missing.bin"], stats=stats)
+    assert digests == {path: hashlib.sha256(path.read_bytes()).hexdigest() for path in paths}
+    assert stats == {"files_hashed": 4, "bytes_hashed": 4000}
+
+    again: dict[str, int] = {}
+    cache.digest_many(paths, stats=again)
+    assert again == {"files_cached": 4, "bytes_cached": 4000}
+
+
+def test_phase_cache_misses_on_fingerprint_change(tmp_path: Path) -> None:
+    cache = validation_cache.PhaseCache(tmp_path)
+    unit_dir = tmp_path / "unit"
+
+    cache.store(unit_dir, "artifact_schema", "fp-1", {"status": "PASS"})
+
+    assert cache.load(unit_dir, "artifact_schema", "fp-1") == {"status": "PASS"}
+    assert cache.load(unit_dir, "artifact_schema", "fp-2") is None
+    assert cache.stats == {"hits": 1, "misses": 1, "writes": 1}
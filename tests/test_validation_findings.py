@@ -0,0 +1,56 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = ROOT / "factory" / "scripts" / "python" / "validation_findings.py"
+
+spec = importlib.util.spec_from_file_location("validation_findings", SCRIPT_PATH)
+validation_findings = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = validation_findings
+spec.loader.exec_module(validation_findings)
+
+Finding = validation_findings.Finding
+
+
+def test_to_dict_matches_the_findings_contract_shape() -> None:
+    finding = Finding("TMP_RULE", "TEMPLATE", "HIGH", "broken", path="exercise-design.json", rule_id="rule-1")
+
+    assert json.dumps(finding.to_dict()) == json.dumps(
+        {
+            "code": "TMP_RULE",
+            "category": "TEMPLATE",
+            "severity": "HIGH",
+            "path": "exercise-design.json",
+            "rule_id": "rule-1",
+            "message": "broken",
+            "details": {},
+            "status": "OPEN",
+        }
+    )
+    assert finding["code"] == "TMP_RULE"
+    assert finding["details"] == {}
+    assert finding.get("missing", "fallback") == "fallback"
+    assert Finding.from_dict(finding.to_dict()).to_dict() == finding.to_dict()
+
+
+def test_message_template_renders_once_on_first_read() -> None:
+    keys = ["b", "a"]
+    finding = Finding("TMP_KEYS", "TEMPLATE", "HIGH", "keys {} for '{}'", message_args=(keys, "mcq"))
+
+    assert finding.message == "keys ['b', 'a'] for 'mcq'"
+    keys.append("c")
+    assert finding.message == "keys ['b', 'a'] for 'mcq'"
+    # Without message_args the text is used verbatim, braces included.
+    assert Finding("X", "SYSTEM", "LOW", "literal {}").message == "literal {}"
+
+
+def test_dedupe_keeps_first_finding_per_code_path_and_rendered_message() -> None:
+    first = Finding("TMP_DUP", "TEMPLATE", "HIGH", "template '{}' missing", path="p", message_args=("t1",))
+    same_text = Finding("TMP_DUP", "SYSTEM", "LOW", "template 't1' missing", path="p")
+    other_path = Finding("TMP_DUP", "TEMPLATE", "HIGH", "template 't1' missing", path="q")
+
+    assert validation_findings.dedupe_findings([first, same_text, other_path]) == [first, other_path]
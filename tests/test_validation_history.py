@@ -0,0 +1,79 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = ROOT / "factory" / "scripts" / "python" / "validation_history.py"
+
+spec = importlib.util.spec_from_file_location("validation_history", SCRIPT_PATH)
+validation_history = importlib.util.module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = validation_history
+spec.loader.exec_module(validation_history)
+
+DAY = 86400
+NOW = 1_780_000_000
+
+
+def _payload(unit: str, status: str, codes: list[tuple[str, str]]) -> dict:
+    return {
+        "STATUS": status,
+        "UNIT_DIR": f"/repo/programs/prog-a/units/{unit}",
+        "RESPONSE_VERSION": "2.0.0",
+        "PIPELINE": {"mode": "collect-all-per-phase"},
+        "STEPS": [{"step_id": "ART_SCHEMA_001", "phase": "artifact_schema", "status": status, "severity": "HIGH"}],
+        "FINDINGS": [
+            {"code": code, "category": "ARTIFACT", "severity": severity, "path": "", "message": code}
+            for code, severity in codes
+        ],
+    }
+
+
+def test_findings_query_filters_by_code_unit_and_window(tmp_path: Path) -> None:
+    with validation_history.HistoryStore(tmp_path / "validation.db") as store:
+        store.record(_payload("001-a", "BLOCK", [("CONSISTENCY_CHECK_FAILED", "HIGH")]), recorded_at=NOW - 10 * DAY)
+        store.record(
+            _payload("001-a", "BLOCK", [("CONSISTENCY_CHECK_FAILED", "HIGH"), ("AUDIT_GATE_BLOCK", "LOW")]),
+            recorded_at=NOW - DAY,
+        )
+        store.record(_payload("002-b", "BLOCK", [("CONSISTENCY_CHECK_FAILED", "HIGH")]), recorded_at=NOW - 60)
+
+        recent = store.findings(code="CONSISTENCY_CHECK_FAILED", since=validation_history.parse_since("7d", now=NOW))
+        assert [(row["program_id"], row["unit_id"], row["runs"]) for row in recent] == [
+            ("prog-a", "002-b", 1),
+            ("prog-a", "001-a", 1),
+        ]
+        everything = store.findings(code="CONSISTENCY_CHECK_FAILED", unit="001-a")
+        assert everything[0]["occurrences"] == 2
+        assert store.findings(severity="low")[0]["code"] == "AUDIT_GATE_BLOCK"
+
+        runs = store.runs(unit="001-a")
+        assert [run["by_severity"] for run in runs] == [{"HIGH": 1, "LOW": 1}, {"HIGH": 1}]
+
+
+def test_prune_folds_old_runs_into_rollups_without_losing_counts(tmp_path: Path) -> None:
+    with validation_history.HistoryStore(tmp_path / "validation.db") as store:
+        for offset in (40, 40, 35, 1):
+            payload = _payload("001-a", "BLOCK", [("SCHEMA_VALIDATION_ERROR", "HIGH")] * 2)
+            store.record(payload, recorded_at=NOW - offset * DAY)
+        before = store.findings(code="SCHEMA_VALIDATION_ERROR")
+
+        assert store.prune(30, now=NOW)["runs_rolled_up"] == 3
+        assert len(store.runs()) == 1
+        after = store.findings(code="SCHEMA_VALIDATION_ERROR")
+        assert (after[0]["occurrences"], after[0]["runs"]) == (before[0]["occurrences"], before[0]["runs"]) == (8, 4)
+
+        # A second prune over the same window adds nothing; the daily prune runs once per day.
+        assert store.prune(30, now=NOW)["runs_rolled_up"] == 0
+        assert store.findings(code="SCHEMA_VALIDATION_ERROR")[0]["occurrences"] == 8
+        assert store.prune_daily(30, now=NOW) is None
+
+
+def test_parse_since_accepts_relative_and_iso_values() -> None:
+    assert validation_history.parse_since("2w", now=NOW) == NOW - 14 * DAY
+    assert validation_history.parse_since("2026-01-31") == validation_history.parse_since("2026-01-31T00:00:00Z")
+    with pytest.raises(validation_history.HistoryError):
+        validation_history.parse_since("last tuesday")